@@ -8,14 +8,28 @@ APP_ORGANIZATION_DOMAIN = "yingcang-media-manager.local"
 APP_INTERNAL_NAME = "YingcangMediaManager"
 APP_USER_AGENT = f"{APP_INTERNAL_NAME}/{__version__}"
 
+from importlib import import_module
+from typing import Any
+
+from .compact_models import ScanResultBatch
 from .models import MediaType, VideoMetadata
-from .scan_engine import ScanEngine
-from .scanner import ScanConfig, Scanner
+
+# The scanning API imports Qt, so it is loaded on first access. This keeps
+# Qt-free submodules, such as the parse worker entry point in
+# filename_parser, importable without starting PySide6.
+_LAZY_EXPORTS = {
+    "ScanEngine": ".scan_engine",
+    "StreamingScanOptions": ".scan_engine",
+    "ScanConfig": ".scanner",
+    "Scanner": ".scanner",
+}
 
 __all__ = [
     "MediaType",
     "VideoMetadata",
+    "ScanResultBatch",
     "ScanEngine",
+    "StreamingScanOptions",
     "ScanConfig",
     "Scanner",
     "__version__",
@@ -26,3 +40,12 @@ __all__ = [
     "APP_INTERNAL_NAME",
     "APP_USER_AGENT",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
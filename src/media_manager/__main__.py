@@ -1,7 +1,10 @@
 # src/media_manager/__main__.py
 
+import multiprocessing
+
 from .main import main
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
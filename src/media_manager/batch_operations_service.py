@@ -276,7 +276,10 @@ class BatchOperationsService:
             else:
                 self._logger.warning("TVDB provider enabled but API key missing")
 
-        return ProviderAdapter(providers if providers else None)
+        return ProviderAdapter(
+            providers if providers else None,
+            provider_timeout=float(self._settings.get_provider_timeout()),
+        )
 
     def _load_media_item(self, session, item_id: int) -> MediaItem | None:
         stmt = (
@@ -0,0 +1,186 @@
+"""Encodings for cached provider payloads.
+
+Every encoded value starts with a version byte naming the codec that wrote
+it, so entries stay readable after the default codec changes. Values without
+a version byte are legacy JSON text written before codecs existed.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - depends on the environment
+    lz4_frame = None
+
+DEFAULT_CODEC = "zlib"
+
+# zlib level 6 is within a few percent of level 9 on JSON at a fraction of the cost.
+ZLIB_LEVEL = 6
+
+
+class CodecError(Exception):
+    """Exception raised when a cached payload can't be decoded."""
+
+    pass
+
+
+def _dump_json(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class CacheCodec:
+    """Base codec: subclasses turn values into a body and back."""
+
+    name = ""
+    version = 0
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value, prefixed with this codec's version byte."""
+        return bytes((self.version,)) + self.dump(value)
+
+    def dump(self, value: Any) -> bytes:
+        """Encode a value without the version byte."""
+        raise NotImplementedError
+
+    def load(self, body: bytes) -> Any:
+        """Decode a body produced by ``dump``."""
+        raise NotImplementedError
+
+
+class JsonCodec(CacheCodec):
+    """Compact UTF-8 JSON."""
+
+    name = "json"
+    version = 1
+
+    def dump(self, value: Any) -> bytes:
+        return _dump_json(value)
+
+    def load(self, body: bytes) -> Any:
+        return _load_json(body)
+
+
+class ZlibCodec(CacheCodec):
+    """Compact JSON compressed with zlib."""
+
+    name = "zlib"
+    version = 2
+
+    def __init__(self, level: int = ZLIB_LEVEL) -> None:
+        self.level = level
+
+    def dump(self, value: Any) -> bytes:
+        return zlib.compress(_dump_json(value), self.level)
+
+    def load(self, body: bytes) -> Any:
+        return _load_json(zlib.decompress(body))
+
+
+class Lz4Codec(CacheCodec):
+    """Compact JSON compressed with LZ4 frames (requires the lz4 package)."""
+
+    name = "lz4"
+    version = 3
+
+    def dump(self, value: Any) -> bytes:
+        return lz4_frame.compress(_dump_json(value))
+
+    def load(self, body: bytes) -> Any:
+        return _load_json(lz4_frame.decompress(body))
+
+
+_codecs_by_name: dict[str, CacheCodec] = {}
+_codecs_by_version: dict[int, CacheCodec] = {}
+
+
+def register_codec(codec: CacheCodec) -> None:
+    """Make a codec available for encoding by name and for decoding.
+
+    Args:
+        codec: Codec to register
+
+    Raises:
+        ValueError: If the version byte could be mistaken for legacy JSON text
+            or is already taken by a different codec
+    """
+    # Legacy entries start with JSON text, so versions stay below its first
+    # byte, whitespace included.
+    if not 0 < codec.version < 0x09:
+        raise ValueError(f"Codec version must be between 1 and 8: {codec.version}")
+    existing = _codecs_by_version.get(codec.version)
+    if existing is not None and existing.name != codec.name:
+        raise ValueError(
+            f"Codec version {codec.version} is already used by {existing.name}"
+        )
+    _codecs_by_name[codec.name] = codec
+    _codecs_by_version[codec.version] = codec
+
+
+def get_codec(name: Optional[str] = None) -> CacheCodec:
+    """Get a registered codec by name.
+
+    Args:
+        name: Codec name; None selects ``DEFAULT_CODEC``
+
+    Returns:
+        The codec
+
+    Raises:
+        KeyError: If no codec of that name is registered
+    """
+    return _codecs_by_name[name or DEFAULT_CODEC]
+
+
+def available_codecs() -> list[str]:
+    """Names of the registered codecs."""
+    return list(_codecs_by_name)
+
+
+def decode_payload(payload: bytes | str) -> Any:
+    """Decode a cached payload written by any registered codec.
+
+    Args:
+        payload: Encoded value, or legacy JSON text
+
+    Returns:
+        The decoded value
+
+    Raises:
+        CodecError: If the payload is corrupt or its codec isn't registered
+    """
+    try:
+        if isinstance(payload, str):
+            return json.loads(payload)
+        if not payload or payload[0] >= 0x09:
+            return _load_json(payload)
+        codec = _codecs_by_version.get(payload[0])
+        if codec is None:
+            raise CodecError(f"No codec registered for version {payload[0]}")
+        return codec.load(payload[1:])
+    except CodecError:
+        raise
+    except Exception as exc:
+        raise CodecError(f"Failed to decode cached payload: {exc}") from exc
+
+
+register_codec(JsonCodec())
+register_codec(ZlibCodec())
+if lz4_frame is not None:
+    register_codec(Lz4Codec())
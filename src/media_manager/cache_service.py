@@ -1,33 +1,111 @@
-"""Caching service for provider results with optional Redis/diskcache support."""
+"""Caching service for provider results with optional Redis/diskcache support.
+
+Lookups go through up to three tiers: a bounded in-process LRU, an optional
+on-disk or Redis backend, and the SQLite ``ProviderCache`` table. A hit in a
+lower tier is copied into the tiers above it. Values are stored as encoded by
+a ``cache_codec`` codec, compressed by default.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Optional, Sequence
 
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, select
 
+from .cache_codec import CacheCodec, CodecError, decode_payload, get_codec
 from .logging import get_logger
-from .persistence.database import get_database_service
+from .persistence.database import DatabaseService, get_database_service
 from .persistence.models import ProviderCache
 
 logger_instance = get_logger()
 logger = logger_instance.get_logger(__name__)
 
+DEFAULT_MEMORY_CACHE_ENTRIES = 2048
+DEFAULT_MEMORY_CACHE_BYTES = 32 * 1024 * 1024  # 32 MB of encoded values
+DEFAULT_FILE_CACHE_BYTES = 256 * 1024 * 1024  # 256 MB
+DEFAULT_FILE_CACHE_DIR = Path.home() / ".media-manager" / "provider_cache"
+
+# Eviction trims the file cache to this fraction of its limit, so a full
+# cache isn't rescanned on every write.
+_FILE_CACHE_LOW_WATER = 0.9
+
+# Hit counts are written to ProviderCache once this many keys are pending or
+# this many seconds have passed since the last flush, whichever comes first.
+HIT_FLUSH_BATCH_SIZE = 256
+HIT_FLUSH_INTERVAL = 30.0
+
+# Keys per "IN (...)" query, below SQLite's bound-parameter limit.
+_DB_LOOKUP_CHUNK = 500
+
+
+def generate_cache_key(provider_name: str, query_type: str, **params: Any) -> str:
+    """Generate the cache key for a provider query.
+
+    Args:
+        provider_name: Provider name (tmdb, tvdb, etc.)
+        query_type: Type of query (search_movie, get_details, etc.)
+        **params: Query parameters
+
+    Returns:
+        Cache key hash
+    """
+    # Sort params for consistent key generation
+    sorted_params = json.dumps(params, sort_keys=True)
+    key_string = f"{provider_name}:{query_type}:{sorted_params}"
+    return hashlib.sha256(key_string.encode()).hexdigest()
+
+
+@dataclass
+class CacheQuery:
+    """A provider query identifying one cache entry, for bulk operations."""
+
+    provider_name: str
+    query_type: str
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        """Cache key of the entry."""
+        return generate_cache_key(self.provider_name, self.query_type, **self.params)
+
 
 class CacheBackend:
     """Base interface for cache backends."""
 
-    def get(self, key: str) -> Optional[str]:
+    def get(self, key: str) -> Optional[bytes]:
         """Get value from cache."""
         raise NotImplementedError
 
-    def set(self, key: str, value: str, ttl: int) -> None:
+    def set(self, key: str, value: bytes, ttl: int) -> None:
         """Set value in cache with TTL in seconds."""
         raise NotImplementedError
 
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        """Get several values; keys that miss are left out of the result."""
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value:
+                values[key] = value
+        return values
+
+    def set_many(self, items: dict[str, bytes], ttl: int) -> None:
+        """Set several values with the same TTL in seconds."""
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
     def delete(self, key: str) -> None:
         """Delete value from cache."""
         raise NotImplementedError
@@ -48,22 +126,47 @@ class RedisBackend(CacheBackend):
         """
         self.client = redis_client
 
-    def get(self, key: str) -> Optional[str]:
+    def get(self, key: str) -> Optional[bytes]:
         """Get value from Redis."""
         try:
             value = self.client.get(key)
-            return value.decode("utf-8") if value else None
+            return value or None
         except Exception as e:
             logger.error(f"Redis get error: {e}")
             return None
 
-    def set(self, key: str, value: str, ttl: int) -> None:
+    def set(self, key: str, value: bytes, ttl: int) -> None:
         """Set value in Redis with TTL."""
         try:
             self.client.setex(key, ttl, value)
         except Exception as e:
             logger.error(f"Redis set error: {e}")
 
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        """Get several values from Redis with one MGET."""
+        if not keys:
+            return {}
+        try:
+            values = self.client.mget(list(keys))
+            return {
+                key: value for key, value in zip(keys, values) if value
+            }
+        except Exception as e:
+            logger.error(f"Redis mget error: {e}")
+            return {}
+
+    def set_many(self, items: dict[str, bytes], ttl: int) -> None:
+        """Set several values in Redis in one pipelined round trip."""
+        if not items:
+            return
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipeline.setex(key, ttl, value)
+            pipeline.execute()
+        except Exception as e:
+            logger.error(f"Redis pipeline set error: {e}")
+
     def delete(self, key: str) -> None:
         """Delete value from Redis."""
         try:
@@ -95,7 +198,7 @@ class DiskCacheBackend(CacheBackend):
             logger.warning("diskcache not installed, disk caching disabled")
             self.cache = None
 
-    def get(self, key: str) -> Optional[str]:
+    def get(self, key: str) -> Optional[bytes]:
         """Get value from disk cache."""
         if not self.cache:
             return None
@@ -105,7 +208,7 @@ class DiskCacheBackend(CacheBackend):
             logger.error(f"Diskcache get error: {e}")
             return None
 
-    def set(self, key: str, value: str, ttl: int) -> None:
+    def set(self, key: str, value: bytes, ttl: int) -> None:
         """Set value in disk cache with TTL."""
         if not self.cache:
             return
@@ -114,6 +217,29 @@ class DiskCacheBackend(CacheBackend):
         except Exception as e:
             logger.error(f"Diskcache set error: {e}")
 
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        """Get several values from disk cache in one transaction."""
+        if not self.cache or not keys:
+            return {}
+        try:
+            with self.cache.transact():
+                values = {key: self.cache.get(key) for key in keys}
+            return {key: value for key, value in values.items() if value}
+        except Exception as e:
+            logger.error(f"Diskcache get_many error: {e}")
+            return {}
+
+    def set_many(self, items: dict[str, bytes], ttl: int) -> None:
+        """Set several values in disk cache in one transaction."""
+        if not self.cache or not items:
+            return
+        try:
+            with self.cache.transact():
+                for key, value in items.items():
+                    self.cache.set(key, value, expire=ttl)
+        except Exception as e:
+            logger.error(f"Diskcache set_many error: {e}")
+
     def delete(self, key: str) -> None:
         """Delete value from disk cache."""
         if not self.cache:
@@ -133,6 +259,234 @@ class DiskCacheBackend(CacheBackend):
             logger.error(f"Diskcache clear error: {e}")
 
 
+class MemoryBackend(CacheBackend):
+    """In-process LRU tier holding the most recently used entries.
+
+    The tier is bounded both by entry count and by the total length of the
+    stored values; whichever limit is hit first evicts the least recently
+    used entries. Expired entries are dropped when they are next read.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MEMORY_CACHE_ENTRIES,
+        max_bytes: int = DEFAULT_MEMORY_CACHE_BYTES,
+    ) -> None:
+        """Initialize the memory tier.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            max_bytes: Total size of stored values kept before evicting
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total length of the stored values."""
+        with self._lock:
+            return self._size
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a live value and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        """Get several live values under one lock acquisition."""
+        now = time.monotonic()
+        values = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[0] <= now:
+                    self._remove(key)
+                    continue
+                self._entries.move_to_end(key)
+                values[key] = entry[1]
+        return values
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, items: dict[str, bytes], ttl: int) -> None:
+        """Store several values, evicting the least recently used entries if full."""
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            for key, value in items.items():
+                self._remove(key)
+                if len(value) > self.max_bytes:
+                    # Caching it would flush everything else out.
+                    continue
+                self._entries[key] = (expires_at, value)
+                self._size += len(value)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        """Delete a value from memory."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Clear all memory entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+class FileCacheBackend(CacheBackend):
+    """Compact on-disk store bounded by total size.
+
+    Each entry is one file holding its expiry time and the encoded value.
+    Reads refresh the file's modification time, and once the store grows
+    past ``max_bytes`` the least recently used files are removed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_FILE_CACHE_DIR,
+        max_bytes: int = DEFAULT_FILE_CACHE_BYTES,
+    ) -> None:
+        """Initialize the file backend.
+
+        Args:
+            cache_dir: Directory for cache files
+            max_bytes: Total size the store may reach before eviction
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get value from the file store."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                expires_at = float(f.readline())
+                value = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.error(f"File cache get error: {e}")
+            return None
+
+        if expires_at <= time.time():
+            self.delete(key)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Set value in the file store with TTL."""
+        path = self._path(key)
+        data = f"{time.time() + ttl}\n".encode("ascii") + value
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            temp_path.write_bytes(data)
+            with self._lock:
+                previous = path.stat().st_size if path.exists() else 0
+                os.replace(temp_path, path)
+                if self._total_bytes is not None:
+                    self._total_bytes += len(data) - previous
+                if self._size() > self.max_bytes:
+                    self._evict()
+        except OSError as e:
+            logger.error(f"File cache set error: {e}")
+
+    def delete(self, key: str) -> None:
+        """Delete value from the file store."""
+        path = self._path(key)
+        try:
+            with self._lock:
+                size = path.stat().st_size
+                path.unlink()
+                if self._total_bytes is not None:
+                    self._total_bytes -= size
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"File cache delete error: {e}")
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._lock:
+            try:
+                if self.cache_dir.exists():
+                    shutil.rmtree(self.cache_dir)
+            except OSError as e:
+                logger.error(f"File cache clear error: {e}")
+            self._total_bytes = None
+
+    def _files(self) -> list[os.DirEntry[str]]:
+        if not self.cache_dir.exists():
+            return []
+        entries = []
+        for shard in os.scandir(self.cache_dir):
+            if shard.is_dir():
+                entries.extend(
+                    entry
+                    for entry in os.scandir(shard.path)
+                    if entry.is_file() and not entry.name.endswith(".tmp")
+                )
+        return entries
+
+    def _size(self) -> int:
+        if self._total_bytes is None:
+            self._total_bytes = sum(entry.stat().st_size for entry in self._files())
+        return self._total_bytes
+
+    def _evict(self) -> None:
+        """Remove least recently used files until under the low-water mark."""
+        target = int(self.max_bytes * _FILE_CACHE_LOW_WATER)
+        files = sorted(self._files(), key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in files)
+        evicted = 0
+        for entry in files:
+            if total <= target:
+                break
+            try:
+                size = entry.stat().st_size
+                os.unlink(entry.path)
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        self._total_bytes = total
+        logger.debug(f"Evicted {evicted} file cache entries")
+
+
 class CacheService:
     """Service for caching provider results with multiple backend support."""
 
@@ -141,18 +495,48 @@ class CacheService:
         backend: Optional[CacheBackend] = None,
         default_ttl: int = 3600,  # 1 hour default
         use_db_cache: bool = True,
+        memory_entries: int = DEFAULT_MEMORY_CACHE_ENTRIES,
+        memory_bytes: int = DEFAULT_MEMORY_CACHE_BYTES,
+        codec: Optional[CacheCodec] = None,
     ) -> None:
         """Initialize cache service.
 
         Args:
-            backend: Optional external cache backend (Redis or DiskCache)
+            backend: Optional external cache backend (Redis, DiskCache or files)
             default_ttl: Default TTL in seconds
-            use_db_cache: Whether to use database as cache layer
+            use_db_cache: Whether to use database as cache layer. With a
+                backend, entries are only read from the database, not written.
+            memory_entries: Entry limit of the in-process LRU tier; 0 disables it
+            memory_bytes: Size limit of the in-process LRU tier
+            codec: Codec for new entries (defaults to ``cache_codec.DEFAULT_CODEC``);
+                entries written by any registered codec are still read
         """
         self.backend = backend
+        self.codec = codec or get_codec()
         self.default_ttl = default_ttl
         self.use_db_cache = use_db_cache
-        self.db_service = get_database_service()
+        # With a backend the payload is stored there alone. The database tier
+        # is still read for older entries but not written, so responses are
+        # not kept on disk twice outside the backend's size limit.
+        self._store_in_db = use_db_cache and backend is None
+        self.memory = (
+            MemoryBackend(memory_entries, memory_bytes) if memory_entries > 0 else None
+        )
+        self._db_service: Optional[DatabaseService] = None
+        # Hit counts and last-access times waiting to be written to the database
+        self._pending_hits: dict[str, tuple[int, datetime]] = {}
+        self._hits_lock = threading.Lock()
+        self._last_hit_flush = time.monotonic()
+
+    @property
+    def db_service(self) -> Optional[DatabaseService]:
+        """Database behind the SQLite tier, or None until one is initialized."""
+        if self._db_service is None:
+            try:
+                self._db_service = get_database_service()
+            except RuntimeError:
+                return None
+        return self._db_service
 
     def _generate_cache_key(
         self, provider_name: str, query_type: str, **params: Any
@@ -167,10 +551,7 @@ class CacheService:
         Returns:
             Cache key hash
         """
-        # Sort params for consistent key generation
-        sorted_params = json.dumps(params, sort_keys=True)
-        key_string = f"{provider_name}:{query_type}:{sorted_params}"
-        return hashlib.sha256(key_string.encode()).hexdigest()
+        return generate_cache_key(provider_name, query_type, **params)
 
     def get(
         self, provider_name: str, query_type: str, **params: Any
@@ -187,33 +568,153 @@ class CacheService:
         """
         cache_key = self._generate_cache_key(provider_name, query_type, **params)
 
-        # Try external backend first (Redis/DiskCache)
+        if self.memory is not None:
+            cached_value = self.memory.get(cache_key)
+            if cached_value is not None:
+                logger.debug(f"Cache hit (memory): {cache_key}")
+                self._record_hit(cache_key)
+                return self._decode(cached_value)
+
+        # Then the external backend (Redis/DiskCache/files)
         if self.backend:
             try:
                 cached_value = self.backend.get(cache_key)
                 if cached_value:
                     logger.debug(f"Cache hit (backend): {cache_key}")
-                    return json.loads(cached_value)
+                    if self.memory is not None:
+                        self.memory.set(cache_key, cached_value, self.default_ttl)
+                    return self._decode(cached_value)
             except Exception as e:
                 logger.warning(f"Backend cache error: {e}")
 
         # Fall back to database cache
         if self.use_db_cache:
-            return self._get_from_db(cache_key)
+            entry = self._get_from_db(cache_key)
+            if entry is not None:
+                cached_value, remaining_ttl = entry
+                self._promote(cache_key, cached_value, remaining_ttl)
+                return self._decode(cached_value)
 
         return None
 
-    def _get_from_db(self, cache_key: str) -> Optional[dict[str, Any]]:
+    def get_many(self, queries: Sequence[CacheQuery]) -> list[Optional[Any]]:
+        """Get cached results for many queries at once.
+
+        Each tier is asked once for every key still missing: the memory tier
+        under one lock, the backend with one bulk call (MGET for Redis), and
+        the database with ``IN (...)`` queries.
+
+        Args:
+            queries: Queries to look up
+
+        Returns:
+            Cached results aligned with ``queries``, None for misses
+        """
+        keys = [query.key for query in queries]
+        found = self._get_many_raw(keys, record_hits=True)
+        logger.debug(f"Cache get_many: {len(found)} of {len(set(keys))} keys hit")
+        return [self._decode(found[key]) if key in found else None for key in keys]
+
+    def prefetch(self, queries: Sequence[CacheQuery]) -> int:
+        """Warm the memory tier for queries that are about to be looked up.
+
+        Entries found in the backend or database are promoted with bulk
+        reads, so the ``get`` calls that follow are answered from memory.
+        Hits are counted when those calls happen, not here.
+
+        Args:
+            queries: Queries that will be looked up shortly
+
+        Returns:
+            Number of distinct queries now cached in memory
+        """
+        if self.memory is None:
+            return 0
+        return len(self._get_many_raw([query.key for query in queries], record_hits=False))
+
+    def _get_many_raw(self, keys: Sequence[str], record_hits: bool) -> dict[str, bytes]:
+        """Look up many keys tier by tier, promoting hits to faster tiers.
+
+        Args:
+            keys: Cache keys
+            record_hits: Whether memory and database hits count as reads
+
+        Returns:
+            Cached JSON for each key that hit
+        """
+        missing = list(dict.fromkeys(keys))
+        found: dict[str, bytes] = {}
+
+        if self.memory is not None and missing:
+            memory_hits = self.memory.get_many(missing)
+            if record_hits:
+                self._record_hits(memory_hits)
+            found.update(memory_hits)
+            missing = [key for key in missing if key not in found]
+
+        if self.backend and missing:
+            try:
+                backend_hits = self.backend.get_many(missing)
+            except Exception as e:
+                logger.warning(f"Backend cache error: {e}")
+                backend_hits = {}
+            if self.memory is not None:
+                self.memory.set_many(backend_hits, self.default_ttl)
+            found.update(backend_hits)
+            missing = [key for key in missing if key not in found]
+
+        if self.use_db_cache and missing:
+            db_hits = self._get_many_from_db(missing)
+            if record_hits:
+                self._record_hits(db_hits)
+            if db_hits:
+                # Promote with the shortest remaining TTL so no tier outlives the DB.
+                values = {key: value for key, (value, _) in db_hits.items()}
+                ttl = min(remaining for _, remaining in db_hits.values())
+                if self.memory is not None:
+                    self.memory.set_many(values, ttl)
+                if self.backend:
+                    try:
+                        self.backend.set_many(values, ttl)
+                    except Exception as e:
+                        logger.warning(f"Backend cache set error: {e}")
+                found.update(values)
+
+        return found
+
+    def _decode(self, payload: bytes) -> Optional[Any]:
+        """Decode a cached payload, treating an unreadable one as a miss."""
+        try:
+            return decode_payload(payload)
+        except CodecError as e:
+            logger.warning(f"Discarding unreadable cache entry: {e}")
+            return None
+
+    def _promote(self, cache_key: str, value: bytes, ttl: int) -> None:
+        """Copy a database hit into the faster tiers."""
+        if self.memory is not None:
+            self.memory.set(cache_key, value, ttl)
+        if self.backend:
+            try:
+                self.backend.set(cache_key, value, ttl)
+            except Exception as e:
+                logger.warning(f"Backend cache set error: {e}")
+
+    def _get_from_db(self, cache_key: str) -> Optional[tuple[bytes, int]]:
         """Get cached result from database.
 
         Args:
             cache_key: Cache key
 
         Returns:
-            Cached result or None
+            Cached JSON and its remaining TTL in seconds, or None
         """
+        db_service = self.db_service
+        if db_service is None:
+            return None
+
         try:
-            with self.db_service.get_session() as session:
+            with db_service.get_session() as session:
                 statement = (
                     select(ProviderCache)
                     .where(ProviderCache.cache_key == cache_key)
@@ -222,20 +723,114 @@ class CacheService:
                 result = session.exec(statement).first()
 
                 if result:
-                    # Update hit count and last accessed
-                    result.hit_count += 1
-                    result.last_accessed = datetime.utcnow()
-                    session.add(result)
-                    session.commit()
-
                     logger.debug(f"Cache hit (DB): {cache_key}")
-                    return json.loads(result.response_data)
+                    self._record_hit(cache_key)
+                    remaining = (result.expires_at - datetime.utcnow()).total_seconds()
+                    return result.response_data, max(1, int(remaining))
 
                 return None
         except Exception as e:
             logger.error(f"Database cache get error: {e}")
             return None
 
+    def _get_many_from_db(self, cache_keys: Sequence[str]) -> dict[str, tuple[bytes, int]]:
+        """Get many cached results from the database.
+
+        Args:
+            cache_keys: Cache keys
+
+        Returns:
+            Cached JSON and remaining TTL in seconds for each key that hit
+        """
+        db_service = self.db_service
+        if db_service is None:
+            return {}
+
+        hits: dict[str, tuple[bytes, int]] = {}
+        now = datetime.utcnow()
+        try:
+            with db_service.get_session() as session:
+                for start in range(0, len(cache_keys), _DB_LOOKUP_CHUNK):
+                    chunk = cache_keys[start:start + _DB_LOOKUP_CHUNK]
+                    statement = (
+                        select(
+                            ProviderCache.cache_key,
+                            ProviderCache.response_data,
+                            ProviderCache.expires_at,
+                        )
+                        .where(ProviderCache.cache_key.in_(chunk))
+                        .where(ProviderCache.expires_at > now)
+                    )
+                    for cache_key, response_data, expires_at in session.exec(statement):
+                        remaining = (expires_at - now).total_seconds()
+                        hits[cache_key] = (response_data, max(1, int(remaining)))
+        except Exception as e:
+            logger.error(f"Database cache get_many error: {e}")
+            return {}
+        return hits
+
+    def _record_hit(self, cache_key: str) -> None:
+        """Buffer a hit for ``cache_key`` and flush the buffer when it's due.
+
+        Reads only touch memory; the counts reach ``ProviderCache`` in one
+        batched UPDATE per flush instead of a write transaction per hit.
+        """
+        self._record_hits((cache_key,))
+
+    def _record_hits(self, cache_keys: Any) -> None:
+        """Buffer one hit for each key in ``cache_keys``."""
+        if not self._store_in_db or not cache_keys:
+            return
+
+        accessed = datetime.utcnow()
+        with self._hits_lock:
+            for cache_key in cache_keys:
+                hits, _ = self._pending_hits.get(cache_key, (0, None))
+                self._pending_hits[cache_key] = (hits + 1, accessed)
+            due = (
+                len(self._pending_hits) >= HIT_FLUSH_BATCH_SIZE
+                or time.monotonic() - self._last_hit_flush >= HIT_FLUSH_INTERVAL
+            )
+        if due:
+            self.flush_hits()
+
+    def flush_hits(self) -> int:
+        """Write buffered hit counts and last-access times to the database.
+
+        Returns:
+            Number of cache entries updated
+        """
+        with self._hits_lock:
+            pending, self._pending_hits = self._pending_hits, {}
+            self._last_hit_flush = time.monotonic()
+
+        db_service = self.db_service
+        if not pending or db_service is None:
+            return 0
+
+        table = ProviderCache.__table__
+        statement = (
+            update(table)
+            .where(table.c.cache_key == bindparam("key"))
+            .values(
+                hit_count=table.c.hit_count + bindparam("hits"),
+                last_accessed=bindparam("accessed"),
+            )
+        )
+        rows = [
+            {"key": key, "hits": hits, "accessed": accessed}
+            for key, (hits, accessed) in pending.items()
+        ]
+        try:
+            with db_service.get_session() as session:
+                session.connection().execute(statement, rows)
+                session.commit()
+            logger.debug(f"Flushed hit counts for {len(rows)} cache entries")
+            return len(rows)
+        except Exception as e:
+            logger.error(f"Database cache hit flush error: {e}")
+            return 0
+
     def set(
         self,
         provider_name: str,
@@ -255,29 +850,123 @@ class CacheService:
         """
         cache_key = self._generate_cache_key(provider_name, query_type, **params)
         ttl = ttl or self.default_ttl
-        response_json = json.dumps(response_data)
+        payload = self.codec.encode(response_data)
+
+        if self.memory is not None:
+            self.memory.set(cache_key, payload, ttl)
 
         # Store in external backend if available
         if self.backend:
             try:
-                self.backend.set(cache_key, response_json, ttl)
+                self.backend.set(cache_key, payload, ttl)
                 logger.debug(f"Cache set (backend): {cache_key}")
             except Exception as e:
                 logger.warning(f"Backend cache set error: {e}")
 
         # Store in database cache
-        if self.use_db_cache:
+        if self._store_in_db:
             self._set_in_db(
-                cache_key, provider_name, query_type, params, response_json, ttl
+                cache_key, provider_name, query_type, params, payload, ttl
             )
 
+    def set_many(
+        self,
+        entries: Sequence[tuple[CacheQuery, Any]],
+        ttl: Optional[int] = None,
+    ) -> None:
+        """Set many cached results at once.
+
+        The backend receives one bulk call (a pipeline for Redis) and the
+        database one batched upsert.
+
+        Args:
+            entries: Queries with the response data to cache for each
+            ttl: TTL in seconds (uses default if None)
+        """
+        if not entries:
+            return
+
+        ttl = ttl or self.default_ttl
+        encoded = {
+            query.key: (query, self.codec.encode(response_data))
+            for query, response_data in entries
+        }
+        values = {key: payload for key, (_, payload) in encoded.items()}
+
+        if self.memory is not None:
+            self.memory.set_many(values, ttl)
+
+        if self.backend:
+            try:
+                self.backend.set_many(values, ttl)
+                logger.debug(f"Cache set_many (backend): {len(values)} entries")
+            except Exception as e:
+                logger.warning(f"Backend cache set error: {e}")
+
+        if self._store_in_db:
+            self._set_many_in_db(encoded, ttl)
+
+    def _set_many_in_db(
+        self, encoded: dict[str, tuple[CacheQuery, bytes]], ttl: int
+    ) -> None:
+        """Upsert many cached results into the database in one statement.
+
+        Args:
+            encoded: Query and response JSON keyed by cache key
+            ttl: TTL in seconds
+        """
+        db_service = self.db_service
+        if db_service is None:
+            return
+
+        if db_service.engine.dialect.name != "sqlite":
+            for cache_key, (query, payload) in encoded.items():
+                self._set_in_db(
+                    cache_key, query.provider_name, query.query_type,
+                    query.params, payload, ttl,
+                )
+            return
+
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl)
+        rows = [
+            {
+                "cache_key": cache_key,
+                "provider_name": query.provider_name,
+                "query_type": query.query_type,
+                "query_params": json.dumps(query.params),
+                "response_data": payload,
+                "created_at": now,
+                "expires_at": expires_at,
+                "hit_count": 0,
+                "last_accessed": now,
+            }
+            for cache_key, (query, payload) in encoded.items()
+        ]
+        statement = sqlite_insert(ProviderCache.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=["cache_key"],
+            set_={
+                "response_data": statement.excluded.response_data,
+                "expires_at": statement.excluded.expires_at,
+                "last_accessed": statement.excluded.last_accessed,
+            },
+        )
+        try:
+            with db_service.get_session() as session:
+                session.connection().execute(statement, rows)
+                session.commit()
+            logger.debug(f"Cache set_many (DB): {len(rows)} entries")
+        except Exception as e:
+            logger.error(f"Database cache set_many error: {e}")
+
     def _set_in_db(
         self,
         cache_key: str,
         provider_name: str,
         query_type: str,
         params: dict[str, Any],
-        response_json: str,
+        payload: bytes,
         ttl: int,
     ) -> None:
         """Set cached result in database.
@@ -287,11 +976,15 @@ class CacheService:
             provider_name: Provider name
             query_type: Type of query
             params: Query parameters
-            response_json: Response JSON string
+            payload: Encoded response
             ttl: TTL in seconds
         """
+        db_service = self.db_service
+        if db_service is None:
+            return
+
         try:
-            with self.db_service.get_session() as session:
+            with db_service.get_session() as session:
                 # Check if entry exists
                 statement = select(ProviderCache).where(
                     ProviderCache.cache_key == cache_key
@@ -302,7 +995,7 @@ class CacheService:
 
                 if existing:
                     # Update existing entry
-                    existing.response_data = response_json
+                    existing.response_data = payload
                     existing.expires_at = expires_at
                     existing.last_accessed = datetime.utcnow()
                     session.add(existing)
@@ -313,7 +1006,7 @@ class CacheService:
                         provider_name=provider_name,
                         query_type=query_type,
                         query_params=json.dumps(params),
-                        response_data=response_json,
+                        response_data=payload,
                         expires_at=expires_at,
                     )
                     session.add(cache_entry)
@@ -333,13 +1026,16 @@ class CacheService:
         """
         cache_key = self._generate_cache_key(provider_name, query_type, **params)
 
+        if self.memory is not None:
+            self.memory.delete(cache_key)
+
         if self.backend:
             try:
                 self.backend.delete(cache_key)
             except Exception as e:
                 logger.warning(f"Backend cache delete error: {e}")
 
-        if self.use_db_cache:
+        if self.use_db_cache and self.db_service is not None:
             try:
                 with self.db_service.get_session() as session:
                     statement = select(ProviderCache).where(
@@ -358,9 +1054,10 @@ class CacheService:
         Returns:
             Number of entries cleared
         """
-        if not self.use_db_cache:
+        if not self.use_db_cache or self.db_service is None:
             return 0
 
+        self.flush_hits()
         try:
             with self.db_service.get_session() as session:
                 statement = select(ProviderCache).where(
@@ -381,13 +1078,16 @@ class CacheService:
 
     def clear_all(self) -> None:
         """Clear all cache entries."""
+        if self.memory is not None:
+            self.memory.clear()
+
         if self.backend:
             try:
                 self.backend.clear()
             except Exception as e:
                 logger.warning(f"Backend cache clear error: {e}")
 
-        if self.use_db_cache:
+        if self.use_db_cache and self.db_service is not None:
             try:
                 with self.db_service.get_session() as session:
                     statement = select(ProviderCache)
@@ -405,9 +1105,10 @@ class CacheService:
         Returns:
             Dictionary with cache statistics
         """
-        if not self.use_db_cache:
+        if not self.use_db_cache or self.db_service is None:
             return {}
 
+        self.flush_hits()
         try:
             with self.db_service.get_session() as session:
                 all_entries = session.exec(select(ProviderCache)).all()
@@ -438,7 +1139,7 @@ def get_cache_service() -> CacheService:
     """
     global _cache_service
     if _cache_service is None:
-        _cache_service = CacheService()
+        _cache_service = CacheService(backend=FileCacheBackend())
     return _cache_service
 
 
@@ -446,6 +1147,9 @@ def initialize_cache_service(
     backend: Optional[CacheBackend] = None,
     default_ttl: int = 3600,
     use_db_cache: bool = True,
+    memory_entries: int = DEFAULT_MEMORY_CACHE_ENTRIES,
+    memory_bytes: int = DEFAULT_MEMORY_CACHE_BYTES,
+    codec: Optional[CacheCodec] = None,
 ) -> CacheService:
     """Initialize the global cache service with custom configuration.
 
@@ -453,10 +1157,17 @@ def initialize_cache_service(
         backend: Optional external cache backend
         default_ttl: Default TTL in seconds
         use_db_cache: Whether to use database cache
+        memory_entries: Entry limit of the in-process LRU tier; 0 disables it
+        memory_bytes: Size limit of the in-process LRU tier
+        codec: Codec for new entries
 
     Returns:
         Initialized cache service
     """
     global _cache_service
-    _cache_service = CacheService(backend, default_ttl, use_db_cache)
+    if _cache_service is not None:
+        _cache_service.flush_hits()
+    _cache_service = CacheService(
+        backend, default_ttl, use_db_cache, memory_entries, memory_bytes, codec
+    )
     return _cache_service
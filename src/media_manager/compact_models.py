@@ -0,0 +1,465 @@
+"""Memory-compact representations of scan results and match queue entries."""
+
+from __future__ import annotations
+
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Iterator, overload
+
+from .models import (
+    MatchStatus,
+    MediaMatch,
+    MediaType,
+    PosterInfo,
+    PosterType,
+    SubtitleInfo,
+    SubtitleLanguage,
+    VideoMetadata,
+)
+
+# Sentinel stored in the integer columns for a missing value.
+_MISSING = -1
+_MEDIA_TYPES: tuple[MediaType, ...] = tuple(MediaType)
+_MEDIA_TYPE_CODES = {media_type: code for code, media_type in enumerate(_MEDIA_TYPES)}
+
+_METADATA_FIELDS = ("path", "title", "media_type", "year", "season", "episode")
+
+
+def _metadata_as_dict(metadata: Any) -> dict[str, Any]:
+    return {
+        "path": str(metadata.path),
+        "title": metadata.title,
+        "media_type": metadata.media_type.value,
+        "year": metadata.year,
+        "season": metadata.season,
+        "episode": metadata.episode,
+    }
+
+
+def _metadata_equals(left: Any, right: Any) -> bool:
+    try:
+        return all(
+            getattr(left, name) == getattr(right, name) for name in _METADATA_FIELDS
+        )
+    except AttributeError:
+        return False
+
+
+def _encode_int(value: int | None) -> int:
+    return _MISSING if value is None else value
+
+
+def _decode_int(value: int) -> int | None:
+    return None if value == _MISSING else value
+
+
+class CompactVideoMetadata:
+    """Slotted variant of :class:`VideoMetadata`.
+
+    The path is kept as an interned string and only turned into a ``Path``
+    when accessed, so entries sharing a directory layout share storage.
+    """
+
+    __slots__ = ("_path", "title", "media_type", "year", "season", "episode")
+
+    def __init__(
+        self,
+        path: Path | str,
+        title: str,
+        media_type: MediaType,
+        year: int | None = None,
+        season: int | None = None,
+        episode: int | None = None,
+    ) -> None:
+        self._path = sys.intern(os.fspath(path))
+        self.title = sys.intern(title)
+        self.media_type = media_type
+        self.year = year
+        self.season = season
+        self.episode = episode
+
+    @classmethod
+    def from_metadata(cls, metadata: Any) -> CompactVideoMetadata:
+        """Create a compact copy of any VideoMetadata-like object."""
+        if isinstance(metadata, cls):
+            return metadata
+        return cls(
+            metadata.path,
+            metadata.title,
+            metadata.media_type,
+            metadata.year,
+            metadata.season,
+            metadata.episode,
+        )
+
+    @property
+    def path(self) -> Path:
+        """Path of the video file."""
+        return Path(self._path)
+
+    @path.setter
+    def path(self, value: Path | str) -> None:
+        self._path = sys.intern(os.fspath(value))
+
+    @property
+    def path_str(self) -> str:
+        """Path of the video file as a string, without allocating a Path."""
+        return self._path
+
+    def is_movie(self) -> bool:
+        """Return True if the metadata represents a movie."""
+        return self.media_type is MediaType.MOVIE
+
+    def is_episode(self) -> bool:
+        """Return True if the metadata represents a TV episode."""
+        return self.media_type is MediaType.TV
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the metadata."""
+        return _metadata_as_dict(self)
+
+    def to_metadata(self) -> VideoMetadata:
+        """Return an equivalent :class:`VideoMetadata`."""
+        return VideoMetadata(
+            self.path, self.title, self.media_type, self.year, self.season, self.episode
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return _metadata_equals(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactVideoMetadata(path={self._path!r}, title={self.title!r}, "
+            f"media_type={self.media_type!r}, year={self.year!r}, "
+            f"season={self.season!r}, episode={self.episode!r})"
+        )
+
+
+class CompactMediaMatch(MediaMatch):
+    """Slotted variant of :class:`MediaMatch`.
+
+    ``posters``, ``subtitles`` and ``cast`` are only allocated when first
+    accessed, so pending queue entries cost no container objects.
+
+    It subclasses :class:`MediaMatch` so ``isinstance`` checks and
+    ``dataclasses.replace`` accept it: the constructor takes the same
+    fields, and ``replace`` returns another compact match. The inherited
+    ``__dict__`` is never populated, so the entry stays slot-sized.
+    """
+
+    __slots__ = (
+        "metadata",
+        "status",
+        "confidence",
+        "matched_title",
+        "matched_year",
+        "external_id",
+        "source",
+        "poster_url",
+        "overview",
+        "user_selected",
+        "runtime",
+        "aired_date",
+        "_posters",
+        "_subtitles",
+        "_cast",
+    )
+
+    def __init__(
+        self,
+        metadata: Any,
+        status: MatchStatus = MatchStatus.PENDING,
+        confidence: float | None = None,
+        matched_title: str | None = None,
+        matched_year: int | None = None,
+        external_id: str | None = None,
+        source: str | None = None,
+        poster_url: str | None = None,
+        overview: str | None = None,
+        user_selected: bool = False,
+        posters: dict[PosterType, PosterInfo] | None = None,
+        subtitles: dict[SubtitleLanguage, SubtitleInfo] | None = None,
+        runtime: int | None = None,
+        aired_date: str | None = None,
+        cast: list[str] | None = None,
+    ) -> None:
+        self.metadata = metadata
+        self.status = status
+        self.confidence = confidence
+        self.matched_title = matched_title
+        self.matched_year = matched_year
+        self.external_id = external_id
+        self.source = source
+        self.poster_url = poster_url
+        self.overview = overview
+        self.user_selected = user_selected
+        self.runtime = runtime
+        self.aired_date = aired_date
+        self._posters = posters or None
+        self._subtitles = subtitles or None
+        self._cast = cast or None
+
+    @classmethod
+    def from_match(cls, match: MediaMatch) -> CompactMediaMatch:
+        """Create a compact copy of a :class:`MediaMatch`."""
+        return cls(
+            CompactVideoMetadata.from_metadata(match.metadata),
+            status=match.status,
+            confidence=match.confidence,
+            matched_title=match.matched_title,
+            matched_year=match.matched_year,
+            external_id=match.external_id,
+            source=match.source,
+            poster_url=match.poster_url,
+            overview=match.overview,
+            user_selected=match.user_selected,
+            posters=match.posters,
+            subtitles=match.subtitles,
+            runtime=match.runtime,
+            aired_date=match.aired_date,
+            cast=match.cast,
+        )
+
+    @property
+    def posters(self) -> dict[PosterType, PosterInfo]:
+        """Poster downloads keyed by type, allocated on first access."""
+        if self._posters is None:
+            self._posters = {}
+        return self._posters
+
+    @posters.setter
+    def posters(self, value: dict[PosterType, PosterInfo] | None) -> None:
+        self._posters = value
+
+    @property
+    def subtitles(self) -> dict[SubtitleLanguage, SubtitleInfo]:
+        """Subtitle downloads keyed by language, allocated on first access."""
+        if self._subtitles is None:
+            self._subtitles = {}
+        return self._subtitles
+
+    @subtitles.setter
+    def subtitles(self, value: dict[SubtitleLanguage, SubtitleInfo] | None) -> None:
+        self._subtitles = value
+
+    @property
+    def cast(self) -> list[str]:
+        """Cast names, allocated on first access."""
+        if self._cast is None:
+            self._cast = []
+        return self._cast
+
+    @cast.setter
+    def cast(self, value: list[str] | None) -> None:
+        self._cast = value
+
+    def is_matched(self) -> bool:
+        """Return True if the item has been matched (automatically or manually)."""
+        return self.status in (MatchStatus.MATCHED, MatchStatus.MANUAL)
+
+    def needs_review(self) -> bool:
+        """Return True if the item needs user review."""
+        return self.status == MatchStatus.PENDING or (
+            self.status == MatchStatus.MATCHED and (self.confidence or 0) < 0.8
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the match."""
+        return self.to_match().as_dict()
+
+    def to_match(self) -> MediaMatch:
+        """Return an equivalent :class:`MediaMatch`."""
+        metadata = self.metadata
+        if not isinstance(metadata, VideoMetadata):
+            metadata = metadata.to_metadata()
+        return MediaMatch(
+            metadata=metadata,
+            status=self.status,
+            confidence=self.confidence,
+            matched_title=self.matched_title,
+            matched_year=self.matched_year,
+            external_id=self.external_id,
+            source=self.source,
+            poster_url=self.poster_url,
+            overview=self.overview,
+            user_selected=self.user_selected,
+            posters=dict(self._posters or {}),
+            subtitles=dict(self._subtitles or {}),
+            runtime=self.runtime,
+            aired_date=self.aired_date,
+            cast=list(self._cast or []),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactMediaMatch(metadata={self.metadata!r}, status={self.status!r}, "
+            f"matched_title={self.matched_title!r})"
+        )
+
+
+class VideoMetadataView:
+    """Read-only row view into a :class:`ScanResultBatch`.
+
+    Fields are decoded from the batch columns on access; the view itself
+    only stores the batch and the row index.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: ScanResultBatch, index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    @property
+    def path(self) -> Path:
+        """Path of the video file."""
+        return Path(self._batch._paths[self._index])
+
+    @property
+    def path_str(self) -> str:
+        """Path of the video file as a string, without allocating a Path."""
+        return self._batch._paths[self._index]
+
+    @property
+    def title(self) -> str:
+        """Parsed title."""
+        return self._batch._titles[self._index]
+
+    @property
+    def media_type(self) -> MediaType:
+        """Detected media type."""
+        return _MEDIA_TYPES[self._batch._media_types[self._index]]
+
+    @property
+    def year(self) -> int | None:
+        """Release year, if detected."""
+        return _decode_int(self._batch._years[self._index])
+
+    @property
+    def season(self) -> int | None:
+        """Season number, if detected."""
+        return _decode_int(self._batch._seasons[self._index])
+
+    @property
+    def episode(self) -> int | None:
+        """Episode number, if detected."""
+        return _decode_int(self._batch._episodes[self._index])
+
+    def is_movie(self) -> bool:
+        """Return True if the metadata represents a movie."""
+        return self.media_type is MediaType.MOVIE
+
+    def is_episode(self) -> bool:
+        """Return True if the metadata represents a TV episode."""
+        return self.media_type is MediaType.TV
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the metadata."""
+        return _metadata_as_dict(self)
+
+    def to_metadata(self) -> VideoMetadata:
+        """Materialize the row as a :class:`VideoMetadata`."""
+        return self._batch.metadata_at(self._index)
+
+    def __eq__(self, other: object) -> bool:
+        return _metadata_equals(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"VideoMetadataView({self.to_metadata()!r})"
+
+
+class ScanResultBatch:
+    """Columnar container for scan results.
+
+    Paths and titles are stored as interned strings; media type, year,
+    season and episode live in parallel compact arrays. Indexing and
+    iteration return :class:`VideoMetadataView` rows that behave like
+    :class:`VideoMetadata` for read access.
+    """
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        """Initialize the batch.
+
+        Args:
+            items: Optional VideoMetadata-like objects to add
+        """
+        self._paths: list[str] = []
+        self._titles: list[str] = []
+        self._media_types = array("b")
+        self._years = array("i")
+        self._seasons = array("i")
+        self._episodes = array("i")
+        self.extend(items)
+
+    def append(self, metadata: Any) -> None:
+        """Add a VideoMetadata-like object to the batch."""
+        path = getattr(metadata, "path_str", None)
+        if path is None:
+            path = os.fspath(metadata.path)
+        self._paths.append(sys.intern(path))
+        self._titles.append(sys.intern(metadata.title))
+        self._media_types.append(_MEDIA_TYPE_CODES[metadata.media_type])
+        self._years.append(_encode_int(metadata.year))
+        self._seasons.append(_encode_int(metadata.season))
+        self._episodes.append(_encode_int(metadata.episode))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Add several VideoMetadata-like objects to the batch."""
+        for metadata in items:
+            self.append(metadata)
+
+    def metadata_at(self, index: int) -> VideoMetadata:
+        """Materialize a row as a :class:`VideoMetadata`."""
+        return VideoMetadata(
+            path=Path(self._paths[index]),
+            title=self._titles[index],
+            media_type=_MEDIA_TYPES[self._media_types[index]],
+            year=_decode_int(self._years[index]),
+            season=_decode_int(self._seasons[index]),
+            episode=_decode_int(self._episodes[index]),
+        )
+
+    def to_metadata_list(self) -> list[VideoMetadata]:
+        """Materialize every row as a :class:`VideoMetadata`."""
+        return [self.metadata_at(index) for index in range(len(self))]
+
+    def paths(self) -> list[str]:
+        """Return the stored paths as strings."""
+        return list(self._paths)
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.__init__()
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @overload
+    def __getitem__(self, index: int) -> VideoMetadataView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[VideoMetadataView]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> VideoMetadataView | list[VideoMetadataView]:
+        if isinstance(index, slice):
+            return [
+                VideoMetadataView(self, position)
+                for position in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ScanResultBatch index out of range")
+        return VideoMetadataView(self, index)
+
+    def __iter__(self) -> Iterator[VideoMetadataView]:
+        for index in range(len(self)):
+            yield VideoMetadataView(self, index)
@@ -0,0 +1,408 @@
+"""Filename parsing for scanned video files.
+
+This module is also the entry point of the parse worker processes, so it
+must stay free of Qt imports.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from .models import MediaType
+
+YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+QUALITY_PATTERN = re.compile(
+    r"\b(480p|576p|720p|1080p|1440p|2160p|4k|8k|hdtv|webrip|web[- ]?dl|"
+    r"bluray|blu[- ]?ray|brrip|hdrip|dvdrip|dvdscr|remux|proper|repack|"
+    r"xvid|x264|x265|h\.264|h\.265|hevc|aac|ac3|dts|ddp5\.1|5\.1|7\.1|"
+    r"10bit|hdr|uhd|atm|dolby|truehd|limited|internal|sample)\b",
+    re.IGNORECASE,
+)
+BRACKET_CONTENT_PATTERN = re.compile(r"\[[^\]]*\]|\([^\)]*\)|\{[^\}]*\}")
+MULTISPACE_PATTERN = re.compile(r"\s+")
+EPISODE_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(r"(?i)\b[S](?P<season>\d{1,2})[.\s_-]*E(?P<episode>\d{1,2})\b"),
+    re.compile(r"(?i)\b(?P<season>\d{1,2})x(?P<episode>\d{1,2})\b"),
+    re.compile(
+        r"(?i)Season[.\s_-]*(?P<season>\d{1,2})[.\s_-]*"
+        r"(?:Episode|Ep)[.\s_-]*(?P<episode>\d{1,2})"
+    ),
+)
+SEPARATOR_PATTERN = re.compile(r"[._]+")
+DASH_PATTERN = re.compile(r"[-]+")
+
+DEFAULT_PARSER_CACHE_SIZE = 4096
+
+# Splitting on word runs yields separators at even and words at odd
+# indexes. Underscores count as separators, as in the reference normalisation.
+_WORD_SPLIT_PATTERN = re.compile(r"([^\W_]+)")
+_OPENING_BRACKETS = {"[": "]", "(": ")", "{": "}"}
+_BRACKET_CHARS = frozenset("[](){}")
+
+_SXE_PATTERN = re.compile(r"(?i)S(?P<season>\d{1,2})E(?P<episode>\d{1,2})")
+_SEASON_PATTERN = re.compile(r"(?i)S(?P<season>\d{1,2})")
+_EPISODE_PATTERN = re.compile(r"(?i)E(?P<episode>\d{1,2})")
+_NXN_PATTERN = re.compile(r"(?i)(?P<season>\d{1,2})x(?P<episode>\d{1,2})")
+
+_QUALITY_WORDS = frozenset(
+    "480p 576p 720p 1080p 1440p 2160p 4k 8k hdtv webrip webdl bluray brrip "
+    "hdrip dvdrip dvdscr remux proper repack xvid x264 x265 hevc aac ac3 dts "
+    "10bit hdr uhd atm dolby truehd limited internal sample".split()
+)
+# Two-word quality tags joined by a single "-" or " " (web-dl, blu ray).
+_QUALITY_PAIRS = {"web": "dl", "blu": "ray"}
+
+# Characters that case-fold onto ASCII letters under re.IGNORECASE but not
+# under str.lower(); names containing them use the reference parser.
+_CASEFOLD_HAZARDS = frozenset("\u0130\u0131\u017f\u212a")
+
+
+class ParsedName(NamedTuple):
+    """Fields extracted from a filename stem."""
+
+    title: str
+    media_type: MediaType
+    year: int | None
+    season: int | None
+    episode: int | None
+
+
+def reference_parse_stem(stem: str) -> ParsedName:
+    """Parse a stem with the original regex pipeline.
+
+    This is the reference implementation: :class:`FilenameParser` must
+    produce exactly the same result for every input.
+
+    Args:
+        stem: Filename without its extension
+
+    Returns:
+        ParsedName with the extracted fields
+    """
+    working_name = SEPARATOR_PATTERN.sub(" ", stem)
+
+    media_type = MediaType.MOVIE
+    season = None
+    episode = None
+
+    for pattern in EPISODE_PATTERNS:
+        match = pattern.search(working_name)
+        if match:
+            try:
+                season = int(match.group("season"))
+                episode = int(match.group("episode"))
+                media_type = MediaType.TV
+            except (TypeError, ValueError):
+                season = None
+                episode = None
+                media_type = MediaType.MOVIE
+            working_name = pattern.sub(" ", working_name, count=1)
+            break
+
+    year = _extract_year(working_name)
+    if year is not None:
+        working_name = working_name.replace(str(year), " ", 1)
+
+    title = _clean_title(working_name)
+    if not title:
+        title = SEPARATOR_PATTERN.sub(" ", stem).strip()
+
+    return ParsedName(title, media_type, year, season, episode)
+
+
+def _extract_year(name: str) -> int | None:
+    match = YEAR_PATTERN.search(name)
+    if match:
+        try:
+            return int(match.group(0))
+        except ValueError:
+            return None
+    return None
+
+
+def _clean_title(raw_title: str) -> str:
+    cleaned = BRACKET_CONTENT_PATTERN.sub(" ", raw_title)
+    cleaned = QUALITY_PATTERN.sub(" ", cleaned)
+    cleaned = DASH_PATTERN.sub(" ", cleaned)
+    cleaned = MULTISPACE_PATTERN.sub(" ", cleaned)
+    return cleaned.strip(" ._-")
+
+
+class FilenameParser:
+    """Single-pass tokenizing filename parser with a bounded LRU cache.
+
+    Each normalised stem is split into tokens once and the tokens are
+    classified as episode markers, years, quality tags and bracket groups,
+    instead of running a chain of regex substitutions over the whole name.
+    Names the tokenizer cannot classify with certainty (nested or unbalanced
+    brackets, "Season N Episode M" markers, ambiguous year positions) are
+    handed to :func:`reference_parse_stem`, whose output is authoritative.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_PARSER_CACHE_SIZE) -> None:
+        """Initialize the parser.
+
+        Args:
+            cache_size: Maximum number of stems kept in the LRU cache. 0 disables caching.
+        """
+        self._cache_size = cache_size
+        if cache_size > 0:
+            self._parse = lru_cache(maxsize=cache_size)(self._parse_uncached)
+        else:
+            self._parse = self._parse_uncached
+
+    def parse(self, stem: str) -> ParsedName:
+        """Parse a filename stem.
+
+        Args:
+            stem: Filename without its extension
+
+        Returns:
+            ParsedName with the extracted fields
+        """
+        return self._parse(stem)
+
+    def cache_info(self) -> dict[str, int]:
+        """Return hit, miss and size counters of the stem cache."""
+        info = getattr(self._parse, "cache_info", None)
+        if info is None:
+            return {"hits": 0, "misses": 0, "size": 0, "max_size": 0}
+        stats = info()
+        return {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "size": stats.currsize,
+            "max_size": self._cache_size,
+        }
+
+    def cache_clear(self) -> None:
+        """Drop all cached parse results."""
+        clear = getattr(self._parse, "cache_clear", None)
+        if clear is not None:
+            clear()
+
+    def _parse_uncached(self, stem: str) -> ParsedName:
+        if "season" in stem.lower() or (
+            not stem.isascii() and not _CASEFOLD_HAZARDS.isdisjoint(stem)
+        ):
+            return reference_parse_stem(stem)
+
+        parts = _WORD_SPLIT_PATTERN.split(stem)
+        count = len(parts)
+        plain = _BRACKET_CHARS.isdisjoint(stem)
+        # Without brackets the title is built in place while classifying.
+        pieces = parts[:] if plain else parts
+        sxe = None
+        nxn = None
+        year_position = None
+
+        position = 1
+        while position < count:
+            lowered = parts[position].lower()
+            if lowered in _QUALITY_WORDS:
+                if plain:
+                    pieces[position] = " "
+            elif lowered[0] == "s":
+                if sxe is None:
+                    sxe = _match_sxe(parts, position)
+            elif "x" in lowered:
+                if nxn is None:
+                    nxn = _match_nxn(parts[position], position)
+            elif len(lowered) == 4 and lowered[:2] in ("19", "20"):
+                if year_position is None and lowered[2:].isdecimal():
+                    year_position = position
+            elif (
+                plain
+                and lowered in _QUALITY_PAIRS
+                and position + 2 < count
+                and parts[position + 2].lower() == _QUALITY_PAIRS[lowered]
+                and SEPARATOR_PATTERN.sub(" ", parts[position + 1]) in ("-", " ")
+            ):
+                pieces[position] = " "
+                pieces[position + 1] = ""
+                pieces[position + 2] = ""
+                position += 2
+            position += 2
+
+        removed: dict[int, int] = {}
+        media_type = MediaType.MOVIE
+        season = None
+        episode = None
+        # SxxEyy anywhere in the name wins over NxM, as in the reference.
+        marker = sxe or nxn
+        if marker is not None:
+            first, last, season, episode = marker
+            media_type = MediaType.TV
+            removed[first] = last
+
+        year = None
+        if year_position is not None:
+            word = parts[year_position]
+            if not word.isascii():
+                return reference_parse_stem(stem)
+            # The reference removes the first occurrence of the digits, which
+            # may sit inside an earlier word.
+            for earlier in range(1, year_position, 2):
+                if word in parts[earlier]:
+                    return reference_parse_stem(stem)
+            year = int(word)
+            removed[year_position] = year_position
+
+        if plain:
+            for first, last in removed.items():
+                pieces[first] = " "
+                for cleared in range(first + 1, last + 1):
+                    pieces[cleared] = ""
+            title = _join_title(pieces)
+        else:
+            title = _build_title(parts, removed)
+            if title is None:
+                return reference_parse_stem(stem)
+        if not title:
+            title = SEPARATOR_PATTERN.sub(" ", stem).strip()
+        return ParsedName(title, media_type, year, season, episode)
+
+
+# Parsed fields sent back by parse worker processes:
+# (title, media type value, year, season, episode).
+ParsedRow = tuple[str, str, Optional[int], Optional[int], Optional[int]]
+
+_worker_parser: FilenameParser | None = None
+
+
+def parse_stem_chunk(stems: list[str]) -> list[ParsedRow]:
+    """Parse a chunk of stems inside a worker process."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = FilenameParser()
+    rows = []
+    for stem in stems:
+        parsed = _worker_parser.parse(stem)
+        rows.append(
+            (
+                parsed.title,
+                parsed.media_type.value,
+                parsed.year,
+                parsed.season,
+                parsed.episode,
+            )
+        )
+    return rows
+
+
+def _is_gap(separator: str) -> bool:
+    return (
+        separator.replace(".", " ").replace("_", " ").replace("-", " ").isspace()
+    )
+
+
+def _match_sxe(parts: list[str], position: int) -> tuple[int, int, int, int] | None:
+    word = parts[position]
+    match = _SXE_PATTERN.fullmatch(word)
+    if match:
+        return (
+            position,
+            position,
+            int(match.group("season")),
+            int(match.group("episode")),
+        )
+    # "S01 E02": season and episode split by separators only.
+    season_match = _SEASON_PATTERN.fullmatch(word)
+    if season_match and position + 2 < len(parts) and _is_gap(parts[position + 1]):
+        episode_match = _EPISODE_PATTERN.fullmatch(parts[position + 2])
+        if episode_match:
+            return (
+                position,
+                position + 2,
+                int(season_match.group("season")),
+                int(episode_match.group("episode")),
+            )
+    return None
+
+
+def _match_nxn(word: str, position: int) -> tuple[int, int, int, int] | None:
+    match = _NXN_PATTERN.fullmatch(word)
+    if match:
+        return (
+            position,
+            position,
+            int(match.group("season")),
+            int(match.group("episode")),
+        )
+    return None
+
+
+def _join_title(pieces: list[str]) -> str:
+    cleaned = "".join(pieces).replace(".", " ").replace("_", " ").replace("-", " ")
+    return " ".join(cleaned.split())
+
+
+def _build_title(parts: list[str], removed: dict[int, int]) -> str | None:
+    """Rebuild the title of a name with brackets.
+
+    Returns None for nested or unbalanced brackets, which only the reference
+    pipeline handles.
+    """
+    # Removed spans and whole bracket groups each collapse to one space, as
+    # in the reference before quality tags are stripped.
+    pieces: list[str] = []
+    word_pieces: list[int] = []
+    closing: str | None = None
+    count = len(parts)
+    position = 0
+    while position < count:
+        part = parts[position]
+        if position % 2:
+            if closing is None:
+                if position in removed:
+                    pieces.append(" ")
+                    position = removed[position] + 1
+                    continue
+                word_pieces.append(len(pieces))
+                pieces.append(part)
+        elif closing is None and _BRACKET_CHARS.isdisjoint(part):
+            pieces.append(part)
+        else:
+            start = 0
+            for index, char in enumerate(part):
+                if closing is not None:
+                    if char == closing:
+                        closing = None
+                        start = index + 1
+                    elif char in _BRACKET_CHARS:
+                        return None
+                elif char in _OPENING_BRACKETS:
+                    pieces.append(part[start:index])
+                    pieces.append(" ")
+                    closing = _OPENING_BRACKETS[char]
+                elif char in _BRACKET_CHARS:
+                    return None
+            if closing is None:
+                pieces.append(part[start:])
+        position += 1
+    if closing is not None:
+        return None
+
+    # Quality tags, including pairs such as "web-dl" that are separated by
+    # exactly one "-" or space once brackets are gone.
+    index = 0
+    while index < len(word_pieces):
+        piece = word_pieces[index]
+        lowered = pieces[piece].lower()
+        if lowered in _QUALITY_WORDS:
+            pieces[piece] = " "
+        elif lowered in _QUALITY_PAIRS and index + 1 < len(word_pieces):
+            following = word_pieces[index + 1]
+            between = SEPARATOR_PATTERN.sub(" ", "".join(pieces[piece + 1 : following]))
+            if between in ("-", " ") and (
+                pieces[following].lower() == _QUALITY_PAIRS[lowered]
+            ):
+                pieces[piece] = " "
+                for cleared in range(piece + 1, following + 1):
+                    pieces[cleared] = ""
+                index += 1
+        index += 1
+
+    return _join_title(pieces)
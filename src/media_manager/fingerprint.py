@@ -0,0 +1,490 @@
+"""Partial content fingerprints for detecting moved and renamed files."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+from sqlalchemy import bindparam, update
+from sqlmodel import select
+
+from .instrumentation import get_instrumentation
+from .logging import get_logger
+from .models import VideoMetadata
+from .persistence.database import DatabaseService, get_database_service
+from .persistence.models import MediaFile
+from .scan_index import RelinkedFile, ScanDelta
+
+logger_instance = get_logger()
+logger = logger_instance.get_logger(__name__)
+
+MIB = 1024 * 1024
+DEFAULT_SAMPLE_SIZE = 4 * MIB
+DEFAULT_FINGERPRINT_WORKERS = 2
+DEFAULT_MAX_BYTES_PER_SECOND = 64 * MIB
+DEFAULT_BACKFILL_BATCH_SIZE = 200
+
+# Keep IN clauses below SQLite's bound parameter limit.
+_QUERY_CHUNK_SIZE = 500
+
+
+class ThroughputLimiter:
+    """Pace reads so that all threads together stay below a byte rate."""
+
+    def __init__(self, bytes_per_second: int | None) -> None:
+        """Initialize the limiter.
+
+        Args:
+            bytes_per_second: Maximum read rate. None or 0 disables the cap.
+        """
+        self._rate = bytes_per_second or None
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def consume(self, size: int) -> None:
+        """Block until ``size`` bytes may be read."""
+        if self._rate is None or size <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot)
+            self._next_slot = start + size / self._rate
+        if start > now:
+            time.sleep(start - now)
+
+
+def compute_fingerprint(
+    path: Path | str,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    buffer: bytearray | None = None,
+    limiter: ThroughputLimiter | None = None,
+) -> str:
+    """Hash the size and the first and last ``sample_size`` bytes of a file.
+
+    Files up to twice the sample size are hashed completely. Reads go
+    through ``readinto`` on an unbuffered file, so a reused ``buffer``
+    avoids allocating per file.
+
+    Args:
+        path: File to fingerprint
+        sample_size: Bytes read from each end of the file
+        buffer: Scratch buffer of at least ``sample_size`` bytes
+        limiter: Optional throughput cap applied before each read
+
+    Returns:
+        Fingerprint string of the form ``"<size hex>-<digest hex>"``
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    if buffer is None or len(buffer) < sample_size:
+        buffer = bytearray(sample_size)
+    view = memoryview(buffer)
+    hasher = hashlib.blake2b(digest_size=16)
+
+    with open(path, "rb", buffering=0) as handle:
+        size = os.fstat(handle.fileno()).st_size
+        hasher.update(size.to_bytes(8, "little"))
+        if size <= 2 * sample_size:
+            _hash_range(handle, hasher, view[:sample_size], size, limiter)
+        else:
+            _hash_range(handle, hasher, view[:sample_size], sample_size, limiter)
+            handle.seek(size - sample_size)
+            _hash_range(handle, hasher, view[:sample_size], sample_size, limiter)
+
+    return f"{size:x}-{hasher.hexdigest()}"
+
+
+def fingerprint_size(fingerprint: str) -> int:
+    """Return the file size recorded in a fingerprint."""
+    return int(fingerprint.partition("-")[0], 16)
+
+
+def _hash_range(
+    handle,
+    hasher,
+    view: memoryview,
+    length: int,
+    limiter: ThroughputLimiter | None,
+) -> None:
+    remaining = length
+    while remaining > 0:
+        chunk = view[: min(len(view), remaining)]
+        if limiter is not None:
+            limiter.consume(len(chunk))
+        read = handle.readinto(chunk)
+        if not read:
+            break
+        hasher.update(chunk[:read])
+        remaining -= read
+
+
+class Fingerprinter:
+    """Compute fingerprints on a small, throughput-capped I/O pool.
+
+    The pool is deliberately narrow and shares one rate limiter, so
+    fingerprinting a large batch of new files does not saturate spinning
+    disks while scans or playback are running.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        max_workers: int = DEFAULT_FINGERPRINT_WORKERS,
+        max_bytes_per_second: int | None = DEFAULT_MAX_BYTES_PER_SECOND,
+    ) -> None:
+        """Initialize the fingerprinter.
+
+        Args:
+            sample_size: Bytes hashed from each end of a file
+            max_workers: Number of files read concurrently
+            max_bytes_per_second: Combined read rate cap. None disables it.
+        """
+        self._sample_size = max(1, sample_size)
+        self._max_workers = max(1, max_workers)
+        self._limiter = ThroughputLimiter(max_bytes_per_second)
+        self._buffers = threading.local()
+
+    def fingerprint(self, path: Path) -> str | None:
+        """Fingerprint a single file, returning None if it cannot be read."""
+        buffer = getattr(self._buffers, "buffer", None)
+        if buffer is None:
+            buffer = bytearray(self._sample_size)
+            self._buffers.buffer = buffer
+        try:
+            return compute_fingerprint(path, self._sample_size, buffer, self._limiter)
+        except OSError as exc:
+            logger.debug("Cannot fingerprint %s: %s", path, exc)
+            return None
+
+    def fingerprint_many(
+        self, paths: Iterable[Path]
+    ) -> Iterator[tuple[Path, str | None]]:
+        """Fingerprint files on the I/O pool, yielding results in input order.
+
+        At most twice the worker count of files are in flight at once.
+
+        Args:
+            paths: Files to fingerprint
+
+        Yields:
+            Tuples of path and fingerprint (None if unreadable)
+        """
+        instrumentation = get_instrumentation()
+        started = time.perf_counter()
+        count = 0
+
+        if self._max_workers == 1:
+            for path in paths:
+                count += 1
+                yield path, self.fingerprint(path)
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="fingerprint"
+            )
+            pending: deque[tuple[Path, Future[str | None]]] = deque()
+            try:
+                for path in paths:
+                    pending.append((path, executor.submit(self.fingerprint, path)))
+                    if len(pending) >= self._max_workers * 2:
+                        queued_path, future = pending.popleft()
+                        count += 1
+                        yield queued_path, future.result()
+                while pending:
+                    queued_path, future = pending.popleft()
+                    count += 1
+                    yield queued_path, future.result()
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        if count:
+            instrumentation.record_timer(
+                "fingerprint.fingerprint_many", time.perf_counter() - started
+            )
+            instrumentation.increment_counter("fingerprint.files", count)
+
+
+class FingerprintService:
+    """Relink moved or renamed files to their existing media items.
+
+    Added files of a scan delta whose size matches a stored ``MediaFile``
+    are fingerprinted and looked up among the stored fingerprints. A match
+    whose recorded path was removed in the same delta, or no longer exists,
+    is treated as a move: the ``MediaFile`` row is updated in place and the
+    file is reported as relinked instead of added, so it never reaches
+    provider matching. Stored fingerprints are written on ingest or by a
+    background :meth:`start_backfill` pass.
+    """
+
+    def __init__(
+        self,
+        database_service: Optional[DatabaseService] = None,
+        fingerprinter: Optional[Fingerprinter] = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            database_service: Optional database service instance
+            fingerprinter: Fingerprinter to use. Defaults to one with default limits.
+        """
+        self._db_service = database_service or get_database_service()
+        self._fingerprinter = fingerprinter or Fingerprinter()
+        self._backfill_lock = threading.Lock()
+        self._backfill_thread: threading.Thread | None = None
+
+    def relink(self, delta: ScanDelta) -> list[RelinkedFile]:
+        """Move relinked files from ``delta.added`` to ``delta.relinked``.
+
+        The matching entries of ``delta.removed`` are dropped as well. Only
+        added files whose size equals that of a fingerprinted ``MediaFile``
+        are hashed, so a delta of genuinely new files reads no file content.
+        Sizes come from ``delta.discovered`` when the scan recorded them;
+        other added files are stat'ed here.
+
+        Args:
+            delta: Scan delta to update in place
+
+        Returns:
+            The files that were relinked
+        """
+        if not delta.added:
+            return []
+
+        with self._db_service.get_session() as session:
+            existing_paths = self._load_existing_paths(
+                session, [str(metadata.path) for metadata in delta.added]
+            )
+            sizes: dict[str, int] = {}
+            for metadata in delta.added:
+                path = str(metadata.path)
+                if path in existing_paths:
+                    continue
+                discovered = delta.discovered.get(path)
+                if discovered is not None and discovered.size is not None:
+                    sizes[path] = discovered.size
+                    continue
+                try:
+                    sizes[path] = os.stat(path).st_size
+                except OSError:
+                    continue
+            tracked_sizes = self._load_tracked_sizes(session, list(set(sizes.values())))
+        hash_paths = [Path(path) for path, size in sizes.items() if size in tracked_sizes]
+        if not hash_paths:
+            return []
+
+        fingerprints = {
+            str(path): fingerprint
+            for path, fingerprint in self._fingerprinter.fingerprint_many(hash_paths)
+            if fingerprint is not None
+        }
+        if not fingerprints:
+            return []
+
+        removed_by_path = {str(metadata.path): metadata for metadata in delta.removed}
+        relinked: list[RelinkedFile] = []
+        relinked_paths: set[str] = set()
+        relinked_previous: set[str] = set()
+        now = datetime.utcnow()
+
+        with self._db_service.get_session() as session:
+            candidates = self._load_by_fingerprint(session, list(fingerprints.values()))
+
+            for metadata in delta.added:
+                path = str(metadata.path)
+                fingerprint = fingerprints.get(path)
+                if fingerprint is None:
+                    continue
+                for media_file in candidates.get(fingerprint, ()):
+                    previous_path = media_file.path
+                    if previous_path in relinked_previous:
+                        continue
+                    if previous_path not in removed_by_path and os.path.exists(
+                        previous_path
+                    ):
+                        # Both copies exist: a duplicate, not a move.
+                        continue
+                    media_file.path = path
+                    media_file.filename = metadata.path.name
+                    media_file.updated_at = now
+                    session.add(media_file)
+                    previous = removed_by_path.get(previous_path) or VideoMetadata(
+                        path=Path(previous_path),
+                        title=metadata.title,
+                        media_type=metadata.media_type,
+                        year=metadata.year,
+                        season=metadata.season,
+                        episode=metadata.episode,
+                    )
+                    relinked.append(
+                        RelinkedFile(previous, metadata, media_file.media_item_id)
+                    )
+                    relinked_paths.add(path)
+                    relinked_previous.add(previous_path)
+                    break
+            session.commit()
+
+        if relinked:
+            delta.added = [
+                metadata
+                for metadata in delta.added
+                if str(metadata.path) not in relinked_paths
+            ]
+            delta.removed = [
+                metadata
+                for metadata in delta.removed
+                if str(metadata.path) not in relinked_previous
+            ]
+            delta.relinked.extend(relinked)
+            get_instrumentation().increment_counter("fingerprint.relinked", len(relinked))
+            logger.info("Relinked %d moved files by fingerprint", len(relinked))
+        return relinked
+
+    def backfill(self, limit: int = 1000) -> int:
+        """Compute missing fingerprints for stored media files.
+
+        Args:
+            limit: Maximum number of files to fingerprint in this call
+
+        Returns:
+            Number of fingerprints stored
+        """
+        stored, _ = self._backfill_batch(limit, after_id=0)
+        return stored
+
+    def start_backfill(
+        self, batch_size: int = DEFAULT_BACKFILL_BATCH_SIZE
+    ) -> threading.Thread:
+        """Fingerprint every stored media file that lacks one, in the background.
+
+        Files are visited once in ID order, so unreadable files are skipped
+        rather than retried. Calling this while a pass is running returns the
+        running thread.
+
+        Args:
+            batch_size: Files read from the database and hashed per batch
+
+        Returns:
+            The backfill thread
+        """
+        with self._backfill_lock:
+            if self._backfill_thread is not None and self._backfill_thread.is_alive():
+                return self._backfill_thread
+            thread = threading.Thread(
+                target=self._run_backfill,
+                args=(max(1, batch_size),),
+                name="fingerprint-backfill",
+                daemon=True,
+            )
+            self._backfill_thread = thread
+            thread.start()
+            return thread
+
+    def _run_backfill(self, batch_size: int) -> None:
+        after_id = 0
+        total = 0
+        try:
+            while True:
+                stored, last_id = self._backfill_batch(batch_size, after_id)
+                total += stored
+                if last_id is None:
+                    break
+                after_id = last_id
+        except Exception as exc:  # pragma: no cover - safeguard logging
+            logger.error("Fingerprint backfill failed: %s", exc)
+        if total:
+            logger.info("Backfilled %d media file fingerprints", total)
+
+    def _backfill_batch(self, limit: int, after_id: int) -> tuple[int, int | None]:
+        """Fingerprint one batch of files with an ID above ``after_id``.
+
+        The file content is read outside any transaction.
+
+        Returns:
+            Number of fingerprints stored and the last ID visited, or None
+            if no files were left
+        """
+        with self._db_service.get_session() as session:
+            rows = session.exec(
+                select(MediaFile.id, MediaFile.path)
+                .where(
+                    MediaFile.fingerprint.is_(None),  # type: ignore[union-attr]
+                    MediaFile.id > after_id,
+                )
+                .order_by(MediaFile.id)
+                .limit(limit)
+            ).all()
+        if not rows:
+            return 0, None
+
+        ids_by_path = {path: file_id for file_id, path in rows}
+        values = [
+            {
+                "file_id": ids_by_path[str(path)],
+                "fingerprint": fingerprint,
+                "file_size": fingerprint_size(fingerprint),
+            }
+            for path, fingerprint in self._fingerprinter.fingerprint_many(
+                Path(path) for path in ids_by_path
+            )
+            if fingerprint is not None
+        ]
+        if values:
+            with self._db_service.get_session() as session:
+                session.connection().execute(
+                    update(MediaFile)
+                    .where(MediaFile.id == bindparam("file_id"))
+                    .values(
+                        fingerprint=bindparam("fingerprint"),
+                        file_size=bindparam("file_size"),
+                    ),
+                    values,
+                )
+                session.commit()
+        return len(values), rows[-1][0]
+
+    def _load_tracked_sizes(self, session, sizes: Sequence[int]) -> set[int]:
+        """Sizes among ``sizes`` that a fingerprinted media file has."""
+        tracked: set[int] = set()
+        for start in range(0, len(sizes), _QUERY_CHUNK_SIZE):
+            chunk = sizes[start : start + _QUERY_CHUNK_SIZE]
+            tracked.update(
+                session.exec(
+                    select(MediaFile.file_size)
+                    .where(
+                        MediaFile.file_size.in_(chunk),  # type: ignore[attr-defined]
+                        MediaFile.fingerprint.is_not(None),  # type: ignore[union-attr]
+                    )
+                    .distinct()
+                ).all()
+            )
+        return tracked
+
+    def _load_by_fingerprint(
+        self, session, fingerprints: Sequence[str]
+    ) -> dict[str, list[MediaFile]]:
+        candidates: dict[str, list[MediaFile]] = {}
+        unique = sorted(set(fingerprints))
+        for start in range(0, len(unique), _QUERY_CHUNK_SIZE):
+            chunk = unique[start : start + _QUERY_CHUNK_SIZE]
+            rows = session.exec(
+                select(MediaFile).where(MediaFile.fingerprint.in_(chunk))  # type: ignore[union-attr]
+            ).all()
+            for media_file in rows:
+                candidates.setdefault(media_file.fingerprint, []).append(media_file)
+        return candidates
+
+    def _load_existing_paths(self, session, paths: Sequence[str]) -> set[str]:
+        existing: set[str] = set()
+        for start in range(0, len(paths), _QUERY_CHUNK_SIZE):
+            chunk = paths[start : start + _QUERY_CHUNK_SIZE]
+            existing.update(
+                session.exec(select(MediaFile.path).where(MediaFile.path.in_(chunk))).all()
+            )
+        return existing
@@ -0,0 +1,356 @@
+"""Bulk ingest of scan and match results into MediaItem/MediaFile rows."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, Union
+
+from sqlalchemy import bindparam, delete, func, insert, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, select
+
+from .fingerprint import Fingerprinter, fingerprint_size
+from .instrumentation import get_instrumentation
+from .logging import get_logger
+from .models import MediaMatch, VideoMetadata
+from .persistence.database import DatabaseService, get_database_service
+from .persistence.models import ExternalId, MediaFile, MediaItem
+
+logger_instance = get_logger()
+logger = logger_instance.get_logger(__name__)
+
+# Items per transaction. MediaItem rows have 12 columns, so a chunk stays well
+# below SQLite's bound parameter limit.
+DEFAULT_INGEST_CHUNK_SIZE = 500
+
+IngestItem = Union[VideoMetadata, MediaMatch]
+
+
+def _is_match(item: IngestItem) -> bool:
+    """Whether an item is a match, including ``CompactMediaMatch``."""
+    return hasattr(item, "metadata")
+
+
+@dataclass
+class IngestResult:
+    """Counts from a bulk ingest."""
+
+    inserted: int = 0
+    updated: int = 0
+    duplicates: int = 0
+    chunks: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of distinct files written."""
+        return self.inserted + self.updated
+
+
+class IngestService:
+    """Write batches of scan results with bulk statements.
+
+    Files are keyed by ``MediaFile.path``: a path seen before updates its
+    existing item and file, a new path gets a new item and file. Each chunk
+    is one transaction that resolves existing paths with one ``IN (...)``
+    query, inserts new items with one executemany ``RETURNING`` their IDs,
+    and upserts every file in one statement. With a fingerprinter, files
+    without a stored fingerprint are hashed before their chunk's transaction
+    so moved files can be relinked later.
+    """
+
+    def __init__(
+        self,
+        database_service: Optional[DatabaseService] = None,
+        chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE,
+        fingerprinter: Optional[Fingerprinter] = None,
+    ) -> None:
+        """Initialize the ingest service.
+
+        Args:
+            database_service: Optional database service instance
+            chunk_size: Items written per transaction
+            fingerprinter: Optional fingerprinter for new media files
+        """
+        self._db_service = database_service or get_database_service()
+        self._chunk_size = max(1, chunk_size)
+        self._fingerprinter = fingerprinter
+        self._instrumentation = get_instrumentation()
+
+    def ingest(
+        self,
+        library_id: int,
+        items: Iterable[IngestItem],
+        file_sizes: Optional[Mapping[str, int]] = None,
+    ) -> IngestResult:
+        """Insert or update media items and files for scan results.
+
+        Args:
+            library_id: Library the items belong to
+            items: Scanned metadata, or matches carrying provider details
+            file_sizes: Optional file sizes in bytes keyed by path string
+
+        Returns:
+            Counts of inserted, updated and duplicate items
+        """
+        result = IngestResult()
+        sizes = file_sizes or {}
+        for chunk in self._chunks(items):
+            rows = self._dedupe(chunk, result)
+            fingerprints = self._fingerprint_chunk(rows)
+            with self._instrumentation.timer("ingest.chunk"):
+                with self._db_service.get_session() as session:
+                    self._write_chunk(
+                        session, library_id, rows, sizes, fingerprints, result
+                    )
+                    session.commit()
+            result.chunks += 1
+
+        self._instrumentation.increment_counter("ingest.items_inserted", result.inserted)
+        self._instrumentation.increment_counter("ingest.items_updated", result.updated)
+        logger.info(
+            f"Ingested {result.total} files into library {library_id}: "
+            f"{result.inserted} new, {result.updated} updated, {result.duplicates} duplicates"
+        )
+        return result
+
+    def _chunks(self, items: Iterable[IngestItem]) -> Iterator[list[IngestItem]]:
+        chunk: list[IngestItem] = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= self._chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _fingerprint_chunk(self, rows: Mapping[str, IngestItem]) -> dict[str, str]:
+        """Fingerprint the files of a chunk that have no stored fingerprint."""
+        if self._fingerprinter is None:
+            return {}
+        with self._db_service.get_session() as session:
+            known = set(
+                session.exec(
+                    select(MediaFile.path).where(
+                        MediaFile.path.in_(list(rows)),
+                        MediaFile.fingerprint.is_not(None),  # type: ignore[union-attr]
+                    )
+                ).all()
+            )
+        return {
+            str(path): fingerprint
+            for path, fingerprint in self._fingerprinter.fingerprint_many(
+                Path(path) for path in rows if path not in known
+            )
+            if fingerprint is not None
+        }
+
+    @staticmethod
+    def _dedupe(chunk: Sequence[IngestItem], result: IngestResult) -> dict[str, IngestItem]:
+        """Key a chunk by path; a later item for the same path wins."""
+        rows: dict[str, IngestItem] = {}
+        for item in chunk:
+            metadata = item.metadata if _is_match(item) else item
+            rows[str(metadata.path)] = item
+        result.duplicates += len(chunk) - len(rows)
+        return rows
+
+    def _write_chunk(
+        self,
+        session: Session,
+        library_id: int,
+        rows: dict[str, IngestItem],
+        sizes: Mapping[str, int],
+        fingerprints: Mapping[str, str],
+        result: IngestResult,
+    ) -> None:
+        now = datetime.utcnow()
+        existing = dict(
+            session.exec(
+                select(MediaFile.path, MediaFile.media_item_id).where(
+                    MediaFile.path.in_(list(rows))
+                )
+            ).all()
+        )
+
+        new_paths = [path for path in rows if path not in existing]
+        item_ids = dict(existing)
+        if new_paths:
+            new_ids = self._insert_items(
+                session,
+                [self._item_values(rows[path], library_id, now) for path in new_paths],
+            )
+            item_ids.update(zip(new_paths, new_ids))
+
+        if existing:
+            session.connection().execute(
+                update(MediaItem)
+                .where(MediaItem.id == bindparam("item_id"))
+                .values(
+                    title=bindparam("title"),
+                    media_type=bindparam("media_type"),
+                    year=bindparam("year"),
+                    season=bindparam("season"),
+                    episode=bindparam("episode"),
+                    # Provider details are only bound for matched items; an
+                    # unmatched rescan keeps the stored values.
+                    description=func.coalesce(
+                        bindparam("b_description"), MediaItem.description
+                    ),
+                    runtime=func.coalesce(bindparam("b_runtime"), MediaItem.runtime),
+                    aired_date=func.coalesce(
+                        bindparam("b_aired_date"), MediaItem.aired_date
+                    ),
+                    updated_at=bindparam("updated_at"),
+                ),
+                [
+                    {
+                        "item_id": existing[path],
+                        **self._identity_values(rows[path]),
+                        **{
+                            f"b_{key}": value
+                            for key, value in self._details_values(rows[path]).items()
+                        },
+                        "updated_at": now,
+                    }
+                    for path in existing
+                ],
+            )
+        self._upsert_external_ids(session, existing, rows, item_ids, now)
+
+        file_rows = []
+        for path in rows:
+            fingerprint = fingerprints.get(path)
+            file_size = sizes.get(path, 0)
+            if not file_size and fingerprint is not None:
+                file_size = fingerprint_size(fingerprint)
+            file_rows.append(
+                {
+                    "media_item_id": item_ids[path],
+                    "path": path,
+                    "filename": Path(path).name,
+                    "file_size": file_size,
+                    "fingerprint": fingerprint,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        table = MediaFile.__table__
+        statement = sqlite_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=["path"],
+            set_={
+                "filename": statement.excluded.filename,
+                # An unknown size or fingerprint keeps the stored one.
+                "file_size": func.coalesce(
+                    func.nullif(statement.excluded.file_size, 0), table.c.file_size
+                ),
+                "fingerprint": func.coalesce(
+                    statement.excluded.fingerprint, table.c.fingerprint
+                ),
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+        session.connection().execute(statement, file_rows)
+
+        result.inserted += len(new_paths)
+        result.updated += len(existing)
+
+    @staticmethod
+    def _insert_items(session: Session, values: list[dict[str, Any]]) -> list[int]:
+        """Insert media items and return their IDs in input order."""
+        connection = session.connection()
+        if connection.dialect.insert_executemany_returning_sort_by_parameter_order:
+            returned = connection.execute(
+                insert(MediaItem.__table__).returning(
+                    MediaItem.__table__.c.id, sort_by_parameter_order=True
+                ),
+                values,
+            )
+            return list(returned.scalars())
+        # SQLite before 3.35 has no RETURNING.
+        return [
+            connection.execute(insert(MediaItem.__table__), row).inserted_primary_key[0]
+            for row in values
+        ]
+
+    @staticmethod
+    def _upsert_external_ids(
+        session: Session,
+        existing: Mapping[str, int],
+        rows: Mapping[str, IngestItem],
+        item_ids: Mapping[str, int],
+        now: datetime,
+    ) -> None:
+        """Write the provider ID of each matched item, replacing a stored one."""
+        external_rows = [
+            {
+                "media_item_id": item_ids[path],
+                "source": item.source,
+                "external_id": item.external_id,
+                "created_at": now,
+            }
+            for path, item in rows.items()
+            if _is_match(item) and item.external_id and item.source
+        ]
+        if not external_rows:
+            return
+        connection = session.connection()
+        existing_ids = set(existing.values())
+        replaced = [
+            {"b_item_id": row["media_item_id"], "b_source": row["source"]}
+            for row in external_rows
+            if row["media_item_id"] in existing_ids
+        ]
+        if replaced:
+            connection.execute(
+                delete(ExternalId).where(
+                    ExternalId.media_item_id == bindparam("b_item_id"),
+                    ExternalId.source == bindparam("b_source"),
+                ),
+                replaced,
+            )
+        connection.execute(insert(ExternalId.__table__), external_rows)
+
+    @staticmethod
+    def _identity_values(item: IngestItem) -> dict[str, Any]:
+        """Title, type, year and episode numbers, preferring matched values."""
+        if _is_match(item):
+            metadata = item.metadata
+            title = (item.is_matched() and item.matched_title) or metadata.title
+            year = (item.is_matched() and item.matched_year) or metadata.year
+        else:
+            metadata = item
+            title, year = metadata.title, metadata.year
+        return {
+            "title": title,
+            "media_type": metadata.media_type.value,
+            "year": year,
+            "season": metadata.season,
+            "episode": metadata.episode,
+        }
+
+    @staticmethod
+    def _details_values(item: IngestItem) -> dict[str, Any]:
+        """Provider description, runtime and air date of a matched item."""
+        if _is_match(item) and item.is_matched():
+            return {
+                "description": item.overview,
+                "runtime": item.runtime,
+                "aired_date": item.aired_date,
+            }
+        return {"description": None, "runtime": None, "aired_date": None}
+
+    def _item_values(
+        self, item: IngestItem, library_id: int, now: datetime
+    ) -> dict[str, Any]:
+        return {
+            "library_id": library_id,
+            **self._identity_values(item),
+            **self._details_values(item),
+            "genres": None,
+            "rating": None,
+            "created_at": now,
+            "updated_at": now,
+        }
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from collections import defaultdict
 from contextlib import contextmanager
@@ -88,6 +89,36 @@ class CounterMetrics:
         }
 
 
+@dataclass
+class GaugeMetrics:
+    """Metrics for a gauge (a value that goes up and down)."""
+
+    name: str
+    value: float = 0.0
+    min_value: float = float("inf")
+    max_value: float = float("-inf")
+    last_timestamp: Optional[datetime] = None
+
+    def set(self, value: float) -> None:
+        """Set the current value."""
+        self.value = value
+        self.min_value = min(self.min_value, value)
+        self.max_value = max(self.max_value, value)
+        self.last_timestamp = datetime.utcnow()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "value": self.value,
+            "min_value": self.min_value if self.min_value != float("inf") else 0.0,
+            "max_value": self.max_value if self.max_value != float("-inf") else 0.0,
+            "last_timestamp": self.last_timestamp.isoformat()
+            if self.last_timestamp
+            else None,
+        }
+
+
 class Instrumentation:
     """Central instrumentation for performance monitoring."""
 
@@ -95,7 +126,10 @@ class Instrumentation:
         """Initialize instrumentation."""
         self.timers: Dict[str, TimerMetrics] = {}
         self.counters: Dict[str, CounterMetrics] = {}
+        self.gauges: Dict[str, GaugeMetrics] = {}
         self._enabled = True
+        # Metrics are recorded from worker threads as well as the GUI thread.
+        self._lock = threading.Lock()
 
     def enable(self) -> None:
         """Enable instrumentation."""
@@ -137,10 +171,11 @@ class Instrumentation:
         if not self._enabled:
             return
 
-        if name not in self.timers:
-            self.timers[name] = TimerMetrics(name=name)
+        with self._lock:
+            if name not in self.timers:
+                self.timers[name] = TimerMetrics(name=name)
 
-        self.timers[name].record(duration)
+            self.timers[name].record(duration)
 
         # Log slow operations
         if duration > 1.0:  # > 1 second
@@ -159,10 +194,27 @@ class Instrumentation:
         if not self._enabled:
             return
 
-        if name not in self.counters:
-            self.counters[name] = CounterMetrics(name=name)
+        with self._lock:
+            if name not in self.counters:
+                self.counters[name] = CounterMetrics(name=name)
+
+            self.counters[name].increment(value, metadata)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set the current value of a gauge.
+
+        Args:
+            name: Gauge name
+            value: Current value
+        """
+        if not self._enabled:
+            return
+
+        with self._lock:
+            if name not in self.gauges:
+                self.gauges[name] = GaugeMetrics(name=name)
 
-        self.counters[name].increment(value, metadata)
+            self.gauges[name].set(value)
 
     def get_timer_metrics(self, name: str) -> Optional[TimerMetrics]:
         """Get metrics for a specific timer.
@@ -186,18 +238,31 @@ class Instrumentation:
         """
         return self.counters.get(name)
 
+    def get_gauge_metrics(self, name: str) -> Optional[GaugeMetrics]:
+        """Get metrics for a specific gauge.
+
+        Args:
+            name: Gauge name
+
+        Returns:
+            Gauge metrics or None
+        """
+        return self.gauges.get(name)
+
     def get_all_metrics(self) -> dict[str, Any]:
         """Get all metrics.
 
         Returns:
             Dictionary with all metrics
         """
-        return {
-            "timers": {name: timer.to_dict() for name, timer in self.timers.items()},
-            "counters": {
-                name: counter.to_dict() for name, counter in self.counters.items()
-            },
-        }
+        with self._lock:
+            return {
+                "timers": {name: timer.to_dict() for name, timer in self.timers.items()},
+                "counters": {
+                    name: counter.to_dict() for name, counter in self.counters.items()
+                },
+                "gauges": {name: gauge.to_dict() for name, gauge in self.gauges.items()},
+            }
 
     def get_summary(self) -> str:
         """Get a human-readable summary of metrics.
@@ -206,10 +271,14 @@ class Instrumentation:
             Summary string
         """
         lines = ["=== Performance Metrics Summary ===", ""]
+        with self._lock:
+            timers = sorted(self.timers.items())
+            counters = sorted(self.counters.items())
+            gauges = sorted(self.gauges.items())
 
-        if self.timers:
+        if timers:
             lines.append("Timers:")
-            for name, timer in sorted(self.timers.items()):
+            for name, timer in timers:
                 lines.append(
                     f"  {name}: "
                     f"count={timer.count}, "
@@ -219,18 +288,31 @@ class Instrumentation:
                 )
             lines.append("")
 
-        if self.counters:
+        if counters:
             lines.append("Counters:")
-            for name, counter in sorted(self.counters.items()):
+            for name, counter in counters:
                 lines.append(f"  {name}: count={counter.count}")
             lines.append("")
 
+        if gauges:
+            lines.append("Gauges:")
+            for name, gauge in gauges:
+                lines.append(
+                    f"  {name}: "
+                    f"value={gauge.value:g}, "
+                    f"min={gauge.min_value:g}, "
+                    f"max={gauge.max_value:g}"
+                )
+            lines.append("")
+
         return "\n".join(lines)
 
     def reset(self) -> None:
         """Reset all metrics."""
-        self.timers.clear()
-        self.counters.clear()
+        with self._lock:
+            self.timers.clear()
+            self.counters.clear()
+            self.gauges.clear()
         logger.info("Instrumentation metrics reset")
 
     def export_to_log(self) -> None:
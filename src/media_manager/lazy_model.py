@@ -8,7 +8,7 @@ from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal, Slot
 
 from .instrumentation import get_instrumentation
 from .logging import get_logger
-from .persistence.repositories import MediaItemRepository
+from .persistence.repositories import MediaItemCursor, MediaItemRepository
 
 logger_instance = get_logger()
 logger = logger_instance.get_logger(__name__)
@@ -174,6 +174,8 @@ class LazyMediaItemModel(LazyListModel):
         page_size: int = 100,
         prefetch_threshold: int = 20,
         library_id: Optional[int] = None,
+        sort_by: str = "title",
+        descending: bool = False,
     ) -> None:
         """Initialize lazy media item model.
 
@@ -182,9 +184,14 @@ class LazyMediaItemModel(LazyListModel):
             page_size: Number of items to load per page
             prefetch_threshold: Number of items from end to trigger prefetch
             library_id: Optional library ID to filter by
+            sort_by: Sort key, as accepted by MediaItemRepository
+            descending: Sort in descending order
         """
         super().__init__(parent, page_size, prefetch_threshold)
         self.library_id = library_id
+        self.sort_by = sort_by
+        self.descending = descending
+        self._cursor: Optional[MediaItemCursor] = None
         self._repository = MediaItemRepository()
 
         # Connect load signal to loading function
@@ -202,25 +209,50 @@ class LazyMediaItemModel(LazyListModel):
             self._load_total_count()
             self.fetchMore()
 
+    def set_sort(self, sort_by: str, descending: bool = False) -> None:
+        """Set the sort order and reload from the first page.
+
+        Args:
+            sort_by: Sort key, as accepted by MediaItemRepository
+            descending: Sort in descending order
+        """
+        if (self.sort_by, self.descending) != (sort_by, descending):
+            self.clear()
+            self.sort_by = sort_by
+            self.descending = descending
+            self._load_total_count()
+            self.fetchMore()
+
+    def clear(self) -> None:
+        """Clear all items and restart paging from the first page."""
+        super().clear()
+        self._cursor = None
+
     @Slot()
     def _load_next_page(self) -> None:
         """Load the next page of items."""
         try:
             with self._instrumentation.timer("lazy_media_model.load_page"):
+                # Seek from the last loaded item instead of an offset, so a
+                # page deep into a large library costs the same as the first.
+                page_options = {
+                    "limit": self.page_size,
+                    "after": self._cursor,
+                    "sort_by": self.sort_by,
+                    "descending": self.descending,
+                    "lazy_load": True,  # Use lazy loading for better performance
+                }
                 if self.library_id is not None:
                     items = self._repository.get_by_library(
-                        self.library_id,
-                        limit=self.page_size,
-                        offset=self._current_offset,
-                        lazy_load=True,  # Use lazy loading for better performance
+                        self.library_id, **page_options
                     )
                 else:
-                    items = self._repository.get_all(
-                        limit=self.page_size,
-                        offset=self._current_offset,
-                        lazy_load=True,
-                    )
+                    items = self._repository.get_all(**page_options)
 
+                if items:
+                    self._cursor = MediaItemCursor.after(
+                        items[-1], self.sort_by, self.descending
+                    )
                 self.append_items(items)
                 logger.debug(
                     f"Loaded page: offset={self._current_offset}, "
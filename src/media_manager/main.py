@@ -1,5 +1,6 @@
 """Main entry point for the media manager application."""
 
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -12,7 +13,8 @@ from media_manager import (
 )
 from media_manager.logging import get_logger, setup_logging
 from media_manager.main_window import MainWindow
-from media_manager.persistence.database import init_database_service
+from media_manager.performance_utils import setup_cache_backend
+from media_manager.persistence.database import SQLiteProfile, init_database_service
 from media_manager.services import get_service_registry
 from media_manager.settings import get_settings
 
@@ -46,12 +48,19 @@ def main() -> int:
         settings = get_settings()
 
         # Initialize database service
-        db_service = init_database_service(settings.get_database_url())
+        db_service = init_database_service(
+            settings.get_database_url(),
+            sqlite_profile=SQLiteProfile.from_overrides(settings.get_sqlite_profile_overrides()),
+            read_pool_size=settings.get_database_read_pool_size(),
+        )
 
         # Register database service in service registry
         service_registry = get_service_registry()
         service_registry.register("DatabaseService", db_service)
 
+        # Build the provider cache from the cache settings before any provider runs
+        setup_cache_backend()
+
         # Create main window
         main_window = MainWindow(settings)
         main_window.setWindowTitle(APP_DISPLAY_NAME)
@@ -68,4 +77,6 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Frozen builds re-run this script in parse worker processes.
+    multiprocessing.freeze_support()
     sys.exit(main())
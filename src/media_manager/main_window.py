@@ -19,6 +19,7 @@ from PySide6.QtWidgets import (
 
 from . import APP_DISPLAY_NAME, __version__
 from .batch_operations_dialog import BatchOperationsDialog
+from .cache_service import get_cache_service
 from .dashboard_widget import DashboardWidget
 from .detail_panel import DetailPanel
 from .help_center_dialog import HelpCenterDialog
@@ -574,6 +575,8 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event: Any) -> None:
         """Handle window close event."""
         self._save_window_state()
+        # Persist buffered provider cache hit counts
+        get_cache_service().flush_hits()
         self._logger.info("Main window closing")
         super().closeEvent(event)
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from PySide6.QtCore import QObject, Signal, Slot
 
+from .compact_models import CompactMediaMatch, CompactVideoMetadata
 from .library_postprocessor import PostProcessingOptions, PostProcessingSummary
 from .logging import get_logger
 from .models import MediaMatch, PosterType, SearchRequest, SearchResult, VideoMetadata
@@ -34,9 +35,13 @@ class MatchManager(QObject):
         self._current_match: MediaMatch | None = None
 
     def add_metadata(self, metadata_list: list[VideoMetadata]) -> None:
-        """Add metadata items to be matched."""
+        """Add metadata items to be matched.
+
+        Queue entries use the slotted compact models so large scans keep a
+        small per-item footprint.
+        """
         for metadata in metadata_list:
-            match = MediaMatch(metadata=metadata)
+            match = CompactMediaMatch(CompactVideoMetadata.from_metadata(metadata))
             self._matches.append(match)
 
         self.matches_updated.emit(list(self._matches))
@@ -5,9 +5,11 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING, Optional
 
+from .cache_codec import DEFAULT_CODEC, get_codec
 from .cache_service import (
     CacheService,
     DiskCacheBackend,
+    FileCacheBackend,
     RedisBackend,
     get_cache_service,
     initialize_cache_service,
@@ -70,16 +72,30 @@ def setup_cache_backend() -> Optional[CacheService]:
         else:
             logger.warning("Disk backend selected but no directory configured")
 
+    if backend is None:
+        # Compact, size-bounded file store between memory and the database
+        backend = FileCacheBackend(
+            max_bytes=settings.get_provider_cache_max_mb() * 1024 * 1024
+        )
+
+    codec_name = settings.get_provider_cache_codec()
+    try:
+        codec = get_codec(codec_name)
+    except KeyError:
+        logger.warning(f"Cache codec {codec_name!r} is not available, using {DEFAULT_CODEC}")
+        codec = get_codec(DEFAULT_CODEC)
+
     # Initialize cache service
     cache_service = initialize_cache_service(
         backend=backend,
         default_ttl=ttl,
         use_db_cache=True,  # Always use DB as fallback
+        codec=codec,
     )
 
     logger.info(
         f"Cache service initialized: backend={backend_type}, ttl={ttl}s, "
-        f"use_db_cache=True"
+        f"codec={codec.name}, use_db_cache=True"
     )
 
     return cache_service
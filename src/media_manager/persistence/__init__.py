@@ -1,6 +1,6 @@
 """Persistence layer for media manager."""
 
-from .database import DatabaseService, get_database_service, init_database_service
+from .database import DatabaseService, SQLiteProfile, get_database_service, init_database_service
 from .models import (
     Artwork,
     Collection,
@@ -14,6 +14,10 @@ from .models import (
     MediaFile,
     MediaItem,
     Person,
+    ScanCheckpoint,
+    ScanCheckpointEntry,
+    ScanDirectoryEntry,
+    ScanFileEntry,
     Subtitle,
     Tag,
     Trailer,
@@ -22,6 +26,7 @@ from .repositories import Repository, RepositoryManager, UnitOfWork
 
 __all__ = [
     "DatabaseService",
+    "SQLiteProfile",
     "get_database_service",
     "init_database_service",
     "Library",
@@ -39,6 +44,10 @@ __all__ = [
     "Favorite",
     "HistoryEvent",
     "JobRun",
+    "ScanCheckpoint",
+    "ScanCheckpointEntry",
+    "ScanDirectoryEntry",
+    "ScanFileEntry",
     "Repository",
     "RepositoryManager",
     "UnitOfWork",
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import os
+import sqlite3
+import threading
+import weakref
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+from urllib.parse import quote
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import ArgumentError
+from sqlalchemy.pool import QueuePool
 from sqlmodel import SQLModel, Session, create_engine as sm_create_engine
 
 from media_manager.logging import get_logger
@@ -16,6 +23,139 @@ logger_instance = get_logger()
 logger = logger_instance.get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """Pragmas applied to every new SQLite connection.
+
+    WAL lets readers keep going while a background job writes, and
+    ``synchronous=NORMAL`` is durable in WAL mode except for the last
+    transactions before a power loss. Any field set to None is left at the
+    SQLite default.
+    """
+
+    journal_mode: Optional[str] = "WAL"
+    synchronous: Optional[str] = "NORMAL"
+    cache_size_kib: Optional[int] = 64 * 1024  # Page cache per connection
+    mmap_size: Optional[int] = 256 * 1024 * 1024
+    temp_store: Optional[str] = "MEMORY"
+    busy_timeout_ms: Optional[int] = 5000
+
+    @classmethod
+    def from_overrides(cls, overrides: dict[str, Any]) -> SQLiteProfile:
+        """Build the default profile with some fields replaced.
+
+        Unknown field names are logged and ignored.
+        """
+        known = {name: value for name, value in overrides.items() if name in cls.__dataclass_fields__}
+        for name in overrides.keys() - known.keys():
+            logger.warning(f"Ignoring unknown SQLite profile setting: {name}")
+        return cls(**known)
+
+    def pragmas(self, read_only: bool = False) -> list[str]:
+        """PRAGMA statements for this profile, in the order they are applied.
+
+        Args:
+            read_only: Build the statements for a read-only connection, which
+                leaves journaling to the writer and refuses writes
+        """
+        statements = []
+        if self.busy_timeout_ms is not None:
+            # First, so the journal mode switch waits for other connections.
+            statements.append(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        if read_only:
+            statements.append("PRAGMA query_only=ON")
+        else:
+            if self.journal_mode is not None:
+                statements.append(f"PRAGMA journal_mode={self.journal_mode}")
+            if self.synchronous is not None:
+                statements.append(f"PRAGMA synchronous={self.synchronous}")
+        if self.cache_size_kib is not None:
+            # Negative values are a size in KiB rather than a page count.
+            statements.append(f"PRAGMA cache_size={-int(self.cache_size_kib)}")
+        if self.mmap_size is not None:
+            statements.append(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        if self.temp_store is not None:
+            statements.append(f"PRAGMA temp_store={self.temp_store}")
+        return statements
+
+
+DEFAULT_SQLITE_PROFILE = SQLiteProfile()
+
+# SQLite's own settings: rollback journal, full sync, default page cache.
+SQLITE_DEFAULTS_PROFILE = SQLiteProfile(
+    journal_mode=None,
+    synchronous=None,
+    cache_size_kib=None,
+    mmap_size=None,
+    temp_store=None,
+    busy_timeout_ms=None,
+)
+
+
+# Statements that never take SQLite's write lock.
+_READ_STATEMENT_PREFIXES = ("SELECT", "PRAGMA", "EXPLAIN")
+
+
+class _WriteLock:
+    """Write lock that is reentrant per thread.
+
+    Holders release it with the owner token returned by :meth:`acquire`, so
+    the finalizer of a session dropped without ``close()`` can release it
+    from whichever thread runs garbage collection.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._owner: Optional[int] = None
+        self._count = 0
+
+    def acquire(self) -> int:
+        """Block until the calling thread holds the lock; return the owner token."""
+        owner = threading.get_ident()
+        with self._condition:
+            while self._owner not in (None, owner):
+                self._condition.wait()
+            self._owner = owner
+            self._count += 1
+        return owner
+
+    def release(self, owner: int) -> None:
+        """Release one hold taken by ``owner``."""
+        with self._condition:
+            if self._owner != owner or not self._count:
+                return
+            self._count -= 1
+            if not self._count:
+                self._owner = None
+                self._condition.notify_all()
+
+
+class _SerializedSession(Session):
+    """Session whose writes hold the owning service's write lock.
+
+    The lock is taken before the first statement that writes and released
+    when the transaction ends, so read-only sessions never wait for it.
+    """
+
+
+@event.listens_for(_SerializedSession, "after_begin")
+def _track_write_connection(session: Session, transaction: Any, connection: Any) -> None:
+    connection.info["serialized_session"] = weakref.ref(session)
+    session.info["write_connection_info"] = connection.info
+
+
+@event.listens_for(_SerializedSession, "after_transaction_end")
+def _release_write_lock(session: Session, transaction: Any) -> None:
+    if transaction.parent is not None:
+        return
+    connection_info = session.info.pop("write_connection_info", None)
+    if connection_info is not None:
+        connection_info.pop("serialized_session", None)
+    release = session.info.pop("write_lock_release", None)
+    if release is not None:
+        release()
+
+
 class DatabaseService:
     """Service for managing database connections and operations."""
 
@@ -24,6 +164,8 @@ class DatabaseService:
         database_url: str,
         auto_migrate: bool = True,
         alembic_ini_path: Optional[Path] = None,
+        sqlite_profile: SQLiteProfile = DEFAULT_SQLITE_PROFILE,
+        read_pool_size: int = 0,
     ) -> None:
         """Initialize database service.
 
@@ -31,24 +173,120 @@ class DatabaseService:
             database_url: SQLAlchemy database URL
             auto_migrate: Whether to automatically run migrations on init
             alembic_ini_path: Optional path to the Alembic configuration file
+            sqlite_profile: Pragmas applied to each SQLite connection
+            read_pool_size: Read-only connections kept for ``get_read_session``.
+                0 serves reads and writes from one engine. Only SQLite
+                database files can be split.
         """
         self.database_url = database_url
         self.auto_migrate = auto_migrate
         default_alembic_path = Path(__file__).parent / "alembic.ini"
         self.alembic_ini_path = Path(alembic_ini_path) if alembic_ini_path else default_alembic_path
+        self.sqlite_profile = sqlite_profile
+        self.read_pool_size = read_pool_size
         self._engine: Optional[Engine] = None
+        self._read_engine: Optional[Engine] = None
+        self._sqlite_path = self._sqlite_file_path(database_url)
+        self._write_lock = _WriteLock()
+        self._engine_lock = threading.Lock()
+
+    @staticmethod
+    def _sqlite_file_path(database_url: str) -> Optional[Path]:
+        """Path of the SQLite database file, or None for other databases."""
+        try:
+            url = make_url(database_url)
+        except ArgumentError:
+            # Reported when the engine is created.
+            return None
+        if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+            return None
+        return Path(url.database).resolve()
+
+    @property
+    def split_read_write(self) -> bool:
+        """Whether reads use a separate read-only pool and writes are serialized."""
+        return self.read_pool_size > 0 and self._sqlite_path is not None
 
     @property
     def engine(self) -> Engine:
         """Get or create the database engine."""
         if self._engine is None:
+            is_sqlite = "sqlite" in self.database_url
             self._engine = sm_create_engine(
                 self.database_url,
                 echo=False,
-                connect_args={"check_same_thread": False} if "sqlite" in self.database_url else {},
+                connect_args={"check_same_thread": False} if is_sqlite else {},
             )
+            if is_sqlite:
+                event.listen(self._engine, "connect", self._apply_sqlite_profile)
+            if self.split_read_write:
+                event.listen(self._engine, "before_cursor_execute", self._lock_before_write)
         return self._engine
 
+    def _lock_before_write(
+        self,
+        connection: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Take the write lock for a serialized session's first write."""
+        session_ref = connection.info.get("serialized_session")
+        session = session_ref() if session_ref is not None else None
+        if session is None or "write_lock_release" in session.info:
+            return
+        if statement.lstrip().upper().startswith(_READ_STATEMENT_PREFIXES):
+            return
+        owner = self._write_lock.acquire()
+        # Called on commit, rollback or close, or when the session is collected.
+        session.info["write_lock_release"] = weakref.finalize(
+            session, self._write_lock.release, owner
+        )
+
+    @property
+    def read_engine(self) -> Engine:
+        """Get or create the engine behind ``get_read_session``.
+
+        In split mode this is a pool of read-only connections (``mode=ro``
+        and ``query_only``) to the same file; otherwise it is ``engine``.
+        """
+        if not self.split_read_write:
+            return self.engine
+        with self._engine_lock:
+            if self._read_engine is None:
+                # The writer creates the file and switches it to WAL first.
+                with self.engine.connect():
+                    pass
+                uri = f"file:{quote(self._sqlite_path.as_posix())}?mode=ro"
+                self._read_engine = create_engine(
+                    "sqlite://",
+                    creator=lambda: sqlite3.connect(uri, uri=True, check_same_thread=False),
+                    poolclass=QueuePool,
+                    pool_size=self.read_pool_size,
+                    max_overflow=self.read_pool_size,
+                )
+                event.listen(self._read_engine, "connect", self._apply_read_only_profile)
+        return self._read_engine
+
+    def _apply_sqlite_profile(self, dbapi_connection: Any, connection_record: Any) -> None:
+        """Run the profile's pragmas on a new SQLite connection."""
+        self._run_pragmas(dbapi_connection, self.sqlite_profile.pragmas())
+
+    def _apply_read_only_profile(self, dbapi_connection: Any, connection_record: Any) -> None:
+        """Run the profile's read-only pragmas on a new reader connection."""
+        self._run_pragmas(dbapi_connection, self.sqlite_profile.pragmas(read_only=True))
+
+    @staticmethod
+    def _run_pragmas(dbapi_connection: Any, statements: list[str]) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
     def create_all(self) -> None:
         """Create all database tables."""
         try:
@@ -98,11 +336,31 @@ class DatabaseService:
             raise
 
     def get_session(self) -> Session:
-        """Create a new database session."""
+        """Create a new database session.
+
+        In split mode writes are serialized with every other ``get_session``
+        transaction, so background writers queue for the database instead of
+        failing on SQLite's lock. The lock is taken at a transaction's first
+        write and released when it commits, rolls back or is closed; sessions
+        that only read never wait for it.
+        """
+        if self.split_read_write:
+            return _SerializedSession(self.engine)
         return Session(self.engine)
 
+    def get_read_session(self) -> Session:
+        """Create a session for queries that never write.
+
+        In split mode it uses the read-only pool, so views and stats keep
+        reading while a writer holds the lock.
+        """
+        return Session(self.read_engine)
+
     def close(self) -> None:
-        """Close the database engine."""
+        """Close the database engines."""
+        if self._read_engine is not None:
+            self._read_engine.dispose()
+            self._read_engine = None
         if self._engine is not None:
             self._engine.dispose()
             self._engine = None
@@ -113,12 +371,19 @@ class DatabaseService:
 _database_service: Optional[DatabaseService] = None
 
 
-def init_database_service(database_url: Optional[str] = None, auto_migrate: bool = True) -> DatabaseService:
+def init_database_service(
+    database_url: Optional[str] = None,
+    auto_migrate: bool = True,
+    sqlite_profile: SQLiteProfile = DEFAULT_SQLITE_PROFILE,
+    read_pool_size: int = 0,
+) -> DatabaseService:
     """Initialize the global database service.
 
     Args:
         database_url: SQLAlchemy database URL. If None, defaults to ~/.media-manager/media_manager.db
         auto_migrate: Whether to automatically run migrations
+        sqlite_profile: Pragmas applied to each SQLite connection
+        read_pool_size: Read-only connections for views and stats; 0 disables the split
 
     Returns:
         Initialized DatabaseService instance
@@ -130,7 +395,12 @@ def init_database_service(database_url: Optional[str] = None, auto_migrate: bool
         db_dir.mkdir(parents=True, exist_ok=True)
         database_url = f"sqlite:///{db_dir / 'media_manager.db'}"
 
-    _database_service = DatabaseService(database_url, auto_migrate)
+    _database_service = DatabaseService(
+        database_url,
+        auto_migrate,
+        sqlite_profile=sqlite_profile,
+        read_pool_size=read_pool_size,
+    )
     _database_service.initialize()
 
     return _database_service
@@ -0,0 +1,71 @@
+"""Add directory and file signature tables for incremental scans.
+
+Revision ID: 003_add_scan_index
+Revises: 002_add_tags_favorites
+Create Date: 2024-01-03 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003_add_scan_index'
+down_revision = '002_add_tags_favorites'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add scan index tables."""
+
+    # Create scandirectoryentry table
+    op.create_table(
+        'scandirectoryentry',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('root', sa.String(), nullable=False),
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('parent', sa.String(), nullable=True),
+        sa.Column('mtime_ns', sa.Integer(), nullable=False),
+        sa.Column('config_key', sa.String(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('root', 'path')
+    )
+    op.create_index('ix_scandirectoryentry_root', 'scandirectoryentry', ['root'])
+    op.create_index('ix_scandirectoryentry_path', 'scandirectoryentry', ['path'])
+    op.create_index('ix_scandirectoryentry_parent', 'scandirectoryentry', ['parent'])
+
+    # Create scanfileentry table
+    op.create_table(
+        'scanfileentry',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('root', sa.String(), nullable=False),
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('directory', sa.String(), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('mtime_ns', sa.Integer(), nullable=False),
+        sa.Column('inode', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('root', 'path')
+    )
+    op.create_index('ix_scanfileentry_root', 'scanfileentry', ['root'])
+    op.create_index('ix_scanfileentry_path', 'scanfileentry', ['path'])
+    op.create_index('ix_scanfileentry_directory', 'scanfileentry', ['directory'])
+
+
+def downgrade() -> None:
+    """Remove scan index tables."""
+
+    # Drop scanfileentry table
+    op.drop_index('ix_scanfileentry_directory', 'scanfileentry')
+    op.drop_index('ix_scanfileentry_path', 'scanfileentry')
+    op.drop_index('ix_scanfileentry_root', 'scanfileentry')
+    op.drop_table('scanfileentry')
+
+    # Drop scandirectoryentry table
+    op.drop_index('ix_scandirectoryentry_parent', 'scandirectoryentry')
+    op.drop_index('ix_scandirectoryentry_path', 'scandirectoryentry')
+    op.drop_index('ix_scandirectoryentry_root', 'scandirectoryentry')
+    op.drop_table('scandirectoryentry')
@@ -0,0 +1,30 @@
+"""Add content fingerprint column to media files.
+
+Revision ID: 004_add_file_fingerprint
+Revises: 003_add_scan_index
+Create Date: 2024-01-04 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004_add_file_fingerprint'
+down_revision = '003_add_scan_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add fingerprint column and index to mediafile."""
+    with op.batch_alter_table('mediafile') as batch_op:
+        batch_op.add_column(sa.Column('fingerprint', sa.String(), nullable=True))
+    op.create_index('ix_mediafile_fingerprint', 'mediafile', ['fingerprint'])
+
+
+def downgrade() -> None:
+    """Remove fingerprint column from mediafile."""
+    op.drop_index('ix_mediafile_fingerprint', 'mediafile')
+    with op.batch_alter_table('mediafile') as batch_op:
+        batch_op.drop_column('fingerprint')
@@ -0,0 +1,59 @@
+"""Add tables for checkpointed, resumable scans.
+
+Revision ID: 005_add_scan_checkpoints
+Revises: 004_add_file_fingerprint
+Create Date: 2024-01-05 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_add_scan_checkpoints'
+down_revision = '004_add_file_fingerprint'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add scan checkpoint tables."""
+
+    # Create scancheckpoint table
+    op.create_table(
+        'scancheckpoint',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_run_id', sa.Integer(), nullable=False),
+        sa.Column('config_key', sa.String(), nullable=False),
+        sa.Column('frontier', sa.String(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['job_run_id'], ['jobrun.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_scancheckpoint_job_run_id', 'scancheckpoint', ['job_run_id'], unique=True)
+    op.create_index('ix_scancheckpoint_config_key', 'scancheckpoint', ['config_key'])
+
+    # Create scancheckpointentry table
+    op.create_table(
+        'scancheckpointentry',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_run_id', sa.Integer(), nullable=False),
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('media_type', sa.String(), nullable=False),
+        sa.Column('year', sa.Integer(), nullable=True),
+        sa.Column('season', sa.Integer(), nullable=True),
+        sa.Column('episode', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['job_run_id'], ['jobrun.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_scancheckpointentry_job_run_id', 'scancheckpointentry', ['job_run_id'])
+
+
+def downgrade() -> None:
+    """Remove scan checkpoint tables."""
+    op.drop_index('ix_scancheckpointentry_job_run_id', 'scancheckpointentry')
+    op.drop_table('scancheckpointentry')
+    op.drop_index('ix_scancheckpoint_config_key', 'scancheckpoint')
+    op.drop_index('ix_scancheckpoint_job_run_id', 'scancheckpoint')
+    op.drop_table('scancheckpoint')
@@ -0,0 +1,46 @@
+"""Store provider cache responses as binary codec payloads.
+
+Revision ID: 006_binary_provider_cache
+Revises: 005_add_scan_checkpoints
+Create Date: 2024-01-06 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006_binary_provider_cache'
+down_revision = '005_add_scan_checkpoints'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Change providercache.response_data to a binary column.
+
+    Existing JSON text rows are kept as they are; the cache service still
+    decodes them.
+    """
+    with op.batch_alter_table('providercache') as batch_op:
+        batch_op.alter_column(
+            'response_data',
+            existing_type=sa.String(),
+            type_=sa.LargeBinary(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Change providercache.response_data back to text.
+
+    Binary entries can't be read as JSON text, so the cache is emptied.
+    """
+    op.execute('DELETE FROM providercache')
+    with op.batch_alter_table('providercache') as batch_op:
+        batch_op.alter_column(
+            'response_data',
+            existing_type=sa.LargeBinary(),
+            type_=sa.String(),
+            existing_nullable=False,
+        )
@@ -0,0 +1,97 @@
+"""Add denormalized media item counts to libraries.
+
+Revision ID: 007_library_item_counts
+Revises: 006_binary_provider_cache
+Create Date: 2024-01-07 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_library_item_counts'
+down_revision = '006_binary_provider_cache'
+branch_labels = None
+depends_on = None
+
+
+COUNT_TRIGGERS = {
+    'mediaitem_count_insert': """
+        CREATE TRIGGER mediaitem_count_insert
+        AFTER INSERT ON mediaitem
+        BEGIN
+            UPDATE library SET
+                item_count = item_count + 1,
+                movie_count = movie_count + (NEW.media_type = 'movie'),
+                tv_count = tv_count + (NEW.media_type = 'tv')
+            WHERE id = NEW.library_id;
+        END
+    """,
+    'mediaitem_count_delete': """
+        CREATE TRIGGER mediaitem_count_delete
+        AFTER DELETE ON mediaitem
+        BEGIN
+            UPDATE library SET
+                item_count = item_count - 1,
+                movie_count = movie_count - (OLD.media_type = 'movie'),
+                tv_count = tv_count - (OLD.media_type = 'tv')
+            WHERE id = OLD.library_id;
+        END
+    """,
+    'mediaitem_count_update': """
+        CREATE TRIGGER mediaitem_count_update
+        AFTER UPDATE OF library_id, media_type ON mediaitem
+        BEGIN
+            UPDATE library SET
+                item_count = item_count - 1,
+                movie_count = movie_count - (OLD.media_type = 'movie'),
+                tv_count = tv_count - (OLD.media_type = 'tv')
+            WHERE id = OLD.library_id;
+            UPDATE library SET
+                item_count = item_count + 1,
+                movie_count = movie_count + (NEW.media_type = 'movie'),
+                tv_count = tv_count + (NEW.media_type = 'tv')
+            WHERE id = NEW.library_id;
+        END
+    """,
+}
+
+
+def upgrade() -> None:
+    """Add library count columns, backfill them and install the triggers."""
+    with op.batch_alter_table('library') as batch_op:
+        for column in ('item_count', 'movie_count', 'tv_count'):
+            batch_op.add_column(
+                sa.Column(column, sa.Integer(), nullable=False, server_default='0')
+            )
+
+    op.execute(
+        """
+        UPDATE library SET
+            item_count = (
+                SELECT COUNT(*) FROM mediaitem WHERE mediaitem.library_id = library.id
+            ),
+            movie_count = (
+                SELECT COUNT(*) FROM mediaitem
+                WHERE mediaitem.library_id = library.id AND mediaitem.media_type = 'movie'
+            ),
+            tv_count = (
+                SELECT COUNT(*) FROM mediaitem
+                WHERE mediaitem.library_id = library.id AND mediaitem.media_type = 'tv'
+            )
+        """
+    )
+
+    for statement in COUNT_TRIGGERS.values():
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop the count triggers and columns."""
+    for name in COUNT_TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name}')
+
+    with op.batch_alter_table('library') as batch_op:
+        for column in ('tv_count', 'movie_count', 'item_count'):
+            batch_op.drop_column(column)
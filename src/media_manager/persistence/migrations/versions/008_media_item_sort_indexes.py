@@ -0,0 +1,39 @@
+"""Add indexes for keyset paging of media items by every sort key.
+
+Revision ID: 008_media_item_sort_indexes
+Revises: 007_library_item_counts
+Create Date: 2024-01-08 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008_media_item_sort_indexes'
+down_revision = '007_library_item_counts'
+branch_labels = None
+depends_on = None
+
+
+# ix_mediaitem_library_title and ix_mediaitem_library_year come from 001, and
+# title and year already have single-column indexes.
+SORT_INDEXES = {
+    'ix_mediaitem_library_rating': ['library_id', 'rating'],
+    'ix_mediaitem_library_created_at': ['library_id', 'created_at'],
+    'ix_mediaitem_library_runtime': ['library_id', 'runtime'],
+    'ix_mediaitem_rating': ['rating'],
+    'ix_mediaitem_created_at': ['created_at'],
+    'ix_mediaitem_runtime': ['runtime'],
+}
+
+
+def upgrade() -> None:
+    """Add the sort indexes."""
+    for name, columns in SORT_INDEXES.items():
+        op.create_index(name, 'mediaitem', columns)
+
+
+def downgrade() -> None:
+    """Remove the sort indexes."""
+    for name in SORT_INDEXES:
+        op.drop_index(name, 'mediaitem')
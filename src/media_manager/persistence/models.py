@@ -3,6 +3,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import DDL, Index, UniqueConstraint, event
+from sqlalchemy.engine import Connection, Engine
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -45,6 +47,11 @@ class Library(SQLModel, table=True):
     default_destination: Optional[str] = None  # Default path for processed files
     color: Optional[str] = None  # UI color for library identification
 
+    # Denormalized media item counts, maintained by the mediaitem triggers below
+    item_count: int = Field(default=0)
+    movie_count: int = Field(default=0)
+    tv_count: int = Field(default=0)
+
     # Relationships
     media_items: list["MediaItem"] = Relationship(back_populates="library")
     job_runs: list["JobRun"] = Relationship(back_populates="library")
@@ -53,6 +60,17 @@ class Library(SQLModel, table=True):
 class MediaItem(SQLModel, table=True):
     """Media item (movie or TV show) in a library."""
 
+    # Per-library indexes for every MediaItemRepository sort key. SQLite
+    # appends the rowid (id) to each index entry, so these also serve the
+    # (sort value, id) keyset seek.
+    __table_args__ = (
+        Index("ix_mediaitem_library_title", "library_id", "title"),
+        Index("ix_mediaitem_library_year", "library_id", "year"),
+        Index("ix_mediaitem_library_rating", "library_id", "rating"),
+        Index("ix_mediaitem_library_created_at", "library_id", "created_at"),
+        Index("ix_mediaitem_library_runtime", "library_id", "runtime"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     library_id: int = Field(foreign_key="library.id", index=True)
     title: str = Field(index=True)
@@ -60,10 +78,10 @@ class MediaItem(SQLModel, table=True):
     year: Optional[int] = Field(index=True)
     description: Optional[str] = None
     genres: Optional[str] = None
-    runtime: Optional[int] = None
+    runtime: Optional[int] = Field(default=None, index=True)
     aired_date: Optional[str] = None
-    rating: Optional[float] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    rating: Optional[float] = Field(default=None, index=True)
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     # For TV episodes
@@ -96,6 +114,7 @@ class MediaFile(SQLModel, table=True):
     path: str = Field(unique=True, index=True)
     filename: str
     file_size: int
+    fingerprint: Optional[str] = Field(default=None, index=True)  # Partial content hash
     duration: Optional[int] = None
     container: Optional[str] = None
     video_codec: Optional[str] = None
@@ -311,8 +330,121 @@ class ProviderCache(SQLModel, table=True):
     provider_name: str = Field(index=True)  # "tmdb", "tvdb", etc.
     query_type: str = Field(index=True)  # "search_movie", "search_tv", "get_details"
     query_params: str  # JSON-serialized query parameters
-    response_data: str  # JSON-serialized response
+    response_data: bytes  # Response encoded by a cache_codec codec
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
     expires_at: datetime = Field(index=True)  # TTL expiration
     hit_count: int = Field(default=0)  # Track cache hits
     last_accessed: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+
+class ScanDirectoryEntry(SQLModel, table=True):
+    """Directory signature recorded by incremental scans."""
+
+    __table_args__ = (UniqueConstraint("root", "path"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    root: str = Field(index=True)  # Scan root the directory belongs to
+    path: str = Field(index=True)
+    parent: Optional[str] = Field(default=None, index=True)
+    mtime_ns: int
+    config_key: str  # Hash of the ScanConfig filters used when listing
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ScanFileEntry(SQLModel, table=True):
+    """File signature (size, mtime, inode) recorded by incremental scans."""
+
+    __table_args__ = (UniqueConstraint("root", "path"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    root: str = Field(index=True)
+    path: str = Field(index=True)
+    directory: str = Field(index=True)
+    size: int
+    mtime_ns: int
+    inode: int
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ScanCheckpoint(SQLModel, table=True):
+    """Walk frontier of a checkpointed scan, one row per scan job."""
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    job_run_id: int = Field(foreign_key="jobrun.id", unique=True, index=True)
+    config_key: str = Field(index=True)  # Hash of the roots and ScanConfig filters
+    frontier: str  # JSON array of directories still to be listed
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ScanCheckpointEntry(SQLModel, table=True):
+    """Parsed result persisted by a checkpointed scan."""
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    job_run_id: int = Field(foreign_key="jobrun.id", index=True)
+    path: str
+    title: str
+    media_type: str
+    year: Optional[int] = None
+    season: Optional[int] = None
+    episode: Optional[int] = None
+
+
+# Keep Library.item_count, movie_count and tv_count in step with mediaitem so
+# per-library counts are a primary-key lookup instead of a table scan.
+# Migration 007 installs the same triggers on existing databases.
+LIBRARY_COUNT_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS mediaitem_count_insert
+    AFTER INSERT ON mediaitem
+    BEGIN
+        UPDATE library SET
+            item_count = item_count + 1,
+            movie_count = movie_count + (NEW.media_type = 'movie'),
+            tv_count = tv_count + (NEW.media_type = 'tv')
+        WHERE id = NEW.library_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS mediaitem_count_delete
+    AFTER DELETE ON mediaitem
+    BEGIN
+        UPDATE library SET
+            item_count = item_count - 1,
+            movie_count = movie_count - (OLD.media_type = 'movie'),
+            tv_count = tv_count - (OLD.media_type = 'tv')
+        WHERE id = OLD.library_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS mediaitem_count_update
+    AFTER UPDATE OF library_id, media_type ON mediaitem
+    BEGIN
+        UPDATE library SET
+            item_count = item_count - 1,
+            movie_count = movie_count - (OLD.media_type = 'movie'),
+            tv_count = tv_count - (OLD.media_type = 'tv')
+        WHERE id = OLD.library_id;
+        UPDATE library SET
+            item_count = item_count + 1,
+            movie_count = movie_count + (NEW.media_type = 'movie'),
+            tv_count = tv_count + (NEW.media_type = 'tv')
+        WHERE id = NEW.library_id;
+    END
+    """,
+)
+
+for _trigger in LIBRARY_COUNT_TRIGGERS:
+    event.listen(
+        MediaItem.__table__,
+        "after_create",
+        DDL(_trigger).execute_if(dialect="sqlite"),
+    )
+
+
+def library_counters_maintained(bind: "Engine | Connection") -> bool:
+    """Return True if the library item counters are kept by triggers.
+
+    The triggers are only installed on SQLite; other databases must count
+    media items directly.
+    """
+    return bind.dialect.name == "sqlite"
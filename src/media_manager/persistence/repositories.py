@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any, Generator, Generic, List, Optional, Type, TypeVar
 
+from sqlalchemy import and_, func, tuple_, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select
 from sqlalchemy.orm import selectinload
 
 from media_manager.logging import get_logger
 from .database import get_database_service
-from .models import Library, MediaItem, MediaFile, Artwork, Credit, Person
+from .models import (
+    Library,
+    MediaItem,
+    MediaFile,
+    Artwork,
+    Credit,
+    Person,
+    library_counters_maintained,
+)
 
 logger_instance = get_logger()
 logger = logger_instance.get_logger(__name__)
@@ -149,8 +159,8 @@ class Repository(Generic[T]):
             Total number of entities
         """
         try:
-            statement = select(self.entity_type)
-            return len(self.session.exec(statement).all())
+            statement = select(func.count()).select_from(self.entity_type)
+            return self.session.exec(statement).one()
         except SQLAlchemyError as e:
             logger.error(f"Failed to count {self.entity_type.__name__}: {e}")
             raise
@@ -266,21 +276,21 @@ class LibraryRepository:
     
     def get_all(self) -> List[Library]:
         """Get all libraries."""
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             statement = select(Library).order_by(Library.name)
             result = session.exec(statement)
             return list(result.all())
     
     def get_active(self) -> List[Library]:
         """Get all active libraries."""
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             statement = select(Library).where(Library.is_active == True).order_by(Library.name)
             result = session.exec(statement)
             return list(result.all())
     
     def get_by_id(self, library_id: int) -> Optional[Library]:
         """Get library by ID."""
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             statement = select(Library).where(Library.id == library_id)
             result = session.exec(statement)
             return result.first()
@@ -312,11 +322,78 @@ class LibraryRepository:
             return True
     
     def count_items(self, library_id: int) -> int:
-        """Count media items in a library."""
+        """Count media items in a library.
+
+        Reads the library's denormalized counter where triggers maintain it,
+        so the cost doesn't grow with the library.
+        """
+        with self._db_service.get_read_session() as session:
+            return _count_library_items(session, library_id)
+
+    def rebuild_item_counts(self) -> None:
+        """Recompute every library's item counters from the media items.
+
+        The counters are kept current by triggers; this repairs them after
+        rows were changed with the triggers absent.
+        """
+
+        def count_where(*conditions: Any) -> Any:
+            return (
+                select(func.count(MediaItem.id))
+                .where(MediaItem.library_id == Library.id, *conditions)
+                .scalar_subquery()
+            )
+
         with self._db_service.get_session() as session:
-            statement = select(MediaItem).where(MediaItem.library_id == library_id)
-            result = session.exec(statement)
-            return len(list(result.all()))
+            session.execute(
+                update(Library).values(
+                    item_count=count_where(),
+                    movie_count=count_where(MediaItem.media_type == "movie"),
+                    tv_count=count_where(MediaItem.media_type == "tv"),
+                )
+            )
+            session.commit()
+
+
+# Sort keys accepted by MediaItemRepository paging, named as in SearchCriteria.sort_by
+MEDIA_ITEM_SORT_COLUMNS = {
+    "title": MediaItem.title,
+    "year": MediaItem.year,
+    "rating": MediaItem.rating,
+    "added": MediaItem.created_at,
+    "runtime": MediaItem.runtime,
+}
+
+
+@dataclass(frozen=True)
+class MediaItemCursor:
+    """Keyset position just after an item in a sorted listing.
+
+    Pages that start from a cursor seek straight to ``(sort value, id)``
+    in an index, so deep pages cost the same as the first one.
+    """
+
+    sort_by: str
+    value: Any
+    item_id: int
+    descending: bool = False
+
+    @classmethod
+    def after(
+        cls, item: MediaItem, sort_by: str = "title", descending: bool = False
+    ) -> MediaItemCursor:
+        """Build the cursor that continues a listing after ``item``.
+
+        Args:
+            item: Last item of the current page
+            sort_by: Sort key of the listing
+            descending: Whether the listing is in descending order
+
+        Returns:
+            Cursor for the next page
+        """
+        value = getattr(item, MEDIA_ITEM_SORT_COLUMNS[sort_by].key)
+        return cls(sort_by, value, item.id, descending)
 
 
 class MediaItemRepository:
@@ -331,72 +408,120 @@ class MediaItemRepository:
         self._logger = logger
         self._db_service = database_service or get_database_service()
     
-    def get_all(self, limit: Optional[int] = None, offset: int = 0, lazy_load: bool = False) -> List[MediaItem]:
+    def get_all(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        lazy_load: bool = False,
+        after: Optional[MediaItemCursor] = None,
+        sort_by: str = "title",
+        descending: bool = False,
+    ) -> List[MediaItem]:
         """Get all media items with optional pagination and lazy loading.
 
         Args:
             limit: Maximum number of items to return (None for all)
-            offset: Number of items to skip
+            offset: Number of items to skip; ignored when ``after`` is given
             lazy_load: If True, don't eagerly load relationships
+            after: Cursor of the previous page's last item
+            sort_by: Sort key, one of ``MEDIA_ITEM_SORT_COLUMNS``
+            descending: Sort in descending order
 
         Returns:
             List of media items
         """
-        with self._db_service.get_session() as session:
-            statement = select(MediaItem)
-            
-            if not lazy_load:
-                statement = statement.options(
-                    selectinload(MediaItem.files),
-                    selectinload(MediaItem.artworks),
-                    selectinload(MediaItem.credits).selectinload(Credit.person),
-                    selectinload(MediaItem.library)
-                )
-            
-            statement = statement.order_by(MediaItem.title).offset(offset)
-            
-            if limit is not None:
-                statement = statement.limit(limit)
-            
-            result = session.exec(statement)
-            return list(result.all())
+        return self._fetch_page(
+            select(MediaItem), limit, offset, lazy_load, after, sort_by, descending
+        )
     
     def get_by_library(
-        self, library_id: int, limit: Optional[int] = None, offset: int = 0, lazy_load: bool = False
+        self,
+        library_id: int,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        lazy_load: bool = False,
+        after: Optional[MediaItemCursor] = None,
+        sort_by: str = "title",
+        descending: bool = False,
     ) -> List[MediaItem]:
         """Get media items by library ID with optional pagination.
 
         Args:
             library_id: Library ID to filter by
             limit: Maximum number of items to return (None for all)
-            offset: Number of items to skip
+            offset: Number of items to skip; ignored when ``after`` is given
             lazy_load: If True, don't eagerly load relationships
+            after: Cursor of the previous page's last item
+            sort_by: Sort key, one of ``MEDIA_ITEM_SORT_COLUMNS``
+            descending: Sort in descending order
 
         Returns:
             List of media items
         """
-        with self._db_service.get_session() as session:
-            statement = select(MediaItem).where(MediaItem.library_id == library_id)
-            
-            if not lazy_load:
-                statement = statement.options(
-                    selectinload(MediaItem.files),
-                    selectinload(MediaItem.artworks),
-                    selectinload(MediaItem.credits).selectinload(Credit.person),
-                    selectinload(MediaItem.library)
-                )
-            
-            statement = statement.order_by(MediaItem.title).offset(offset)
-            
-            if limit is not None:
-                statement = statement.limit(limit)
-            
-            result = session.exec(statement)
-            return list(result.all())
-    
+        return self._fetch_page(
+            select(MediaItem).where(MediaItem.library_id == library_id),
+            limit,
+            offset,
+            lazy_load,
+            after,
+            sort_by,
+            descending,
+        )
+
+    def _fetch_page(
+        self,
+        statement: Any,
+        limit: Optional[int],
+        offset: int,
+        lazy_load: bool,
+        after: Optional[MediaItemCursor],
+        sort_by: str,
+        descending: bool,
+    ) -> List[MediaItem]:
+        """Run a listing with eager loading, ordering and offset or keyset paging."""
+        if sort_by not in MEDIA_ITEM_SORT_COLUMNS:
+            raise ValueError(f"Unknown sort key: {sort_by}")
+        if after is not None and (after.sort_by, after.descending) != (sort_by, descending):
+            raise ValueError(
+                f"Cursor for {after.sort_by} cannot page a listing sorted by {sort_by}"
+            )
+        column = MEDIA_ITEM_SORT_COLUMNS[sort_by]
+
+        if not lazy_load:
+            statement = statement.options(
+                selectinload(MediaItem.files),
+                selectinload(MediaItem.artworks),
+                selectinload(MediaItem.credits).selectinload(Credit.person),
+                selectinload(MediaItem.library)
+            )
+
+        # id breaks ties so every item has a unique position for cursors.
+        if descending:
+            statement = statement.order_by(column.desc(), MediaItem.id.desc())
+        else:
+            statement = statement.order_by(column, MediaItem.id)
+
+        with self._db_service.get_read_session() as session:
+            if after is None:
+                statement = statement.offset(offset)
+                if limit is not None:
+                    statement = statement.limit(limit)
+                return list(session.exec(statement).all())
+
+            items: List[MediaItem] = []
+            for condition in _cursor_segments(column, after):
+                remaining = None if limit is None else limit - len(items)
+                if remaining == 0:
+                    break
+                segment = statement.where(condition)
+                if remaining is not None:
+                    segment = segment.limit(remaining)
+                items.extend(session.exec(segment).all())
+            return items
+
     def get_by_id(self, item_id: int) -> Optional[MediaItem]:
         """Get media item by ID."""
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             statement = (
                 select(MediaItem)
                 .where(MediaItem.id == item_id)
@@ -419,13 +544,8 @@ class MediaItemRepository:
         Returns:
             Count of items
         """
-        with self._db_service.get_session() as session:
-            from sqlalchemy import func
-            statement = select(func.count(MediaItem.id)).where(
-                MediaItem.library_id == library_id
-            )
-            result = session.exec(statement)
-            return result.one()
+        with self._db_service.get_read_session() as session:
+            return _count_library_items(session, library_id)
 
     def count_all(self) -> int:
         """Count all media items.
@@ -433,11 +553,12 @@ class MediaItemRepository:
         Returns:
             Total count of items
         """
-        with self._db_service.get_session() as session:
-            from sqlalchemy import func
-            statement = select(func.count(MediaItem.id))
-            result = session.exec(statement)
-            return result.one()
+        with self._db_service.get_read_session() as session:
+            if library_counters_maintained(session.get_bind()):
+                statement = select(func.coalesce(func.sum(Library.item_count), 0))
+            else:
+                statement = select(func.count(MediaItem.id))
+            return session.exec(statement).one()
 
     def search(self, query: str, limit: int = 100, offset: int = 0) -> List[MediaItem]:
         """Search media items by title or description.
@@ -450,7 +571,7 @@ class MediaItemRepository:
         Returns:
             List of matching items
         """
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             statement = (
                 select(MediaItem)
                 .where(
@@ -471,6 +592,41 @@ class MediaItemRepository:
             return list(result.all())
 
 
+def _count_library_items(session: Session, library_id: int) -> int:
+    """Count a library's media items, from its counter where triggers keep it."""
+    if library_counters_maintained(session.get_bind()):
+        statement = select(Library.item_count).where(Library.id == library_id)
+        return session.exec(statement).first() or 0
+    statement = select(func.count(MediaItem.id)).where(
+        MediaItem.library_id == library_id
+    )
+    return session.exec(statement).one()
+
+
+def _cursor_segments(column: Any, cursor: MediaItemCursor) -> List[Any]:
+    """Conditions selecting the rows after a cursor, in listing order.
+
+    SQLite sorts NULLs first ascending and last descending. Each condition
+    covers a contiguous run of the listing that SQLite can seek to in the
+    sort index; a single OR of them would make it scan from the start.
+    """
+    if cursor.descending:
+        if cursor.value is None:
+            return [and_(column.is_(None), MediaItem.id < cursor.item_id)]
+        segments = [tuple_(column, MediaItem.id) < tuple_(cursor.value, cursor.item_id)]
+        # SQLite can't tell IS NULL is empty on a NOT NULL column and would
+        # scan the whole index for it.
+        if column.expression.nullable:
+            segments.append(column.is_(None))
+        return segments
+    if cursor.value is None:
+        return [
+            and_(column.is_(None), MediaItem.id > cursor.item_id),
+            column.is_not(None),
+        ]
+    return [tuple_(column, MediaItem.id) > tuple_(cursor.value, cursor.item_id)]
+
+
 @contextmanager
 def transactional_context() -> Generator[UnitOfWork, None, None]:
     """Context manager for transactional operations.
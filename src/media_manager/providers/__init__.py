@@ -1,12 +1,18 @@
 """Metadata providers for media information retrieval."""
 
 from .base import BaseProvider, ProviderError
+from .http_client import AsyncHTTPClient, HTTPError
+from .match_planner import MatchGroup, plan_match_groups
 from .tmdb import TMDBProvider
 from .tvdb import TVDBProvider
 
 __all__ = [
+    "AsyncHTTPClient",
     "BaseProvider",
+    "HTTPError",
+    "MatchGroup",
     "ProviderError",
     "TMDBProvider",
     "TVDBProvider",
+    "plan_match_groups",
 ]
@@ -2,36 +2,87 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from media_manager.cache_service import get_cache_service
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import replace
+from itertools import islice
+from typing import Any, Awaitable, Callable, Iterable, Iterator
+
+from media_manager.cache_service import CacheQuery, generate_cache_key, get_cache_service
 from media_manager.instrumentation import get_instrumentation
 from media_manager.logging import get_logger
 from media_manager.models import MediaMatch, MediaType, MatchStatus, DownloadStatus, PosterInfo, PosterType, VideoMetadata
 from .base import BaseProvider, ProviderError, ProviderResult
+from .http_client import AsyncHTTPClient
+from .match_planner import MatchGroup
+from .single_flight import SingleFlight
+
+DEFAULT_PROVIDER_TIMEOUT = 10.0  # Seconds each provider may take in fan-out mode
+
+# Threads per provider, so several workers can fan out at the same time.
+_FAN_OUT_WORKERS_PER_PROVIDER = 4
+
+# Details lookups run on a bounded pool so enrichment can't flood a provider.
+DEFAULT_DETAILS_CONCURRENCY = 8
+
+# Items whose cached searches are fetched together before matching a batch.
+PREFETCH_BATCH_SIZE = 256
+
+# Searches in flight across every adapter, keyed like CacheService entries.
+_IN_FLIGHT_SEARCHES: SingleFlight[list[ProviderResult]] = SingleFlight()
+_IN_FLIGHT_DETAILS: SingleFlight[ProviderResult] = SingleFlight()
 
 
 class ProviderAdapter:
     """Adapter that merges results from multiple providers."""
 
-    def __init__(self, providers: list[BaseProvider] | None = None, use_cache: bool = True) -> None:
+    def __init__(
+        self,
+        providers: list[BaseProvider] | None = None,
+        use_cache: bool = True,
+        concurrent: bool = True,
+        provider_timeout: float | None = DEFAULT_PROVIDER_TIMEOUT,
+        provider_timeouts: dict[str, float] | None = None,
+        details_concurrency: int = DEFAULT_DETAILS_CONCURRENCY,
+    ) -> None:
         """Initialize the adapter with providers.
 
         Args:
             providers: List of provider instances. If None, uses mock providers.
             use_cache: Whether to use caching for provider results
+            concurrent: Whether to query all providers in parallel
+            provider_timeout: Deadline in seconds for each provider in concurrent
+                mode. None waits for every provider.
+            provider_timeouts: Per-provider deadlines keyed by provider name,
+                overriding ``provider_timeout``
+            details_concurrency: Maximum details lookups in flight at once
         """
         self.providers = providers or []
         self._logger = get_logger().get_logger(__name__)
         self._use_cache = use_cache
         self._cache_service = get_cache_service() if use_cache else None
         self._instrumentation = get_instrumentation()
+        self._concurrent = concurrent
+        self._provider_timeout = provider_timeout
+        self._provider_timeouts = dict(provider_timeouts or {})
+        self._details_concurrency = max(1, details_concurrency)
+        self._executor: ThreadPoolExecutor | None = None
+        self._details_executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
 
     def search_and_match(
         self, metadata: VideoMetadata, fallback_to_mock: bool = False
     ) -> MediaMatch:
         """Search for a match using all providers and create a MediaMatch.
 
+        In concurrent mode all providers are queried at once and results
+        that arrive within each provider's deadline are merged, so a cache
+        miss costs the latency of the slowest provider rather than the sum.
+
         Args:
             metadata: Video metadata to match
             fallback_to_mock: If True, fall back to mock results if providers fail
@@ -39,69 +90,176 @@ class ProviderAdapter:
         Returns:
             MediaMatch with results from best provider
         """
-        results = []
+        with self._instrumentation.timer("provider_adapter.search_and_match"):
+            results = self._fan_out(
+                lambda provider: self._search_provider(provider, metadata)
+            )
+
+        return self._best_match(metadata, results, fallback_to_mock)
+
+    async def search_and_match_async(
+        self, metadata: VideoMetadata, fallback_to_mock: bool = False
+    ) -> MediaMatch:
+        """Async variant of ``search_and_match``.
 
+        Providers are queried through their ``*_async`` methods, so many
+        items can be matched concurrently on one event loop. Bind a shared
+        client with ``bind_http_client`` to pool connections across lookups.
+        """
         with self._instrumentation.timer("provider_adapter.search_and_match"):
-            for provider in self.providers:
-                try:
-                    # Try to get from cache first
-                    cached_results = None
-                    if self._use_cache and self._cache_service:
-                        cache_key_params = {
-                            "title": metadata.title,
-                            "year": metadata.year,
-                        }
-                        query_type = "search_movie" if metadata.is_movie() else "search_tv"
-                        
-                        with self._instrumentation.timer("provider_adapter.cache_lookup"):
-                            cached_results = self._cache_service.get(
-                                provider.name, query_type, **cache_key_params
-                            )
-                        
-                        if cached_results:
-                            self._instrumentation.increment_counter("provider_adapter.cache_hits")
-                            self._logger.debug(f"Cache hit for {provider.name}")
-                            # Convert cached dict back to ProviderResult objects
-                            provider_results = [
-                                ProviderResult(**r) for r in cached_results
-                            ]
-                            results.extend(provider_results)
-                            continue
-
-                    # Cache miss - query provider
-                    self._instrumentation.increment_counter("provider_adapter.cache_misses")
-                    
-                    with self._instrumentation.timer(f"provider.{provider.name}.search"):
-                        if metadata.is_movie():
-                            provider_results = provider.search_movie(metadata.title, metadata.year)
-                        else:
-                            provider_results = provider.search_tv(metadata.title, metadata.year)
-
-                    # Cache the results
-                    if self._use_cache and self._cache_service and provider_results:
-                        cache_key_params = {
-                            "title": metadata.title,
-                            "year": metadata.year,
-                        }
-                        query_type = "search_movie" if metadata.is_movie() else "search_tv"
-                        
-                        # Convert to dict for caching
-                        cached_data = [r.as_dict() for r in provider_results]
-                        
-                        with self._instrumentation.timer("provider_adapter.cache_store"):
-                            self._cache_service.set(
-                                provider.name, query_type, cached_data, **cache_key_params
-                            )
-
-                    results.extend(provider_results)
-                    self._logger.debug(f"Got {len(provider_results)} results from {provider.name}")
-                except ProviderError as exc:
-                    self._logger.warning(f"Provider {provider.name} error: {exc}")
-                    self._instrumentation.increment_counter(f"provider.{provider.name}.errors")
-                except Exception as exc:
-                    self._logger.error(f"Unexpected error from {provider.name}: {exc}")
-                    self._instrumentation.increment_counter(f"provider.{provider.name}.exceptions")
+            results = await self._fan_out_async(
+                lambda provider: self._search_provider_async(provider, metadata)
+            )
+
+        return self._best_match(metadata, results, fallback_to_mock)
 
+    def match_group(
+        self, group: MatchGroup, fallback_to_mock: bool = False
+    ) -> list[MediaMatch]:
+        """Match every member of a group with one search and one details call.
+
+        The group's representative is searched once, the best result is
+        enriched with a single show- or movie-level details lookup, and that
+        result is applied to every member. Importing a full series therefore
+        costs a handful of provider calls per show instead of per episode.
+
+        Args:
+            group: Metadata items sharing a title, year and media type
+            fallback_to_mock: If True, fall back to mock results if providers fail
+
+        Returns:
+            One MediaMatch per group member, in member order
+        """
+        with self._instrumentation.timer("provider_adapter.match_group"):
+            best = self._search_group(group)
+            if best is not None:
+                best = self._with_details(best, group.representative)
+
+        return self._group_matches(group, best, fallback_to_mock)
+
+    def match_groups(
+        self,
+        groups: Iterable[MatchGroup],
+        fallback_to_mock: bool = False,
+        on_error: Callable[[MatchGroup, Exception], None] | None = None,
+    ) -> Iterator[tuple[MatchGroup, list[MediaMatch]]]:
+        """Match groups with searches and details lookups pipelined.
+
+        Searches run on the calling thread while details for groups already
+        searched are fetched on the bounded details pool, so the search for
+        the next title overlaps the details call for the previous one. Cached
+        searches for each batch of representatives are loaded in bulk first.
+
+        Args:
+            groups: Groups to match, usually from ``plan_match_groups``
+            fallback_to_mock: If True, fall back to mock results if providers fail
+            on_error: Called with a group and the exception its lookup raised;
+                the remaining groups are still matched. Without it the
+                exception propagates.
+
+        Yields:
+            Each group with its matches, in input order, skipping groups
+            passed to ``on_error``
+        """
+        pending: deque[tuple[MatchGroup, ProviderResult | None, Future[ProviderResult] | None]]
+        pending = deque()
+        for group in self.with_prefetched_searches(groups):
+            try:
+                with self._instrumentation.timer("provider_adapter.match_group"):
+                    best = self._search_group(group)
+                future = None
+                if best is not None:
+                    future = self._get_details_executor().submit(
+                        self._with_details, best, group.representative
+                    )
+            except Exception as exc:
+                if on_error is None:
+                    raise
+                on_error(group, exc)
+                continue
+            pending.append((group, best, future))
+
+            # Hand back finished groups early, and block once the window is full.
+            while pending and (
+                pending[0][2] is None
+                or pending[0][2].done()
+                or len(pending) > self._details_concurrency
+            ):
+                group, best, future = pending.popleft()
+                matches = self._settle_group(group, best, future, fallback_to_mock, on_error)
+                if matches is not None:
+                    yield group, matches
+
+        while pending:
+            group, best, future = pending.popleft()
+            matches = self._settle_group(group, best, future, fallback_to_mock, on_error)
+            if matches is not None:
+                yield group, matches
+
+    def enrich_matches(self, matches: list[MediaMatch]) -> list[MediaMatch]:
+        """Fill in full details for matches that only carry search data.
+
+        Each distinct provider title is fetched once on the bounded details
+        pool, with credits, videos and images in the same request where the
+        provider supports it, and the result is applied to every match that
+        points at it. Manual decisions such as status and confidence are kept.
+
+        Args:
+            matches: Matches to enrich
+
+        Returns:
+            Enriched copies of the matches, in input order
+        """
+        futures: dict[tuple[str, str, bool], Future[ProviderResult]] = {}
+        executor = self._get_details_executor()
+        with self._instrumentation.timer("provider_adapter.enrich_matches"):
+            for match in matches:
+                key = self._details_target(match)
+                if key is None or key in futures:
+                    continue
+                source, external_id, _ = key
+                stub = ProviderResult(source, external_id, match.matched_title or "")
+                futures[key] = executor.submit(self._with_details, stub, match.metadata)
+
+            enriched = []
+            for match in matches:
+                key = self._details_target(match)
+                if key is None:
+                    enriched.append(match)
+                else:
+                    enriched.append(self._apply_details(match, futures[key].result()))
+
+        self._instrumentation.increment_counter(
+            "provider_adapter.details_requests", value=len(futures)
+        )
+        return enriched
+
+    async def match_group_async(
+        self, group: MatchGroup, fallback_to_mock: bool = False
+    ) -> list[MediaMatch]:
+        """Async variant of ``match_group``."""
+        representative = group.representative
+        with self._instrumentation.timer("provider_adapter.match_group"):
+            results = await self._fan_out_async(
+                lambda provider: self._search_provider_async(provider, representative)
+            )
+            best = self._best_result(results)
+            if best is not None:
+                best = await self._with_details_async(best, representative)
+
+        return self._group_matches(group, best, fallback_to_mock)
+
+    def bind_http_client(self, client: AsyncHTTPClient | None) -> None:
+        """Set the HTTP client every provider uses for async calls."""
+        for provider in self.providers:
+            provider.http_client = client
+
+    def _best_match(
+        self,
+        metadata: VideoMetadata,
+        results: list[ProviderResult],
+        fallback_to_mock: bool,
+    ) -> MediaMatch:
         if not results and fallback_to_mock:
             self._logger.debug("No results from providers, using mock")
             return self._create_mock_match(metadata)
@@ -121,6 +279,406 @@ class ProviderAdapter:
 
         return self._result_to_match(metadata, best_result)
 
+    def _search_group(self, group: MatchGroup) -> ProviderResult | None:
+        representative = group.representative
+        results = self._fan_out(
+            lambda provider: self._search_provider(provider, representative)
+        )
+        return self._best_result(results)
+
+    def _finish_group(
+        self,
+        group: MatchGroup,
+        best: ProviderResult | None,
+        future: Future[ProviderResult] | None,
+        fallback_to_mock: bool,
+    ) -> list[MediaMatch]:
+        if future is not None:
+            try:
+                best = future.result()
+            except Exception as exc:
+                self._logger.error(f"Unexpected error getting details for {best.title}: {exc}")
+        return self._group_matches(group, best, fallback_to_mock)
+
+    def _settle_group(
+        self,
+        group: MatchGroup,
+        best: ProviderResult | None,
+        future: Future[ProviderResult] | None,
+        fallback_to_mock: bool,
+        on_error: Callable[[MatchGroup, Exception], None] | None,
+    ) -> list[MediaMatch] | None:
+        """Finish a group, returning None if its error went to ``on_error``."""
+        try:
+            return self._finish_group(group, best, future, fallback_to_mock)
+        except Exception as exc:
+            if on_error is None:
+                raise
+            on_error(group, exc)
+            return None
+
+    def _details_target(self, match: MediaMatch) -> tuple[str, str, bool] | None:
+        """Return the (provider, external ID, is movie) a match can be enriched from."""
+        if not match.external_id or self._find_provider(match.source or "") is None:
+            return None
+        return match.source, match.external_id, match.metadata.is_movie()
+
+    def _apply_details(self, match: MediaMatch, details: ProviderResult) -> MediaMatch:
+        detailed = self._result_to_match(match.metadata, details)
+        return replace(
+            match,
+            overview=detailed.overview or match.overview,
+            poster_url=match.poster_url or detailed.poster_url,
+            posters={**detailed.posters, **match.posters},
+            runtime=detailed.runtime or match.runtime,
+            aired_date=detailed.aired_date or match.aired_date,
+            cast=detailed.cast or match.cast,
+        )
+
+    @staticmethod
+    def _best_result(results: list[ProviderResult]) -> ProviderResult | None:
+        if not results:
+            return None
+        return max(results, key=lambda result: result.confidence)
+
+    def _group_matches(
+        self,
+        group: MatchGroup,
+        best: ProviderResult | None,
+        fallback_to_mock: bool,
+    ) -> list[MediaMatch]:
+        if len(group.members) > 1:
+            self._instrumentation.increment_counter(
+                "provider_adapter.grouped_lookups_saved", value=len(group.members) - 1
+            )
+        if best is None:
+            return [self._best_match(member, [], fallback_to_mock) for member in group.members]
+        return [self._result_to_match(member, best) for member in group.members]
+
+    def _find_provider(self, provider_name: str) -> BaseProvider | None:
+        for provider in self.providers:
+            if provider.name == provider_name:
+                return provider
+        return None
+
+    def _with_details(self, result: ProviderResult, metadata: VideoMetadata) -> ProviderResult:
+        """Return ``result`` enriched with full details, or unchanged on failure."""
+        provider = self._find_provider(result.provider_name)
+        if provider is None:
+            return result
+
+        def fetch() -> ProviderResult:
+            with self._instrumentation.timer(f"provider.{provider.name}.details"):
+                if metadata.is_movie():
+                    return provider.get_movie_details(result.external_id)
+                return provider.get_tv_details(result.external_id)
+
+        try:
+            details, shared = _IN_FLIGHT_DETAILS.do(
+                self._details_key(provider, result.external_id, metadata), fetch
+            )
+        except ProviderError as exc:
+            self._logger.warning(f"Failed to get details for {result.title}: {exc}")
+            return result
+
+        if shared:
+            self._instrumentation.increment_counter("provider_adapter.coalesced_requests")
+        # Details lookups report full confidence; keep the search's score.
+        return replace(details, confidence=result.confidence)
+
+    async def _with_details_async(
+        self, result: ProviderResult, metadata: VideoMetadata
+    ) -> ProviderResult:
+        """Async variant of ``_with_details``."""
+        provider = self._find_provider(result.provider_name)
+        if provider is None:
+            return result
+
+        async def fetch() -> ProviderResult:
+            with self._instrumentation.timer(f"provider.{provider.name}.details"):
+                if metadata.is_movie():
+                    return await provider.get_movie_details_async(result.external_id)
+                return await provider.get_tv_details_async(result.external_id)
+
+        try:
+            details, shared = await _IN_FLIGHT_DETAILS.do_async(
+                self._details_key(provider, result.external_id, metadata), fetch
+            )
+        except ProviderError as exc:
+            self._logger.warning(f"Failed to get details for {result.title}: {exc}")
+            return result
+
+        if shared:
+            self._instrumentation.increment_counter("provider_adapter.coalesced_requests")
+        return replace(details, confidence=result.confidence)
+
+    @staticmethod
+    def _details_key(
+        provider: BaseProvider, external_id: str, metadata: VideoMetadata
+    ) -> str:
+        query_type = "movie_details" if metadata.is_movie() else "tv_details"
+        return generate_cache_key(provider.name, query_type, external_id=external_id)
+
+    def close(self) -> None:
+        """Shut down the fan-out and details thread pools."""
+        with self._executor_lock:
+            executors = (self._executor, self._details_executor)
+            self._executor = self._details_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _search_provider(
+        self, provider: BaseProvider, metadata: VideoMetadata
+    ) -> list[ProviderResult]:
+        """Search one provider, going through the cache.
+
+        Identical searches already in flight (from any adapter) are joined
+        instead of being sent again.
+
+        Raises:
+            ProviderError: If the provider query fails
+        """
+        cached_results = self._load_cached_search(provider, metadata)
+        if cached_results is not None:
+            return cached_results
+
+        def fetch() -> list[ProviderResult]:
+            with self._instrumentation.timer(f"provider.{provider.name}.search"):
+                if metadata.is_movie():
+                    provider_results = provider.search_movie(metadata.title, metadata.year)
+                else:
+                    provider_results = provider.search_tv(metadata.title, metadata.year)
+
+            self._store_search(provider, metadata, provider_results)
+            return provider_results
+
+        provider_results, shared = _IN_FLIGHT_SEARCHES.do(
+            self._search_key(provider, metadata), fetch
+        )
+        if shared:
+            self._instrumentation.increment_counter("provider_adapter.coalesced_requests")
+        return provider_results
+
+    async def _search_provider_async(
+        self, provider: BaseProvider, metadata: VideoMetadata
+    ) -> list[ProviderResult]:
+        """Async variant of ``_search_provider``."""
+        cached_results = self._load_cached_search(provider, metadata)
+        if cached_results is not None:
+            return cached_results
+
+        async def fetch() -> list[ProviderResult]:
+            with self._instrumentation.timer(f"provider.{provider.name}.search"):
+                if metadata.is_movie():
+                    provider_results = await provider.search_movie_async(
+                        metadata.title, metadata.year
+                    )
+                else:
+                    provider_results = await provider.search_tv_async(
+                        metadata.title, metadata.year
+                    )
+
+            self._store_search(provider, metadata, provider_results)
+            return provider_results
+
+        provider_results, shared = await _IN_FLIGHT_SEARCHES.do_async(
+            self._search_key(provider, metadata), fetch
+        )
+        if shared:
+            self._instrumentation.increment_counter("provider_adapter.coalesced_requests")
+        return provider_results
+
+    @staticmethod
+    def _search_key(provider: BaseProvider, metadata: VideoMetadata) -> str:
+        query_type = "search_movie" if metadata.is_movie() else "search_tv"
+        return generate_cache_key(
+            provider.name, query_type, title=metadata.title, year=metadata.year
+        )
+
+    def _load_cached_search(
+        self, provider: BaseProvider, metadata: VideoMetadata
+    ) -> list[ProviderResult] | None:
+        """Return cached search results, or None on a cache miss."""
+        if provider.caches_responses:
+            # The provider caches the raw response itself.
+            return None
+
+        if self._use_cache and self._cache_service:
+            query_type = "search_movie" if metadata.is_movie() else "search_tv"
+            with self._instrumentation.timer("provider_adapter.cache_lookup"):
+                cached_results = self._cache_service.get(
+                    provider.name, query_type, title=metadata.title, year=metadata.year
+                )
+
+            if cached_results:
+                self._instrumentation.increment_counter("provider_adapter.cache_hits")
+                self._logger.debug(f"Cache hit for {provider.name}")
+                # Convert cached dict back to ProviderResult objects
+                return [ProviderResult(**r) for r in cached_results]
+
+        self._instrumentation.increment_counter("provider_adapter.cache_misses")
+        return None
+
+    def _store_search(
+        self,
+        provider: BaseProvider,
+        metadata: VideoMetadata,
+        provider_results: list[ProviderResult],
+    ) -> None:
+        """Cache search results from a provider."""
+        if (
+            self._use_cache
+            and self._cache_service
+            and provider_results
+            and not provider.caches_responses
+        ):
+            query_type = "search_movie" if metadata.is_movie() else "search_tv"
+            # Convert to dict for caching
+            cached_data = [r.as_dict() for r in provider_results]
+
+            with self._instrumentation.timer("provider_adapter.cache_store"):
+                self._cache_service.set(
+                    provider.name,
+                    query_type,
+                    cached_data,
+                    title=metadata.title,
+                    year=metadata.year,
+                )
+
+        self._logger.debug(f"Got {len(provider_results)} results from {provider.name}")
+
+    def _fan_out(
+        self, query: Callable[[BaseProvider], list[ProviderResult]]
+    ) -> list[ProviderResult]:
+        """Run ``query`` against every provider and collect the results.
+
+        Results keep the provider order. In concurrent mode a provider that
+        misses its deadline is skipped; its query keeps running in the
+        background, so a late answer still reaches the cache.
+        """
+        if not self._concurrent:
+            results: list[ProviderResult] = []
+            for provider in self.providers:
+                results.extend(self._call_provider(provider, query))
+            return results
+
+        if not self.providers:
+            return []
+
+        executor = self._get_executor()
+        started = time.monotonic()
+        futures: list[tuple[BaseProvider, Future[list[ProviderResult]]]] = [
+            (provider, executor.submit(self._call_provider, provider, query))
+            for provider in self.providers
+        ]
+
+        results = []
+        for provider, future in futures:
+            deadline = self._provider_timeouts.get(provider.name, self._provider_timeout)
+            remaining = (
+                None if deadline is None else max(0.0, started + deadline - time.monotonic())
+            )
+            try:
+                results.extend(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                self._logger.warning(
+                    f"Provider {provider.name} missed its {deadline:.1f}s deadline"
+                )
+                self._instrumentation.increment_counter(f"provider.{provider.name}.timeouts")
+        return results
+
+    async def _fan_out_async(
+        self, query: Callable[[BaseProvider], Awaitable[list[ProviderResult]]]
+    ) -> list[ProviderResult]:
+        """Async variant of ``_fan_out``.
+
+        A provider that misses its deadline is cancelled rather than left
+        running, since nothing outlives the caller's event loop.
+        """
+        if not self._concurrent:
+            results: list[ProviderResult] = []
+            for provider in self.providers:
+                results.extend(await self._call_provider_async(provider, query, None))
+            return results
+
+        batches = await asyncio.gather(
+            *(
+                self._call_provider_async(
+                    provider,
+                    query,
+                    self._provider_timeouts.get(provider.name, self._provider_timeout),
+                )
+                for provider in self.providers
+            )
+        )
+        return [result for batch in batches for result in batch]
+
+    def _call_provider(
+        self,
+        provider: BaseProvider,
+        query: Callable[[BaseProvider], list[ProviderResult]],
+    ) -> list[ProviderResult]:
+        started = time.perf_counter()
+        try:
+            return query(provider)
+        except Exception as exc:
+            self._record_provider_error(provider, exc)
+        finally:
+            # Recorded even for late answers, so slow providers stay visible.
+            self._instrumentation.record_timer(
+                f"provider.{provider.name}.latency", time.perf_counter() - started
+            )
+        return []
+
+    async def _call_provider_async(
+        self,
+        provider: BaseProvider,
+        query: Callable[[BaseProvider], Awaitable[list[ProviderResult]]],
+        deadline: float | None,
+    ) -> list[ProviderResult]:
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(query(provider), timeout=deadline)
+        except asyncio.TimeoutError:
+            self._logger.warning(
+                f"Provider {provider.name} missed its {deadline:.1f}s deadline"
+            )
+            self._instrumentation.increment_counter(f"provider.{provider.name}.timeouts")
+        except Exception as exc:
+            self._record_provider_error(provider, exc)
+        finally:
+            self._instrumentation.record_timer(
+                f"provider.{provider.name}.latency", time.perf_counter() - started
+            )
+        return []
+
+    def _record_provider_error(self, provider: BaseProvider, exc: Exception) -> None:
+        if isinstance(exc, ProviderError):
+            self._logger.warning(f"Provider {provider.name} error: {exc}")
+            self._instrumentation.increment_counter(f"provider.{provider.name}.errors")
+        else:
+            self._logger.error(f"Unexpected error from {provider.name}: {exc}")
+            self._instrumentation.increment_counter(f"provider.{provider.name}.exceptions")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, len(self.providers)) * _FAN_OUT_WORKERS_PER_PROVIDER,
+                    thread_name_prefix="provider-fan-out",
+                )
+            return self._executor
+
+    def _get_details_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._details_executor is None:
+                self._details_executor = ThreadPoolExecutor(
+                    max_workers=self._details_concurrency,
+                    thread_name_prefix="provider-details",
+                )
+            return self._details_executor
+
     def get_full_details(self, metadata: VideoMetadata, external_id: str, provider_name: str) -> MediaMatch:
         """Get full details for a matched item.
 
@@ -168,10 +726,70 @@ class ProviderAdapter:
         Returns:
             List of MediaMatch objects
         """
-        return [
-            self.search_and_match(metadata, fallback_to_mock)
-            for metadata in metadata_list
-        ]
+        matches: list[MediaMatch] = []
+        for start in range(0, len(metadata_list), PREFETCH_BATCH_SIZE):
+            batch = metadata_list[start:start + PREFETCH_BATCH_SIZE]
+            self.prefetch_searches(batch)
+            matches.extend(
+                self.search_and_match(metadata, fallback_to_mock) for metadata in batch
+            )
+        return matches
+
+    def with_prefetched_searches(
+        self, groups: Iterable[MatchGroup]
+    ) -> Iterator[MatchGroup]:
+        """Yield groups, warming the search cache for each batch first.
+
+        Args:
+            groups: Groups about to be matched
+
+        Yields:
+            The groups, in input order
+        """
+        iterator = iter(groups)
+        while batch := list(islice(iterator, PREFETCH_BATCH_SIZE)):
+            self.prefetch_searches(group.representative for group in batch)
+            yield from batch
+
+    def prefetch_searches(self, metadata_list: Iterable[VideoMetadata]) -> int:
+        """Load cached searches for a batch with bulk reads before matching.
+
+        Providers that cache raw responses are warmed in the shared cache;
+        the rest are warmed under the adapter's own search entries. The
+        per-item lookups that follow are then answered from memory.
+
+        Args:
+            metadata_list: Items about to be matched
+
+        Returns:
+            Number of cached searches found
+        """
+        if not self._use_cache or not self._cache_service:
+            return 0
+
+        shared: list[CacheQuery] = []
+        own: list[CacheQuery] = []
+        for metadata in metadata_list:
+            movie = metadata.is_movie()
+            for provider in self.providers:
+                if provider.caches_responses:
+                    key = provider.search_cache_key(metadata.title, metadata.year, movie)
+                    shared.append(provider.response_cache_query(key))
+                else:
+                    own.append(CacheQuery(
+                        provider.name,
+                        "search_movie" if movie else "search_tv",
+                        {"title": metadata.title, "year": metadata.year},
+                    ))
+
+        with self._instrumentation.timer("provider_adapter.cache_prefetch"):
+            found = 0
+            if shared:
+                found += get_cache_service().prefetch(shared)
+            if own:
+                found += self._cache_service.prefetch(own)
+        self._logger.debug(f"Prefetched {found} cached searches")
+        return found
 
     def search_results(
         self, query: str, media_type: MediaType, year: int | None = None
@@ -186,20 +804,14 @@ class ProviderAdapter:
         Returns:
             Merged list of results sorted by confidence
         """
-        results = []
-
-        for provider in self.providers:
-            try:
+        def query_provider(provider: BaseProvider) -> list[ProviderResult]:
+            with self._instrumentation.timer(f"provider.{provider.name}.search"):
                 if media_type == MediaType.MOVIE:
-                    provider_results = provider.search_movie(query, year)
-                else:
-                    provider_results = provider.search_tv(query, year)
+                    return provider.search_movie(query, year)
+                return provider.search_tv(query, year)
 
-                results.extend(provider_results)
-            except ProviderError as exc:
-                self._logger.warning(f"Provider {provider.name} error: {exc}")
-            except Exception as exc:
-                self._logger.error(f"Unexpected error from {provider.name}: {exc}")
+        with self._instrumentation.timer("provider_adapter.search_results"):
+            results = self._fan_out(query_provider)
 
         # Merge duplicate results (same title and year) and keep highest confidence
         merged = {}
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from media_manager.cache_service import CacheQuery, get_cache_service
+
+if TYPE_CHECKING:
+    from .http_client import AsyncHTTPClient
 
 
 class ProviderError(Exception):
@@ -59,12 +65,26 @@ class ProviderResult:
 
 
 class BaseProvider(ABC):
-    """Base class for metadata providers."""
+    """Base class for metadata providers.
+
+    The ``*_async`` methods form the async variant of the interface. By
+    default they run the blocking method in a worker thread; providers that
+    talk HTTP override them to use ``http_client`` so that many lookups can
+    share a handful of pooled connections on one event loop.
+    """
+
+    # Whether the provider caches its own raw responses through CacheService,
+    # in which case the adapter doesn't cache its parsed results again.
+    caches_responses = False
+
+    # How long raw API responses stay in the shared provider cache.
+    RESPONSE_CACHE_TTL = 7 * 24 * 3600
 
     def __init__(self, api_key: str | None = None) -> None:
         """Initialize the provider."""
         self.api_key = api_key
         self.name = self.__class__.__name__
+        self.http_client: AsyncHTTPClient | None = None
 
     @abstractmethod
     def search_movie(self, title: str, year: int | None = None) -> list[ProviderResult]:
@@ -163,3 +183,65 @@ class BaseProvider(ABC):
             ProviderError: If the API call fails
         """
         pass
+
+    async def search_movie_async(
+        self, title: str, year: int | None = None
+    ) -> list[ProviderResult]:
+        """Async variant of ``search_movie``."""
+        return await asyncio.to_thread(self.search_movie, title, year)
+
+    async def search_tv_async(
+        self, title: str, year: int | None = None
+    ) -> list[ProviderResult]:
+        """Async variant of ``search_tv``."""
+        return await asyncio.to_thread(self.search_tv, title, year)
+
+    async def get_movie_details_async(self, external_id: str) -> ProviderResult:
+        """Async variant of ``get_movie_details``."""
+        return await asyncio.to_thread(self.get_movie_details, external_id)
+
+    async def get_tv_details_async(
+        self, external_id: str, season: int | None = None, episode: int | None = None
+    ) -> ProviderResult:
+        """Async variant of ``get_tv_details``."""
+        return await asyncio.to_thread(self.get_tv_details, external_id, season, episode)
+
+    @staticmethod
+    def search_cache_key(title: str, year: int | None, movie: bool) -> str:
+        """Cache key of the raw response for a title search."""
+        return f"{'movie' if movie else 'tv'}_search:{title}:{year}"
+
+    def response_cache_query(self, key: str) -> CacheQuery:
+        """Shared-cache query for a raw API response.
+
+        Args:
+            key: Cache key, prefixed with the query type (``"movie_details:550"``)
+
+        Returns:
+            Query identifying the cache entry
+        """
+        return CacheQuery(self.name, key.partition(":")[0], {"key": key})
+
+    def _load_from_cache(self, key: str) -> dict[str, Any] | None:
+        """Load a raw API response from the shared provider cache.
+
+        Args:
+            key: Cache key, prefixed with the query type (``"movie_details:550"``)
+
+        Returns:
+            Cached response or None if not found
+        """
+        query = self.response_cache_query(key)
+        return get_cache_service().get(query.provider_name, query.query_type, **query.params)
+
+    def _save_to_cache(self, key: str, data: dict[str, Any]) -> None:
+        """Save a raw API response to the shared provider cache.
+
+        Args:
+            key: Cache key, prefixed with the query type
+            data: Response to cache
+        """
+        query_type = key.partition(":")[0]
+        get_cache_service().set(
+            self.name, query_type, data, ttl=self.RESPONSE_CACHE_TTL, key=key
+        )
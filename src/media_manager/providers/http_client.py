@@ -0,0 +1,412 @@
+"""Pooled HTTP clients used by the providers.
+
+``AsyncHTTPClient`` serves the async provider interface; blocking calls go
+through one shared ``requests.Session`` per provider from
+:func:`get_requests_session`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+
+from media_manager.logging import get_logger
+
+from .base import ProviderError
+
+DEFAULT_TIMEOUT = 10.0  # Seconds for a whole request, including connect
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0  # Seconds an idle connection stays pooled
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+
+_USER_AGENT = "media-manager/0.1"
+_MAX_LINE = 64 * 1024
+
+_requests_sessions: dict[str, requests.Session] = {}
+_requests_sessions_lock = threading.Lock()
+
+
+def get_requests_session(provider_name: str) -> requests.Session:
+    """Get the keep-alive session shared by a provider's blocking calls.
+
+    Every provider instance and worker thread reuses the same connection
+    pool, so repeated lookups skip the TCP and TLS handshakes.
+
+    Args:
+        provider_name: Provider the session belongs to, e.g. ``"TMDB"``
+
+    Returns:
+        Shared session for the provider
+    """
+    with _requests_sessions_lock:
+        session = _requests_sessions.get(provider_name)
+        if session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = _USER_AGENT
+            adapter = HTTPAdapter(pool_maxsize=DEFAULT_MAX_CONNECTIONS_PER_HOST)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _requests_sessions[provider_name] = session
+        return session
+
+
+def reset_requests_sessions() -> None:
+    """Close and forget every shared provider session."""
+    with _requests_sessions_lock:
+        sessions = list(_requests_sessions.values())
+        _requests_sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+class HTTPError(ProviderError):
+    """HTTP failure from ``AsyncHTTPClient``.
+
+    ``status`` is None for transport errors (connect failure, timeout, broken
+    connection) and the response status code otherwise.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status: int | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+def is_transport_error(exc: BaseException) -> bool:
+    """Whether ``exc`` is an ``HTTPError`` raised before any response arrived."""
+    return isinstance(exc, HTTPError) and exc.status is None
+
+
+@dataclass
+class HTTPResponse:
+    """A fully read HTTP response."""
+
+    status: int
+    reason: str
+    headers: dict[str, str] = field(default_factory=dict)  # Lower-cased names
+    body: bytes = b""
+
+    def json(self) -> Any:
+        """Decode the body as JSON."""
+        return json.loads(self.body.decode("utf-8"))
+
+
+@dataclass
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    last_used: float = 0.0
+
+    def is_usable(self, keepalive_timeout: float) -> bool:
+        return (
+            not self.writer.is_closing()
+            and not self.reader.at_eof()
+            and time.monotonic() - self.last_used < keepalive_timeout
+        )
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _HostPool:
+    """Idle connections to one (scheme, host, port), bounded by a semaphore."""
+
+    def __init__(self, max_connections: int) -> None:
+        self.slots = asyncio.Semaphore(max_connections)
+        self.idle: list[_Connection] = []
+
+
+class AsyncHTTPClient:
+    """Minimal HTTP/1.1 client with per-host keep-alive connection pools.
+
+    Connections are reused across requests to the same host, so a batch of
+    lookups pays for one TCP+TLS handshake per pooled connection instead of
+    one per request. An instance belongs to the event loop it is first used
+    on; use it as an async context manager or call ``aclose()`` when done.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            max_connections_per_host: Concurrent connections allowed per host
+            timeout: Deadline in seconds for each request
+            keepalive_timeout: Seconds an idle connection is kept for reuse
+            ssl_context: TLS context for https URLs; defaults to system trust
+        """
+        self._max_connections_per_host = max(1, max_connections_per_host)
+        self._timeout = timeout
+        self._keepalive_timeout = keepalive_timeout
+        self._ssl_context = ssl_context
+        self._pools: dict[tuple[str, str, int], _HostPool] = {}
+        self._closed = False
+        self._logger = get_logger().get_logger(__name__)
+        self.connections_opened = 0
+        self.requests_sent = 0
+
+    async def __aenter__(self) -> AsyncHTTPClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        self._closed = True
+        for pool in self._pools.values():
+            for connection in pool.idle:
+                connection.close()
+            pool.idle.clear()
+        self._pools.clear()
+
+    async def get_json(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """GET ``url`` and decode the JSON body.
+
+        Raises:
+            HTTPError: On transport errors or a non-2xx status
+        """
+        response = await self.request("GET", url, params=params, headers=headers)
+        return self._decode(response)
+
+    async def post_json(
+        self,
+        url: str,
+        payload: Any,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """POST ``payload`` as JSON to ``url`` and decode the JSON body.
+
+        Raises:
+            HTTPError: On transport errors or a non-2xx status
+        """
+        response = await self.request("POST", url, json_body=payload, headers=headers)
+        return self._decode(response)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json_body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> HTTPResponse:
+        """Send a request and return the response, whatever its status.
+
+        Raises:
+            HTTPError: On transport errors or timeouts
+        """
+        if self._closed:
+            raise HTTPError("HTTP client is closed")
+
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise HTTPError(f"Unsupported URL: {url}")
+
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        target = parts.path or "/"
+        query = parts.query
+        if params:
+            encoded = urlencode(params, doseq=True)
+            query = f"{query}&{encoded}" if query else encoded
+        if query:
+            target = f"{target}?{query}"
+
+        host_header = parts.hostname if parts.port is None else f"{parts.hostname}:{port}"
+        request_headers = {
+            "Host": host_header,
+            "User-Agent": _USER_AGENT,
+            "Accept": "application/json",
+            "Accept-Encoding": "identity",
+            "Connection": "keep-alive",
+        }
+        body = b""
+        if json_body is not None:
+            body = json.dumps(json_body).encode("utf-8")
+            request_headers["Content-Type"] = "application/json"
+        if body or method in ("POST", "PUT", "PATCH"):
+            request_headers["Content-Length"] = str(len(body))
+        request_headers.update(headers or {})
+
+        head = f"{method} {target} HTTP/1.1\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in request_headers.items()
+        )
+        payload = head.encode("latin-1") + b"\r\n" + body
+
+        try:
+            return await asyncio.wait_for(
+                self._send(key, method, payload), timeout=self._timeout
+            )
+        except asyncio.TimeoutError as exc:
+            raise HTTPError(f"{method} {url} timed out after {self._timeout:.1f}s") from exc
+
+    async def _send(
+        self, key: tuple[str, str, int], method: str, payload: bytes
+    ) -> HTTPResponse:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _HostPool(self._max_connections_per_host)
+
+        async with pool.slots:
+            reused = self._take_idle(pool)
+            connection = reused or await self._connect(key)
+            while True:
+                try:
+                    return await self._exchange(pool, connection, method, payload)
+                except (ConnectionError, asyncio.IncompleteReadError, _StaleConnection) as exc:
+                    connection.close()
+                    if connection is not reused:
+                        raise HTTPError(f"HTTP request to {key[1]} failed: {exc}") from exc
+                    # The server dropped the idle connection; retry on a fresh one.
+                    self._logger.debug(f"Pooled connection to {key[1]} was closed, reconnecting")
+                    connection = await self._connect(key)
+                except ValueError as exc:
+                    connection.close()
+                    raise HTTPError(f"Malformed response from {key[1]}: {exc}") from exc
+                except BaseException:
+                    # Cancelled or timed out mid-exchange: the stream is unusable.
+                    connection.close()
+                    raise
+
+    def _take_idle(self, pool: _HostPool) -> _Connection | None:
+        while pool.idle:
+            connection = pool.idle.pop()
+            if connection.is_usable(self._keepalive_timeout):
+                return connection
+            connection.close()
+        return None
+
+    async def _connect(self, key: tuple[str, str, int]) -> _Connection:
+        scheme, host, port = key
+        context = None
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            context = self._ssl_context
+        try:
+            reader, writer = await asyncio.open_connection(
+                host, port, ssl=context, limit=_MAX_LINE
+            )
+        except OSError as exc:
+            raise HTTPError(f"Could not connect to {host}:{port}: {exc}") from exc
+        self.connections_opened += 1
+        return _Connection(reader, writer)
+
+    async def _exchange(
+        self,
+        pool: _HostPool,
+        connection: _Connection,
+        method: str,
+        payload: bytes,
+    ) -> HTTPResponse:
+        connection.writer.write(payload)
+        await connection.writer.drain()
+        self.requests_sent += 1
+
+        reader = connection.reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise _StaleConnection("connection closed before response")
+        version, status, reason = _parse_status_line(status_line)
+
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n"):
+                break
+            if not line:
+                raise asyncio.IncompleteReadError(b"", None)
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = version == "HTTP/1.1"
+        connection_header = headers.get("connection", "").lower()
+        if connection_header == "close":
+            keep_alive = False
+        elif connection_header == "keep-alive":
+            keep_alive = True
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            body = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await _read_chunked(reader)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        if keep_alive and not self._closed:
+            connection.last_used = time.monotonic()
+            pool.idle.append(connection)
+        else:
+            connection.close()
+
+        return HTTPResponse(status=status, reason=reason, headers=headers, body=body)
+
+    def _decode(self, response: HTTPResponse) -> Any:
+        if not 200 <= response.status < 300:
+            raise HTTPError(
+                f"HTTP {response.status} {response.reason}".rstrip(),
+                status=response.status,
+                headers=response.headers,
+            )
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise HTTPError(
+                f"Invalid JSON in response: {exc}",
+                status=response.status,
+                headers=response.headers,
+            ) from exc
+
+
+class _StaleConnection(Exception):
+    """A pooled connection was closed by the server before answering."""
+
+
+def _parse_status_line(line: bytes) -> tuple[str, int, str]:
+    parts = line.decode("latin-1").strip().split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise ValueError(f"Malformed status line: {line!r}")
+    return parts[0], int(parts[1]), parts[2] if len(parts) > 2 else ""
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise asyncio.IncompleteReadError(b"", None)
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            # Skip optional trailers up to the terminating blank line.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()
@@ -0,0 +1,77 @@
+"""Group pending metadata so items sharing a title are matched once."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from media_manager.models import MediaType, VideoMetadata
+
+_SEPARATORS = re.compile(r"[._\-]+")
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_title(title: str) -> str:
+    """Fold a parsed title so spelling variants of one show compare equal.
+
+    Case, accents, punctuation and separator runs are ignored, so
+    ``"Marvel's.Agents-of_SHIELD"`` and ``"marvels agents of shield"``
+    normalize alike.
+    """
+    folded = unicodedata.normalize("NFKD", title)
+    folded = "".join(char for char in folded if not unicodedata.combining(char))
+    folded = _SEPARATORS.sub(" ", folded.casefold())
+    folded = _PUNCTUATION.sub("", folded)
+    return _WHITESPACE.sub(" ", folded).strip()
+
+
+@dataclass(frozen=True)
+class MatchKey:
+    """Identity of a provider lookup shared by several files."""
+
+    title: str
+    year: int | None
+    media_type: MediaType
+
+    @classmethod
+    def for_metadata(cls, metadata: VideoMetadata) -> MatchKey:
+        """Build the grouping key for a metadata item."""
+        return cls(normalize_title(metadata.title), metadata.year, metadata.media_type)
+
+
+@dataclass
+class MatchGroup:
+    """Metadata items that resolve to the same show or movie."""
+
+    key: MatchKey
+    members: list[VideoMetadata] = field(default_factory=list)
+
+    @property
+    def representative(self) -> VideoMetadata:
+        """The item whose title and year are sent to the providers."""
+        return self.members[0]
+
+
+def plan_match_groups(metadata_list: Iterable[VideoMetadata]) -> list[MatchGroup]:
+    """Group metadata by normalized title, year and media type.
+
+    Groups are returned in order of first appearance and keep their
+    members in input order, so progress follows the scan order.
+
+    Args:
+        metadata_list: Metadata items waiting to be matched
+
+    Returns:
+        One group per distinct lookup
+    """
+    groups: dict[MatchKey, MatchGroup] = {}
+    for metadata in metadata_list:
+        key = MatchKey.for_metadata(metadata)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = MatchGroup(key)
+        group.members.append(metadata)
+    return list(groups.values())
@@ -0,0 +1,414 @@
+"""Shared rate limiting and adaptive concurrency for provider API calls."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Iterator, Tuple, Union
+
+from media_manager.instrumentation import get_instrumentation
+from media_manager.logging import get_logger
+
+from .base import ProviderError
+
+# (requests per second, burst size) for each provider's API.
+DEFAULT_RATE_LIMITS: dict[str, tuple[float, int]] = {
+    "TMDB": (40.0, 20),
+    "TVDB": (20.0, 10),
+}
+_FALLBACK_RATE_LIMIT = (10.0, 5)
+
+DEFAULT_RETRY_AFTER = 1.0  # Seconds to pause on a 429 without a Retry-After header
+_CONGESTION_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RateLimitedError(ProviderError):
+    """The provider answered 429 Too Many Requests."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None, default: float = DEFAULT_RETRY_AFTER) -> float:
+    """Parse a ``Retry-After`` header (delta seconds or HTTP date) into seconds."""
+    if not value:
+        return default
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out start times instead of blocking.
+
+    ``reserve()`` books the next free slot and returns how long the caller
+    must wait before using it, so the same bucket serves threads (which
+    sleep) and event loops (which ``asyncio.sleep``).
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Sustained requests per second
+            capacity: Requests allowed back to back after an idle period
+        """
+        self._interval = 1.0 / rate
+        self._tolerance = (max(1, capacity) - 1) * self._interval
+        self._next_slot = 0.0  # Theoretical arrival time of the next request
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.rate = rate
+        self.capacity = capacity
+
+    def reserve(self) -> float:
+        """Book a slot and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            next_slot = max(self._next_slot, now)
+            allowed_at = max(next_slot - self._tolerance, self._paused_until, now)
+            self._next_slot = max(next_slot, allowed_at) + self._interval
+            return allowed_at - now
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no slots for ``seconds``, then resume without a burst."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._next_slot = max(self._next_slot, until + self._tolerance)
+
+
+_Waiter = Union[threading.Event, Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]]
+
+
+class AIMDController:
+    """Concurrency limit with additive increase and multiplicative decrease.
+
+    The limit grows by one after a full window of successful requests and is
+    cut by ``backoff`` on a congestion signal (429, 5xx, transport error) or
+    when latency climbs above ``latency_tolerance`` times its best recent
+    level. Waiting threads and coroutines are woken in arrival order.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 32,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            initial: Starting concurrency limit
+            minimum: Lowest limit a decrease can reach
+            maximum: Highest limit an increase can reach
+            backoff: Factor applied to the limit on congestion
+            latency_tolerance: Latency ratio over the baseline counted as congestion
+            cooldown: Seconds after a decrease during which further signals are ignored
+        """
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._limit = min(max(initial, self._minimum), self._maximum)
+        self._backoff = backoff
+        self._latency_tolerance = latency_tolerance
+        self._cooldown = cooldown
+        self._in_flight = 0
+        self._successes = 0
+        self._latency: float | None = None  # Moving average
+        self._baseline: float | None = None
+        self._last_decrease = float("-inf")
+        self._waiters: deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """Callers queued for a slot."""
+        return len(self._waiters)
+
+    def acquire(self) -> None:
+        """Block the calling thread until a slot is free."""
+        with self._lock:
+            if not self._waiters and self._in_flight < self._limit:
+                self._in_flight += 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        # The releasing side counts the slot for us before setting the event.
+        event.wait()
+
+    async def acquire_async(self) -> None:
+        """Wait on the running event loop until a slot is free."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self._in_flight < self._limit:
+                self._in_flight += 1
+                return
+            future: asyncio.Future[None] = loop.create_future()
+            waiter = (loop, future)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                    granted = False
+                except ValueError:
+                    granted = True
+            if granted:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Give a slot back and wake the next waiter if the limit allows."""
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    def record_success(self, latency: float) -> None:
+        """Feed a completed request's latency into the controller."""
+        with self._lock:
+            self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+            if self._baseline is None or self._latency < self._baseline:
+                self._baseline = self._latency
+
+            if self._latency > self._baseline * self._latency_tolerance:
+                if self._decrease():
+                    # Accept the new level so only a further rise backs off again.
+                    self._baseline = self._latency / self._latency_tolerance
+                return
+
+            self._successes += 1
+            if self._successes >= self._limit and self._limit < self._maximum:
+                self._limit += 1
+                self._successes = 0
+                self._wake_waiters()
+
+    def record_congestion(self) -> None:
+        """Back off after a throttled, failed or timed-out request."""
+        with self._lock:
+            self._decrease()
+
+    def _decrease(self) -> bool:
+        now = time.monotonic()
+        if now - self._last_decrease < self._cooldown:
+            return False
+        self._last_decrease = now
+        self._limit = max(self._minimum, int(self._limit * self._backoff))
+        self._successes = 0
+        return True
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self._limit:
+            waiter = self._waiters.popleft()
+            self._in_flight += 1
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+            else:
+                loop, future = waiter
+                loop.call_soon_threadsafe(_resolve, future)
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class RequestTicket:
+    """Handle for one rate-limited request, used to report its outcome."""
+
+    def __init__(self) -> None:
+        self.status: int | None = None
+        self.retry_after: float | None = None
+
+    def observe(self, status: int, retry_after: str | None = None) -> None:
+        """Record the response status (and ``Retry-After`` header on a 429)."""
+        self.status = status
+        if status == 429:
+            self.retry_after = parse_retry_after(retry_after)
+
+
+class ProviderRateLimiter:
+    """Token bucket plus AIMD concurrency control for one provider API key.
+
+    Obtain instances from ``get_rate_limiter`` so that every worker thread and
+    event loop talking to the same provider with the same key shares them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: int,
+        controller: AIMDController | None = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            name: Metric prefix, e.g. ``rate_limiter.TMDB.1a2b3c4d``
+            rate: Sustained requests per second
+            burst: Requests allowed back to back after an idle period
+            controller: Concurrency controller; a default one is created if None
+        """
+        self.name = name
+        self.bucket = TokenBucket(rate, burst)
+        self.controller = controller or AIMDController()
+        self._dispatched: deque[float] = deque()
+        self._sleeping = 0
+        self._lock = threading.Lock()
+        self._logger = get_logger().get_logger(__name__)
+        self._instrumentation = get_instrumentation()
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a concurrency slot or a token."""
+        return self.controller.waiting + self._sleeping
+
+    @contextmanager
+    def request(self) -> Iterator[RequestTicket]:
+        """Hold a slot and a token for one blocking request.
+
+        Call ``observe`` on the yielded ticket with the response status. An
+        exception leaving the block before that counts as congestion.
+        """
+        self._publish()
+        self.controller.acquire()
+        try:
+            delay = self.bucket.reserve()
+            if delay > 0:
+                self._set_sleeping(+1)
+                try:
+                    time.sleep(delay)
+                finally:
+                    self._set_sleeping(-1)
+            with self._track() as ticket:
+                yield ticket
+        finally:
+            self.controller.release()
+            self._publish()
+
+    @asynccontextmanager
+    async def request_async(self) -> AsyncIterator[RequestTicket]:
+        """Async variant of ``request``."""
+        self._publish()
+        await self.controller.acquire_async()
+        try:
+            delay = self.bucket.reserve()
+            if delay > 0:
+                self._set_sleeping(+1)
+                try:
+                    await asyncio.sleep(delay)
+                finally:
+                    self._set_sleeping(-1)
+            with self._track() as ticket:
+                yield ticket
+        finally:
+            self.controller.release()
+            self._publish()
+
+    @contextmanager
+    def _track(self) -> Iterator[RequestTicket]:
+        """Time one dispatched request and feed its outcome to the controller."""
+        with self._lock:
+            self._dispatched.append(time.monotonic())
+        self._publish()
+
+        ticket = RequestTicket()
+        started = time.monotonic()
+        try:
+            yield ticket
+        except BaseException:
+            if ticket.status is None:
+                # No response at all: connection error, timeout or cancellation.
+                self.controller.record_congestion()
+                raise
+            self._settle(ticket, time.monotonic() - started)
+            raise
+        self._settle(ticket, time.monotonic() - started)
+
+    def _settle(self, ticket: RequestTicket, latency: float) -> None:
+        if ticket.retry_after is not None:
+            self._logger.warning(
+                f"{self.name} throttled, pausing for {ticket.retry_after:.1f}s"
+            )
+            self.bucket.pause(ticket.retry_after)
+            self._instrumentation.increment_counter(f"{self.name}.throttled")
+        if ticket.status in _CONGESTION_STATUSES:
+            self.controller.record_congestion()
+        else:
+            self.controller.record_success(latency)
+
+    def _set_sleeping(self, delta: int) -> None:
+        with self._lock:
+            self._sleeping += delta
+        self._publish()
+
+    def _publish(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            while self._dispatched and now - self._dispatched[0] > 1.0:
+                self._dispatched.popleft()
+            rate = len(self._dispatched)
+        self._instrumentation.set_gauge(f"{self.name}.rate", rate)
+        self._instrumentation.set_gauge(f"{self.name}.queue_depth", self.queue_depth)
+        self._instrumentation.set_gauge(f"{self.name}.concurrency", self.controller.limit)
+
+
+_limiters: dict[tuple[str, str], ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, api_key: str | None) -> ProviderRateLimiter:
+    """Get the process-wide limiter for a provider and API key.
+
+    Args:
+        provider: Provider API name, e.g. ``"TMDB"``
+        api_key: API key the requests are made with
+
+    Returns:
+        The shared ProviderRateLimiter for that pair
+    """
+    key_id = hashlib.sha1((api_key or "").encode()).hexdigest()[:8]
+    with _limiters_lock:
+        limiter = _limiters.get((provider, key_id))
+        if limiter is None:
+            rate, burst = DEFAULT_RATE_LIMITS.get(provider, _FALLBACK_RATE_LIMIT)
+            limiter = ProviderRateLimiter(f"rate_limiter.{provider}.{key_id}", rate, burst)
+            _limiters[(provider, key_id)] = limiter
+        return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Drop every shared limiter (mainly for tests)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,95 @@
+"""In-flight deduplication of identical provider lookups."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from .base import ProviderError
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one call per key at a time and share its outcome.
+
+    The first caller for a key (the leader) runs the call; callers arriving
+    while it is in flight wait on the same future and receive its result or
+    exception. Threads and coroutines on any event loop can share one
+    instance, because the shared future is a ``concurrent.futures.Future``.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, Future[T]] = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched."""
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: str, call: Callable[[], T]) -> tuple[T, bool]:
+        """Run ``call`` for ``key`` unless an identical call is in flight.
+
+        Returns:
+            The result and whether it was shared from another caller
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = call()
+        except BaseException as exc:
+            self._finish(key, future, exc=exc)
+            raise
+        self._finish(key, future, result=result)
+        return result, False
+
+    async def do_async(
+        self, key: str, call: Callable[[], Awaitable[T]]
+    ) -> tuple[T, bool]:
+        """Async variant of ``do``.
+
+        A follower that is cancelled stops waiting without cancelling the
+        leader's call.
+        """
+        future, leader = self._join(key)
+        if not leader:
+            result = await asyncio.shield(asyncio.wrap_future(future))
+            return result, True
+
+        try:
+            result = await call()
+        except BaseException as exc:
+            self._finish(key, future, exc=exc)
+            raise
+        self._finish(key, future, result=result)
+        return result, False
+
+    def _join(self, key: str) -> tuple[Future[T], bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def _finish(
+        self,
+        key: str,
+        future: Future[T],
+        result: T | None = None,
+        exc: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+        if exc is None:
+            future.set_result(result)  # type: ignore[arg-type]
+        elif isinstance(exc, Exception):
+            future.set_exception(exc)
+        else:
+            # Don't hand the leader's cancellation or interrupt to the followers.
+            future.set_exception(ProviderError("Shared lookup was cancelled"))
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import hashlib
-from pathlib import Path
-from typing import Any
+import asyncio
+from typing import Any, Callable, TypeVar
 
 import requests  # type: ignore[import-untyped]
 from tenacity import (
     retry,
+    retry_if_exception,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
@@ -18,6 +18,13 @@ from media_manager.logging import get_logger
 from media_manager.settings import get_settings
 
 from .base import BaseProvider, ProviderError, ProviderResult
+from .http_client import HTTPError, get_requests_session, is_transport_error
+from .rate_limit import RateLimitedError, get_rate_limiter
+
+T = TypeVar("T")
+
+# Everything enrichment needs, fetched alongside the title in one request.
+DETAILS_APPEND_TO_RESPONSE = "credits,videos,images"
 
 
 class TMDBProvider(BaseProvider):
@@ -25,7 +32,7 @@ class TMDBProvider(BaseProvider):
 
     DEFAULT_API_BASE = "https://api.themoviedb.org/3"
     DEFAULT_IMAGE_BASE = "https://image.tmdb.org/t/p"
-    CACHE_DIR = Path.home() / ".media-manager" / "tmdb_cache"
+    caches_responses = True
 
     def __init__(self, api_key: str | None = None) -> None:
         """Initialize TMDB provider.
@@ -35,7 +42,6 @@ class TMDBProvider(BaseProvider):
         """
         super().__init__(api_key)
         self._logger = get_logger().get_logger(__name__)
-        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
         self._settings = get_settings()
 
     @property
@@ -65,7 +71,8 @@ class TMDBProvider(BaseProvider):
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(requests.RequestException),
+        retry=retry_if_exception_type((requests.RequestException, RateLimitedError)),
+        reraise=True,
     )
     def _api_call(
         self, endpoint: str, params: dict[str, Any] | None = None
@@ -91,12 +98,17 @@ class TMDBProvider(BaseProvider):
 
         params["api_key"] = api_key
 
+        limiter = get_rate_limiter("TMDB", api_key)
         try:
-            response = requests.get(
-                f"{self.api_base}{endpoint}",
-                params=params,
-                timeout=10,
-            )
+            with limiter.request() as ticket:
+                response = get_requests_session("TMDB").get(
+                    f"{self.api_base}{endpoint}",
+                    params=params,
+                    timeout=10,
+                )
+                ticket.observe(response.status_code, response.headers.get("Retry-After"))
+            if ticket.retry_after is not None:
+                raise RateLimitedError("TMDB rate limit exceeded", ticket.retry_after)
             response.raise_for_status()
             result: dict[str, Any] = response.json()
             return result
@@ -104,54 +116,107 @@ class TMDBProvider(BaseProvider):
             self._logger.error(f"TMDB API error: {exc}")
             raise ProviderError(f"TMDB API call failed: {exc}") from exc
 
-    def _get_cache_path(self, key: str) -> Path:
-        """Get cache file path for a key.
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=(
+            retry_if_exception(is_transport_error)
+            | retry_if_exception_type(RateLimitedError)
+        ),
+        reraise=True,
+    )
+    async def _api_call_async(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Make an API call to TMDB through ``http_client``.
 
-        Args:
-            key: Cache key (any string)
+        Falls back to the blocking ``_api_call`` in a worker thread when no
+        client is bound.
 
-        Returns:
-            Path to cache file
+        Raises:
+            ProviderError: If API key is not set or API call fails
         """
-        hash_key = hashlib.md5(key.encode()).hexdigest()
-        return self.CACHE_DIR / f"{hash_key}.json"
+        client = self.http_client
+        if client is None:
+            return await asyncio.to_thread(self._api_call, endpoint, params)
 
-    def _load_from_cache(self, key: str) -> dict[str, Any] | None:
-        """Load data from cache.
+        api_key = self.effective_api_key
+        if not api_key:
+            raise ProviderError("TMDB API key is not configured")
 
-        Args:
-            key: Cache key
+        params = dict(params or {})
+        params["api_key"] = api_key
 
-        Returns:
-            Cached data or None if not found
-        """
-        cache_path = self._get_cache_path(key)
-        if cache_path.exists():
-            try:
-                import json
+        limiter = get_rate_limiter("TMDB", api_key)
+        try:
+            async with limiter.request_async() as ticket:
+                try:
+                    result: dict[str, Any] = await client.get_json(
+                        f"{self.api_base}{endpoint}", params=params
+                    )
+                except HTTPError as exc:
+                    if exc.status is not None:
+                        ticket.observe(exc.status, exc.headers.get("retry-after"))
+                    raise
+                ticket.observe(200)
+            return result
+        except HTTPError as exc:
+            self._logger.error(f"TMDB API error: {exc}")
+            if exc.status is None:
+                raise
+            if ticket.retry_after is not None:
+                raise RateLimitedError("TMDB rate limit exceeded", ticket.retry_after) from exc
+            raise ProviderError(f"TMDB API call failed: {exc}") from exc
 
-                with open(cache_path, encoding="utf-8") as f:
-                    data: dict[str, Any] = json.load(f)
-                    return data
-            except Exception as exc:
-                self._logger.debug(f"Failed to load cache: {exc}")
-        return None
+    async def _fetch_async(
+        self,
+        cache_key: str,
+        endpoint: str,
+        params: dict[str, Any],
+        action: str,
+        parse: Callable[[dict[str, Any]], T],
+    ) -> T:
+        """Parse the cached response for ``cache_key``, fetching it on a miss."""
+        cached = self._load_from_cache(cache_key)
+        if cached:
+            return parse(cached)
+
+        try:
+            response = await self._api_call_async(endpoint, params)
+            self._save_to_cache(cache_key, response)
+            return parse(response)
+        except HTTPError as exc:
+            raise ProviderError(f"TMDB API call failed: {exc}") from exc
+        except ProviderError:
+            raise
+        except Exception as exc:
+            self._logger.error(f"Failed to {action}: {exc}")
+            raise ProviderError(f"Failed to {action}: {exc}") from exc
 
-    def _save_to_cache(self, key: str, data: dict[str, Any]) -> None:
-        """Save data to cache.
+    def _details_response(self, external_id: str, media_type: str) -> dict[str, Any]:
+        """Fetch a movie or series with credits, videos and images appended.
+
+        Details, cast and trailers are all read from this one cached
+        response, so enriching a title costs a single request.
 
         Args:
-            key: Cache key
-            data: Data to cache
+            external_id: TMDB ID
+            media_type: "movie" or "tv"
+
+        Returns:
+            Raw API response
         """
-        cache_path = self._get_cache_path(key)
-        try:
-            import json
+        cache_key = f"{media_type}_details:{external_id}"
+        cached = self._load_from_cache(cache_key)
+        if cached:
+            return cached
 
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as exc:
-            self._logger.debug(f"Failed to save cache: {exc}")
+        response = self._api_call(
+            f"/{media_type}/{external_id}",
+            {"append_to_response": DETAILS_APPEND_TO_RESPONSE},
+        )
+        self._save_to_cache(cache_key, response)
+        return response
 
     def search_movie(self, title: str, year: int | None = None) -> list[ProviderResult]:
         """Search for a movie by title and optional year.
@@ -163,7 +228,7 @@ class TMDBProvider(BaseProvider):
         Returns:
             List of ProviderResult objects
         """
-        cache_key = f"movie_search:{title}:{year}"
+        cache_key = self.search_cache_key(title, year, movie=True)
         cached = self._load_from_cache(cache_key)
         if cached:
             return self._parse_search_results(cached, "movie")
@@ -192,7 +257,7 @@ class TMDBProvider(BaseProvider):
         Returns:
             List of ProviderResult objects
         """
-        cache_key = f"tv_search:{title}:{year}"
+        cache_key = self.search_cache_key(title, year, movie=False)
         cached = self._load_from_cache(cache_key)
         if cached:
             return self._parse_search_results(cached, "tv")
@@ -220,17 +285,8 @@ class TMDBProvider(BaseProvider):
         Returns:
             ProviderResult with complete metadata
         """
-        cache_key = f"movie_details:{external_id}"
-        cached = self._load_from_cache(cache_key)
-        if cached:
-            return self._parse_movie_details(cached)
-
         try:
-            response = self._api_call(
-                f"/movie/{external_id}", {"append_to_response": "credits,videos,images"}
-            )
-            self._save_to_cache(cache_key, response)
-            return self._parse_movie_details(response)
+            return self._parse_movie_details(self._details_response(external_id, "movie"))
         except ProviderError:
             raise
         except Exception as exc:
@@ -269,24 +325,74 @@ class TMDBProvider(BaseProvider):
                 self._logger.error(f"Failed to get TV episode details: {exc}")
                 raise ProviderError(f"Failed to get TV episode details: {exc}") from exc
         else:
-            cache_key = f"tv_details:{external_id}"
-            cached = self._load_from_cache(cache_key)
-            if cached:
-                return self._parse_tv_details(cached)
-
             try:
-                response = self._api_call(
-                    f"/tv/{external_id}",
-                    {"append_to_response": "credits,videos,images"},
-                )
-                self._save_to_cache(cache_key, response)
-                return self._parse_tv_details(response)
+                return self._parse_tv_details(self._details_response(external_id, "tv"))
             except ProviderError:
                 raise
             except Exception as exc:
                 self._logger.error(f"Failed to get TV details: {exc}")
                 raise ProviderError(f"Failed to get TV details: {exc}") from exc
 
+    async def search_movie_async(
+        self, title: str, year: int | None = None
+    ) -> list[ProviderResult]:
+        """Async variant of ``search_movie``."""
+        params: dict[str, Any] = {"query": title, "include_adult": False}
+        if year:
+            params["year"] = year
+        return await self._fetch_async(
+            self.search_cache_key(title, year, movie=True),
+            "/search/movie",
+            params,
+            "search movie",
+            lambda response: self._parse_search_results(response, "movie"),
+        )
+
+    async def search_tv_async(
+        self, title: str, year: int | None = None
+    ) -> list[ProviderResult]:
+        """Async variant of ``search_tv``."""
+        params: dict[str, Any] = {"query": title, "include_adult": False}
+        if year:
+            params["first_air_date_year"] = year
+        return await self._fetch_async(
+            self.search_cache_key(title, year, movie=False),
+            "/search/tv",
+            params,
+            "search TV series",
+            lambda response: self._parse_search_results(response, "tv"),
+        )
+
+    async def get_movie_details_async(self, external_id: str) -> ProviderResult:
+        """Async variant of ``get_movie_details``."""
+        return await self._fetch_async(
+            f"movie_details:{external_id}",
+            f"/movie/{external_id}",
+            {"append_to_response": DETAILS_APPEND_TO_RESPONSE},
+            "get movie details",
+            self._parse_movie_details,
+        )
+
+    async def get_tv_details_async(
+        self, external_id: str, season: int | None = None, episode: int | None = None
+    ) -> ProviderResult:
+        """Async variant of ``get_tv_details``."""
+        if season is not None and episode is not None:
+            return await self._fetch_async(
+                f"tv_episode_details:{external_id}:{season}:{episode}",
+                f"/tv/{external_id}/season/{season}/episode/{episode}",
+                {"append_to_response": "credits,videos"},
+                "get TV episode details",
+                self._parse_tv_details,
+            )
+        return await self._fetch_async(
+            f"tv_details:{external_id}",
+            f"/tv/{external_id}",
+            {"append_to_response": DETAILS_APPEND_TO_RESPONSE},
+            "get TV details",
+            self._parse_tv_details,
+        )
+
     def get_cast(self, external_id: str, media_type: str) -> list[str]:
         """Get cast list for a movie or TV series.
 
@@ -298,8 +404,7 @@ class TMDBProvider(BaseProvider):
             List of actor names
         """
         try:
-            endpoint = f"/{media_type}/{external_id}"
-            response = self._api_call(endpoint, {"append_to_response": "credits"})
+            response = self._details_response(external_id, media_type)
             credits = response.get("credits", {})
             cast_list = credits.get("cast", [])
             return [person["name"] for person in cast_list[:10]]  # Top 10 cast members
@@ -318,8 +423,7 @@ class TMDBProvider(BaseProvider):
             List of trailer URLs
         """
         try:
-            endpoint = f"/{media_type}/{external_id}"
-            response = self._api_call(endpoint, {"append_to_response": "videos"})
+            response = self._details_response(external_id, media_type)
             videos = response.get("videos", {})
             results = videos.get("results", [])
             trailers = []
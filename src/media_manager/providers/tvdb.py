@@ -2,30 +2,42 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
-from pathlib import Path
-from typing import Any
+import asyncio
+from typing import Any, Callable, TypeVar
 
 import requests  # type: ignore[import-untyped]
 from tenacity import (
     retry,
+    retry_if_exception,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
 
+from media_manager.cache_service import get_cache_service
 from media_manager.logging import get_logger
 from media_manager.settings import get_settings
 
 from .base import BaseProvider, ProviderError, ProviderResult
+from .http_client import (
+    AsyncHTTPClient,
+    HTTPError,
+    get_requests_session,
+    is_transport_error,
+)
+from .rate_limit import RateLimitedError, get_rate_limiter
+
+T = TypeVar("T")
+
+# TVDB tokens are valid for a month; refresh them a little early.
+TOKEN_CACHE_TTL = 25 * 24 * 3600
 
 
 class TVDBProvider(BaseProvider):
     """Provider for TVDB API (v4)."""
 
     API_BASE = "https://api4.thetvdb.com/v4"
-    CACHE_DIR = Path.home() / ".media-manager" / "tvdb_cache"
+    caches_responses = True
 
     def __init__(self, api_key: str | None = None) -> None:
         """Initialize TVDB provider.
@@ -35,7 +47,6 @@ class TVDBProvider(BaseProvider):
         """
         super().__init__(api_key)
         self._logger = get_logger().get_logger(__name__)
-        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
         self._token: str | None = None
         self._settings = get_settings()
 
@@ -47,28 +58,24 @@ class TVDBProvider(BaseProvider):
             return alt_key
         return self.api_key
 
+    def _load_cached_token(self) -> str | None:
+        cached = get_cache_service().get(self.name, "token")
+        return cached.get("token") if cached else None
+
+    def _store_token(self, token: str) -> None:
+        get_cache_service().set(self.name, "token", {"token": token}, ttl=TOKEN_CACHE_TTL)
+
     def _authenticate(self) -> None:
         """Authenticate and get token for TVDB API v4."""
         if not self.effective_api_key:
             raise ProviderError("TVDB API key is not configured")
 
-        cache_key = "tvdb_token"
-        cache_path = (
-            self.CACHE_DIR / f"{hashlib.md5(cache_key.encode()).hexdigest()}.json"
-        )
-
-        if cache_path.exists():
-            try:
-                with open(cache_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._token = data.get("token")
-                    if self._token:
-                        return
-            except Exception as exc:
-                self._logger.debug(f"Failed to load token cache: {exc}")
+        self._token = self._load_cached_token()
+        if self._token:
+            return
 
         try:
-            response = requests.post(
+            response = get_requests_session("TVDB").post(
                 f"{self.API_BASE}/login",
                 json={"apikey": self.effective_api_key},
                 timeout=10,
@@ -78,20 +85,39 @@ class TVDBProvider(BaseProvider):
             self._token = data.get("data", {}).get("token")
 
             if self._token:
-                try:
-                    cache_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(cache_path, "w", encoding="utf-8") as f:
-                        json.dump({"token": self._token}, f)
-                except Exception as exc:
-                    self._logger.debug(f"Failed to cache token: {exc}")
+                self._store_token(self._token)
         except requests.RequestException as exc:
             self._logger.error(f"TVDB authentication failed: {exc}")
             raise ProviderError(f"TVDB authentication failed: {exc}") from exc
 
+    async def _authenticate_async(self, client: AsyncHTTPClient) -> None:
+        """Async variant of ``_authenticate``."""
+        if not self.effective_api_key:
+            raise ProviderError("TVDB API key is not configured")
+
+        self._token = self._load_cached_token()
+        if self._token:
+            return
+
+        try:
+            data = await client.post_json(
+                f"{self.API_BASE}/login", {"apikey": self.effective_api_key}
+            )
+        except HTTPError as exc:
+            self._logger.error(f"TVDB authentication failed: {exc}")
+            raise ProviderError(f"TVDB authentication failed: {exc}") from exc
+
+        self._token = data.get("data", {}).get("token")
+        if self._token:
+            self._store_token(self._token)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((requests.RequestException, TimeoutError)),
+        retry=retry_if_exception_type(
+            (requests.RequestException, RateLimitedError, TimeoutError)
+        ),
+        reraise=True,
     )
     def _api_call(
         self, endpoint: str, params: dict[str, Any] | None = None
@@ -115,13 +141,18 @@ class TVDBProvider(BaseProvider):
             "Authorization": f"Bearer {self._token}",
         }
 
+        limiter = get_rate_limiter("TVDB", self.effective_api_key)
         try:
-            response = requests.get(
-                f"{self.API_BASE}{endpoint}",
-                params=params,
-                headers=headers,
-                timeout=10,
-            )
+            with limiter.request() as ticket:
+                response = get_requests_session("TVDB").get(
+                    f"{self.API_BASE}{endpoint}",
+                    params=params,
+                    headers=headers,
+                    timeout=10,
+                )
+                ticket.observe(response.status_code, response.headers.get("Retry-After"))
+            if ticket.retry_after is not None:
+                raise RateLimitedError("TVDB rate limit exceeded", ticket.retry_after)
             response.raise_for_status()
             result: dict[str, Any] = response.json()
             return result
@@ -129,50 +160,82 @@ class TVDBProvider(BaseProvider):
             self._logger.error(f"TVDB API error: {exc}")
             raise ProviderError(f"TVDB API call failed: {exc}") from exc
 
-    def _get_cache_path(self, key: str) -> Path:
-        """Get cache file path for a key.
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=(
+            retry_if_exception(is_transport_error)
+            | retry_if_exception_type(RateLimitedError)
+        ),
+        reraise=True,
+    )
+    async def _api_call_async(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Make an API call to TVDB through ``http_client``.
 
-        Args:
-            key: Cache key (any string)
+        Falls back to the blocking ``_api_call`` in a worker thread when no
+        client is bound.
 
-        Returns:
-            Path to cache file
+        Raises:
+            ProviderError: If not authenticated or API call fails
         """
-        hash_key = hashlib.md5(key.encode()).hexdigest()
-        return self.CACHE_DIR / f"{hash_key}.json"
+        client = self.http_client
+        if client is None:
+            return await asyncio.to_thread(self._api_call, endpoint, params)
 
-    def _load_from_cache(self, key: str) -> dict[str, Any] | None:
-        """Load data from cache.
+        if not self._token:
+            await self._authenticate_async(client)
 
-        Args:
-            key: Cache key
+        headers = {
+            "Authorization": f"Bearer {self._token}",
+        }
 
-        Returns:
-            Cached data or None if not found
-        """
-        cache_path = self._get_cache_path(key)
-        if cache_path.exists():
-            try:
-                with open(cache_path, encoding="utf-8") as f:
-                    data: dict[str, Any] = json.load(f)
-                    return data
-            except Exception as exc:
-                self._logger.debug(f"Failed to load cache: {exc}")
-        return None
+        limiter = get_rate_limiter("TVDB", self.effective_api_key)
+        try:
+            async with limiter.request_async() as ticket:
+                try:
+                    result: dict[str, Any] = await client.get_json(
+                        f"{self.API_BASE}{endpoint}", params=params, headers=headers
+                    )
+                except HTTPError as exc:
+                    if exc.status is not None:
+                        ticket.observe(exc.status, exc.headers.get("retry-after"))
+                    raise
+                ticket.observe(200)
+            return result
+        except HTTPError as exc:
+            self._logger.error(f"TVDB API error: {exc}")
+            if exc.status is None:
+                raise
+            if ticket.retry_after is not None:
+                raise RateLimitedError("TVDB rate limit exceeded", ticket.retry_after) from exc
+            raise ProviderError(f"TVDB API call failed: {exc}") from exc
 
-    def _save_to_cache(self, key: str, data: dict[str, Any]) -> None:
-        """Save data to cache.
+    async def _fetch_async(
+        self,
+        cache_key: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        action: str,
+        parse: Callable[[dict[str, Any]], T],
+    ) -> T:
+        """Parse the cached response for ``cache_key``, fetching it on a miss."""
+        cached = self._load_from_cache(cache_key)
+        if cached:
+            return parse(cached)
 
-        Args:
-            key: Cache key
-            data: Data to cache
-        """
-        cache_path = self._get_cache_path(key)
         try:
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            response = await self._api_call_async(endpoint, params)
+            self._save_to_cache(cache_key, response)
+            return parse(response)
+        except HTTPError as exc:
+            raise ProviderError(f"TVDB API call failed: {exc}") from exc
+        except ProviderError:
+            raise
         except Exception as exc:
-            self._logger.debug(f"Failed to save cache: {exc}")
+            self._logger.error(f"Failed to {action}: {exc}")
+            raise ProviderError(f"Failed to {action}: {exc}") from exc
 
     def search_movie(self, title: str, year: int | None = None) -> list[ProviderResult]:
         """Search for a movie by title and optional year.
@@ -186,7 +249,7 @@ class TVDBProvider(BaseProvider):
         Returns:
             List of ProviderResult objects
         """
-        cache_key = f"movie_search:{title}:{year}"
+        cache_key = self.search_cache_key(title, year, movie=True)
         cached = self._load_from_cache(cache_key)
         if cached:
             return self._parse_search_results(cached, "movie")
@@ -212,7 +275,7 @@ class TVDBProvider(BaseProvider):
         Returns:
             List of ProviderResult objects
         """
-        cache_key = f"tv_search:{title}:{year}"
+        cache_key = self.search_cache_key(title, year, movie=False)
         cached = self._load_from_cache(cache_key)
         if cached:
             return self._parse_search_results(cached, "tv")
@@ -300,6 +363,60 @@ class TVDBProvider(BaseProvider):
                 self._logger.error(f"Failed to get TV details: {exc}")
                 raise ProviderError(f"Failed to get TV details: {exc}") from exc
 
+    async def search_movie_async(
+        self, title: str, year: int | None = None
+    ) -> list[ProviderResult]:
+        """Async variant of ``search_movie``."""
+        return await self._fetch_async(
+            self.search_cache_key(title, year, movie=True),
+            "/search",
+            {"query": title, "type": "movie"},
+            "search movie",
+            lambda response: self._parse_search_results(response, "movie"),
+        )
+
+    async def search_tv_async(
+        self, title: str, year: int | None = None
+    ) -> list[ProviderResult]:
+        """Async variant of ``search_tv``."""
+        return await self._fetch_async(
+            self.search_cache_key(title, year, movie=False),
+            "/search",
+            {"query": title, "type": "series"},
+            "search TV series",
+            lambda response: self._parse_search_results(response, "tv"),
+        )
+
+    async def get_movie_details_async(self, external_id: str) -> ProviderResult:
+        """Async variant of ``get_movie_details``."""
+        return await self._fetch_async(
+            f"movie_details:{external_id}",
+            f"/movies/{external_id}",
+            {"extended": "full"},
+            "get movie details",
+            lambda response: self._parse_details(response, "movie"),
+        )
+
+    async def get_tv_details_async(
+        self, external_id: str, season: int | None = None, episode: int | None = None
+    ) -> ProviderResult:
+        """Async variant of ``get_tv_details``."""
+        if season is not None and episode is not None:
+            return await self._fetch_async(
+                f"tv_episode_details:{external_id}:{season}:{episode}",
+                f"/series/{external_id}/episodes/default/{season}/{episode}",
+                None,
+                "get TV episode details",
+                lambda response: self._parse_details(response, "tv"),
+            )
+        return await self._fetch_async(
+            f"tv_details:{external_id}",
+            f"/series/{external_id}",
+            {"extended": "full"},
+            "get TV details",
+            lambda response: self._parse_details(response, "tv"),
+        )
+
     def get_cast(self, external_id: str, media_type: str) -> list[str]:
         """Get cast list for a movie or TV series.
 
@@ -0,0 +1,263 @@
+"""Persisted checkpoints that let interrupted scans resume."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence
+
+from sqlalchemy import delete, insert, update
+from sqlmodel import select
+
+from .logging import get_logger
+from .models import MediaType, VideoMetadata
+from .persistence.database import DatabaseService, get_database_service
+from .persistence.models import JobRun, ScanCheckpoint, ScanCheckpointEntry
+from .scan_index import make_config_key
+from .scanner import ScanConfig
+
+logger_instance = get_logger()
+logger = logger_instance.get_logger(__name__)
+
+SCAN_JOB_TYPE = "scan"
+STATUS_RUNNING = "running"
+STATUS_INTERRUPTED = "interrupted"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+RESUMABLE_STATUSES = (STATUS_RUNNING, STATUS_INTERRUPTED)
+
+# Keep bulk statements below SQLite's bound parameter limit.
+_WRITE_CHUNK_SIZE = 500
+
+
+@dataclass
+class CheckpointState:
+    """State of a checkpointed scan job."""
+
+    job_run_id: int
+    frontier: list[str]
+    results: list[VideoMetadata] = field(default_factory=list)
+    items_processed: int = 0
+
+
+def make_checkpoint_key(config: ScanConfig) -> str:
+    """Hash the roots and filter settings a checkpoint is only valid for."""
+    filters = make_config_key(
+        config.ignored_directories,
+        config.ignored_extensions,
+        config.video_extensions,
+    )
+    roots = "|".join(str(root) for root in config.root_paths)
+    return hashlib.sha1(f"{roots}|{filters}".encode("utf-8")).hexdigest()
+
+
+class ScanCheckpointStore:
+    """SQLite-backed store of scan frontiers and parsed results.
+
+    Each checkpointed scan is a ``JobRun`` of type ``"scan"``. The walk
+    frontier lives in a ``ScanCheckpoint`` row and results are appended to
+    ``ScanCheckpointEntry`` in bulk, together with ``items_processed``, in
+    one transaction per checkpoint.
+    """
+
+    def __init__(self, database_service: Optional[DatabaseService] = None) -> None:
+        """Initialize the store.
+
+        Args:
+            database_service: Optional database service instance
+        """
+        self._db_service = database_service or get_database_service()
+
+    def find_resumable(self, config: ScanConfig) -> Optional[CheckpointState]:
+        """Return the latest unfinished scan for the same roots and filters.
+
+        Args:
+            config: Scan configuration of the scan to resume
+
+        Returns:
+            The checkpointed state, or None if there is nothing to resume
+        """
+        key = make_checkpoint_key(config)
+        with self._db_service.get_session() as session:
+            row = session.exec(
+                select(JobRun.id, JobRun.items_processed, ScanCheckpoint.frontier)
+                .join(ScanCheckpoint, ScanCheckpoint.job_run_id == JobRun.id)
+                .where(ScanCheckpoint.config_key == key)
+                .where(JobRun.job_type == SCAN_JOB_TYPE)
+                .where(JobRun.status.in_(RESUMABLE_STATUSES))  # type: ignore[attr-defined]
+                .order_by(JobRun.started_at.desc(), JobRun.id.desc())  # type: ignore[union-attr]
+            ).first()
+            if row is None:
+                return None
+            job_run_id, items_processed, frontier = row
+
+            entries = session.exec(
+                select(
+                    ScanCheckpointEntry.path,
+                    ScanCheckpointEntry.title,
+                    ScanCheckpointEntry.media_type,
+                    ScanCheckpointEntry.year,
+                    ScanCheckpointEntry.season,
+                    ScanCheckpointEntry.episode,
+                )
+                .where(ScanCheckpointEntry.job_run_id == job_run_id)
+                .order_by(ScanCheckpointEntry.id)
+            ).all()
+
+        results = [
+            VideoMetadata(
+                path=Path(path),
+                title=title,
+                media_type=MediaType(media_type),
+                year=year,
+                season=season,
+                episode=episode,
+            )
+            for path, title, media_type, year, season, episode in entries
+        ]
+        logger.info(
+            "Resuming scan job %d with %d results and %d pending directories",
+            job_run_id,
+            len(results),
+            len(json.loads(frontier)),
+        )
+        return CheckpointState(job_run_id, json.loads(frontier), results, items_processed)
+
+    def start(
+        self, config: ScanConfig, library_id: Optional[int] = None
+    ) -> CheckpointState:
+        """Record a new scan job whose frontier holds the scan roots.
+
+        Args:
+            config: Scan configuration
+            library_id: Optional library the scan belongs to
+
+        Returns:
+            State of the new job
+        """
+        # The frontier is a stack, so the first root goes last.
+        frontier = [str(root) for root in reversed(config.root_paths)]
+        with self._db_service.get_session() as session:
+            job_run = JobRun(
+                library_id=library_id, job_type=SCAN_JOB_TYPE, status=STATUS_RUNNING
+            )
+            session.add(job_run)
+            session.flush()
+            session.add(
+                ScanCheckpoint(
+                    job_run_id=job_run.id,
+                    config_key=make_checkpoint_key(config),
+                    frontier=json.dumps(frontier),
+                )
+            )
+            session.commit()
+            job_run_id = job_run.id
+        return CheckpointState(job_run_id, frontier)
+
+    def save(
+        self,
+        job_run_id: int,
+        frontier: Sequence[str],
+        results: Sequence[VideoMetadata],
+        items_processed: int,
+    ) -> None:
+        """Persist a checkpoint in a single transaction.
+
+        Args:
+            job_run_id: Scan job to update
+            frontier: Directories still to be listed
+            results: Results parsed since the previous checkpoint
+            items_processed: Total number of processed files
+        """
+        now = datetime.utcnow()
+        with self._db_service.get_session() as session:
+            for start in range(0, len(results), _WRITE_CHUNK_SIZE):
+                session.exec(
+                    insert(ScanCheckpointEntry),
+                    params=[
+                        {
+                            "job_run_id": job_run_id,
+                            "path": str(metadata.path),
+                            "title": metadata.title,
+                            "media_type": metadata.media_type.value,
+                            "year": metadata.year,
+                            "season": metadata.season,
+                            "episode": metadata.episode,
+                        }
+                        for metadata in results[start : start + _WRITE_CHUNK_SIZE]
+                    ],
+                )
+            session.exec(
+                update(ScanCheckpoint)
+                .where(ScanCheckpoint.job_run_id == job_run_id)
+                .values(frontier=json.dumps(list(frontier)), updated_at=now)
+            )
+            session.exec(
+                update(JobRun)
+                .where(JobRun.id == job_run_id)
+                .values(items_processed=items_processed)
+            )
+            session.commit()
+        logger.debug(
+            "Checkpointed scan job %d at %d items, %d pending directories",
+            job_run_id,
+            items_processed,
+            len(frontier),
+        )
+
+    def complete(self, job_run_id: int, items_processed: int) -> None:
+        """Mark a scan job completed and drop its checkpoint rows."""
+        self._finish(job_run_id, STATUS_COMPLETED, items_processed)
+
+    def interrupt(self, job_run_id: int, message: str) -> None:
+        """Mark a scan job interrupted, keeping its checkpoint for resuming."""
+        with self._db_service.get_session() as session:
+            session.exec(
+                update(JobRun)
+                .where(JobRun.id == job_run_id)
+                .values(status=STATUS_INTERRUPTED, error_message=message)
+            )
+            session.commit()
+
+    def discard(self, config: ScanConfig) -> int:
+        """Abandon unfinished scans for the same roots and filters.
+
+        Returns:
+            Number of jobs marked failed
+        """
+        key = make_checkpoint_key(config)
+        with self._db_service.get_session() as session:
+            job_run_ids = session.exec(
+                select(ScanCheckpoint.job_run_id).where(ScanCheckpoint.config_key == key)
+            ).all()
+        for job_run_id in job_run_ids:
+            self._finish(job_run_id, STATUS_FAILED, None, "Discarded before resuming")
+        return len(job_run_ids)
+
+    def _finish(
+        self,
+        job_run_id: int,
+        status: str,
+        items_processed: Optional[int],
+        message: Optional[str] = None,
+    ) -> None:
+        values: dict[str, object] = {"status": status, "completed_at": datetime.utcnow()}
+        if items_processed is not None:
+            values["items_processed"] = items_processed
+            values["items_succeeded"] = items_processed
+        if message is not None:
+            values["error_message"] = message
+        with self._db_service.get_session() as session:
+            session.exec(
+                delete(ScanCheckpointEntry).where(
+                    ScanCheckpointEntry.job_run_id == job_run_id
+                )
+            )
+            session.exec(
+                delete(ScanCheckpoint).where(ScanCheckpoint.job_run_id == job_run_id)
+            )
+            session.exec(update(JobRun).where(JobRun.id == job_run_id).values(**values))
+            session.commit()
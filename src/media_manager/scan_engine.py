@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Callable, Sequence
+import threading
+import time
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Sequence
 
 from PySide6.QtCore import QObject, Signal
 
@@ -10,6 +15,28 @@ from .logging import get_logger
 from .models import VideoMetadata
 from .scanner import ScanConfig, Scanner
 
+if TYPE_CHECKING:
+    from .fingerprint import FingerprintService
+    from .scan_checkpoint import ScanCheckpointStore
+    from .scan_index import ScanDelta, ScanIndex
+    from .watcher import FileChange
+
+
+@dataclass
+class StreamingScanOptions:
+    """Options controlling batching and throttling of streaming scans."""
+
+    batch_size: int = 500
+    progress_interval: float = 0.25  # Seconds between progress signals
+    progress_every: int = 1000  # Items between progress signals
+    max_retained_results: int | None = 10000  # None retains everything
+
+    def __post_init__(self) -> None:
+        self.batch_size = max(1, self.batch_size)
+        self.progress_every = max(1, self.progress_every)
+        if self.max_retained_results is not None:
+            self.max_retained_results = max(0, self.max_retained_results)
+
 
 class ScanEngine(QObject):
     """High-level scanning engine that coordinates filesystem discovery."""
@@ -17,55 +44,348 @@ class ScanEngine(QObject):
     scan_started = Signal(str)
     scan_progress = Signal(int, int, str)
     scan_completed = Signal(object)
+    scan_delta_completed = Signal(object)
+    files_relinked = Signal(object)  # list[RelinkedFile]
+    scan_resumed = Signal(int, int)  # JobRun id, restored results
+    scan_batch_ready = Signal(object)
     enrichment_task_created = Signal(object)
+    enrichment_batch_created = Signal(object)
     scan_error = Signal(str)
 
     def __init__(
         self,
         scanner: Scanner | None = None,
         parent: QObject | None = None,
+        fingerprint_service: FingerprintService | None = None,
     ) -> None:
         super().__init__(parent)
         self._scanner = scanner or Scanner()
+        self._fingerprint_service = fingerprint_service
         self._logger = get_logger().get_logger(__name__)
-        self._results: list[VideoMetadata] = []
+        # Keyed by path so deltas patch the cache in O(changes); dicts keep
+        # insertion order, which is the order results are reported in.
+        # Watcher changes are applied on the watcher thread while a scan may
+        # be running on another, so the cached results are guarded by a lock.
+        self._results_lock = threading.RLock()
+        self._results: dict[Path, VideoMetadata] = {}
+        # Unchanged files known from the scan index, parsed on first access.
+        self._pending_paths: dict[Path, None] = {}
+        # False until a scan has produced the whole library, e.g. in a fresh
+        # process whose first scan is incremental.
+        self._results_complete = False
+        self._last_delta: ScanDelta | None = None
         self._callbacks: list[Callable[[VideoMetadata], None]] = []
 
     def scan(self, config: ScanConfig) -> list[VideoMetadata]:
-        """Perform a scan with the provided configuration."""
-        self._results = []
+        """Perform a scan with the provided configuration.
 
-        valid_roots = [root for root in config.root_paths if root.exists()]
-        for root in config.root_paths:
-            if root.exists():
-                self.scan_started.emit(str(root))
-            else:
-                message = f"Scan root does not exist: {root}"
-                self._logger.warning(message)
-                self.scan_error.emit(message)
+        Discovered paths are parsed and reported while the walker is still
+        discovering files, so ``scan_progress`` is emitted with a total of 0
+        (unknown) until the scan completes; a final signal then carries the
+        known total. Files beyond
+        ``config.process_parse_threshold`` are parsed on worker processes.
+        """
+        self._reset_results()
+
+        valid_roots = self._validate_roots(config)
+        if not valid_roots:
+            self.scan_completed.emit([])
+            return []
+
+        effective_config = config.with_roots(valid_roots)
+
+        processed = 0
+        for processed, metadata in enumerate(self._iter_parsed(effective_config), start=1):
+            self._store_result(metadata)
+            self.scan_progress.emit(processed, 0, str(metadata.path))
+            self.enrichment_task_created.emit(metadata)
+            self._dispatch_enrichment_callbacks(metadata)
+
+        if processed:
+            # Final progress carries the now known total.
+            self.scan_progress.emit(processed, processed, str(metadata.path))
+        self._results_complete = True
+        results = self.get_results()
+        self.scan_completed.emit(results)
+        return list(results)
+
+    def iter_scan(
+        self,
+        config: ScanConfig,
+        options: StreamingScanOptions | None = None,
+    ) -> Iterator[list[VideoMetadata]]:
+        """Scan in streaming mode, yielding parsed results in batches.
+
+        Unlike :meth:`scan`, no per-file signals are emitted. Each batch is
+        announced once through ``scan_batch_ready`` and
+        ``enrichment_batch_created``, while ``scan_progress`` is throttled to
+        one signal per ``progress_interval`` seconds or ``progress_every``
+        items, whichever comes first. At most ``max_retained_results`` of the
+        most recent results are kept for :meth:`get_results`.
+
+        Args:
+            config: Scan configuration
+            options: Batching and throttling options
+
+        Yields:
+            Lists of parsed metadata of at most ``batch_size`` items
+        """
+        options = options or StreamingScanOptions()
+        self._reset_results()
+
+        valid_roots = self._validate_roots(config)
+        if not valid_roots:
+            self.scan_completed.emit([])
+            return
+
+        effective_config = config.with_roots(valid_roots)
+        processed = 0
+        last_reported = 0
+        last_report_time = time.monotonic()
+        batch: list[VideoMetadata] = []
+
+        for metadata in self._iter_parsed(effective_config):
+            self._dispatch_enrichment_callbacks(metadata)
+            batch.append(metadata)
+            processed += 1
+
+            now = time.monotonic()
+            if (
+                processed - last_reported >= options.progress_every
+                or now - last_report_time >= options.progress_interval
+            ):
+                self.scan_progress.emit(processed, 0, str(metadata.path))
+                last_reported = processed
+                last_report_time = now
+
+            if len(batch) >= options.batch_size:
+                self._publish_batch(batch, options)
+                yield batch
+                batch = []
+
+        if batch:
+            self._publish_batch(batch, options)
+            yield batch
+
+        if processed:
+            # Final progress carries the now known total.
+            self.scan_progress.emit(processed, processed, str(metadata.path))
+        self._results_complete = options.max_retained_results is None
+        self.scan_completed.emit(self.get_results())
+
+    def scan_checkpointed(
+        self,
+        config: ScanConfig,
+        store: ScanCheckpointStore | None = None,
+        checkpoint_every: int = 5000,
+        checkpoint_interval: float = 30.0,
+        resume: bool = True,
+        library_id: int | None = None,
+    ) -> list[VideoMetadata]:
+        """Perform a scan that can resume after being interrupted.
+
+        The walk frontier and the results parsed since the previous
+        checkpoint are written in one transaction after every directory
+        that brings the unsaved results to ``checkpoint_every``, or once
+        ``checkpoint_interval`` seconds have passed. Progress is recorded in
+        a ``JobRun`` through ``items_processed``. If an unfinished job for
+        the same roots and filters exists, its results are restored, announced
+        through ``scan_resumed`` and the walk continues from its frontier;
+        restored results are not passed to the enrichment callbacks again.
+
+        Args:
+            config: Scan configuration
+            store: Checkpoint store. Defaults to one on the global database.
+            checkpoint_every: Unsaved results that trigger a checkpoint
+            checkpoint_interval: Seconds after which a checkpoint is written
+            resume: Whether to resume an unfinished job instead of discarding it
+            library_id: Optional library recorded on the job
+
+        Returns:
+            All results, including restored ones
+        """
+        from .scan_checkpoint import ScanCheckpointStore
+
+        store = store or ScanCheckpointStore()
+        self._reset_results()
 
+        valid_roots = self._validate_roots(config)
         if not valid_roots:
             self.scan_completed.emit([])
             return []
 
         effective_config = config.with_roots(valid_roots)
-        video_paths = list(self._scanner.iter_video_files(effective_config))
-        total = len(video_paths)
+        state = store.find_resumable(effective_config) if resume else None
+        if state is None:
+            if not resume:
+                store.discard(effective_config)
+            state = store.start(effective_config, library_id)
+        else:
+            for metadata in state.results:
+                self._store_result(metadata)
+            self.scan_resumed.emit(state.job_run_id, len(state.results))
 
-        for index, path in enumerate(video_paths, start=1):
-            metadata = self._scanner.parse_video(path)
-            self._results.append(metadata)
-            self.scan_progress.emit(index, total, str(path))
+        processed = state.items_processed
+        unsaved: list[VideoMetadata] = []
+        last_checkpoint = time.monotonic()
+        try:
+            for paths in self._scanner.iter_frontier(effective_config, state.frontier):
+                for path in paths:
+                    metadata = self._scanner.parse_video(path)
+                    self._store_result(metadata)
+                    unsaved.append(metadata)
+                    processed += 1
+                    self.scan_progress.emit(processed, 0, str(path))
+                    self.enrichment_task_created.emit(metadata)
+                    self._dispatch_enrichment_callbacks(metadata)
+
+                # The frontier is only consistent between directories.
+                now = time.monotonic()
+                if len(unsaved) >= checkpoint_every or (
+                    unsaved and now - last_checkpoint >= checkpoint_interval
+                ):
+                    store.save(state.job_run_id, state.frontier, unsaved, processed)
+                    unsaved = []
+                    last_checkpoint = now
+        except BaseException as exc:
+            # Results since the last checkpoint are parsed again on resume.
+            store.interrupt(state.job_run_id, str(exc) or type(exc).__name__)
+            raise
+
+        store.complete(state.job_run_id, processed)
+        self._results_complete = True
+        results = self.get_results()
+        self.scan_completed.emit(results)
+        return list(results)
+
+    def scan_incremental(
+        self,
+        config: ScanConfig,
+        index: ScanIndex | None = None,
+        verify_files: bool = True,
+    ) -> ScanDelta:
+        """Perform an incremental scan against the persisted scan index.
+
+        Only added and changed files are reported through ``scan_progress``,
+        ``enrichment_task_created`` and the enrichment callbacks. Cached
+        results are patched with the delta rather than replaced. If no scan
+        has produced the whole library yet, e.g. after a restart, unchanged
+        files are taken from the index and parsed the first time
+        :meth:`get_results` needs them, so the results still cover the whole
+        library. With a fingerprint service configured, moved files are
+        relinked to their existing media items and reported through
+        ``files_relinked`` instead.
+
+        Args:
+            config: Scan configuration
+            index: Scan index to use. Defaults to one on the global database.
+            verify_files: Whether to re-stat files in unchanged directories
+
+        Returns:
+            ScanDelta with added, changed and removed metadata
+        """
+        from .scan_index import ScanDelta, ScanIndex
+
+        valid_roots = self._validate_roots(config)
+        if not valid_roots:
+            delta = ScanDelta()
+            self._last_delta = delta
+            self.scan_delta_completed.emit(delta)
+            return delta
+
+        effective_config = config.with_roots(valid_roots)
+        scan_index = index or ScanIndex()
+        delta = self._scanner.scan_incremental(
+            effective_config, scan_index, verify_files=verify_files
+        )
+        if not self._results_complete:
+            indexed = [
+                Path(path) for root in valid_roots for path in scan_index.file_paths(root)
+            ]
+            with self._results_lock:
+                for path in indexed:
+                    if path not in self._results:
+                        self._pending_paths[path] = None
+
+        self._relink_moved_files(delta)
+        updated = delta.added + delta.changed
+        total = len(updated)
+        for index_position, metadata in enumerate(updated, start=1):
+            self.scan_progress.emit(index_position, total, str(metadata.path))
+            self.enrichment_task_created.emit(metadata)
+            self._dispatch_enrichment_callbacks(metadata)
+
+        self._apply_delta(delta)
+        self._results_complete = True
+        self._last_delta = delta
+        self.scan_delta_completed.emit(delta)
+        return delta
+
+    def apply_changes(self, changes: Iterable[FileChange]) -> ScanDelta:
+        """Apply live filesystem changes reported by a watcher.
+
+        Only the changed paths are parsed, reported through ``scan_progress``
+        and ``enrichment_task_created``, and passed to the enrichment
+        callbacks; deleted files are only removed from the cached results.
+        The resulting delta is published through ``scan_delta_completed``.
+
+        This is called on the watcher thread. The cached results are
+        updated under the engine's lock, so a scan may run concurrently;
+        signals reach receivers on other threads through queued connections,
+        but the enrichment callbacks run on the watcher thread.
+
+        Args:
+            changes: Coalesced file changes
+
+        Returns:
+            ScanDelta with added, changed and removed metadata
+        """
+        from .scan_index import ScanDelta
+        from .watcher import ChangeKind
+
+        delta = ScanDelta()
+        for change in changes:
+            with self._results_lock:
+                known = self._results.get(change.path)
+                pending = change.path in self._pending_paths
+            if known is None and pending:
+                known = self._scanner.parse_video(change.path)
+            if change.kind is ChangeKind.DELETED:
+                delta.removed.append(known or self._scanner.parse_video(change.path))
+            elif known is None:
+                delta.added.append(self._scanner.parse_video(change.path))
+            else:
+                delta.changed.append(self._scanner.parse_video(change.path))
+
+        self._relink_moved_files(delta)
+        updated = delta.added + delta.changed
+        total = len(updated)
+        for index_position, metadata in enumerate(updated, start=1):
+            self.scan_progress.emit(index_position, total, str(metadata.path))
             self.enrichment_task_created.emit(metadata)
             self._dispatch_enrichment_callbacks(metadata)
 
-        self.scan_completed.emit(list(self._results))
-        return list(self._results)
+        self._apply_delta(delta)
+        self._last_delta = delta
+        self.scan_delta_completed.emit(delta)
+        return delta
+
+    def set_fingerprint_service(self, service: FingerprintService | None) -> None:
+        """Enable or disable relinking of moved files by content fingerprint."""
+        self._fingerprint_service = service
+
+    def get_last_delta(self) -> ScanDelta | None:
+        """Return the delta produced by the last incremental scan."""
+        return self._last_delta
 
     def register_enrichment_callback(
         self, callback: Callable[[VideoMetadata], None]
     ) -> None:
-        """Register a callback invoked for every discovered item."""
+        """Register a callback invoked for every discovered item.
+
+        Callbacks run on the thread doing the work: the scanning thread for
+        scans and the watcher thread for :meth:`apply_changes`.
+        """
         if callback not in self._callbacks:
             self._callbacks.append(callback)
 
@@ -78,16 +398,98 @@ class ScanEngine(QObject):
 
     def clear_results(self) -> None:
         """Clear cached scan results."""
-        self._results = []
+        self._reset_results()
 
     def get_results(self) -> list[VideoMetadata]:
         """Return the cached scan results."""
-        return list(self._results)
+        with self._results_lock:
+            self._parse_pending()
+            return list(self._results.values())
 
     def get_results_by_paths(self, paths: Sequence[str]) -> list[VideoMetadata]:
         """Return cached results filtered by file path."""
-        lookup = {metadata.path.as_posix(): metadata for metadata in self._results}
-        return [lookup[path] for path in paths if path in lookup]
+        with self._results_lock:
+            self._parse_pending()
+            results = [self._results.get(Path(path)) for path in paths]
+        return [metadata for metadata in results if metadata is not None]
+
+    def _store_result(self, metadata: VideoMetadata) -> None:
+        with self._results_lock:
+            self._results[metadata.path] = metadata
+
+    def _reset_results(self) -> None:
+        with self._results_lock:
+            self._results = {}
+            self._pending_paths = {}
+            self._results_complete = False
+
+    def _parse_pending(self) -> None:
+        # Called with the results lock held.
+        if not self._pending_paths:
+            return
+        pending, self._pending_paths = self._pending_paths, {}
+        for path in pending:
+            if path not in self._results:
+                self._results[path] = self._scanner.parse_video(path)
+
+    def _iter_parsed(self, config: ScanConfig) -> Iterator[VideoMetadata]:
+        paths = self._scanner.iter_video_files(config)
+        # Parse in-process until the scan is large enough to amortise worker
+        # start-up, then hand the rest to the multi-process parser.
+        for path in islice(paths, config.process_parse_threshold):
+            yield self._scanner.parse_video(path)
+        yield from self._scanner.iter_parse_many(paths, workers=config.parse_workers)
+
+    def _validate_roots(self, config: ScanConfig) -> list[Path]:
+        valid_roots = [root for root in config.root_paths if root.exists()]
+        for root in config.root_paths:
+            if root.exists():
+                self.scan_started.emit(str(root))
+            else:
+                message = f"Scan root does not exist: {root}"
+                self._logger.warning(message)
+                self.scan_error.emit(message)
+        return valid_roots
+
+    def _relink_moved_files(self, delta: ScanDelta) -> None:
+        if self._fingerprint_service is None:
+            return
+        relinked = []
+        if delta.added:
+            try:
+                relinked = self._fingerprint_service.relink(delta)
+            except Exception as exc:  # pragma: no cover - safeguard logging
+                self._logger.error("Fingerprint relinking failed: %s", exc)
+        # Fingerprint files ingested since the last scan so later moves match.
+        self._fingerprint_service.start_backfill()
+        if relinked:
+            self.files_relinked.emit(relinked)
+
+    def _apply_delta(self, delta: ScanDelta) -> None:
+        with self._results_lock:
+            for metadata in (*delta.added, *delta.changed, *delta.removed):
+                self._results.pop(metadata.path, None)
+                self._pending_paths.pop(metadata.path, None)
+            for relinked in delta.relinked:
+                self._results.pop(relinked.previous.path, None)
+                self._pending_paths.pop(relinked.previous.path, None)
+                self._pending_paths.pop(relinked.current.path, None)
+                self._results[relinked.current.path] = relinked.current
+            for metadata in (*delta.added, *delta.changed):
+                self._results[metadata.path] = metadata
+
+    def _publish_batch(
+        self, batch: list[VideoMetadata], options: StreamingScanOptions
+    ) -> None:
+        with self._results_lock:
+            for metadata in batch:
+                self._results[metadata.path] = metadata
+            limit = options.max_retained_results
+            if limit is not None and len(self._results) > limit:
+                for path in list(islice(self._results, len(self._results) - limit)):
+                    del self._results[path]
+        self.scan_batch_ready.emit(batch)
+        self.enrichment_batch_created.emit(batch)
 
     def _dispatch_enrichment_callbacks(self, metadata: VideoMetadata) -> None:
         for callback in list(self._callbacks):
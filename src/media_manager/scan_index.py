@@ -0,0 +1,301 @@
+"""Persisted directory and file signatures for incremental scans."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+from sqlalchemy import delete, insert
+from sqlmodel import select
+
+from .logging import get_logger
+from .models import VideoMetadata
+from .persistence.database import DatabaseService, get_database_service
+from .persistence.models import ScanDirectoryEntry, ScanFileEntry
+from .scanner import DiscoveredFile, FileSignature
+
+logger_instance = get_logger()
+logger = logger_instance.get_logger(__name__)
+
+# Keep bulk statements below SQLite's bound parameter limit.
+_WRITE_CHUNK_SIZE = 500
+
+
+@dataclass
+class IndexSnapshot:
+    """In-memory view of the index for a single scan root."""
+
+    directories: dict[str, int] = field(default_factory=dict)
+    directory_keys: dict[str, str] = field(default_factory=dict)
+    directory_parents: dict[str, Optional[str]] = field(default_factory=dict)
+    files: dict[str, FileSignature] = field(default_factory=dict)
+    file_directories: dict[str, str] = field(default_factory=dict)
+    files_by_directory: dict[str, list[str]] = field(default_factory=dict)
+    children: dict[str, list[str]] = field(default_factory=dict)
+
+    def add_directory(
+        self, path: str, parent: Optional[str], mtime_ns: int, config_key: str
+    ) -> None:
+        """Record a directory and link it to its parent."""
+        self.directories[path] = mtime_ns
+        self.directory_keys[path] = config_key
+        self.directory_parents[path] = parent
+        if parent is not None:
+            self.children.setdefault(parent, []).append(path)
+
+    def add_file(self, path: str, directory: str, signature: FileSignature) -> None:
+        """Record a file signature under its directory."""
+        self.files[path] = signature
+        self.file_directories[path] = directory
+        self.files_by_directory.setdefault(directory, []).append(path)
+
+
+class RelinkedFile(NamedTuple):
+    """A moved or renamed file linked back to its existing media item."""
+
+    previous: VideoMetadata
+    current: VideoMetadata
+    media_item_id: int
+
+
+@dataclass
+class ScanDelta:
+    """Result of an incremental scan relative to the persisted index."""
+
+    added: list[VideoMetadata] = field(default_factory=list)
+    changed: list[VideoMetadata] = field(default_factory=list)
+    removed: list[VideoMetadata] = field(default_factory=list)
+    relinked: list[RelinkedFile] = field(default_factory=list)
+    unchanged_count: int = 0
+    skipped_directories: int = 0
+    # Stat data of added files, keyed by path, so later stages need not re-stat.
+    discovered: dict[str, DiscoveredFile] = field(default_factory=dict)
+
+    def has_changes(self) -> bool:
+        """Return True if anything was added, changed, removed or relinked."""
+        return bool(self.added or self.changed or self.removed or self.relinked)
+
+    def as_dict(self) -> dict[str, object]:
+        """Return a dictionary representation of the delta."""
+        return {
+            "added": [metadata.as_dict() for metadata in self.added],
+            "changed": [metadata.as_dict() for metadata in self.changed],
+            "removed": [metadata.as_dict() for metadata in self.removed],
+            "relinked": [
+                {
+                    "previous": relinked.previous.as_dict(),
+                    "current": relinked.current.as_dict(),
+                    "media_item_id": relinked.media_item_id,
+                }
+                for relinked in self.relinked
+            ],
+            "unchanged_count": self.unchanged_count,
+            "skipped_directories": self.skipped_directories,
+        }
+
+
+def make_config_key(
+    ignored_directories: Sequence[str],
+    ignored_extensions: Sequence[str],
+    video_extensions: Sequence[str],
+) -> str:
+    """Hash the filter settings that affect which entries a listing yields."""
+    parts = [
+        ",".join(ignored_directories),
+        ",".join(ignored_extensions),
+        ",".join(video_extensions),
+    ]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _chunks(items: Sequence[str], size: int = _WRITE_CHUNK_SIZE) -> Iterable[Sequence[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class ScanIndex:
+    """SQLite-backed store of directory mtimes and file signatures."""
+
+    def __init__(self, database_service: Optional[DatabaseService] = None) -> None:
+        """Initialize the scan index.
+
+        Args:
+            database_service: Optional database service instance
+        """
+        self._db_service = database_service or get_database_service()
+
+    def load(self, root: Path) -> IndexSnapshot:
+        """Load the persisted snapshot for a scan root.
+
+        Args:
+            root: Scan root path
+
+        Returns:
+            Snapshot of the recorded directories and files
+        """
+        root_key = str(root)
+        snapshot = IndexSnapshot()
+        with self._db_service.get_session() as session:
+            directories = session.exec(
+                select(
+                    ScanDirectoryEntry.path,
+                    ScanDirectoryEntry.parent,
+                    ScanDirectoryEntry.mtime_ns,
+                    ScanDirectoryEntry.config_key,
+                ).where(ScanDirectoryEntry.root == root_key)
+            ).all()
+            for path, parent, mtime_ns, config_key in directories:
+                snapshot.add_directory(path, parent, mtime_ns, config_key)
+
+            files = session.exec(
+                select(
+                    ScanFileEntry.path,
+                    ScanFileEntry.directory,
+                    ScanFileEntry.size,
+                    ScanFileEntry.mtime_ns,
+                    ScanFileEntry.inode,
+                ).where(ScanFileEntry.root == root_key)
+            ).all()
+            for path, directory, size, mtime_ns, inode in files:
+                snapshot.add_file(path, directory, FileSignature(size, mtime_ns, inode))
+
+        logger.debug(
+            "Loaded scan index for %s: %d directories, %d files",
+            root_key,
+            len(snapshot.directories),
+            len(snapshot.files),
+        )
+        return snapshot
+
+    def file_paths(self, root: Path) -> list[str]:
+        """Return the paths of the files recorded for a scan root.
+
+        Args:
+            root: Scan root path
+
+        Returns:
+            Recorded file paths
+        """
+        with self._db_service.get_session() as session:
+            return list(
+                session.exec(
+                    select(ScanFileEntry.path).where(ScanFileEntry.root == str(root))
+                ).all()
+            )
+
+    def save(self, root: Path, previous: IndexSnapshot, current: IndexSnapshot) -> None:
+        """Persist the difference between two snapshots of a scan root.
+
+        Only rows that were added, changed or removed are written, in chunked
+        bulk statements inside a single transaction.
+
+        Args:
+            root: Scan root path
+            previous: Snapshot loaded before the scan
+            current: Snapshot observed during the scan
+        """
+        root_key = str(root)
+        now = datetime.utcnow()
+
+        stale_dirs = [
+            path
+            for path in previous.directories
+            if path not in current.directories
+            or previous.directories[path] != current.directories[path]
+            or previous.directory_keys.get(path) != current.directory_keys.get(path)
+        ]
+        stale_dir_set = set(stale_dirs)
+        new_dirs = [
+            path
+            for path in current.directories
+            if path not in previous.directories or path in stale_dir_set
+        ]
+        stale_files = [
+            path
+            for path, signature in previous.files.items()
+            if current.files.get(path) != signature
+        ]
+        new_files = [
+            path
+            for path, signature in current.files.items()
+            if previous.files.get(path) != signature
+        ]
+
+        if not (stale_dirs or new_dirs or stale_files or new_files):
+            return
+
+        with self._db_service.get_session() as session:
+            for chunk in _chunks(stale_dirs):
+                session.exec(
+                    delete(ScanDirectoryEntry)
+                    .where(ScanDirectoryEntry.root == root_key)
+                    .where(ScanDirectoryEntry.path.in_(chunk))
+                )
+            for chunk in _chunks(stale_files):
+                session.exec(
+                    delete(ScanFileEntry)
+                    .where(ScanFileEntry.root == root_key)
+                    .where(ScanFileEntry.path.in_(chunk))
+                )
+
+            for chunk in _chunks(new_dirs):
+                session.exec(
+                    insert(ScanDirectoryEntry),
+                    params=[
+                        {
+                            "root": root_key,
+                            "path": path,
+                            "parent": current.directory_parents.get(path),
+                            "mtime_ns": current.directories[path],
+                            "config_key": current.directory_keys[path],
+                            "updated_at": now,
+                        }
+                        for path in chunk
+                    ],
+                )
+            for chunk in _chunks(new_files):
+                params = []
+                for path in chunk:
+                    signature = current.files[path]
+                    params.append(
+                        {
+                            "root": root_key,
+                            "path": path,
+                            "directory": current.file_directories[path],
+                            "size": signature.size,
+                            "mtime_ns": signature.mtime_ns,
+                            "inode": signature.inode,
+                            "updated_at": now,
+                        }
+                    )
+                session.exec(insert(ScanFileEntry), params=params)
+
+            session.commit()
+
+        logger.debug(
+            "Updated scan index for %s: %d directories and %d files written",
+            root_key,
+            len(new_dirs),
+            len(new_files),
+        )
+
+    def clear(self, root: Optional[Path] = None) -> None:
+        """Remove recorded signatures for a root, or for every root.
+
+        Args:
+            root: Scan root to clear. If None, the whole index is cleared.
+        """
+        with self._db_service.get_session() as session:
+            directory_statement = delete(ScanDirectoryEntry)
+            file_statement = delete(ScanFileEntry)
+            if root is not None:
+                directory_statement = directory_statement.where(
+                    ScanDirectoryEntry.root == str(root)
+                )
+                file_statement = file_statement.where(ScanFileEntry.root == str(root))
+            session.exec(directory_statement)
+            session.exec(file_statement)
+            session.commit()
@@ -21,6 +21,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from .compact_models import CompactMediaMatch, CompactVideoMetadata
 from .library_postprocessor import ConflictResolution, PostProcessingOptions
 from .logging import get_logger
 from .models import MatchStatus, MediaMatch, VideoMetadata
@@ -166,7 +167,7 @@ class ScanQueueWidget(QWidget):
     def add_metadata(self, metadata_list: list[VideoMetadata]) -> None:
         """Add metadata items to the queue."""
         for metadata in metadata_list:
-            match = MediaMatch(metadata=metadata)
+            match = CompactMediaMatch(CompactVideoMetadata.from_metadata(metadata))
             self._matches.append(match)
             self._add_match_to_list(match)
 
@@ -2,14 +2,35 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import os
-import re
+import stat
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Iterator, Sequence
-
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple, Sequence
+
+from .filename_parser import (  # noqa: F401 - patterns re-exported for callers
+    BRACKET_CONTENT_PATTERN,
+    EPISODE_PATTERNS,
+    MULTISPACE_PATTERN,
+    QUALITY_PATTERN,
+    YEAR_PATTERN,
+    FilenameParser,
+    ParsedRow,
+    parse_stem_chunk,
+)
+from .instrumentation import get_instrumentation
 from .logging import get_logger
 from .models import MediaType, VideoMetadata
+from .walker import DEFAULT_WALKER_WORKERS, ParallelWalker
+
+if TYPE_CHECKING:
+    from .scan_index import IndexSnapshot, ScanDelta, ScanIndex
 
 DEFAULT_VIDEO_EXTENSIONS: tuple[str, ...] = (
     ".mkv",
@@ -44,24 +65,37 @@ DEFAULT_IGNORED_DIRECTORIES: tuple[str, ...] = (
     "$RECYCLE.BIN",
 )
 
-YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
-QUALITY_PATTERN = re.compile(
-    r"\b(480p|576p|720p|1080p|1440p|2160p|4k|8k|hdtv|webrip|web[- ]?dl|"
-    r"bluray|blu[- ]?ray|brrip|hdrip|dvdrip|dvdscr|remux|proper|repack|"
-    r"xvid|x264|x265|h\.264|h\.265|hevc|aac|ac3|dts|ddp5\.1|5\.1|7\.1|"
-    r"10bit|hdr|uhd|atm|dolby|truehd|limited|internal|sample)\b",
-    re.IGNORECASE,
-)
-BRACKET_CONTENT_PATTERN = re.compile(r"\[[^\]]*\]|\([^\)]*\)|\{[^\}]*\}")
-MULTISPACE_PATTERN = re.compile(r"\s+")
-EPISODE_PATTERNS: tuple[re.Pattern[str], ...] = (
-    re.compile(r"(?i)\b[S](?P<season>\d{1,2})[.\s_-]*E(?P<episode>\d{1,2})\b"),
-    re.compile(r"(?i)\b(?P<season>\d{1,2})x(?P<episode>\d{1,2})\b"),
-    re.compile(
-        r"(?i)Season[.\s_-]*(?P<season>\d{1,2})[.\s_-]*"
-        r"(?:Episode|Ep)[.\s_-]*(?P<episode>\d{1,2})"
-    ),
-)
+DEFAULT_PARSE_CHUNK_SIZE = 2000
+DEFAULT_PROCESS_PARSE_THRESHOLD = 20000
+# Upper bound on parse processes when no worker count is configured; more
+# spawned interpreters cost start-up time without speeding up parsing much.
+DEFAULT_MAX_PARSE_WORKERS = 4
+
+def default_parse_workers() -> int:
+    """Return the parse process count used when none is configured."""
+    return min(DEFAULT_MAX_PARSE_WORKERS, os.cpu_count() or 1)
+
+
+class DiscoveredFile(NamedTuple):
+    """Video file found during discovery, with the stat data already at hand."""
+
+    path: Path
+    size: int | None
+    mtime_ns: int | None
+    inode: int | None = None
+
+    @property
+    def signature(self) -> FileSignature:
+        """Change-detection signature built from the discovered stat data."""
+        return FileSignature(self.size or 0, self.mtime_ns or 0, self.inode or 0)
+
+
+class FileSignature(NamedTuple):
+    """Cheap change-detection signature of a file."""
+
+    size: int
+    mtime_ns: int
+    inode: int
 
 
 def _normalize_extension(extension: str) -> str:
@@ -79,6 +113,9 @@ class ScanConfig:
     ignored_directories: Sequence[str] = DEFAULT_IGNORED_DIRECTORIES
     ignored_extensions: Sequence[str] = ()
     video_extensions: Sequence[str] = DEFAULT_VIDEO_EXTENSIONS
+    walker_workers: int = DEFAULT_WALKER_WORKERS
+    parse_workers: int | None = None  # None uses default_parse_workers()
+    process_parse_threshold: int = DEFAULT_PROCESS_PARSE_THRESHOLD
     _ignored_directory_set: set[str] = field(init=False, repr=False)
     _ignored_extension_set: set[str] = field(init=False, repr=False)
     _video_extension_set: set[str] = field(init=False, repr=False)
@@ -108,102 +145,458 @@ class ScanConfig:
             ignored_directories=self.ignored_directories,
             ignored_extensions=self.ignored_extensions,
             video_extensions=self.video_extensions,
+            walker_workers=self.walker_workers,
+            parse_workers=self.parse_workers,
+            process_parse_threshold=self.process_parse_threshold,
         )
 
+    def accepts_extension(self, extension: str) -> bool:
+        """Return True if files with the given lower-case extension are scanned."""
+        if extension in self._ignored_extension_set:
+            return False
+        return extension in self._video_extension_set
+
+    def ignores_directory(self, name: str) -> bool:
+        """Return True if directories with the given name are not descended into."""
+        return name.lower() in self._ignored_directory_set
+
 
 class Scanner:
     """Scanner that walks directories and extracts metadata from video files."""
 
-    def __init__(self) -> None:
+    def __init__(self, parser: FilenameParser | None = None) -> None:
         self._logger = get_logger().get_logger(__name__)
+        self._parser = parser or FilenameParser()
 
     def scan(self, config: ScanConfig) -> list[VideoMetadata]:
         """Scan all configured paths and return video metadata instances."""
         return [self.parse_video(path) for path in self.iter_video_files(config)]
 
     def iter_video_files(self, config: ScanConfig) -> Iterator[Path]:
-        """Yield video file paths discovered in the configured roots."""
+        """Yield video file paths discovered in the configured roots.
+
+        Roots and their top-level subdirectories are listed concurrently on
+        ``config.walker_workers`` threads. Paths are yielded as soon as they
+        are available, in the same order for any number of workers.
+        """
+        for discovered in self.iter_discovered_files(config, stat_files=False):
+            yield discovered.path
+
+    def iter_discovered_files(
+        self, config: ScanConfig, stat_files: bool = True
+    ) -> Iterator[DiscoveredFile]:
+        """Yield discovered video files together with their size, mtime and inode.
+
+        Entries are filtered by extension before anything else, and file types
+        come from the cached ``DirEntry`` information, so rejected entries never
+        cost a ``stat`` call. With ``stat_files`` enabled, size and mtime are
+        read through ``DirEntry.stat()``, which is free on Windows and one call
+        per accepted video file elsewhere; otherwise they are None.
+
+        Args:
+            config: Scan configuration
+            stat_files: Whether to populate size, mtime and inode
+
+        Yields:
+            DiscoveredFile for every accepted video file
+        """
+        roots = []
         for root in config.root_paths:
             if not root.exists():
                 self._logger.warning("Scan root does not exist: %s", root)
                 continue
+            roots.append(root)
 
+        walker = ParallelWalker(
+            ignored_directories=config.ignored_directories,
+            file_filter=lambda entry: self._should_include_entry(entry, config),
+            max_workers=config.walker_workers,
+        )
+        for entry in walker.walk(roots):
+            if not stat_files:
+                yield DiscoveredFile(Path(entry.path), None, None)
+                continue
+            discovered = self._discover_entry(entry)
+            if discovered is not None:
+                yield discovered
+
+    def iter_frontier(
+        self, config: ScanConfig, frontier: list[str]
+    ) -> Iterator[list[Path]]:
+        """Walk directories from an explicit stack of pending directories.
+
+        ``frontier`` is used as a depth-first stack (the last entry is listed
+        next) and updated in place: after each yielded batch it holds exactly
+        the directories that remain to be listed, so it can be persisted and
+        passed back in to resume the walk. Starting from the reversed roots,
+        files come out in the same order as :meth:`iter_video_files`.
+
+        Args:
+            config: Scan configuration
+            frontier: Pending directories, mutated as the walk progresses
+
+        Yields:
+            Accepted video files of one directory, sorted by name
+        """
+        walker = ParallelWalker(
+            ignored_directories=config.ignored_directories,
+            file_filter=lambda entry: self._should_include_entry(entry, config),
+            max_workers=1,
+        )
+        while frontier:
+            directory = frontier.pop()
             try:
-                for dirpath, dirnames, filenames in os.walk(root):
-                    dirnames[:] = [
-                        dirname
-                        for dirname in dirnames
-                        if dirname.lower() not in config._ignored_directory_set
-                    ]
-
-                    for filename in filenames:
-                        file_path = Path(dirpath) / filename
-                        if not file_path.is_file():
-                            continue
+                files, subdirectories = walker.list_directory(directory)
+            except OSError as exc:
+                self._logger.warning("Failed to list directory %s: %s", directory, exc)
+                continue
+            frontier.extend(reversed(subdirectories))
+            yield [Path(entry.path) for entry in files]
+
+    def scan_incremental(
+        self, config: ScanConfig, index: ScanIndex, verify_files: bool = True
+    ) -> ScanDelta:
+        """Scan configured roots and return only what changed since the last scan.
+
+        Directories whose mtime and filter settings match the persisted index
+        are not listed again; their recorded subdirectories and files are
+        reused. With ``verify_files`` disabled, files inside such directories
+        are assumed unchanged too, so an untouched subtree costs one ``stat``
+        per directory. Only added and changed files are parsed.
+
+        Args:
+            config: Scan configuration
+            index: Persisted index to compare against and update
+            verify_files: Whether to re-stat files in unchanged directories
+
+        Returns:
+            ScanDelta with added, changed and removed metadata
+        """
+        # Imported lazily so plain scans do not pull in the persistence layer.
+        from .scan_index import IndexSnapshot, ScanDelta, make_config_key
+
+        delta = ScanDelta()
+        config_key = make_config_key(
+            config.ignored_directories,
+            config.ignored_extensions,
+            config.video_extensions,
+        )
 
-                        if self._should_include_file(file_path, config):
-                            yield file_path
+        for root in config.root_paths:
+            if not root.exists():
+                self._logger.warning("Scan root does not exist: %s", root)
+                continue
+
+            previous = index.load(root)
+            current = IndexSnapshot()
+            root_delta = ScanDelta()
+            try:
+                self._walk_incremental(
+                    root, config, config_key, previous, current, root_delta, verify_files
+                )
             except OSError as exc:
+                # Keep the previous index so an unreadable root is not
+                # reported as a mass removal.
                 self._logger.error("Failed to scan %s: %s", root, exc)
+                continue
 
-    def parse_video(self, path: Path) -> VideoMetadata:
-        """Parse a single video file path into metadata."""
-        stem = path.stem
-        working_name = re.sub(r"[._]+", " ", stem)
+            for path in previous.files:
+                if path not in current.files:
+                    root_delta.removed.append(self.parse_video(Path(path)))
 
-        media_type = MediaType.MOVIE
-        season = None
-        episode = None
+            index.save(root, previous, current)
 
-        for pattern in EPISODE_PATTERNS:
-            match = pattern.search(working_name)
-            if match:
-                try:
-                    season = int(match.group("season"))
-                    episode = int(match.group("episode"))
-                    media_type = MediaType.TV
-                except (TypeError, ValueError):
-                    season = None
-                    episode = None
-                    media_type = MediaType.MOVIE
-                working_name = pattern.sub(" ", working_name, count=1)
-                break
-
-        year = self._extract_year(working_name)
-        if year is not None:
-            working_name = working_name.replace(str(year), " ", 1)
-
-        title = self._clean_title(working_name)
-        if not title:
-            title = re.sub(r"[._]+", " ", stem).strip()
+            delta.added.extend(root_delta.added)
+            delta.discovered.update(root_delta.discovered)
+            delta.changed.extend(root_delta.changed)
+            delta.removed.extend(root_delta.removed)
+            delta.unchanged_count += root_delta.unchanged_count
+            delta.skipped_directories += root_delta.skipped_directories
+
+        return delta
 
+    def parse_video(self, path: Path) -> VideoMetadata:
+        """Parse a single video file path into metadata."""
+        parsed = self._parser.parse(path.stem)
         return VideoMetadata(
             path=path,
-            title=title,
-            media_type=media_type,
-            year=year,
-            season=season,
-            episode=episode,
+            title=parsed.title,
+            media_type=parsed.media_type,
+            year=parsed.year,
+            season=parsed.season,
+            episode=parsed.episode,
+        )
+
+    def parse_many(
+        self,
+        paths: Iterable[Path],
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_PARSE_CHUNK_SIZE,
+    ) -> list[VideoMetadata]:
+        """Parse many paths, sharding them across worker processes.
+
+        Args:
+            paths: Paths to parse
+            workers: Number of worker processes. None uses
+                ``default_parse_workers()``; 1 parses in the calling process.
+            chunk_size: Number of paths sent to a worker at a time
+
+        Returns:
+            Parsed metadata in input order
+        """
+        return list(self.iter_parse_many(paths, workers=workers, chunk_size=chunk_size))
+
+    def iter_parse_many(
+        self,
+        paths: Iterable[Path],
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_PARSE_CHUNK_SIZE,
+    ) -> Iterator[VideoMetadata]:
+        """Lazily parse paths on worker processes, yielding in input order.
+
+        Only stems are sent to the workers and only compact tuples come back,
+        so neither ``Path`` nor ``VideoMetadata`` objects are pickled. At most
+        two chunks per worker are in flight, which keeps memory bounded for
+        iterators over millions of paths. Achieved throughput is reported to
+        instrumentation as the ``scanner.parse_many`` timer and the
+        ``scanner.parse_many.items`` counter.
+
+        Args:
+            paths: Paths to parse
+            workers: Number of worker processes. None uses
+                ``default_parse_workers()``; 1 parses in the calling process.
+            chunk_size: Number of paths sent to a worker at a time
+
+        Yields:
+            Parsed metadata in input order
+        """
+        workers = workers if workers is not None else default_parse_workers()
+        chunk_size = max(1, chunk_size)
+        path_iterator = iter(paths)
+        parsed_count = 0
+        start = time.perf_counter()
+
+        try:
+            if workers <= 1:
+                for path in path_iterator:
+                    parsed_count += 1
+                    yield self.parse_video(path)
+                return
+
+            in_flight: deque[tuple[list[Path], Future[list[ParsedRow]]]] = deque()
+            unsubmitted: list[Path] = []
+            # Spawned workers avoid forking a process that runs Qt threads.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                while True:
+                    try:
+                        while len(in_flight) < workers * 2:
+                            unsubmitted = list(islice(path_iterator, chunk_size))
+                            if not unsubmitted:
+                                break
+                            stems = [path.stem for path in unsubmitted]
+                            future = executor.submit(parse_stem_chunk, stems)
+                            in_flight.append((unsubmitted, future))
+                            unsubmitted = []
+                        if not in_flight:
+                            break
+                        chunk, future = in_flight[0]
+                        rows = future.result()
+                    except (BrokenProcessPool, OSError) as exc:
+                        # Worker processes can be killed or fail to start, for
+                        # example in restricted sandboxes; finish in-process.
+                        self._logger.warning(
+                            "Parse worker pool failed, continuing in-process: %s", exc
+                        )
+                        remaining = [pending for pending, _ in in_flight]
+                        remaining.append(unsubmitted)
+                        in_flight.clear()
+                        for pending_chunk in remaining:
+                            for path in pending_chunk:
+                                parsed_count += 1
+                                yield self.parse_video(path)
+                        for path in path_iterator:
+                            parsed_count += 1
+                            yield self.parse_video(path)
+                        return
+
+                    in_flight.popleft()
+                    for path, row in zip(chunk, rows):
+                        title, media_type, year, season, episode = row
+                        parsed_count += 1
+                        yield VideoMetadata(
+                            path=path,
+                            title=title,
+                            media_type=MediaType(media_type),
+                            year=year,
+                            season=season,
+                            episode=episode,
+                        )
+        finally:
+            self._record_parse_throughput(parsed_count, time.perf_counter() - start, workers)
+
+    def _record_parse_throughput(self, count: int, duration: float, workers: int) -> None:
+        if count == 0:
+            return
+        instrumentation = get_instrumentation()
+        instrumentation.record_timer("scanner.parse_many", duration)
+        instrumentation.increment_counter(
+            "scanner.parse_many.items",
+            count,
+            metadata={
+                "items_per_second": count / duration if duration > 0 else 0.0,
+                "workers": workers,
+            },
         )
 
-    def _should_include_file(self, file_path: Path, config: ScanConfig) -> bool:
-        extension = file_path.suffix.lower()
-        if extension in config._ignored_extension_set:
+    def _should_include_entry(self, entry: os.DirEntry, config: ScanConfig) -> bool:
+        # Check the extension first so non-video entries never cost a stat.
+        extension = os.path.splitext(entry.name)[1].lower()
+        if not self._should_include_extension(extension, config):
+            return False
+        try:
+            return entry.is_file()
+        except OSError:
             return False
-        return extension in config._video_extension_set
 
-    def _extract_year(self, name: str) -> int | None:
-        match = YEAR_PATTERN.search(name)
-        if match:
-            try:
-                return int(match.group(0))
-            except ValueError:
-                return None
-        return None
-
-    def _clean_title(self, raw_title: str) -> str:
-        cleaned = BRACKET_CONTENT_PATTERN.sub(" ", raw_title)
-        cleaned = QUALITY_PATTERN.sub(" ", cleaned)
-        cleaned = re.sub(r"[-]+", " ", cleaned)
-        cleaned = MULTISPACE_PATTERN.sub(" ", cleaned)
-        return cleaned.strip(" ._-")
+    def _should_include_extension(self, extension: str, config: ScanConfig) -> bool:
+        return config.accepts_extension(extension)
+
+    def _walk_incremental(
+        self,
+        root: Path,
+        config: ScanConfig,
+        config_key: str,
+        previous: IndexSnapshot,
+        current: IndexSnapshot,
+        delta: ScanDelta,
+        verify_files: bool,
+    ) -> None:
+        # Directories listed from a parent carry the mtime from their DirEntry.
+        stack: list[tuple[str, str | None, int | None]] = [(str(root), None, None)]
+
+        while stack:
+            directory, parent, mtime_ns = stack.pop()
+            if mtime_ns is None:
+                try:
+                    mtime_ns = os.stat(directory).st_mtime_ns
+                except OSError as exc:
+                    if parent is None:
+                        raise
+                    self._logger.warning("Failed to stat directory %s: %s", directory, exc)
+                    continue
+
+            current.add_directory(directory, parent, mtime_ns, config_key)
+
+            subdirectories: list[tuple[str, int | None]]
+            if (
+                previous.directories.get(directory) == mtime_ns
+                and previous.directory_keys.get(directory) == config_key
+            ):
+                delta.skipped_directories += 1
+                subdirectories = [
+                    (subdirectory, None)
+                    for subdirectory in previous.children.get(directory, ())
+                ]
+                for file_path in previous.files_by_directory.get(directory, ()):
+                    if verify_files:
+                        signature = self._file_signature(file_path)
+                        if signature is None:
+                            continue
+                    else:
+                        signature = previous.files[file_path]
+                    self._record_file(
+                        file_path, directory, signature, previous, current, delta
+                    )
+            else:
+                subdirectories = []
+                try:
+                    with os.scandir(directory) as entries:
+                        listing = sorted(entries, key=lambda entry: entry.name)
+                except OSError as exc:
+                    if parent is None:
+                        raise
+                    self._logger.warning("Failed to list directory %s: %s", directory, exc)
+                    continue
+
+                for entry in listing:
+                    if entry.is_dir():
+                        # Mirror os.walk(followlinks=False): never descend
+                        # into symlinked directories.
+                        if entry.is_symlink():
+                            continue
+                        if config.ignores_directory(entry.name):
+                            continue
+                        try:
+                            subdirectories.append((entry.path, entry.stat().st_mtime_ns))
+                        except OSError:
+                            subdirectories.append((entry.path, None))
+                        continue
+
+                    extension = os.path.splitext(entry.name)[1].lower()
+                    if not self._should_include_extension(extension, config):
+                        continue
+
+                    discovered = self._discover_entry(entry)
+                    if discovered is None:
+                        continue
+                    self._record_file(
+                        entry.path,
+                        directory,
+                        discovered.signature,
+                        previous,
+                        current,
+                        delta,
+                    )
+
+            for subdirectory, subdirectory_mtime in reversed(subdirectories):
+                stack.append((subdirectory, directory, subdirectory_mtime))
+
+    def _discover_entry(self, entry: os.DirEntry) -> DiscoveredFile | None:
+        """Build a DiscoveredFile from a DirEntry's cached stat.
+
+        Returns None for entries that vanished or are not regular files.
+        """
+        try:
+            stat_result = entry.stat()
+        except OSError as exc:
+            self._logger.debug("File disappeared during scan %s: %s", entry.path, exc)
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        # A symlinked file's DirEntry inode names the link, not its target.
+        inode = stat_result.st_ino if entry.is_symlink() else entry.inode()
+        return DiscoveredFile(
+            Path(entry.path), stat_result.st_size, stat_result.st_mtime_ns, inode
+        )
+
+    def _file_signature(self, path: str) -> FileSignature | None:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        return FileSignature(
+            stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino
+        )
+
+    def _record_file(
+        self,
+        path: str,
+        directory: str,
+        signature: FileSignature,
+        previous: IndexSnapshot,
+        current: IndexSnapshot,
+        delta: ScanDelta,
+    ) -> None:
+        current.add_file(path, directory, signature)
+        recorded = previous.files.get(path)
+        if recorded is None:
+            metadata = self.parse_video(Path(path))
+            delta.added.append(metadata)
+            delta.discovered[path] = DiscoveredFile(metadata.path, *signature)
+        elif recorded != signature:
+            delta.changed.append(self.parse_video(Path(path)))
+        else:
+            delta.unchanged_count += 1
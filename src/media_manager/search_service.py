@@ -46,7 +46,7 @@ class SearchService:
         Returns:
             Tuple of (list of matching items, total count)
         """
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             # Build the base query
             query = self._build_query(session, criteria)
 
@@ -211,19 +211,19 @@ class SearchService:
 
     def get_available_tags(self) -> List[Tag]:
         """Get all available tags for filtering."""
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             statement = select(Tag).order_by(Tag.name)
             return list(session.exec(statement).all())
 
     def get_available_people(self, limit: int = 100) -> List[Person]:
         """Get available people (actors, directors, etc.) for filtering."""
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             statement = select(Person).order_by(Person.name).limit(limit)
             return list(session.exec(statement).all())
 
     def get_available_collections(self) -> List[Collection]:
         """Get all available collections for filtering."""
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             statement = select(Collection).order_by(Collection.name)
             return list(session.exec(statement).all())
 
@@ -244,7 +244,7 @@ class SearchService:
 
     def load_search(self, search_id: int) -> Optional[Tuple[SavedSearch, SearchCriteria]]:
         """Load a saved search by ID."""
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             statement = select(SavedSearch).where(SavedSearch.id == search_id)
             saved_search = session.exec(statement).first()
             if saved_search:
@@ -255,7 +255,7 @@ class SearchService:
 
     def get_saved_searches(self) -> List[SavedSearch]:
         """Get all saved searches."""
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             statement = select(SavedSearch).order_by(SavedSearch.name)
             return list(session.exec(statement).all())
 
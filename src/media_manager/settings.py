@@ -406,6 +406,19 @@ class SettingsManager(QObject):
     def set_provider_timeout(self, timeout: int) -> None:
         self.set_provider_setting("timeout", int(timeout))
 
+    def get_provider_concurrency(self) -> int:
+        """Lookups a match run keeps in flight.
+
+        The default of 1 matches over the shared ``requests`` sessions, which
+        honour proxy settings and redirects. Values above 1 opt in to the
+        pooled asyncio client.
+        """
+        value = self.get_provider_setting("concurrency", 1)
+        return max(1, int(value))
+
+    def set_provider_concurrency(self, concurrency: int) -> None:
+        self.set_provider_setting("concurrency", max(1, int(concurrency)))
+
     def get_tmdb_api_base(self) -> str:
         """Get TMDB API base URL (default or alternative)."""
         result = self.get_provider_setting(
@@ -483,6 +496,22 @@ class SettingsManager(QObject):
         """Set provider cache TTL in seconds."""
         self.set_cache_setting("provider_cache_ttl", ttl)
 
+    def get_provider_cache_max_mb(self) -> int:
+        """Get the size limit of the on-disk provider cache in megabytes."""
+        return int(self.get_cache_setting("provider_cache_max_mb", 256))
+
+    def set_provider_cache_max_mb(self, max_mb: int) -> None:
+        """Set the size limit of the on-disk provider cache in megabytes."""
+        self.set_cache_setting("provider_cache_max_mb", max_mb)
+
+    def get_provider_cache_codec(self) -> str:
+        """Get the codec for new provider cache entries: 'json', 'zlib', or 'lz4'."""
+        return str(self.get_cache_setting("codec", "zlib"))
+
+    def set_provider_cache_codec(self, codec: str) -> None:
+        """Set the codec for new provider cache entries."""
+        self.set_cache_setting("codec", codec)
+
     def get_cache_backend_type(self) -> str:
         """Get cache backend type: 'db', 'redis', or 'disk'."""
         return str(self.get_cache_setting("backend_type", "db"))
@@ -722,6 +751,23 @@ class SettingsManager(QObject):
         db_path = self.get_database_path()
         return f"sqlite:///{db_path}"
 
+    def get_database_read_pool_size(self) -> int:
+        """Read-only connections for views and stats; 0 shares one engine."""
+        return int(self._settings.get("database_read_pool_size", 4))
+
+    def set_database_read_pool_size(self, size: int) -> None:
+        self._settings["database_read_pool_size"] = size
+        self._emit_change("database_read_pool_size", size)
+
+    def get_sqlite_profile_overrides(self) -> dict[str, Any]:
+        """SQLiteProfile fields that override the tuned defaults."""
+        overrides = self._settings.get("sqlite_profile", {})
+        return dict(overrides) if isinstance(overrides, dict) else {}
+
+    def set_sqlite_profile_overrides(self, overrides: dict[str, Any]) -> None:
+        self._settings["sqlite_profile"] = dict(overrides)
+        self._emit_change("sqlite_profile", dict(overrides))
+
     # ------------------------------------------------------------------
     # UI settings and layouts
     # ------------------------------------------------------------------
@@ -7,7 +7,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
-from sqlalchemy import func
+from sqlalchemy import case, func
 from sqlmodel import Session, select
 
 from .logging import get_logger
@@ -20,6 +20,7 @@ from .persistence.models import (
     MediaItem,
     Person,
     Tag,
+    library_counters_maintained,
 )
 
 logger_instance = get_logger()
@@ -119,34 +120,36 @@ class StatsService:
         if cached is not None:
             return cached
 
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
+            if tag_id is None and library_counters_maintained(session.get_bind()):
+                # Library counters are kept by triggers; no table scan needed.
+                counts_stmt = select(
+                    func.coalesce(func.sum(Library.item_count), 0),
+                    func.coalesce(func.sum(Library.movie_count), 0),
+                    func.coalesce(func.sum(Library.tv_count), 0),
+                )
+                if library_id is not None:
+                    counts_stmt = counts_stmt.where(Library.id == library_id)
+                total, movies, tv = session.exec(counts_stmt).one()
+                result = {"total": total, "movies": movies, "tv": tv}
+                self._set_cache(cache_key, result)
+                return result
+
             # Total items
             total_stmt = select(func.count(MediaItem.id))
-            if library_id is not None:
-                total_stmt = total_stmt.where(MediaItem.library_id == library_id)
             if tag_id is not None:
                 total_stmt = total_stmt.join(MediaItem.tags).where(Tag.id == tag_id)
-            total = session.exec(total_stmt).scalar() or 0
+            if library_id is not None:
+                total_stmt = total_stmt.where(MediaItem.library_id == library_id)
+            total = session.exec(total_stmt).one() or 0
 
             # Movies
-            movies_stmt = select(func.count(MediaItem.id)).where(
-                MediaItem.media_type == "movie"
-            )
-            if library_id is not None:
-                movies_stmt = movies_stmt.where(MediaItem.library_id == library_id)
-            if tag_id is not None:
-                movies_stmt = movies_stmt.join(MediaItem.tags).where(Tag.id == tag_id)
-            movies = session.exec(movies_stmt).scalar() or 0
+            movies_stmt = total_stmt.where(MediaItem.media_type == "movie")
+            movies = session.exec(movies_stmt).one() or 0
 
             # TV Shows
-            tv_stmt = select(func.count(MediaItem.id)).where(
-                MediaItem.media_type == "tv"
-            )
-            if library_id is not None:
-                tv_stmt = tv_stmt.where(MediaItem.library_id == library_id)
-            if tag_id is not None:
-                tv_stmt = tv_stmt.join(MediaItem.tags).where(Tag.id == tag_id)
-            tv = session.exec(tv_stmt).scalar() or 0
+            tv_stmt = total_stmt.where(MediaItem.media_type == "tv")
+            tv = session.exec(tv_stmt).one() or 0
 
             result = {"total": total, "movies": movies, "tv": tv}
             self._set_cache(cache_key, result)
@@ -163,28 +166,30 @@ class StatsService:
         if cached is not None:
             return cached
 
-        with self._db_service.get_session() as session:
-            # Get all libraries with their item counts
-            result = {}
-            libraries = session.exec(select(Library)).all()
-            for lib in libraries:
-                counts_stmt = select(func.count(MediaItem.id)).where(
-                    MediaItem.library_id == lib.id
-                )
-                total = session.exec(counts_stmt).scalar() or 0
-
-                movies_stmt = select(func.count(MediaItem.id)).where(
-                    (MediaItem.library_id == lib.id)
-                    & (MediaItem.media_type == "movie")
+        with self._db_service.get_read_session() as session:
+            if library_counters_maintained(session.get_bind()):
+                # Library counters are kept by triggers, so one row per library
+                statement = select(
+                    Library.id,
+                    Library.item_count,
+                    Library.movie_count,
+                    Library.tv_count,
                 )
-                movies = session.exec(movies_stmt).scalar() or 0
-
-                tv_stmt = select(func.count(MediaItem.id)).where(
-                    (MediaItem.library_id == lib.id) & (MediaItem.media_type == "tv")
+            else:
+                statement = (
+                    select(
+                        Library.id,
+                        func.count(MediaItem.id),
+                        func.count(case((MediaItem.media_type == "movie", 1))),
+                        func.count(case((MediaItem.media_type == "tv", 1))),
+                    )
+                    .outerjoin(MediaItem, MediaItem.library_id == Library.id)
+                    .group_by(Library.id)
                 )
-                tv = session.exec(tv_stmt).scalar() or 0
-
-                result[lib.id] = {"total": total, "movies": movies, "tv": tv}
+            result = {
+                library_id: {"total": total, "movies": movies, "tv": tv}
+                for library_id, total, movies, tv in session.exec(statement).all()
+            }
 
             self._set_cache(cache_key, result)
             return result
@@ -210,7 +215,7 @@ class StatsService:
         if cached is not None:
             return cached
 
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             stmt = select(func.coalesce(func.sum(MediaItem.runtime), 0))
             if library_id is not None:
                 stmt = stmt.where(MediaItem.library_id == library_id)
@@ -241,7 +246,7 @@ class StatsService:
         if cached is not None:
             return cached
 
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             stmt = select(func.coalesce(func.sum(MediaFile.file_size), 0)).select_from(
                 MediaFile
             )
@@ -280,7 +285,7 @@ class StatsService:
         if cached is not None:
             return cached
 
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             stmt = (
                 select(Person.name, func.count(Credit.id).label("count"))
                 .select_from(Credit)
@@ -324,7 +329,7 @@ class StatsService:
         if cached is not None:
             return cached
 
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             stmt = (
                 select(Person.name, func.count(Credit.id).label("count"))
                 .select_from(Credit)
@@ -366,7 +371,7 @@ class StatsService:
         # Note: We don't cache recent activity to keep it fresh
         cutoff_date = datetime.utcnow() - timedelta(days=days_back)
 
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             stmt = (
                 select(HistoryEvent.id, HistoryEvent.event_type, HistoryEvent.timestamp, MediaItem.title, MediaItem.id)
                 .select_from(HistoryEvent)
@@ -414,7 +419,7 @@ class StatsService:
         if cached is not None:
             return cached
 
-        with self._db_service.get_session() as session:
+        with self._db_service.get_read_session() as session:
             # Total items
             total_stmt = select(func.count(MediaItem.id))
             if library_id is not None:
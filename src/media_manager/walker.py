@@ -0,0 +1,242 @@
+"""Parallel directory walker used for filesystem discovery."""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, Sequence, Union
+
+from .logging import get_logger
+
+logger_instance = get_logger()
+logger = logger_instance.get_logger(__name__)
+
+DEFAULT_WALKER_WORKERS = 8
+
+# Directory listings a subtree may buffer ahead of the consumer.
+SUBTREE_BUFFER_LISTINGS = 32
+
+# Marks the end of a subtree's listings in its buffer.
+_SUBTREE_DONE = object()
+
+# Predicate deciding whether a file entry should be yielded.
+FileFilter = Callable[[os.DirEntry], bool]
+
+
+class ParallelWalker:
+    """Walk directory trees with ``os.scandir`` on a thread pool.
+
+    Work is split into one unit per scan root listing and one unit per
+    top-level subdirectory subtree. At most ``max_workers`` subtrees run
+    at once, which keeps several requests in flight on latency-bound
+    network mounts, and each streams its listings through a bounded
+    buffer, so memory stays flat however large the tree is. Results are
+    yielded in a fixed order: roots in the given order, and within each
+    root a depth-first traversal with entries sorted by name. The output
+    is therefore identical for any number of workers.
+    """
+
+    def __init__(
+        self,
+        ignored_directories: Sequence[str] = (),
+        file_filter: FileFilter | None = None,
+        max_workers: int = DEFAULT_WALKER_WORKERS,
+    ) -> None:
+        """Initialize the walker.
+
+        Args:
+            ignored_directories: Lower-case directory names that are not descended into
+            file_filter: Predicate applied to file entries. Defaults to accepting all files.
+            max_workers: Number of threads listing directories concurrently
+        """
+        self._ignored_directories = {name.lower() for name in ignored_directories}
+        self._file_filter = file_filter or _accept_all
+        self._max_workers = max(1, max_workers)
+
+    def walk(self, roots: Sequence[Path]) -> Iterator[os.DirEntry]:
+        """Yield file entries below the given roots in deterministic order.
+
+        Missing or unreadable roots are logged and skipped.
+
+        Args:
+            roots: Directories to walk
+
+        Yields:
+            Directory entries of the accepted files
+        """
+        if not roots:
+            return
+
+        if self._max_workers == 1:
+            for root in roots:
+                listing = self._list_root(root)
+                if listing is None:
+                    continue
+                files, subdirectories = listing
+                yield from files
+                for subdirectory in subdirectories:
+                    yield from self._walk_subtree(subdirectory)
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="scan-walker"
+        )
+        stop = threading.Event()
+        # Files of a root listing, or the buffer of a running subtree.
+        pending: deque[Union[list[os.DirEntry], queue.Queue]] = deque()
+        try:
+            # Root listings are submitted first, so they never wait behind
+            # subtrees that are blocked on a full buffer.
+            root_futures = [executor.submit(self._list_root, root) for root in roots]
+            units = self._iter_units(root_futures)
+            running = 0
+
+            while True:
+                while running < self._max_workers:
+                    unit = next(units, None)
+                    if unit is None:
+                        break
+                    if isinstance(unit, str):
+                        buffer: queue.Queue = queue.Queue(
+                            maxsize=SUBTREE_BUFFER_LISTINGS
+                        )
+                        executor.submit(self._stream_subtree, unit, buffer, stop)
+                        pending.append(buffer)
+                        running += 1
+                    else:
+                        pending.append(unit)
+                if not pending:
+                    break
+
+                item = pending[0]
+                if isinstance(item, list):
+                    yield from item
+                else:
+                    yield from self._drain(item)
+                    running -= 1
+                pending.popleft()
+        finally:
+            # Stop subtrees promptly if the consumer closes early: unblock
+            # any producer waiting on a full buffer so it sees the flag.
+            stop.set()
+            for item in pending:
+                if not isinstance(item, list):
+                    _discard(item)
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def list_directory(self, directory: str) -> tuple[list[os.DirEntry], list[str]]:
+        """List a single directory.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Accepted file entries and the subdirectories to descend into,
+            both sorted by name
+
+        Raises:
+            OSError: If the directory cannot be listed
+        """
+        return self._list_directory(directory)
+
+    def _list_root(
+        self, root: Path
+    ) -> tuple[list[os.DirEntry], list[str]] | None:
+        try:
+            return self._list_directory(str(root))
+        except OSError as exc:
+            logger.error("Failed to scan %s: %s", root, exc)
+            return None
+
+    def _iter_units(
+        self, root_futures: list[Future[tuple[list[os.DirEntry], list[str]] | None]]
+    ) -> Iterator[Union[list[os.DirEntry], str]]:
+        for future in root_futures:
+            listing = future.result()
+            if listing is None:
+                continue
+            files, subdirectories = listing
+            yield files
+            yield from subdirectories
+
+    def _stream_subtree(
+        self, directory: str, buffer: queue.Queue, stop: threading.Event
+    ) -> None:
+        try:
+            for files in self._iter_subtree_listings(directory):
+                if stop.is_set():
+                    return
+                if files:
+                    buffer.put(files)
+        except Exception as exc:
+            buffer.put(exc)
+            return
+        buffer.put(_SUBTREE_DONE)
+
+    @staticmethod
+    def _drain(buffer: queue.Queue) -> Iterator[os.DirEntry]:
+        while True:
+            item = buffer.get()
+            if item is _SUBTREE_DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield from item
+
+    def _walk_subtree(self, directory: str) -> Iterator[os.DirEntry]:
+        for files in self._iter_subtree_listings(directory):
+            yield from files
+
+    def _iter_subtree_listings(self, directory: str) -> Iterator[list[os.DirEntry]]:
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                files, subdirectories = self._list_directory(current)
+            except OSError as exc:
+                # Match os.walk, which silently skips unreadable subdirectories.
+                logger.debug("Skipping unreadable directory %s: %s", current, exc)
+                continue
+            yield files
+            stack.extend(reversed(subdirectories))
+
+    def _list_directory(self, directory: str) -> tuple[list[os.DirEntry], list[str]]:
+        files: list[os.DirEntry] = []
+        subdirectories: list[str] = []
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=_entry_name):
+                try:
+                    is_directory = entry.is_dir()
+                except OSError:
+                    continue
+                if is_directory:
+                    # Mirror os.walk(followlinks=False): never descend into
+                    # symlinked directories.
+                    if entry.is_symlink():
+                        continue
+                    if entry.name.lower() in self._ignored_directories:
+                        continue
+                    subdirectories.append(entry.path)
+                elif self._file_filter(entry):
+                    files.append(entry)
+        return files, subdirectories
+
+
+def _discard(buffer: queue.Queue) -> None:
+    while True:
+        try:
+            buffer.get_nowait()
+        except queue.Empty:
+            return
+
+
+def _entry_name(entry: os.DirEntry) -> str:
+    return entry.name
+
+
+def _accept_all(entry: os.DirEntry) -> bool:
+    return True
@@ -0,0 +1,818 @@
+"""Filesystem watch mode feeding live change events into the scan engine."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, NamedTuple, Sequence
+
+from PySide6.QtCore import QObject, Signal
+
+from .logging import get_logger
+from .scanner import ScanConfig
+
+if TYPE_CHECKING:
+    from .scan_engine import ScanEngine
+
+logger_instance = get_logger()
+logger = logger_instance.get_logger(__name__)
+
+DEFAULT_DEBOUNCE_SECONDS = 1.0
+DEFAULT_MAX_DELAY_SECONDS = 10.0
+DEFAULT_POLL_INTERVAL_SECONDS = 5.0
+
+# Filesystem types that do not deliver inotify events for remote changes.
+NETWORK_FILESYSTEMS = frozenset(
+    {
+        "9p",
+        "afpfs",
+        "cifs",
+        "davfs",
+        "fuse.rclone",
+        "fuse.sshfs",
+        "ncpfs",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+        "sshfs",
+    }
+)
+
+
+class ChangeKind(str, Enum):
+    """Kind of change reported for a watched file."""
+
+    CREATED = "created"
+    MODIFIED = "modified"
+    DELETED = "deleted"
+
+
+class FileChange(NamedTuple):
+    """A coalesced change to a single video file."""
+
+    path: Path
+    kind: ChangeKind
+
+
+class ChangeCoalescer:
+    """Debounce raw events and fold them into one change per path.
+
+    Events are held until no new event arrived for ``debounce`` seconds, or
+    until the oldest pending event is ``max_delay`` seconds old so a steady
+    stream of downloads cannot postpone processing forever. A file created
+    and deleted within one window is dropped; a file deleted and recreated
+    is reported as modified.
+    """
+
+    def __init__(
+        self,
+        debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            debounce: Quiet period in seconds before pending events are released
+            max_delay: Upper bound in seconds on how long an event is held
+            clock: Monotonic time source
+        """
+        self._debounce = max(0.0, debounce)
+        self._max_delay = max(self._debounce, max_delay)
+        self._clock = clock
+        # Path -> (first kind, last kind), in first-seen order.
+        self._pending: dict[str, tuple[ChangeKind, ChangeKind]] = {}
+        self._first_event_time = 0.0
+        self._last_event_time = 0.0
+
+    def add(self, path: str, kind: ChangeKind) -> None:
+        """Record a raw event for a path."""
+        now = self._clock()
+        if not self._pending:
+            self._first_event_time = now
+        self._last_event_time = now
+        previous = self._pending.get(path)
+        first = previous[0] if previous is not None else kind
+        self._pending[path] = (first, kind)
+
+    def pending_count(self) -> int:
+        """Return the number of paths with pending events."""
+        return len(self._pending)
+
+    def is_ready(self) -> bool:
+        """Return True if the pending events should be released."""
+        if not self._pending:
+            return False
+        now = self._clock()
+        return (
+            now - self._last_event_time >= self._debounce
+            or now - self._first_event_time >= self._max_delay
+        )
+
+    def drain(self, force: bool = False) -> list[FileChange]:
+        """Release pending events as coalesced changes.
+
+        Args:
+            force: Release events even if the debounce window has not passed
+
+        Returns:
+            Coalesced changes in the order their paths were first seen
+        """
+        if not (force or self.is_ready()):
+            return []
+
+        pending, self._pending = self._pending, {}
+        changes = []
+        for path, (first, last) in pending.items():
+            kind = _coalesce(first, last)
+            if kind is not None:
+                changes.append(FileChange(Path(path), kind))
+        return changes
+
+
+def _coalesce(first: ChangeKind, last: ChangeKind) -> ChangeKind | None:
+    if first is ChangeKind.CREATED:
+        # The file did not exist before the window started.
+        return None if last is ChangeKind.DELETED else ChangeKind.CREATED
+    if last is ChangeKind.DELETED:
+        return ChangeKind.DELETED
+    return ChangeKind.MODIFIED
+
+
+class _DirectoryState:
+    __slots__ = ("files", "subdirectories", "mtime_ns")
+
+    def __init__(
+        self, files: set[str], subdirectories: set[str], mtime_ns: int
+    ) -> None:
+        self.files = files
+        self.subdirectories = subdirectories
+        self.mtime_ns = mtime_ns
+
+
+class DirectoryChanges(NamedTuple):
+    """Differences found while updating a :class:`DirectoryTree`."""
+
+    created_files: list[str]
+    deleted_files: list[str]
+    added_directories: list[str]
+    removed_directories: list[str]
+
+
+class DirectoryTree:
+    """In-memory listing of the video files and directories under the roots.
+
+    Only directories that pass the ignore list are recorded and only files
+    accepted by the scan configuration are tracked, so every update costs
+    time proportional to the directories it touches.
+    """
+
+    def __init__(self, config: ScanConfig) -> None:
+        """Initialize the tree.
+
+        Args:
+            config: Scan configuration providing the ignore lists and extensions
+        """
+        self._config = config
+        self._directories: dict[str, _DirectoryState] = {}
+
+    def __contains__(self, directory: object) -> bool:
+        return directory in self._directories
+
+    def directories(self) -> list[str]:
+        """Return every recorded directory."""
+        return list(self._directories)
+
+    def accepts_file(self, name: str) -> bool:
+        """Return True if a file name passes the extension filters."""
+        return self._config.accepts_extension(os.path.splitext(name)[1].lower())
+
+    def accepts_directory(self, name: str) -> bool:
+        """Return True if a directory name passes the ignore list."""
+        return not self._config.ignores_directory(name)
+
+    def add_subtree(self, directory: str) -> DirectoryChanges:
+        """Record a directory and everything below it.
+
+        Returns:
+            Changes listing the files and directories that were added
+        """
+        changes = DirectoryChanges([], [], [], [])
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            if current in self._directories:
+                continue
+            try:
+                state = self._list(current)
+            except OSError as exc:
+                logger.debug("Cannot watch directory %s: %s", current, exc)
+                continue
+            self._directories[current] = state
+            changes.added_directories.append(current)
+            changes.created_files.extend(
+                os.path.join(current, name) for name in sorted(state.files)
+            )
+            stack.extend(
+                os.path.join(current, name)
+                for name in sorted(state.subdirectories, reverse=True)
+            )
+        return changes
+
+    def remove_subtree(self, directory: str) -> DirectoryChanges:
+        """Forget a directory and everything below it.
+
+        Returns:
+            Changes listing the files and directories that were removed
+        """
+        changes = DirectoryChanges([], [], [], [])
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            state = self._directories.pop(current, None)
+            if state is None:
+                continue
+            changes.removed_directories.append(current)
+            changes.deleted_files.extend(
+                os.path.join(current, name) for name in sorted(state.files)
+            )
+            stack.extend(os.path.join(current, name) for name in state.subdirectories)
+        parent, name = os.path.split(directory)
+        parent_state = self._directories.get(parent)
+        if parent_state is not None:
+            parent_state.subdirectories.discard(name)
+        return changes
+
+    def add_file(self, path: str) -> bool:
+        """Record a file. Returns False if it was already known."""
+        directory, name = os.path.split(path)
+        state = self._directories.get(directory)
+        if state is None or name in state.files:
+            return False
+        state.files.add(name)
+        return True
+
+    def remove_file(self, path: str) -> bool:
+        """Forget a file. Returns False if it was not known."""
+        directory, name = os.path.split(path)
+        state = self._directories.get(directory)
+        if state is None or name not in state.files:
+            return False
+        state.files.discard(name)
+        return True
+
+    def add_subdirectory(self, directory: str) -> DirectoryChanges:
+        """Link a new directory to its recorded parent and record its subtree."""
+        parent, name = os.path.split(directory)
+        parent_state = self._directories.get(parent)
+        if parent_state is not None:
+            parent_state.subdirectories.add(name)
+        return self.add_subtree(directory)
+
+    def refresh(self, directory: str, force: bool = False) -> DirectoryChanges:
+        """Re-list a recorded directory if its mtime changed.
+
+        Args:
+            directory: Recorded directory to check
+            force: Re-list even if the mtime is unchanged
+
+        Returns:
+            Changes found in the directory, including whole added or removed
+            subtrees
+        """
+        changes = DirectoryChanges([], [], [], [])
+        state = self._directories.get(directory)
+        if state is None:
+            return changes
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            # The parent's listing reports the removal.
+            return changes
+        if mtime_ns == state.mtime_ns and not force:
+            return changes
+        try:
+            current = self._list(directory)
+        except OSError as exc:
+            logger.debug("Cannot list directory %s: %s", directory, exc)
+            return changes
+
+        changes.created_files.extend(
+            os.path.join(directory, name) for name in sorted(current.files - state.files)
+        )
+        changes.deleted_files.extend(
+            os.path.join(directory, name) for name in sorted(state.files - current.files)
+        )
+        removed = sorted(state.subdirectories - current.subdirectories)
+        added = sorted(current.subdirectories - state.subdirectories)
+        state.files = current.files
+        state.subdirectories = current.subdirectories
+        state.mtime_ns = current.mtime_ns
+
+        for name in removed:
+            _extend(changes, self.remove_subtree(os.path.join(directory, name)))
+        for name in added:
+            _extend(changes, self.add_subtree(os.path.join(directory, name)))
+        return changes
+
+    def _list(self, directory: str) -> _DirectoryState:
+        files: set[str] = set()
+        subdirectories: set[str] = set()
+        mtime_ns = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_directory = entry.is_dir()
+                except OSError:
+                    continue
+                if is_directory:
+                    # Symlinked directories are not followed, as in full scans.
+                    if not entry.is_symlink() and self.accepts_directory(entry.name):
+                        subdirectories.add(entry.name)
+                elif self.accepts_file(entry.name):
+                    files.add(entry.name)
+        return _DirectoryState(files, subdirectories, mtime_ns)
+
+
+def _extend(changes: DirectoryChanges, other: DirectoryChanges) -> None:
+    changes.created_files.extend(other.created_files)
+    changes.deleted_files.extend(other.deleted_files)
+    changes.added_directories.extend(other.added_directories)
+    changes.removed_directories.extend(other.removed_directories)
+
+
+def _changes_to_events(changes: DirectoryChanges) -> list[tuple[str, ChangeKind]]:
+    events = [(path, ChangeKind.DELETED) for path in changes.deleted_files]
+    events.extend((path, ChangeKind.CREATED) for path in changes.created_files)
+    return events
+
+
+class WatchBackend:
+    """Source of raw file events for a set of roots."""
+
+    name = "base"
+
+    def __init__(self, config: ScanConfig) -> None:
+        """Initialize the backend.
+
+        Args:
+            config: Scan configuration whose roots are watched
+        """
+        self._config = config
+        self._tree = DirectoryTree(config)
+
+    def start(self) -> None:
+        """Record the current state of the roots and begin watching."""
+        for root in self._config.root_paths:
+            self._tree.add_subtree(str(root))
+
+    def read_events(self, timeout: float) -> list[tuple[str, ChangeKind]]:
+        """Wait up to ``timeout`` seconds and return raw (path, kind) events."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class PollingBackend(WatchBackend):
+    """Detect changes by comparing directory mtimes at a fixed interval.
+
+    Each poll costs one ``stat`` per watched directory; only directories
+    whose mtime changed are listed again. Used for network mounts and on
+    platforms without inotify. In-place rewrites of existing files do not
+    change the directory mtime and are therefore not reported.
+    """
+
+    name = "polling"
+
+    def __init__(
+        self, config: ScanConfig, interval: float = DEFAULT_POLL_INTERVAL_SECONDS
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            config: Scan configuration whose roots are watched
+            interval: Seconds between polls
+        """
+        super().__init__(config)
+        self._interval = max(0.0, interval)
+        self._next_poll = 0.0
+
+    def start(self) -> None:
+        """Record the current state of the roots and schedule the first poll."""
+        super().start()
+        self._next_poll = time.monotonic() + self._interval
+
+    def read_events(self, timeout: float) -> list[tuple[str, ChangeKind]]:
+        """Poll once the interval elapsed, waiting at most ``timeout`` seconds."""
+        remaining = self._next_poll - time.monotonic()
+        if remaining > timeout:
+            time.sleep(max(0.0, timeout))
+            return []
+        if remaining > 0:
+            time.sleep(remaining)
+        self._next_poll = time.monotonic() + self._interval
+        return self.poll()
+
+    def poll(self) -> list[tuple[str, ChangeKind]]:
+        """Compare every watched directory against its recorded state."""
+        events: list[tuple[str, ChangeKind]] = []
+        for directory in self._tree.directories():
+            if directory in self._tree:
+                events.extend(_changes_to_events(self._tree.refresh(directory)))
+        return events
+
+
+class _Inotify:
+    """Minimal ctypes binding for the Linux inotify API."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_DONT_FOLLOW = 0x02000000
+    IN_EXCL_UNLINK = 0x04000000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+
+    WATCH_MASK = (
+        IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_ONLYDIR
+        | IN_DONT_FOLLOW
+        | IN_EXCL_UNLINK
+    )
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self) -> None:
+        library = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(library, use_errno=True)
+        fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            raise _os_error()
+        self.fd = fd
+
+    def add_watch(self, path: str) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            raise _os_error(path)
+        return wd
+
+    def remove_watch(self, wd: int) -> None:
+        # Fails harmlessly if the kernel already dropped the watch.
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self, timeout: float) -> list[tuple[int, int, str]]:
+        ready, _, _ = select.select([self.fd], [], [], max(0.0, timeout))
+        if not ready:
+            return []
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                raw_name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                events.append((wd, mask, os.fsdecode(raw_name)))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _os_error(path: str | None = None) -> OSError:
+    code = ctypes.get_errno()
+    return OSError(code, os.strerror(code), path)
+
+
+class InotifyBackend(WatchBackend):
+    """Linux inotify backend with one watch per directory.
+
+    Events arrive for the touched directory only, so the cost of an event
+    is independent of the library size. New directories are watched as
+    they appear, and a queue overflow triggers a one-off re-listing of the
+    recorded directories.
+    """
+
+    name = "inotify"
+
+    def __init__(self, config: ScanConfig) -> None:
+        """Initialize the backend.
+
+        Args:
+            config: Scan configuration whose roots are watched
+
+        Raises:
+            OSError: If inotify is unavailable
+        """
+        super().__init__(config)
+        self._inotify = _Inotify()
+        self._watches: dict[int, str] = {}
+        self._watch_ids: dict[str, int] = {}
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Return True if inotify can be used on this platform."""
+        return sys.platform.startswith("linux")
+
+    def start(self) -> None:
+        """Record the roots and add a watch for every directory.
+
+        Raises:
+            OSError: If a watch cannot be added, e.g. when the per-user
+                watch limit is reached
+        """
+        for root in self._config.root_paths:
+            changes = self._tree.add_subtree(str(root))
+            self._add_watches(changes.added_directories, strict=True)
+
+    def read_events(self, timeout: float) -> list[tuple[str, ChangeKind]]:
+        """Wait up to ``timeout`` seconds for inotify events."""
+        events: list[tuple[str, ChangeKind]] = []
+        for wd, mask, name in self._inotify.read(timeout):
+            if mask & _Inotify.IN_Q_OVERFLOW:
+                logger.warning("Inotify queue overflowed; re-listing watched directories")
+                events.extend(self._resync())
+                continue
+            if mask & _Inotify.IN_IGNORED:
+                directory = self._watches.pop(wd, None)
+                if directory is not None and self._watch_ids.get(directory) == wd:
+                    del self._watch_ids[directory]
+                continue
+            directory = self._watches.get(wd)
+            if directory is None or not name or directory not in self._tree:
+                continue
+            path = os.path.join(directory, name)
+            if mask & _Inotify.IN_ISDIR:
+                events.extend(self._handle_directory_event(path, name, mask))
+            else:
+                events.extend(self._handle_file_event(path, name, mask))
+        return events
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        self._inotify.close()
+
+    def _handle_directory_event(
+        self, path: str, name: str, mask: int
+    ) -> list[tuple[str, ChangeKind]]:
+        if mask & (_Inotify.IN_CREATE | _Inotify.IN_MOVED_TO):
+            if not self._tree.accepts_directory(name):
+                return []
+            changes = self._tree.add_subdirectory(path)
+            self._add_watches(changes.added_directories)
+            return _changes_to_events(changes)
+        if mask & (_Inotify.IN_DELETE | _Inotify.IN_MOVED_FROM):
+            changes = self._tree.remove_subtree(path)
+            self._remove_watches(changes.removed_directories)
+            return _changes_to_events(changes)
+        return []
+
+    def _handle_file_event(
+        self, path: str, name: str, mask: int
+    ) -> list[tuple[str, ChangeKind]]:
+        if not self._tree.accepts_file(name):
+            return []
+        if mask & (_Inotify.IN_DELETE | _Inotify.IN_MOVED_FROM):
+            self._tree.remove_file(path)
+            return [(path, ChangeKind.DELETED)]
+        if mask & (_Inotify.IN_CREATE | _Inotify.IN_MOVED_TO):
+            self._tree.add_file(path)
+            return [(path, ChangeKind.CREATED)]
+        if mask & _Inotify.IN_CLOSE_WRITE:
+            kind = ChangeKind.CREATED if self._tree.add_file(path) else ChangeKind.MODIFIED
+            return [(path, kind)]
+        return []
+
+    def _resync(self) -> list[tuple[str, ChangeKind]]:
+        events: list[tuple[str, ChangeKind]] = []
+        for directory in self._tree.directories():
+            if directory not in self._tree:
+                continue
+            changes = self._tree.refresh(directory, force=True)
+            self._remove_watches(changes.removed_directories)
+            self._add_watches(changes.added_directories)
+            events.extend(_changes_to_events(changes))
+        return events
+
+    def _add_watches(self, directories: Sequence[str], strict: bool = False) -> None:
+        for directory in directories:
+            try:
+                wd = self._inotify.add_watch(directory)
+            except OSError as exc:
+                if strict or exc.errno == errno.ENOSPC:
+                    raise
+                logger.debug("Cannot watch directory %s: %s", directory, exc)
+                continue
+            self._watches[wd] = directory
+            self._watch_ids[directory] = wd
+
+    def _remove_watches(self, directories: Sequence[str]) -> None:
+        for directory in directories:
+            wd = self._watch_ids.pop(directory, None)
+            if wd is not None:
+                self._watches.pop(wd, None)
+                self._inotify.remove_watch(wd)
+
+
+def is_network_mount(path: Path) -> bool:
+    """Return True if ``path`` lives on a filesystem listed in NETWORK_FILESYSTEMS."""
+    try:
+        with open("/proc/mounts", encoding="utf-8") as mounts:
+            entries = [line.split() for line in mounts]
+    except OSError:
+        return False
+
+    resolved = str(path.resolve())
+    best_match = ""
+    best_type = ""
+    for entry in entries:
+        if len(entry) < 3:
+            continue
+        # /proc/mounts escapes spaces in mount points as \040.
+        mount_point = entry[1].replace("\\040", " ")
+        if (
+            resolved == mount_point
+            or resolved.startswith(mount_point.rstrip("/") + "/")
+        ) and len(mount_point) > len(best_match):
+            best_match, best_type = mount_point, entry[2]
+    return best_type in NETWORK_FILESYSTEMS
+
+
+class LibraryWatcher(QObject):
+    """Watch scan roots and push changed files through the scan engine.
+
+    Raw events are debounced and coalesced by :class:`ChangeCoalescer` and
+    handed to :meth:`ScanEngine.apply_changes` on the watcher thread, so
+    only changed files are parsed and passed to the enrichment callbacks.
+    Roots on network mounts, or on platforms without inotify, are polled.
+    """
+
+    changes_detected = Signal(object)  # list[FileChange]
+    watch_started = Signal(str)  # Backend names
+    watch_error = Signal(str)
+
+    def __init__(
+        self,
+        engine: ScanEngine,
+        config: ScanConfig,
+        debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        backend: str = "auto",
+        parent: QObject | None = None,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            engine: Scan engine receiving the changes
+            config: Scan configuration providing roots and ignore lists
+            debounce: Quiet period in seconds before changes are processed
+            max_delay: Upper bound in seconds on how long a change is held
+            poll_interval: Seconds between polls for polled roots
+            backend: "auto", "inotify" or "polling"
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        if backend not in ("auto", "inotify", "polling"):
+            raise ValueError(f"Unknown watch backend: {backend}")
+        self._engine = engine
+        self._config = config
+        self._poll_interval = poll_interval
+        self._backend_mode = backend
+        self._coalescer = ChangeCoalescer(debounce, max_delay)
+        self._tick = min(0.25, max(0.01, debounce / 2))
+        self._backends: list[WatchBackend] = []
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start watching the configured roots on a background thread."""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._backends = self._create_backends()
+        if not self._backends:
+            self.watch_error.emit("No scan roots to watch")
+            return
+        self.watch_started.emit(", ".join(backend.name for backend in self._backends))
+        self._thread = threading.Thread(
+            target=self._run, name="library-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop watching and process any changes still pending."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        for backend in self._backends:
+            backend.close()
+        self._backends = []
+
+    def is_running(self) -> bool:
+        """Return True while the watcher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def backend_names(self) -> list[str]:
+        """Return the names of the active backends."""
+        return [backend.name for backend in self._backends]
+
+    def process_pending(self, force: bool = False) -> list[FileChange]:
+        """Hand settled changes to the scan engine.
+
+        Args:
+            force: Process changes even if the debounce window has not passed
+
+        Returns:
+            The changes that were processed
+        """
+        changes = self._coalescer.drain(force=force)
+        if changes:
+            self.changes_detected.emit(changes)
+            try:
+                self._engine.apply_changes(changes)
+            except Exception as exc:  # pragma: no cover - safeguard logging
+                logger.error("Failed to apply %d watched changes: %s", len(changes), exc)
+                self.watch_error.emit(str(exc))
+        return changes
+
+    def _create_backends(self) -> list[WatchBackend]:
+        inotify_roots: list[Path] = []
+        polling_roots: list[Path] = []
+        for root in self._config.root_paths:
+            if not root.exists():
+                message = f"Watch root does not exist: {root}"
+                logger.warning(message)
+                self.watch_error.emit(message)
+                continue
+            if self._backend_mode == "polling" or (
+                self._backend_mode == "auto"
+                and (not InotifyBackend.is_supported() or is_network_mount(root))
+            ):
+                polling_roots.append(root)
+            else:
+                inotify_roots.append(root)
+
+        backends: list[WatchBackend] = []
+        if inotify_roots:
+            inotify_backend: InotifyBackend | None = None
+            try:
+                inotify_backend = InotifyBackend(self._config.with_roots(inotify_roots))
+                inotify_backend.start()
+                backends.append(inotify_backend)
+            except (OSError, AttributeError) as exc:
+                # AttributeError covers a libc without the inotify symbols.
+                logger.warning("Inotify unavailable, falling back to polling: %s", exc)
+                if inotify_backend is not None:
+                    # start() can fail after the descriptor was opened, e.g.
+                    # with ENOSPC at the watch limit.
+                    inotify_backend.close()
+                polling_roots = inotify_roots + polling_roots
+        if polling_roots:
+            backend = PollingBackend(
+                self._config.with_roots(polling_roots), self._poll_interval
+            )
+            backend.start()
+            backends.append(backend)
+        return backends
+
+    def _run(self) -> None:
+        # With two backends, each waits half a tick so neither starves.
+        timeout = self._tick / len(self._backends)
+        while not self._stop_event.is_set():
+            for backend in self._backends:
+                try:
+                    events = backend.read_events(timeout)
+                except OSError as exc:
+                    logger.error("Watch backend %s failed: %s", backend.name, exc)
+                    self.watch_error.emit(str(exc))
+                    continue
+                for path, kind in events:
+                    self._coalescer.add(path, kind)
+            self.process_pending()
+        self.process_pending(force=True)
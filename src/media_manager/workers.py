@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 
 from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
@@ -28,6 +29,8 @@ from .models import (
     VideoMetadata,
 )
 from .providers.adapter import ProviderAdapter
+from .providers.http_client import AsyncHTTPClient
+from .providers.match_planner import MatchGroup, plan_match_groups
 from .providers.tmdb import TMDBProvider
 from .providers.tvdb import TVDBProvider
 from .settings import get_settings
@@ -43,11 +46,22 @@ class MatchWorkerSignals(QObject):
 
 
 class MatchWorker(QRunnable):
-    """Worker for finding matches in background threads."""
+    """Worker for finding matches in background threads.
 
-    def __init__(self, metadata_list: list[VideoMetadata]) -> None:
+    Pending items are first grouped by normalized title, year and media
+    type, and each group is resolved with one search and one details call,
+    so the episodes of a show share a single lookup. Cached searches for the
+    groups are loaded in bulk batches before their lookups.
+
+    With ``concurrency`` above 1 the worker runs an event loop on its own
+    thread and keeps that many lookups in flight over a shared pooled HTTP
+    client, so a single pool thread can drive thousands of lookups.
+    """
+
+    def __init__(self, metadata_list: list[VideoMetadata], concurrency: int = 1) -> None:
         super().__init__()
         self.metadata_list = metadata_list
+        self.concurrency = max(1, concurrency)
         self.signals = MatchWorkerSignals()
         self._logger = get_logger().get_logger(__name__)
         self._should_stop = False
@@ -59,36 +73,108 @@ class MatchWorker(QRunnable):
         instrumentation = get_instrumentation()
         
         total = len(self.metadata_list)
+        groups = plan_match_groups(self.metadata_list)
+        self._logger.debug(f"Planned {len(groups)} lookups for {total} items")
         
         # Initialize provider adapter
         with instrumentation.timer("match_worker.initialize_adapter"):
             adapter = self._get_adapter()
 
-        for index, metadata in enumerate(self.metadata_list, start=1):
-            if self._should_stop:
-                break
-
-            try:
-                # Use provider adapter for matching
-                with instrumentation.timer("match_worker.search_and_match"):
-                    match = adapter.search_and_match(metadata, fallback_to_mock=True)
+        try:
+            if self.concurrency > 1:
+                asyncio.run(self._run_concurrently(adapter, groups))
+            else:
+                self._run_pipelined(adapter, groups)
+        except Exception as exc:  # pragma: no cover - safeguard logging
+            self._logger.error(f"Matching stopped: {exc}")
+        finally:
+            adapter.close()
 
-                self.signals.match_found.emit(match)
-                self.signals.progress.emit(index, total)
-                instrumentation.increment_counter("match_worker.matches_found")
+        self.signals.finished.emit()
 
-            except Exception as exc:
-                error_msg = f"Failed to match {metadata.path}: {exc}"
-                self._logger.error(error_msg)
-                self.signals.match_failed.emit(str(metadata.path), str(exc))
-                instrumentation.increment_counter("match_worker.matches_failed")
+    def _run_pipelined(self, adapter: ProviderAdapter, groups: list[MatchGroup]) -> None:
+        """Match groups on this thread, with details fetched on the adapter's pool."""
+        from .instrumentation import get_instrumentation
+        instrumentation = get_instrumentation()
 
-        self.signals.finished.emit()
+        total = len(self.metadata_list)
+        completed = 0
+        # A failing group is reported on its own; the rest keep matching.
+        for _, matches in adapter.match_groups(
+            groups, fallback_to_mock=True, on_error=self._report_group_failure
+        ):
+            for match in matches:
+                completed += 1
+                self.signals.match_found.emit(match)
+                self.signals.progress.emit(completed, total)
+            instrumentation.increment_counter(
+                "match_worker.matches_found", value=len(matches)
+            )
+            if self._should_stop:
+                break
 
     def stop(self) -> None:
         """Stop the worker."""
         self._should_stop = True
 
+    async def _run_concurrently(
+        self, adapter: ProviderAdapter, groups: list[MatchGroup]
+    ) -> None:
+        """Match every group with up to ``concurrency`` lookups in flight."""
+        from .instrumentation import get_instrumentation
+        instrumentation = get_instrumentation()
+
+        total = len(self.metadata_list)
+        pending = adapter.with_prefetched_searches(groups)
+        completed = 0
+
+        async def drain() -> None:
+            nonlocal completed
+            for group in pending:
+                if self._should_stop:
+                    return
+                try:
+                    with instrumentation.timer("match_worker.search_and_match"):
+                        matches = await adapter.match_group_async(
+                            group, fallback_to_mock=True
+                        )
+                except Exception as exc:
+                    self._report_group_failure(group, exc)
+                    continue
+
+                for match in matches:
+                    completed += 1
+                    self.signals.match_found.emit(match)
+                    self.signals.progress.emit(completed, total)
+                instrumentation.increment_counter(
+                    "match_worker.matches_found", value=len(matches)
+                )
+
+        async with AsyncHTTPClient(
+            max_connections_per_host=self.concurrency,
+            timeout=float(get_settings().get_provider_timeout()),
+        ) as client:
+            adapter.bind_http_client(client)
+            try:
+                await asyncio.gather(
+                    *(drain() for _ in range(min(self.concurrency, len(groups))))
+                )
+            finally:
+                adapter.bind_http_client(None)
+
+    def _report_group_failure(self, group: MatchGroup, exc: Exception) -> None:
+        """Emit a failure for every item in a group whose lookup raised."""
+        from .instrumentation import get_instrumentation
+        instrumentation = get_instrumentation()
+
+        for metadata in group.members:
+            error_msg = f"Failed to match {metadata.path}: {exc}"
+            self._logger.error(error_msg)
+            self.signals.match_failed.emit(str(metadata.path), str(exc))
+        instrumentation.increment_counter(
+            "match_worker.matches_failed", value=len(group.members)
+        )
+
     def _get_adapter(self) -> ProviderAdapter:
         """Get or create provider adapter.
 
@@ -115,7 +201,10 @@ class MatchWorker(QRunnable):
             else:
                 self._logger.warning("TVDB provider enabled but API key not configured")
 
-        adapter = ProviderAdapter(providers if providers else None)
+        adapter = ProviderAdapter(
+            providers if providers else None,
+            provider_timeout=float(settings.get_provider_timeout()),
+        )
         return adapter
 
     def _create_mock_match(self, metadata: VideoMetadata) -> MediaMatch:
@@ -271,7 +360,10 @@ class SearchWorker(QRunnable):
             else:
                 self._logger.debug("TVDB provider enabled but API key not configured")
 
-        adapter = ProviderAdapter(providers if providers else None)
+        adapter = ProviderAdapter(
+            providers if providers else None,
+            provider_timeout=float(settings.get_provider_timeout()),
+        )
         return adapter
 
     def _convert_to_search_results(self, provider_results: list) -> list[SearchResult]:
@@ -360,9 +452,16 @@ class WorkerManager(QObject):
         self._logger.info(f"Worker thread pool size: {self._thread_pool.maxThreadCount()}")
         self._active_workers: list[QRunnable] = []
 
-    def start_match_worker(self, metadata_list: list[VideoMetadata]) -> MatchWorker:
-        """Start a match worker and return it."""
-        worker = MatchWorker(metadata_list)
+    def start_match_worker(
+        self, metadata_list: list[VideoMetadata], concurrency: int | None = None
+    ) -> MatchWorker:
+        """Start a match worker and return it.
+
+        ``concurrency`` defaults to the provider concurrency setting.
+        """
+        if concurrency is None:
+            concurrency = get_settings().get_provider_concurrency()
+        worker = MatchWorker(metadata_list, concurrency=concurrency)
         self._active_workers.append(worker)
         self._thread_pool.start(worker)
 
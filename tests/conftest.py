@@ -77,3 +77,13 @@ def pytest_collection_modifyitems(config, items):
         # Add GUI marker to tests that use QApplication
         if "qapp" in item.fixturenames:
             item.add_marker(pytest.mark.gui)
+
+
+@pytest.fixture
+def provider_cache(monkeypatch):
+    """Install an isolated, memory-only provider cache for the test."""
+    from media_manager import cache_service
+
+    service = cache_service.CacheService(use_db_cache=False)
+    monkeypatch.setattr(cache_service, "_cache_service", service)
+    return service
@@ -349,4 +349,157 @@ class SyntheticDataFactory:
             print(f"  Progress: {progress}/{item_count} ({percentage:.1f}%)")
         
         print(f"Created synthetic library with {item_count} items")
-        return library
\ No newline at end of file
+        return library
+
+def generate_release_names(count: int = 100_000, seed: int = 42) -> List[str]:
+    """Generate filename stems modelled on real-world release names.
+
+    Covers scene-style movie and episode releases, "Title (Year) [Quality]"
+    library layouts, fansub groups in brackets, "Season N Episode M" names
+    and non-Latin titles, with roughly the duplication a real library has.
+    """
+    rng = random.Random(seed)
+    words = [
+        "The", "Dark", "Knight", "Matrix", "Blade", "Runner", "Lost", "City",
+        "Breaking", "Bad", "Office", "Strange", "Things", "Star", "Wars", "Dune",
+        "House", "Dragon", "Crown", "Alien", "Heat", "Fargo", "True", "Detective",
+        "Spider-Man", "Mr", "Robot", "Ocean's", "Eleven", "Amélie", "Godzilla",
+    ]
+    native_titles = ["流浪地球", "霸王别姬", "千と千尋の神隠し", "기생충", "Крик"]
+    qualities = ["720p", "1080p", "2160p", "4K", "HDTV", "WEBRip", "WEB-DL", "BluRay", "Blu-Ray", "REMUX"]
+    codecs = ["x264", "x265", "HEVC", "XviD", "H.264", "10bit", "HDR", "DDP5.1", "AAC", "DTS"]
+    groups = ["RARBG", "YTS", "SPARKS", "NTb", "FLUX", "CtrlHD", "EVO", "GalaxyRG"]
+    fansubs = ["HorribleSubs", "SubsPlease", "Erai-raws", "Judas"]
+
+    def title() -> str:
+        if rng.random() < 0.05:
+            return rng.choice(native_titles)
+        return " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+
+    names: List[str] = []
+    while len(names) < count:
+        name_title = title()
+        year = rng.randint(1950, 2024)
+        quality = rng.choice(qualities)
+        codec = rng.choice(codecs)
+        group = rng.choice(groups)
+        style = rng.random()
+        if style < 0.35:
+            dotted = name_title.replace(" ", ".")
+            name = f"{dotted}.{year}.{quality}.{codec}-{group}"
+        elif style < 0.65:
+            dotted = name_title.replace(" ", ".")
+            season, episode = rng.randint(1, 12), rng.randint(1, 24)
+            name = f"{dotted}.S{season:02d}E{episode:02d}.{quality}.{codec}-{group}"
+        elif style < 0.8:
+            name = f"{name_title} ({year}) [{quality}]"
+        elif style < 0.88:
+            name = f"[{rng.choice(fansubs)}] {name_title} - {rng.randint(1, 99):02d} [{quality}]"
+        elif style < 0.94:
+            underscored = name_title.replace(" ", "_")
+            name = f"{underscored}_{rng.randint(1, 9)}x{rng.randint(1, 24):02d}_{quality}"
+        else:
+            name = f"{name_title} Season {rng.randint(1, 9)} Episode {rng.randint(1, 24)}"
+        names.append(name)
+        # Libraries repeat names across versions, samples and re-scans.
+        if rng.random() < 0.1 and len(names) < count:
+            names.append(name)
+    return names
+
+
+def generate_tmdb_details_payloads(count: int = 200, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate movie details responses shaped like TMDB's.
+
+    Each payload has the fields and nesting of a ``/movie/{id}`` response
+    with ``append_to_response=credits,videos,images``: a cast and crew of a
+    few dozen people, trailers, and poster/backdrop image lists.
+    """
+    rng = random.Random(seed)
+    words = [
+        "The", "Dark", "Knight", "Matrix", "Blade", "Runner", "Lost", "City",
+        "Strange", "Things", "Star", "Wars", "Dune", "House", "Dragon", "Alien",
+    ]
+    first_names = ["Anna", "Brad", "Cate", "Denzel", "Emma", "Hugh", "Keanu", "Meryl", "Song", "Zhang"]
+    last_names = ["Pitt", "Blanchett", "Washington", "Stone", "Jackman", "Reeves", "Streep", "Kang-ho", "Ziyi"]
+    jobs = [("Directing", "Director"), ("Writing", "Screenplay"), ("Sound", "Original Music Composer"),
+            ("Camera", "Director of Photography"), ("Editing", "Editor"), ("Production", "Producer")]
+
+    def person(index: int) -> Dict[str, Any]:
+        return {
+            "adult": False,
+            "gender": rng.choice([0, 1, 2]),
+            "id": rng.randint(1, 3_000_000),
+            "known_for_department": "Acting",
+            "name": f"{rng.choice(first_names)} {rng.choice(last_names)}",
+            "original_name": f"{rng.choice(first_names)} {rng.choice(last_names)}",
+            "popularity": round(rng.uniform(0.5, 90), 3),
+            "profile_path": f"/{rng.getrandbits(64):016x}.jpg",
+            "credit_id": f"{rng.getrandbits(96):024x}",
+            "order": index,
+        }
+
+    def image(width: int, height: int) -> Dict[str, Any]:
+        return {
+            "aspect_ratio": round(width / height, 3),
+            "height": height,
+            "iso_639_1": rng.choice(["en", "fr", "de", None]),
+            "file_path": f"/{rng.getrandbits(64):016x}.jpg",
+            "vote_average": round(rng.uniform(0, 10), 3),
+            "vote_count": rng.randint(0, 40),
+            "width": width,
+        }
+
+    payloads: List[Dict[str, Any]] = []
+    for index in range(count):
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+        cast = [
+            dict(person(order), cast_id=order, character=f"{rng.choice(first_names)} {rng.choice(words)}")
+            for order in range(rng.randint(15, 60))
+        ]
+        crew = []
+        for order in range(rng.randint(10, 40)):
+            department, job = rng.choice(jobs)
+            crew.append(dict(person(order), department=department, job=job, known_for_department=department))
+        payloads.append({
+            "adult": False,
+            "backdrop_path": f"/{rng.getrandbits(64):016x}.jpg",
+            "budget": rng.randint(1, 300) * 1_000_000,
+            "genres": [{"id": rng.randint(12, 10770), "name": rng.choice(words)} for _ in range(3)],
+            "homepage": f"https://example.com/{index}",
+            "id": 1000 + index,
+            "imdb_id": f"tt{rng.randint(100000, 9999999):07d}",
+            "original_language": "en",
+            "original_title": title,
+            "overview": " ".join(rng.choice(words).lower() for _ in range(rng.randint(30, 80))) + ".",
+            "popularity": round(rng.uniform(1, 500), 3),
+            "poster_path": f"/{rng.getrandbits(64):016x}.jpg",
+            "release_date": f"{rng.randint(1950, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "revenue": rng.randint(0, 2_000_000_000),
+            "runtime": rng.randint(80, 180),
+            "status": "Released",
+            "tagline": " ".join(rng.choice(words) for _ in range(6)),
+            "title": title,
+            "vote_average": round(rng.uniform(1, 10), 3),
+            "vote_count": rng.randint(0, 30000),
+            "credits": {"cast": cast, "crew": crew},
+            "videos": {"results": [
+                {
+                    "iso_639_1": "en",
+                    "name": f"Official Trailer {number}",
+                    "key": f"{rng.getrandbits(44):011x}",
+                    "site": "YouTube",
+                    "size": 1080,
+                    "type": rng.choice(["Trailer", "Teaser", "Featurette"]),
+                    "official": True,
+                    "published_at": "2020-01-01T16:00:00.000Z",
+                    "id": f"{rng.getrandbits(96):024x}",
+                }
+                for number in range(rng.randint(1, 8))
+            ]},
+            "images": {
+                "backdrops": [image(3840, 2160) for _ in range(rng.randint(5, 30))],
+                "logos": [image(500, 200) for _ in range(rng.randint(0, 5))],
+                "posters": [image(2000, 3000) for _ in range(rng.randint(5, 30))],
+            },
+        })
+    return payloads
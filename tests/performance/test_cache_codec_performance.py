@@ -0,0 +1,76 @@
+"""Cache codec benchmarks on TMDB-shaped details payloads."""
+
+import json
+import os
+import pytest
+from pathlib import Path
+
+# Set environment variable to avoid Qt issues in performance tests
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from src.media_manager.cache_codec import available_codecs, decode_payload, get_codec
+from src.media_manager.cache_service import FileCacheBackend
+
+from .data_factories import generate_tmdb_details_payloads
+
+
+@pytest.fixture(scope="module")
+def details_payloads() -> list:
+    """200 movie details responses with credits, videos and images."""
+    return generate_tmdb_details_payloads(200)
+
+
+def _raw_size(payloads: list) -> int:
+    return sum(len(get_codec("json").dump(payload)) for payload in payloads)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("codec_name", available_codecs())
+def test_codec_encode_throughput(benchmark, details_payloads: list, codec_name: str) -> None:
+    """Benchmark encoding 200 details payloads."""
+    codec = get_codec(codec_name)
+
+    encoded = benchmark(lambda: [codec.encode(payload) for payload in details_payloads])
+
+    benchmark.extra_info["mb_per_round"] = round(_raw_size(details_payloads) / 1e6, 2)
+    benchmark.extra_info["compression_ratio"] = round(
+        _raw_size(details_payloads) / sum(len(payload) for payload in encoded), 2
+    )
+    assert len(encoded) == len(details_payloads)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("codec_name", available_codecs())
+def test_codec_decode_throughput(benchmark, details_payloads: list, codec_name: str) -> None:
+    """Benchmark decoding 200 details payloads."""
+    codec = get_codec(codec_name)
+    encoded = [codec.encode(payload) for payload in details_payloads]
+
+    decoded = benchmark(lambda: [decode_payload(payload) for payload in encoded])
+
+    benchmark.extra_info["mb_per_round"] = round(_raw_size(details_payloads) / 1e6, 2)
+    assert decoded == details_payloads
+
+
+@pytest.mark.benchmark
+def test_codec_on_disk_size(benchmark, details_payloads: list, tmp_path: Path) -> None:
+    """Compare the file cache footprint of each codec against legacy JSON text."""
+
+    def store(name: str, encode) -> int:
+        backend = FileCacheBackend(tmp_path / name)
+        for index, payload in enumerate(details_payloads):
+            backend.set(f"{index:04d}", encode(payload), 3600)
+        return sum(path.stat().st_size for path in (tmp_path / name).rglob("*") if path.is_file())
+
+    # The pre-codec provider file caches stored indented JSON.
+    sizes = {"legacy": store("legacy", lambda payload: json.dumps(payload, indent=2).encode())}
+    for name in available_codecs():
+        sizes[name] = store(name, get_codec(name).encode)
+
+    benchmark.extra_info.update(sizes)
+    benchmark.pedantic(
+        store, args=("bench", get_codec().encode), rounds=3, iterations=1
+    )
+
+    assert sizes["json"] < sizes["legacy"]
+    assert sizes["zlib"] < sizes["json"] / 3
@@ -1,20 +1,28 @@
 """Database performance benchmarks using pytest-benchmark."""
 
 import os
+import threading
+import time
 import pytest
+from datetime import datetime
 from pathlib import Path
 from sqlmodel import Session, select
 
 # Set environment variable to avoid Qt issues in performance tests
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
-from src.media_manager.persistence.database import DatabaseService
-from src.media_manager.persistence.repositories import MediaItemRepository
+from src.media_manager.persistence.database import (
+    DEFAULT_SQLITE_PROFILE,
+    SQLITE_DEFAULTS_PROFILE,
+    DatabaseService,
+)
+from src.media_manager.persistence.repositories import MediaItemCursor, MediaItemRepository
 from src.media_manager.persistence.models import (
     Library,
     MediaItem,
     Person,
     Credit,
+    JobRun,
 )
 
 from .data_factories import SyntheticDataFactory
@@ -276,4 +284,144 @@ def test_count_performance_regression(
     assert result.min < thresholds["db_count_max_time"], (
         f"Count performance regression: {result.min:.3f}s > "
         f"{thresholds['db_count_max_time']}s"
-    )
\ No newline at end of file
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "profile",
+    [DEFAULT_SQLITE_PROFILE, SQLITE_DEFAULTS_PROFILE],
+    ids=["tuned", "sqlite_defaults"],
+)
+def test_concurrent_reads_during_writes(benchmark, tmp_path: Path, profile) -> None:
+    """Benchmark UI-style reads while a background job keeps writing."""
+    db_service = DatabaseService(f"sqlite:///{tmp_path / 'concurrent.db'}", sqlite_profile=profile)
+    db_service.create_all()
+    with db_service.get_session() as session:
+        factory = SyntheticDataFactory(session)
+        library = factory.create_synthetic_library(
+            item_count=2000,
+            library_name="Concurrent Library",
+            with_tags=False,
+            with_collections=False,
+            with_favorites=False,
+            with_credits=False,
+        )
+        library_id = library.id
+    repository = MediaItemRepository(database_service=db_service)
+
+    stop = threading.Event()
+    writes = []
+
+    def writer() -> None:
+        # A scan job recording progress: many small write transactions.
+        while not stop.is_set():
+            with db_service.get_session() as session:
+                session.add_all(
+                    JobRun(library_id=library_id, job_type="scan", status="running")
+                    for _ in range(50)
+                )
+                session.commit()
+            writes.append(1)
+
+    def read_pages() -> None:
+        # Scrolling the library view while the job runs.
+        def reader() -> None:
+            for offset in range(0, 1000, 50):
+                repository.get_by_library(library_id, limit=50, offset=offset)
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        for thread in readers:
+            thread.join()
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    try:
+        # Let the writer get going before the first measured round.
+        while not writes:
+            time.sleep(0.01)
+        benchmark.pedantic(read_pages, rounds=5, iterations=1)
+    finally:
+        stop.set()
+        writer_thread.join()
+        db_service.close()
+
+    benchmark.extra_info["write_transactions"] = len(writes)
+    assert writes
+
+
+@pytest.fixture(scope="module")
+def deep_library(tmp_path_factory) -> tuple:
+    """A 200k-item library written with one bulk insert."""
+    db_path = tmp_path_factory.mktemp("deep_library") / "deep.db"
+    db_service = DatabaseService(f"sqlite:///{db_path}")
+    db_service.create_all()
+    with db_service.get_session() as session:
+        library = Library(name="Deep", path="/deep", media_type="movie")
+        session.add(library)
+        session.commit()
+        library_id = library.id
+        session.connection().execute(
+            MediaItem.__table__.insert(),
+            [
+                {
+                    "library_id": library_id,
+                    "title": f"Title {index % 50_000:05d}",
+                    "media_type": "movie",
+                    "year": 1950 + index % 70,
+                    "created_at": datetime(2024, 1, 1),
+                    "updated_at": datetime(2024, 1, 1),
+                }
+                for index in range(200_000)
+            ],
+        )
+        session.commit()
+    return MediaItemRepository(database_service=db_service), library_id
+
+
+def _page_seconds(fetch, rounds: int = 5) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fetch()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@pytest.mark.benchmark
+def test_keyset_page_latency_is_flat(benchmark, deep_library: tuple) -> None:
+    """A page 195k items deep costs about as much as the first page with a cursor."""
+    repository, library_id = deep_library
+    depth = 195_000
+    # The item just before the deep page, found once by offset.
+    (anchor,) = repository.get_by_library(
+        library_id, limit=1, offset=depth - 1, lazy_load=True
+    )
+    cursor = MediaItemCursor.after(anchor)
+
+    first_page = _page_seconds(
+        lambda: repository.get_by_library(library_id, limit=100, lazy_load=True)
+    )
+    offset_page = _page_seconds(
+        lambda: repository.get_by_library(
+            library_id, limit=100, offset=depth, lazy_load=True
+        )
+    )
+    keyset = benchmark(
+        repository.get_by_library, library_id, limit=100, after=cursor, lazy_load=True
+    )
+    keyset_page = benchmark.stats.stats.min
+
+    benchmark.extra_info["first_page_ms"] = first_page * 1000
+    benchmark.extra_info["offset_deep_page_ms"] = offset_page * 1000
+    benchmark.extra_info["keyset_deep_page_ms"] = keyset_page * 1000
+
+    offset_items = repository.get_by_library(
+        library_id, limit=100, offset=depth, lazy_load=True
+    )
+    assert [item.id for item in keyset] == [item.id for item in offset_items]
+    # OFFSET walks every skipped index entry; the cursor seeks directly.
+    assert keyset_page < offset_page / 5
+    assert keyset_page < first_page * 3
@@ -1,15 +1,28 @@
 """Scanning performance benchmarks."""
 
+import os
 import pytest
 import tempfile
+import tracemalloc
+from collections import Counter
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from src.media_manager.compact_models import (
+    CompactMediaMatch,
+    CompactVideoMetadata,
+    ScanResultBatch,
+)
+from src.media_manager.filename_parser import FilenameParser, reference_parse_stem
+from src.media_manager.ingest_service import IngestService
+from src.media_manager.models import MediaMatch, VideoMetadata
 from src.media_manager.scan_engine import ScanEngine
+from src.media_manager.scanner import ScanConfig, Scanner
 from src.media_manager.persistence.database import DatabaseService
+from src.media_manager.persistence.models import Library
 from src.media_manager.persistence.repositories import LibraryRepository
 
-from .data_factories import SyntheticDataFactory
+from .data_factories import SyntheticDataFactory, generate_release_names
 from .conftest import perf_thresholds
 
 
@@ -253,4 +266,279 @@ def test_discovery_performance_regression(
         assert time_per_file < thresholds["scan_max_time_per_item"], (
             f"Discovery performance regression: {time_per_file:.4f}s per file > "
             f"{thresholds['scan_max_time_per_item']}s per file"
-        )
\ No newline at end of file
+        )
+
+
+class _CountingDirEntry:
+    """DirEntry proxy that counts the stat calls made through it."""
+
+    def __init__(self, entry: os.DirEntry, counts: Counter) -> None:
+        self._entry = entry
+        self._counts = counts
+        self.name = entry.name
+        self.path = entry.path
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+    def is_symlink(self) -> bool:
+        return self._entry.is_symlink()
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        self._counts["stat"] += 1
+        return self._entry.stat(follow_symlinks=follow_symlinks)
+
+    def inode(self) -> int:
+        return self._entry.inode()
+
+    def __fspath__(self) -> str:
+        return self.path
+
+
+class _CountingScandir:
+    """Context-managed scandir iterator yielding counting entries."""
+
+    def __init__(self, iterator, counts: Counter) -> None:
+        self._iterator = iterator
+        self._counts = counts
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> _CountingDirEntry:
+        return _CountingDirEntry(next(self._iterator), self._counts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._iterator.close()
+
+    def close(self) -> None:
+        self._iterator.close()
+
+
+def _count_syscalls(func) -> Counter:
+    """Run func and count the stat and scandir calls it makes.
+
+    ``DirEntry`` type checks answered from the directory listing are free,
+    so only explicit stats and directory listings are counted.
+    """
+    counts: Counter = Counter()
+    real_stat = os.stat
+    real_lstat = os.lstat
+    real_scandir = os.scandir
+
+    def counting_stat(*args, **kwargs):
+        counts["stat"] += 1
+        return real_stat(*args, **kwargs)
+
+    def counting_lstat(*args, **kwargs):
+        counts["stat"] += 1
+        return real_lstat(*args, **kwargs)
+
+    def counting_scandir(*args, **kwargs):
+        counts["scandir"] += 1
+        return _CountingScandir(real_scandir(*args, **kwargs), counts)
+
+    with patch.object(os, "stat", counting_stat), patch.object(
+        os, "lstat", counting_lstat
+    ), patch.object(os, "scandir", counting_scandir):
+        func()
+    return counts
+
+
+def _legacy_iter_video_files(config: ScanConfig):
+    """Previous discovery loop: os.walk plus Path.is_file() before the extension check."""
+    for root in config.root_paths:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [
+                dirname
+                for dirname in dirnames
+                if dirname.lower() not in config._ignored_directory_set
+            ]
+            for filename in filenames:
+                file_path = Path(dirpath) / filename
+                if not file_path.is_file():
+                    continue
+                suffix = file_path.suffix.lower()
+                if suffix in config._ignored_extension_set:
+                    continue
+                if suffix in config._video_extension_set:
+                    yield file_path
+
+
+@pytest.fixture(scope="module")
+def sidecar_library(tmp_path_factory) -> Path:
+    """Create 10k files: 2k movie folders with one video and four sidecars each."""
+    library_path = tmp_path_factory.mktemp("sidecar_library")
+    for index in range(2000):
+        movie_dir = library_path / f"Movie {index:04d} (2000)"
+        movie_dir.mkdir()
+        (movie_dir / f"Movie.{index:04d}.2000.1080p.mkv").write_bytes(b"")
+        for sidecar in ("movie.nfo", "poster.jpg", "fanart.jpg", "Movie.en.srt"):
+            (movie_dir / sidecar).write_bytes(b"")
+    return library_path
+
+
+@pytest.mark.benchmark
+def test_discovery_syscalls_per_10k_files(benchmark, sidecar_library: Path) -> None:
+    """Count stat calls per 10k files for legacy and DirEntry-based discovery."""
+    config = ScanConfig(root_paths=[sidecar_library], walker_workers=1)
+    scanner = Scanner()
+
+    legacy = _count_syscalls(lambda: list(_legacy_iter_video_files(config)))
+    paths_only = _count_syscalls(lambda: list(scanner.iter_video_files(config)))
+    with_stat = _count_syscalls(lambda: list(scanner.iter_discovered_files(config)))
+
+    benchmark.extra_info["legacy_stats_per_10k"] = legacy["stat"]
+    benchmark.extra_info["paths_only_stats_per_10k"] = paths_only["stat"]
+    benchmark.extra_info["with_stat_stats_per_10k"] = with_stat["stat"]
+    benchmark.extra_info["directory_listings"] = paths_only["scandir"]
+
+    discovered = benchmark(lambda: list(scanner.iter_discovered_files(config)))
+
+    assert len(discovered) == 2000
+    assert all(item.size == 0 and item.mtime_ns for item in discovered)
+    # The legacy loop stats every file, sidecars included.
+    assert legacy["stat"] >= 10000
+    # Type checks come from the listing; only the root existence check stats.
+    assert paths_only["stat"] == 1
+    # Size and mtime cost at most one stat per accepted video file.
+    assert with_stat["stat"] <= 2000 + 1
+    assert paths_only["scandir"] == with_stat["scandir"] == 2001
+
+
+@pytest.fixture(scope="module")
+def release_names() -> list:
+    """100k synthetic release names modelled on real-world naming schemes."""
+    return generate_release_names(100_000)
+
+
+@pytest.mark.benchmark
+def test_reference_parser_performance(benchmark, release_names: list) -> None:
+    """Benchmark the original regex pipeline on 100k release names."""
+    results = benchmark.pedantic(
+        lambda: [reference_parse_stem(name) for name in release_names],
+        rounds=3,
+        iterations=1,
+    )
+    assert len(results) == len(release_names)
+
+
+@pytest.mark.benchmark
+def test_tokenizing_parser_performance(benchmark, release_names: list) -> None:
+    """Benchmark the tokenizing parser on 100k release names against the reference."""
+    expected = [reference_parse_stem(name) for name in release_names]
+
+    def parse_all() -> list:
+        # A fresh parser per round keeps cache hits limited to repeated names.
+        parser = FilenameParser()
+        return [parser.parse(name) for name in release_names]
+
+    results = benchmark.pedantic(parse_all, rounds=3, iterations=1)
+
+    assert results == expected
+
+
+
+def _scan_rows(release_names: list) -> list:
+    parser = FilenameParser()
+    rows = []
+    for index, name in enumerate(release_names):
+        parsed = parser.parse(name)
+        folder = "tv" if parsed.media_type.value == "tv" else "movies"
+        rows.append(
+            (
+                f"/media/{folder}/{parsed.title}/{name}.{index % 7}.mkv",
+                parsed.title,
+                parsed.media_type,
+                parsed.year,
+                parsed.season,
+                parsed.episode,
+            )
+        )
+    return rows
+
+
+def _peak_allocation(build) -> tuple:
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+@pytest.mark.benchmark
+def test_scan_result_memory_footprint(benchmark, release_names: list) -> None:
+    """Compare retained memory of dataclass and compact scan results for 100k files."""
+    rows = _scan_rows(release_names)
+
+    def build_dataclasses() -> list:
+        metadata = [
+            VideoMetadata(Path(path), title, media_type, year, season, episode)
+            for path, title, media_type, year, season, episode in rows
+        ]
+        return [MediaMatch(metadata=item) for item in metadata]
+
+    def build_compact() -> tuple:
+        batch = ScanResultBatch()
+        for path, title, media_type, year, season, episode in rows:
+            batch.append(
+                CompactVideoMetadata(path, title, media_type, year, season, episode)
+            )
+        queue = [
+            CompactMediaMatch(CompactVideoMetadata.from_metadata(view)) for view in batch
+        ]
+        return batch, queue
+
+    legacy, legacy_bytes = _peak_allocation(build_dataclasses)
+    (batch, queue), compact_bytes = benchmark.pedantic(
+        lambda: _peak_allocation(build_compact), rounds=1, iterations=1
+    )
+
+    benchmark.extra_info["legacy_bytes"] = legacy_bytes
+    benchmark.extra_info["compact_bytes"] = compact_bytes
+    benchmark.extra_info["bytes_per_item"] = compact_bytes / len(rows)
+
+    assert len(batch) == len(queue) == len(legacy)
+    assert batch[123] == legacy[123].metadata
+    # The columnar batch plus slotted queue should need well under the memory
+    # of one dataclass, Path and three eager containers per file.
+    assert compact_bytes < legacy_bytes * 0.6
+
+
+@pytest.mark.benchmark
+def test_bulk_ingest_performance(benchmark, tmp_path: Path, release_names: list) -> None:
+    """Ingest 100k scanned files into an empty library; the target is one minute."""
+    db_service = DatabaseService(f"sqlite:///{tmp_path / 'ingest.db'}")
+    db_service.create_all()
+    with db_service.get_session() as session:
+        library = Library(name="Ingest", path=str(tmp_path), media_type="mixed")
+        session.add(library)
+        session.commit()
+        library_id = library.id
+
+    items = [
+        VideoMetadata(Path(path), title, media_type, year, season, episode)
+        for path, title, media_type, year, season, episode in _scan_rows(release_names)
+    ]
+    service = IngestService(db_service)
+
+    result = benchmark.pedantic(
+        lambda: service.ingest(library_id, items), rounds=1, iterations=1
+    )
+
+    elapsed = benchmark.stats.stats.max
+    benchmark.extra_info["items_per_minute"] = int(result.total / elapsed * 60)
+    assert result.total + result.duplicates == len(items)
+    assert elapsed < 60
+
+    # A rescan of the same files updates rows in place.
+    rescan = service.ingest(library_id, items[:1000])
+    assert rescan.inserted == 0 and rescan.updated + rescan.duplicates == 1000
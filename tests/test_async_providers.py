@@ -0,0 +1,297 @@
+"""Tests for the pooled async HTTP client and async provider interface."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from media_manager.models import MediaType, VideoMetadata
+from media_manager.providers.adapter import ProviderAdapter
+from media_manager.providers.base import BaseProvider, ProviderError, ProviderResult
+from media_manager.providers.http_client import (
+    AsyncHTTPClient,
+    HTTPError,
+    reset_requests_sessions,
+)
+from media_manager.providers.tmdb import TMDBProvider
+from media_manager.settings import get_settings
+from media_manager.workers import MatchWorker, WorkerManager
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers JSON requests and records what it was sent."""
+
+    protocol_version = "HTTP/1.1"  # Keep connections open between requests
+
+    def do_GET(self) -> None:  # noqa: N802
+        parts = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        self.server.requests.append((parts.path, query))  # type: ignore[attr-defined]
+        self.server.peers.add(self.client_address)  # type: ignore[attr-defined]
+
+        if parts.path.endswith("/missing"):
+            self._send(404, {"status_message": "not found"}, {"Retry-After": "3"})
+        elif parts.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            body = json.dumps({"chunked": True}).encode()
+            for piece in (body[:5], body[5:]):
+                self.wfile.write(f"{len(piece):x}\r\n".encode() + piece + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        elif parts.path == "/search/movie":
+            self._send(
+                200,
+                {
+                    "results": [
+                        {
+                            "id": 348,
+                            "title": query["query"],
+                            "release_date": f"{query.get('year', '1979')}-05-25",
+                            "popularity": 90.0,
+                        }
+                    ]
+                },
+            )
+        else:
+            self._send(200, {"path": parts.path, "query": query})
+
+    def _send(self, status: int, payload: dict, headers: dict | None = None) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []  # type: ignore[attr-defined]
+    server.peers = set()  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server: ThreadingHTTPServer, path: str) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}{path}"
+
+
+class TestAsyncHTTPClient:
+    def test_reuses_connections_across_requests(self, stub_server) -> None:
+        async def run() -> tuple[list, AsyncHTTPClient]:
+            async with AsyncHTTPClient() as client:
+                results = [
+                    await client.get_json(_url(stub_server, "/echo"), params={"n": n})
+                    for n in range(5)
+                ]
+            return results, client
+
+        results, client = asyncio.run(run())
+
+        assert [result["query"]["n"] for result in results] == ["0", "1", "2", "3", "4"]
+        assert client.requests_sent == 5
+        assert client.connections_opened == 1
+
+    def test_bounds_connections_per_host(self, stub_server) -> None:
+        async def run() -> AsyncHTTPClient:
+            async with AsyncHTTPClient(max_connections_per_host=3) as client:
+                await asyncio.gather(
+                    *(client.get_json(_url(stub_server, "/echo")) for _ in range(30))
+                )
+            return client
+
+        client = asyncio.run(run())
+
+        assert client.requests_sent == 30
+        assert client.connections_opened <= 3
+
+    def test_reads_chunked_bodies(self, stub_server) -> None:
+        async def run() -> dict:
+            async with AsyncHTTPClient() as client:
+                return await client.get_json(_url(stub_server, "/chunked"))
+
+        assert asyncio.run(run()) == {"chunked": True}
+
+    def test_error_status_carries_headers(self, stub_server) -> None:
+        async def run() -> None:
+            async with AsyncHTTPClient() as client:
+                await client.get_json(_url(stub_server, "/missing"))
+
+        with pytest.raises(HTTPError) as excinfo:
+            asyncio.run(run())
+
+        assert excinfo.value.status == 404
+        assert excinfo.value.headers["retry-after"] == "3"
+
+    def test_connect_failure_is_a_transport_error(self) -> None:
+        async def run() -> None:
+            async with AsyncHTTPClient(timeout=2.0) as client:
+                await client.get_json("http://127.0.0.1:9/unreachable")
+
+        with pytest.raises(HTTPError) as excinfo:
+            asyncio.run(run())
+
+        assert excinfo.value.status is None
+
+
+class TestAsyncProviders:
+    def test_tmdb_search_uses_bound_client(
+        self, stub_server, provider_cache, monkeypatch
+    ) -> None:
+        settings = get_settings()
+        monkeypatch.setattr(settings, "get_tmdb_api_base", lambda: _url(stub_server, ""))
+        monkeypatch.setattr(settings, "get_tmdb_api_key_alternative", lambda: None)
+        provider = TMDBProvider("test-key")
+
+        async def run() -> list[ProviderResult]:
+            async with AsyncHTTPClient() as client:
+                provider.http_client = client
+                return await provider.search_movie_async("Alien", 1979)
+
+        results = asyncio.run(run())
+
+        assert [(r.title, r.year, r.external_id) for r in results] == [("Alien", 1979, "348")]
+        path, query = stub_server.requests[0]
+        assert path == "/search/movie"
+        assert query["api_key"] == "test-key"
+        assert query["year"] == "1979"
+
+    def test_tmdb_http_errors_become_provider_errors(
+        self, stub_server, provider_cache, monkeypatch
+    ) -> None:
+        settings = get_settings()
+        monkeypatch.setattr(settings, "get_tmdb_api_base", lambda: _url(stub_server, ""))
+        provider = TMDBProvider("test-key")
+
+        async def run() -> None:
+            async with AsyncHTTPClient() as client:
+                provider.http_client = client
+                await provider.get_movie_details_async("missing")
+
+        with pytest.raises(ProviderError):
+            asyncio.run(run())
+
+    def test_blocking_calls_share_one_keep_alive_session(
+        self, stub_server, provider_cache, monkeypatch
+    ) -> None:
+        settings = get_settings()
+        monkeypatch.setattr(settings, "get_tmdb_api_base", lambda: _url(stub_server, ""))
+        monkeypatch.setattr(settings, "get_tmdb_api_key_alternative", lambda: None)
+        reset_requests_sessions()
+
+        try:
+            titles = [
+                TMDBProvider("test-key").search_movie(title, 1979)[0].title
+                for title in ("Alien", "Aliens", "Heat")
+            ]
+        finally:
+            reset_requests_sessions()
+
+        assert titles == ["Alien", "Aliens", "Heat"]
+        assert len(stub_server.requests) == 3
+        assert len(stub_server.peers) == 1
+
+    def test_sync_providers_get_thread_backed_async_methods(self) -> None:
+        class SyncOnlyProvider(SlowAsyncProvider):
+            search_movie_async = BaseProvider.search_movie_async
+
+            def search_movie(self, title, year=None):
+                return [ProviderResult("Sync", "1", title, year, confidence=0.9)]
+
+        results = asyncio.run(SyncOnlyProvider().search_movie_async("Alien", 1979))
+
+        assert results[0].provider_name == "Sync"
+
+
+class SlowAsyncProvider(BaseProvider):
+    """Provider that answers each async search after a short sleep."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def search_movie_async(self, title, year=None):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return [ProviderResult(self.name, title, title, year, confidence=0.9)]
+
+    def search_movie(self, title, year=None):
+        raise AssertionError("blocking search should not be used")
+
+    def search_tv(self, title, year=None):
+        raise AssertionError("blocking search should not be used")
+
+    def get_movie_details(self, external_id):
+        raise ProviderError("not supported")
+
+    def get_tv_details(self, external_id, season=None, episode=None):
+        raise ProviderError("not supported")
+
+    def get_cast(self, external_id, media_type):
+        return []
+
+    def get_trailers(self, external_id, media_type):
+        return []
+
+
+def test_match_worker_drives_lookups_concurrently() -> None:
+    provider = SlowAsyncProvider()
+    adapter = ProviderAdapter([provider], use_cache=False)
+    metadata_list = [
+        VideoMetadata(
+            path=Path(f"/movies/Title {index}.mkv"),
+            title=f"Title {index}",
+            media_type=MediaType.MOVIE,
+            year=2000,
+        )
+        for index in range(200)
+    ]
+    worker = MatchWorker(metadata_list, concurrency=50)
+    matches = []
+    worker.signals.match_found.connect(matches.append)
+
+    started = time.monotonic()
+    with patch.object(MatchWorker, "_get_adapter", return_value=adapter):
+        worker.run()
+    elapsed = time.monotonic() - started
+
+    assert sorted(match.external_id for match in matches) == sorted(
+        metadata.title for metadata in metadata_list
+    )
+    assert provider.peak_in_flight == 50
+    # Sequentially this would take 200 * 50ms = 10s.
+    assert elapsed < 2.0
+    assert all(p.http_client is None for p in adapter.providers)
+
+
+def test_match_workers_take_concurrency_from_settings(qapp) -> None:
+    manager = WorkerManager(max_thread_count=1)
+
+    with patch.object(get_settings(), "get_provider_concurrency", return_value=16):
+        worker = manager.start_match_worker([])
+    manager._thread_pool.waitForDone(5000)
+
+    assert worker.concurrency == 16
@@ -0,0 +1,372 @@
+"""Tests for the layered provider cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import Session, select
+
+from media_manager import cache_service
+from media_manager.cache_codec import CodecError, decode_payload, get_codec
+from media_manager.cache_service import (
+    CacheQuery,
+    CacheService,
+    FileCacheBackend,
+    MemoryBackend,
+    RedisBackend,
+    generate_cache_key,
+)
+from media_manager.models import MediaType, VideoMetadata
+from media_manager.performance_utils import setup_cache_backend
+from media_manager.persistence import database
+from media_manager.persistence.models import ProviderCache
+from media_manager.providers.adapter import ProviderAdapter
+from media_manager.providers.tmdb import TMDBProvider
+from media_manager.providers.tvdb import TVDBProvider
+
+
+class FakeRedis:
+    """Redis client stand-in that records round trips."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.round_trips: list[str] = []
+
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        self.round_trips.append("mget")
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> FakeRedis.Pipeline:
+        return FakeRedis.Pipeline(self)
+
+    class Pipeline:
+        def __init__(self, client: FakeRedis) -> None:
+            self.client = client
+            self.commands: list[tuple[str, bytes]] = []
+
+        def setex(self, key: str, ttl: int, value: bytes) -> None:
+            self.commands.append((key, value))
+
+        def execute(self) -> None:
+            self.client.round_trips.append("pipeline")
+            for key, value in self.commands:
+                self.client.data[key] = value
+
+
+@pytest.fixture
+def provider_db(tmp_path: Path, monkeypatch) -> database.DatabaseService:
+    """Initialize a throwaway global database for the SQLite tier."""
+    monkeypatch.setattr(database, "_database_service", None)
+    return database.init_database_service(f"sqlite:///{tmp_path / 'cache.db'}", auto_migrate=False)
+
+
+class TestMemoryBackend:
+    def test_evicts_least_recently_used(self) -> None:
+        memory = MemoryBackend(max_entries=2)
+        memory.set("a", "1", 60)
+        memory.set("b", "2", 60)
+        memory.get("a")
+        memory.set("c", "3", 60)
+
+        assert memory.get("a") == "1"
+        assert memory.get("b") is None
+        assert memory.get("c") == "3"
+
+    def test_expired_entries_are_dropped(self) -> None:
+        memory = MemoryBackend()
+        memory.set("a", "1", 0)
+
+        assert memory.get("a") is None
+        assert len(memory) == 0
+
+
+class TestFileCacheBackend:
+    def test_round_trips_binary_values(self, tmp_path: Path) -> None:
+        files = FileCacheBackend(tmp_path)
+        key = generate_cache_key("TMDBProvider", "movie_details", key="movie_details:1")
+        payload = b'\x02\x00\n{"id":1}'
+
+        files.set(key, payload, 60)
+
+        assert files.get(key) == payload
+        assert (tmp_path / key[:2] / key).read_bytes().endswith(payload)
+
+    def test_expired_files_are_removed(self, tmp_path: Path) -> None:
+        files = FileCacheBackend(tmp_path)
+        files.set("ab01", b"value", -1)
+
+        assert files.get("ab01") is None
+        assert not (tmp_path / "ab" / "ab01").exists()
+
+    def test_evicts_least_recently_used_files_past_the_size_limit(self, tmp_path: Path) -> None:
+        files = FileCacheBackend(tmp_path, max_bytes=1000)
+        payload = b"x" * 180
+        for index in range(5):
+            files.set(f"k{index}", payload, 60)
+            # Make the access order visible to mtime-based eviction.
+            os.utime(tmp_path / f"k{index}"[:2] / f"k{index}", (index, index))
+        files.get("k0")
+
+        files.set("k5", payload, 60)
+
+        assert files.get("k0") == payload
+        assert files.get("k1") is None
+        assert files.get("k5") == payload
+        stored = sum(path.stat().st_size for path in tmp_path.rglob("*") if path.is_file())
+        assert stored <= 900
+
+
+class TestCacheService:
+    def test_works_without_a_database(self) -> None:
+        service = CacheService(use_db_cache=True)
+        if service.db_service is not None:
+            pytest.skip("a global database is already initialized")
+
+        service.set("tmdb", "search_movie", {"id": 1}, title="Alien")
+
+        assert service.get("tmdb", "search_movie", title="Alien") == {"id": 1}
+
+    def test_database_hits_are_promoted_to_faster_tiers(
+        self, provider_db, tmp_path: Path
+    ) -> None:
+        CacheService(memory_entries=0).set("tmdb", "search_movie", {"id": 2}, title="Heat")
+        files = FileCacheBackend(tmp_path / "files")
+        service = CacheService(backend=files)
+
+        assert service.get("tmdb", "search_movie", title="Heat") == {"id": 2}
+
+        key = generate_cache_key("tmdb", "search_movie", title="Heat")
+        assert decode_payload(service.memory.get(key)) == {"id": 2}
+        assert decode_payload(files.get(key)) == {"id": 2}
+
+    def test_payloads_are_not_duplicated_in_the_database_with_a_backend(
+        self, provider_db, tmp_path: Path
+    ) -> None:
+        files = FileCacheBackend(tmp_path / "files")
+        service = CacheService(backend=files)
+
+        service.set("tmdb", "search_movie", {"id": 4}, title="Alien")
+        service.set_many(
+            [(CacheQuery("tmdb", "search_movie", {"title": "Heat"}), {"id": 5})]
+        )
+
+        with Session(provider_db.engine) as session:
+            assert session.exec(select(ProviderCache)).all() == []
+        key = generate_cache_key("tmdb", "search_movie", title="Heat")
+        assert decode_payload(files.get(key)) == {"id": 5}
+        assert service.get("tmdb", "search_movie", title="Alien") == {"id": 4}
+
+    def test_clear_all_empties_every_tier(self, provider_db, tmp_path: Path) -> None:
+        files = FileCacheBackend(tmp_path / "files")
+        service = CacheService(backend=files)
+        service.set("tmdb", "search_movie", {"id": 3}, title="Ran")
+
+        service.clear_all()
+
+        assert service.get("tmdb", "search_movie", title="Ran") is None
+        assert service.get_stats()["total_entries"] == 0
+
+
+@pytest.fixture
+def cache_settings(monkeypatch):
+    """Cache settings for ``setup_cache_backend`` with the global service reset."""
+    from media_manager.settings import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "get_provider_cache_enabled", lambda: True)
+    monkeypatch.setattr(settings, "get_cache_backend_type", lambda: "db")
+    monkeypatch.setattr(cache_service, "_cache_service", None)
+    return settings
+
+
+class TestCacheSetup:
+    def test_size_limit_setting_reaches_the_file_tier(self, cache_settings, monkeypatch) -> None:
+        monkeypatch.setattr(cache_settings, "get_provider_cache_max_mb", lambda: 3)
+
+        service = setup_cache_backend()
+
+        assert service is cache_service.get_cache_service()
+        assert isinstance(service.backend, FileCacheBackend)
+        assert service.backend.max_bytes == 3 * 1024 * 1024
+
+    @pytest.mark.parametrize(("setting", "expected"), [("json", "json"), ("bogus", "zlib")])
+    def test_codec_setting_reaches_the_service(
+        self, cache_settings, monkeypatch, setting: str, expected: str
+    ) -> None:
+        monkeypatch.setattr(cache_settings, "get_provider_cache_codec", lambda: setting)
+
+        service = setup_cache_backend()
+
+        assert cache_service.get_cache_service().codec.name == expected
+        assert service.codec is get_codec(expected)
+
+
+class TestProvidersUseTheSharedCache:
+    def test_tmdb_responses_are_cached_once(self, provider_cache) -> None:
+        provider = TMDBProvider("cache-test-key")
+        adapter = ProviderAdapter([provider], concurrent=False)
+        response = {"results": [{"id": 603, "title": "The Matrix", "release_date": "1999-03-31"}]}
+        metadata = VideoMetadata(Path("/m/The Matrix.mkv"), "The Matrix", MediaType.MOVIE, 1999)
+
+        with patch.object(TMDBProvider, "_api_call", return_value=response) as api_call:
+            first = provider.search_movie("The Matrix", 1999)
+            second = provider.search_movie("The Matrix", 1999)
+            adapter._store_search(provider, metadata, first)
+
+        assert api_call.call_count == 1
+        assert first == second
+        # Only the raw response is stored; the adapter doesn't cache it again.
+        assert len(provider_cache.memory) == 1
+
+    def test_tvdb_token_is_kept_in_the_shared_cache(self, provider_cache) -> None:
+        provider = TVDBProvider("cache-test-key")
+
+        provider._store_token("abc")
+
+        assert TVDBProvider("cache-test-key")._load_cached_token() == "abc"
+        assert provider_cache.get(provider.name, "token") == {"token": "abc"}
+
+
+class TestBufferedHitCounts:
+    def test_memory_tier_evicts_by_size(self) -> None:
+        memory = MemoryBackend(max_entries=100, max_bytes=10)
+        memory.set("a", "1234", 60)
+        memory.set("b", "5678", 60)
+        memory.set("c", "90ab", 60)
+        memory.set("huge", "x" * 11, 60)
+
+        assert memory.get("a") is None
+        assert memory.get("b") == "5678"
+        assert memory.get("huge") is None
+        assert memory.size == 8
+
+    def test_hits_are_buffered_and_flushed_in_one_batch(self, provider_db) -> None:
+        service = CacheService()
+        service.set("tmdb", "search_movie", {"id": 4}, title="Ikiru")
+        service.set("tmdb", "search_movie", {"id": 5}, title="Rashomon")
+
+        with patch.object(Session, "commit", autospec=True, side_effect=Session.commit) as commit:
+            for _ in range(3):
+                service.get("tmdb", "search_movie", title="Ikiru")
+            service.get("tmdb", "search_movie", title="Rashomon")
+            assert commit.call_count == 0
+
+            assert service.flush_hits() == 2
+            assert commit.call_count == 1
+
+        with provider_db.get_session() as session:
+            entries = session.exec(select(ProviderCache)).all()
+            hits = {entry.query_params: entry.hit_count for entry in entries}
+        assert hits == {'{"title": "Ikiru"}': 3, '{"title": "Rashomon"}': 1}
+
+    def test_flushes_once_the_batch_fills(self, provider_db, monkeypatch) -> None:
+        monkeypatch.setattr(cache_service, "HIT_FLUSH_BATCH_SIZE", 2)
+        service = CacheService()
+        service.set("tmdb", "search_movie", {"id": 6}, title="Ran")
+        service.set("tmdb", "search_movie", {"id": 7}, title="Kagemusha")
+
+        service.get("tmdb", "search_movie", title="Ran")
+        service.get("tmdb", "search_movie", title="Kagemusha")
+
+        assert service.get_stats()["total_hits"] == 2
+        assert service.flush_hits() == 0
+
+
+class TestBulkOperations:
+    def test_redis_batches_use_one_round_trip(self) -> None:
+        redis = FakeRedis()
+        service = CacheService(backend=RedisBackend(redis), use_db_cache=False, memory_entries=0)
+        queries = [CacheQuery("tmdb", "search_movie", {"title": f"T{i}"}) for i in range(20)]
+
+        service.set_many([(query, {"id": i}) for i, query in enumerate(queries)])
+        results = service.get_many(queries + [CacheQuery("tmdb", "search_movie", {"title": "?"})])
+
+        assert redis.round_trips == ["pipeline", "mget"]
+        assert results == [{"id": i} for i in range(20)] + [None]
+
+    def test_database_tier_upserts_and_reads_in_bulk(self, provider_db) -> None:
+        writer = CacheService(memory_entries=0)
+        alien = CacheQuery("tmdb", "search_movie", {"title": "Alien"})
+        heat = CacheQuery("tmdb", "search_movie", {"title": "Heat"})
+        writer.set(alien.provider_name, alien.query_type, {"id": 0}, **alien.params)
+
+        writer.set_many([(alien, {"id": 1}), (heat, {"id": 2})])
+        reader = CacheService()
+        results = reader.get_many([heat, alien, heat])
+
+        assert results == [{"id": 2}, {"id": 1}, {"id": 2}]
+        assert decode_payload(reader.memory.get(alien.key)) == {"id": 1}
+        assert reader.flush_hits() == 2
+        with provider_db.get_session() as session:
+            assert len(session.exec(select(ProviderCache)).all()) == 2
+
+    def test_search_and_match_all_prefetches_before_matching(self, provider_db) -> None:
+        provider = TMDBProvider("prefetch-test-key")
+        titles = ["Alien", "Heat", "Ran"]
+        seeded = CacheService(memory_entries=0)
+        seeded.set_many([
+            (
+                provider.response_cache_query(provider.search_cache_key(title, 1999, movie=True)),
+                {"results": [{"id": index + 1, "title": title, "release_date": "1999-01-01"}]},
+            )
+            for index, title in enumerate(titles)
+        ])
+        service = CacheService()
+        items = [VideoMetadata(Path(f"/m/{t}.mkv"), t, MediaType.MOVIE, 1999) for t in titles]
+
+        with patch.object(cache_service, "_cache_service", service), \
+                patch.object(CacheService, "_get_from_db", autospec=True) as single_lookup, \
+                patch.object(TMDBProvider, "_api_call") as api_call:
+            matches = ProviderAdapter([provider], concurrent=False).search_and_match_all(items)
+
+        assert [match.matched_title for match in matches] == titles
+        assert api_call.call_count == 0
+        assert single_lookup.call_count == 0
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("name", ["json", "zlib"])
+    def test_payloads_carry_their_codec_version(self, name: str) -> None:
+        codec = get_codec(name)
+        value = {"id": 550, "credits": {"cast": [{"name": "Brad Pitt"}] * 50}}
+
+        payload = codec.encode(value)
+
+        assert payload[0] == codec.version
+        assert decode_payload(payload) == value
+
+    def test_compression_shrinks_repetitive_payloads(self) -> None:
+        value = {"cast": [{"name": "Actor", "character": "Role"}] * 200}
+
+        assert len(get_codec("zlib").encode(value)) < len(get_codec("json").encode(value)) / 5
+
+    def test_legacy_json_text_still_decodes(self) -> None:
+        assert decode_payload('{"id": 1}') == {"id": 1}
+        assert decode_payload(b'[{"id": 1}]') == [{"id": 1}]
+
+    def test_unknown_versions_are_rejected(self) -> None:
+        with pytest.raises(CodecError):
+            decode_payload(b"\x08payload")
+
+    def test_legacy_database_rows_are_read_and_rewritten_encoded(self, provider_db) -> None:
+        query = CacheQuery("tmdb", "search_movie", {"title": "Ikiru"})
+        with provider_db.engine.begin() as connection:
+            connection.exec_driver_sql(
+                "INSERT INTO providercache (cache_key, provider_name, query_type, query_params,"
+                " response_data, created_at, expires_at, hit_count, last_accessed)"
+                " VALUES (?, 'tmdb', 'search_movie', '{}', '{\"id\": 9}',"
+                " datetime('now'), datetime('now', '+1 day'), 0, datetime('now'))",
+                (query.key,),
+            )
+        service = CacheService(memory_entries=0, codec=get_codec("zlib"))
+
+        assert service.get("tmdb", "search_movie", title="Ikiru") == {"id": 9}
+
+        service.set("tmdb", "search_movie", {"id": 10}, title="Ikiru")
+        with provider_db.get_session() as session:
+            stored = session.exec(select(ProviderCache.response_data)).one()
+        assert stored[0] == get_codec("zlib").version
+        assert service.get("tmdb", "search_movie", title="Ikiru") == {"id": 10}
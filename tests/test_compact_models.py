@@ -0,0 +1,213 @@
+"""Tests for the compact scan result and match models."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlmodel import select
+
+from media_manager.compact_models import (
+    CompactMediaMatch,
+    CompactVideoMetadata,
+    ScanResultBatch,
+    VideoMetadataView,
+)
+from media_manager.models import (
+    MatchStatus,
+    MediaMatch,
+    MediaType,
+    PosterInfo,
+    PosterType,
+    VideoMetadata,
+)
+from media_manager.ingest_service import IngestService
+from media_manager.persistence.database import DatabaseService
+from media_manager.persistence.models import ExternalId, Library, MediaItem
+from media_manager.providers.adapter import ProviderAdapter
+from media_manager.providers.base import BaseProvider, ProviderResult
+
+
+class DetailsProvider(BaseProvider):
+    """Provider returning fixed movie details."""
+
+    def search_movie(self, title: str, year: int | None = None) -> list[ProviderResult]:
+        return []
+
+    def search_tv(self, title: str, year: int | None = None) -> list[ProviderResult]:
+        return []
+
+    def get_movie_details(self, external_id: str) -> ProviderResult:
+        return ProviderResult(
+            self.name, external_id, "Alien", 1979, overview="In space", runtime=117
+        )
+
+    def get_tv_details(self, external_id, season=None, episode=None) -> ProviderResult:
+        return self.get_movie_details(external_id)
+
+    def get_cast(self, external_id: str, media_type: str) -> list[str]:
+        return []
+
+    def get_trailers(self, external_id: str, media_type: str) -> list[str]:
+        return []
+
+
+@pytest.fixture
+def metadata_list() -> list[VideoMetadata]:
+    return [
+        VideoMetadata(Path("/media/movies/Alien.1979.mkv"), "Alien", MediaType.MOVIE, 1979),
+        VideoMetadata(
+            Path("/media/tv/Dark.S01E02.mkv"), "Dark", MediaType.TV, None, 1, 2
+        ),
+        VideoMetadata(Path("/media/movies/Heat.mkv"), "Heat", MediaType.MOVIE),
+    ]
+
+
+class TestCompactVideoMetadata:
+    """Tests for CompactVideoMetadata."""
+
+    def test_round_trip_and_equality(self, metadata_list: list[VideoMetadata]) -> None:
+        for metadata in metadata_list:
+            compact = CompactVideoMetadata.from_metadata(metadata)
+
+            assert compact == metadata
+            assert compact.path == metadata.path
+            assert compact.as_dict() == metadata.as_dict()
+            assert compact.is_movie() == metadata.is_movie()
+            assert compact.is_episode() == metadata.is_episode()
+            assert compact.to_metadata() == metadata
+
+    def test_is_slotted_and_interns_path(self) -> None:
+        first = CompactVideoMetadata("/media/" + "a.mkv", "A", MediaType.MOVIE)
+        second = CompactVideoMetadata(Path("/media/a.mkv"), "A", MediaType.MOVIE)
+
+        assert not hasattr(first, "__dict__")
+        assert first.path_str is second.path_str
+
+    def test_path_setter(self) -> None:
+        compact = CompactVideoMetadata("/media/a.mkv", "A", MediaType.MOVIE)
+        compact.path = Path("/media/b.mkv")
+
+        assert compact.path == Path("/media/b.mkv")
+
+
+class TestCompactMediaMatch:
+    """Tests for CompactMediaMatch."""
+
+    def test_containers_are_allocated_lazily(self) -> None:
+        match = CompactMediaMatch(
+            CompactVideoMetadata("/media/a.mkv", "A", MediaType.MOVIE)
+        )
+
+        assert match._posters is None and match._cast is None
+        match.cast.append("Actor")
+        match.posters[PosterType.POSTER] = PosterInfo(poster_type=PosterType.POSTER)
+
+        assert match.cast == ["Actor"]
+        assert PosterType.POSTER in match.posters
+        assert match._subtitles is None
+
+    def test_status_helpers_match_dataclass(self) -> None:
+        metadata = VideoMetadata(Path("/media/a.mkv"), "A", MediaType.MOVIE)
+        for status, confidence in [
+            (MatchStatus.PENDING, None),
+            (MatchStatus.MATCHED, 0.5),
+            (MatchStatus.MATCHED, 0.95),
+            (MatchStatus.MANUAL, None),
+            (MatchStatus.SKIPPED, None),
+        ]:
+            legacy = MediaMatch(metadata=metadata, status=status, confidence=confidence)
+            compact = CompactMediaMatch.from_match(legacy)
+
+            assert compact.is_matched() == legacy.is_matched()
+            assert compact.needs_review() == legacy.needs_review()
+            assert compact.as_dict() == legacy.as_dict()
+
+    def test_to_match_copies_containers(self) -> None:
+        compact = CompactMediaMatch(
+            CompactVideoMetadata("/media/a.mkv", "A", MediaType.MOVIE), cast=["Actor"]
+        )
+
+        match = compact.to_match()
+        match.cast.append("Other")
+
+        assert isinstance(match.metadata, VideoMetadata)
+        assert compact.cast == ["Actor"]
+
+    def test_passes_through_adapter_and_ingest(self, tmp_path: Path) -> None:
+        provider = DetailsProvider()
+        compact = CompactMediaMatch(
+            CompactVideoMetadata(
+                "/media/movies/Alien.1979.mkv", "Alien", MediaType.MOVIE, 1979
+            ),
+            status=MatchStatus.MATCHED,
+            matched_title="Alien",
+            matched_year=1979,
+            external_id="348",
+            source=provider.name,
+        )
+        assert isinstance(compact, MediaMatch)
+
+        adapter = ProviderAdapter([provider], use_cache=False)
+        try:
+            (enriched,) = adapter.enrich_matches([compact])
+        finally:
+            adapter.close()
+
+        assert isinstance(enriched, CompactMediaMatch)
+        assert (enriched.overview, enriched.runtime) == ("In space", 117)
+        assert vars(enriched) == {}
+
+        db_service = DatabaseService(f"sqlite:///{tmp_path / 'compact.db'}")
+        db_service.create_all()
+        with db_service.get_session() as session:
+            library = Library(name="Movies", path="/media/movies", media_type="movie")
+            session.add(library)
+            session.commit()
+            library_id = library.id
+
+        result = IngestService(db_service).ingest(library_id, [enriched])
+
+        assert result.inserted == 1
+        with db_service.get_session() as session:
+            item = session.exec(select(MediaItem)).one()
+            assert (item.title, item.runtime, item.description) == ("Alien", 117, "In space")
+            assert session.exec(select(ExternalId.external_id)).all() == ["348"]
+
+
+class TestScanResultBatch:
+    """Tests for ScanResultBatch."""
+
+    def test_views_read_back_every_field(self, metadata_list: list[VideoMetadata]) -> None:
+        batch = ScanResultBatch(metadata_list)
+
+        assert len(batch) == 3
+        assert [view.to_metadata() for view in batch] == metadata_list
+        assert batch.to_metadata_list() == metadata_list
+        assert batch[1] == metadata_list[1]
+        assert batch[1].season == 1 and batch[1].year is None
+        assert batch[-1].media_type is MediaType.MOVIE
+        assert batch[0].as_dict() == metadata_list[0].as_dict()
+
+    def test_slicing_and_bounds(self, metadata_list: list[VideoMetadata]) -> None:
+        batch = ScanResultBatch(metadata_list)
+
+        assert [view.title for view in batch[1:]] == ["Dark", "Heat"]
+        assert isinstance(batch[0], VideoMetadataView)
+        with pytest.raises(IndexError):
+            batch[3]
+
+    def test_accepts_compact_rows_and_clear(
+        self, metadata_list: list[VideoMetadata]
+    ) -> None:
+        batch = ScanResultBatch(
+            CompactVideoMetadata.from_metadata(metadata) for metadata in metadata_list
+        )
+        batch.extend(ScanResultBatch(metadata_list))
+
+        assert len(batch) == 6
+        assert batch.paths()[3] == str(metadata_list[0].path)
+
+        batch.clear()
+        assert len(batch) == 0
+        assert list(batch) == []
@@ -1,6 +1,19 @@
 """Tests for the database service behavior."""
 
-from media_manager.persistence.database import DatabaseService
+import gc
+import threading
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy import text
+from sqlmodel import select
+
+from media_manager.persistence.database import (
+    SQLITE_DEFAULTS_PROFILE,
+    DatabaseService,
+    SQLiteProfile,
+)
+from media_manager.persistence.models import Library
 
 
 def test_run_migrations_creates_tables_when_alembic_missing(tmp_path, monkeypatch) -> None:
@@ -22,3 +35,140 @@ def test_run_migrations_creates_tables_when_alembic_missing(tmp_path, monkeypatc
     service.run_migrations()
 
     assert create_all_called is True
+
+
+def test_sqlite_profile_pragmas_are_applied_to_each_connection(tmp_path) -> None:
+    """Every pooled connection gets WAL, NORMAL sync, the page cache and mmap settings."""
+    service = DatabaseService(
+        f"sqlite:///{tmp_path / 'tuned.db'}",
+        sqlite_profile=SQLiteProfile(cache_size_kib=8192, mmap_size=1 << 20, busy_timeout_ms=1234),
+    )
+
+    with service.engine.connect() as first, service.engine.connect() as second:
+        for connection in (first, second):
+            pragma = lambda name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("cache_size") == -8192
+            assert pragma("mmap_size") == 1 << 20
+            assert pragma("temp_store") == 2  # MEMORY
+            assert pragma("busy_timeout") == 1234
+
+
+def test_sqlite_defaults_profile_leaves_sqlite_untouched(tmp_path) -> None:
+    service = DatabaseService(
+        f"sqlite:///{tmp_path / 'plain.db'}", sqlite_profile=SQLITE_DEFAULTS_PROFILE
+    )
+
+    with service.engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+
+
+def test_profile_overrides_ignore_unknown_settings() -> None:
+    profile = SQLiteProfile.from_overrides({"mmap_size": 0, "journal_size": 1})
+
+    assert profile == SQLiteProfile(mmap_size=0)
+
+
+def _split_service(tmp_path) -> DatabaseService:
+    service = DatabaseService(f"sqlite:///{tmp_path / 'split.db'}", read_pool_size=2)
+    service.create_all()
+    return service
+
+
+def test_read_sessions_use_a_read_only_pool(tmp_path) -> None:
+    service = _split_service(tmp_path)
+    with service.get_session() as session:
+        session.add(Library(name="Movies", path="/movies", media_type="movie"))
+        session.commit()
+
+    with service.get_read_session() as session:
+        assert [library.name for library in session.exec(select(Library))] == ["Movies"]
+        with pytest.raises(OperationalError):
+            session.add(Library(name="Shows", path="/shows", media_type="tv"))
+            session.commit()
+
+    assert service.read_engine is not service.engine
+    service.close()
+
+
+def test_reads_continue_while_a_writer_holds_the_lock(tmp_path) -> None:
+    service = _split_service(tmp_path)
+    writer = service.get_session()
+    writer.add(Library(name="Movies", path="/movies", media_type="movie"))
+    writer.flush()
+
+    # Another thread's write queues behind the open write transaction...
+    started = threading.Event()
+    finished = threading.Event()
+
+    def queued_write() -> None:
+        started.set()
+        with service.get_session() as session:
+            session.add(Library(name="Shows", path="/shows", media_type="tv"))
+            session.commit()
+        finished.set()
+
+    thread = threading.Thread(target=queued_write)
+    thread.start()
+    started.wait()
+
+    # ...while readers see the last committed state without waiting.
+    with service.get_read_session() as session:
+        assert session.exec(select(Library)).all() == []
+    assert not finished.wait(0.2)
+
+    writer.commit()
+    writer.close()
+    thread.join(timeout=5)
+    assert finished.is_set()
+    with service.get_read_session() as session:
+        assert sorted(library.name for library in session.exec(select(Library))) == ["Movies", "Shows"]
+    service.close()
+
+
+def _write_in_thread(service: DatabaseService, name: str) -> threading.Event:
+    finished = threading.Event()
+
+    def write() -> None:
+        with service.get_session() as session:
+            session.add(Library(name=name, path=f"/{name.lower()}", media_type="movie"))
+            session.commit()
+        finished.set()
+
+    threading.Thread(target=write, daemon=True).start()
+    return finished
+
+
+def test_read_only_sessions_do_not_take_the_write_lock(tmp_path) -> None:
+    service = _split_service(tmp_path)
+    reader = service.get_session()
+    reader.execute(text("select 1"))
+
+    assert _write_in_thread(service, "Movies").wait(5)
+    reader.close()
+    service.close()
+
+
+def test_abandoned_sessions_release_the_write_lock(tmp_path) -> None:
+    service = _split_service(tmp_path)
+    reader = service.get_session()
+    reader.execute(text("select 1"))
+    writer = service.get_session()
+    writer.add(Library(name="Shows", path="/shows", media_type="tv"))
+    writer.flush()
+
+    del reader, writer
+    gc.collect()
+
+    assert _write_in_thread(service, "Movies").wait(5)
+    with service.get_read_session() as session:
+        assert [library.name for library in session.exec(select(Library))] == ["Movies"]
+    service.close()
+
+
+def test_in_memory_databases_share_one_engine() -> None:
+    service = DatabaseService("sqlite://", read_pool_size=2)
+
+    assert not service.split_read_write
+    assert service.read_engine is service.engine
@@ -0,0 +1,199 @@
+"""Tests for the pipelined, bounded details enrichment stage."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from media_manager.instrumentation import get_instrumentation, reset_instrumentation
+from media_manager.models import MatchStatus, MediaMatch, MediaType, VideoMetadata
+from media_manager.providers.adapter import ProviderAdapter
+from media_manager.providers.base import BaseProvider, ProviderResult
+from media_manager.providers.match_planner import plan_match_groups
+from media_manager.providers.tmdb import TMDBProvider
+from media_manager.workers import MatchWorker
+
+
+class SlowDetailsProvider(BaseProvider):
+    """Provider whose details calls are slow and tracked."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        super().__init__()
+        self.delay = delay
+        self.details_calls: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def search_movie(self, title: str, year: int | None = None) -> list[ProviderResult]:
+        return [ProviderResult(self.name, title, title, year, confidence=0.9)]
+
+    def search_tv(self, title: str, year: int | None = None) -> list[ProviderResult]:
+        return []
+
+    def get_movie_details(self, external_id: str) -> ProviderResult:
+        with self._lock:
+            self.details_calls.append(external_id)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return ProviderResult(
+            self.name,
+            external_id,
+            external_id,
+            overview=f"About {external_id}",
+            runtime=100,
+            cast=["Lead"],
+            poster_url=f"https://img/{external_id}.jpg",
+        )
+
+    def get_tv_details(self, external_id, season=None, episode=None) -> ProviderResult:
+        return self.get_movie_details(external_id)
+
+    def get_cast(self, external_id: str, media_type: str) -> list[str]:
+        return []
+
+    def get_trailers(self, external_id: str, media_type: str) -> list[str]:
+        return []
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    reset_instrumentation()
+    yield
+    reset_instrumentation()
+
+
+def _movie(title: str, copy: int = 0) -> VideoMetadata:
+    return VideoMetadata(
+        path=Path(f"/movies/{title}.{copy}.mkv"),
+        title=title,
+        media_type=MediaType.MOVIE,
+        year=2001,
+    )
+
+
+def test_enrich_matches_fetches_each_title_once_on_a_bounded_pool() -> None:
+    provider = SlowDetailsProvider()
+    adapter = ProviderAdapter([provider], use_cache=False, details_concurrency=3)
+    matches = [
+        MediaMatch(
+            metadata=_movie(f"Title {index % 10}", index),
+            status=MatchStatus.MANUAL,
+            confidence=0.5,
+            external_id=f"Title {index % 10}",
+            source=provider.name,
+        )
+        for index in range(40)
+    ]
+    matches.append(MediaMatch(metadata=_movie("Unmatched")))
+
+    started = time.monotonic()
+    enriched = adapter.enrich_matches(matches)
+    elapsed = time.monotonic() - started
+
+    assert sorted(provider.details_calls) == sorted(f"Title {index}" for index in range(10))
+    assert provider.peak_in_flight == 3
+    # Ten 50ms lookups three at a time, not forty in a row.
+    assert elapsed < 0.5
+    assert [match.metadata for match in enriched] == [match.metadata for match in matches]
+    assert all(match.status is MatchStatus.MANUAL for match in enriched[:-1])
+    assert all(match.confidence == 0.5 for match in enriched[:-1])
+    assert all(match.cast == ["Lead"] and match.runtime == 100 for match in enriched[:-1])
+    assert enriched[0].overview == "About Title 0"
+    assert enriched[-1] is matches[-1]
+    requests = get_instrumentation().get_counter_metrics("provider_adapter.details_requests")
+    assert requests.count == 10
+
+
+def test_match_groups_overlaps_searches_with_details() -> None:
+    provider = SlowDetailsProvider(delay=0.1)
+    adapter = ProviderAdapter([provider], use_cache=False, concurrent=False)
+    groups = plan_match_groups(_movie(f"Title {index}") for index in range(8))
+
+    started = time.monotonic()
+    results = list(adapter.match_groups(groups))
+    elapsed = time.monotonic() - started
+
+    assert [group for group, _ in results] == groups
+    assert all(matches[0].cast == ["Lead"] for _, matches in results)
+    assert len(provider.details_calls) == 8
+    # Serial search-then-details would take 8 * 100ms.
+    assert elapsed < 0.5
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_match_runs_prefetch_cached_searches_in_batches(concurrency: int) -> None:
+    adapter = ProviderAdapter([SlowDetailsProvider(delay=0)], use_cache=False, concurrent=False)
+    metadata_list = [_movie(f"Title {index}") for index in range(300)]
+    batches: list[list[VideoMetadata]] = []
+
+    def prefetch(items) -> int:
+        batches.append(list(items))
+        return 0
+
+    worker = MatchWorker(metadata_list, concurrency=concurrency)
+    found: list[MediaMatch] = []
+    worker.signals.match_found.connect(found.append)
+    with patch.object(MatchWorker, "_get_adapter", return_value=adapter), patch.object(
+        adapter, "prefetch_searches", side_effect=prefetch
+    ):
+        worker.run()
+
+    assert len(found) == 300
+    assert [len(batch) for batch in batches] == [256, 44]
+    assert [metadata for batch in batches for metadata in batch] == metadata_list
+
+
+def test_match_worker_reports_failing_groups_and_closes_adapter() -> None:
+    adapter = ProviderAdapter([SlowDetailsProvider(delay=0)], use_cache=False, concurrent=False)
+    search_group = adapter._search_group
+
+    def search(group):
+        if group.representative.title == "Broken":
+            raise RuntimeError("boom")
+        return search_group(group)
+
+    metadata_list = [_movie("Alien"), _movie("Broken"), _movie("Heat")]
+    worker = MatchWorker(metadata_list)
+    found: list[MediaMatch] = []
+    failed: list[tuple[str, str]] = []
+    worker.signals.match_found.connect(found.append)
+    worker.signals.match_failed.connect(lambda path, error: failed.append((path, error)))
+
+    with patch.object(MatchWorker, "_get_adapter", return_value=adapter), patch.object(
+        adapter, "_search_group", side_effect=search
+    ), patch.object(adapter, "close", wraps=adapter.close) as close:
+        worker.run()
+
+    assert [match.metadata.title for match in found] == ["Alien", "Heat"]
+    assert failed == [(str(metadata_list[1].path), "boom")]
+    close.assert_called_once()
+
+
+def test_tmdb_details_cast_and_trailers_share_one_request(provider_cache) -> None:
+    provider = TMDBProvider("details-test-key")
+    response = {
+        "id": 550,
+        "title": "Fight Club",
+        "release_date": "1999-10-15",
+        "credits": {"cast": [{"name": "Brad Pitt"}, {"name": "Edward Norton"}]},
+        "videos": {"results": [{"type": "Trailer", "site": "YouTube", "key": "abc"}]},
+        "images": {"posters": []},
+    }
+
+    with patch.object(TMDBProvider, "_api_call", return_value=response) as api_call:
+        details = provider.get_movie_details("550")
+        cast = provider.get_cast("550", "movie")
+        trailers = provider.get_trailers("550", "movie")
+
+    assert api_call.call_count == 1
+    assert api_call.call_args.args[1] == {"append_to_response": "credits,videos,images"}
+    assert details.cast == cast == ["Brad Pitt", "Edward Norton"]
+    assert trailers == ["https://www.youtube.com/watch?v=abc"]
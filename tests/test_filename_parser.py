@@ -0,0 +1,110 @@
+"""Tests for the tokenizing filename parser."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from media_manager.filename_parser import (
+    FilenameParser,
+    ParsedName,
+    reference_parse_stem,
+)
+from media_manager.models import MediaType
+
+EDGE_CASES = [
+    "The.Matrix.1999.1080p",
+    "Avatar (2009)",
+    "Breaking.Bad.S01E01.720p",
+    "The.Office.US.2x03",
+    "Strange.Show.Season.3.Episode.5.WEBRip",
+    "Show.S01.E02.WEB-DL.x264-GROUP",
+    "Show S01 - E02 Blu-Ray",
+    "Movie.Title.2010.WEB.DL",
+    "Movie.Title.2010.WEB..DL",
+    "Movie web(x)dl",
+    "[HorribleSubs] Anime Title - 05 [1080p]",
+    "Title [S01E02] (2019)",
+    "Nested ((x)) 2019",
+    "Unbalanced ( 2019",
+    "Stray ] bracket 1999",
+    "Area51999 1999",
+    "1999",
+    "S01E02",
+    "2019 2020",
+    "Ocean's.Eleven.2001",
+    "Spider-Man-2002-720p",
+    "流浪地球.2019.2160p.WEB-DL",
+    "Ｍovie １９９９",
+    "Film K 4K 2001",
+    "Mr_Robot_2x05_HDTV",
+    "S01E023 Extra",
+    "s1e2",
+    "__--..",
+    "Title 12x345 1x02",
+    "Heat.1995.PROPER.REPACK.DTS.AAC",
+]
+
+
+def _random_names(count: int, seed: int) -> list[str]:
+    fragments = [
+        "The", "Matrix", "S01E02", "s1e2", "S01", "E02", "2x03", "1999",
+        "2020", "19999", "1080p", "WEB", "DL", "Blu", "Ray", "x264", "(",
+        ")", "[", "]", "{", "}", "(2009)", "[RARBG]", "-", "&", "'", "Ep",
+        "流浪地球", "4K", "sample", "12", "5.1", "h.264",
+    ]
+    separators = ["", ".", "_", " ", "-", ".."]
+    rng = random.Random(seed)
+    return [
+        "".join(
+            rng.choice(fragments) + rng.choice(separators)
+            for _ in range(rng.randint(1, 8))
+        )
+        for _ in range(count)
+    ]
+
+
+class TestFilenameParser:
+    """Tests for FilenameParser."""
+
+    @pytest.mark.parametrize("stem", EDGE_CASES)
+    def test_matches_reference_on_edge_cases(self, stem: str) -> None:
+        assert FilenameParser(cache_size=0).parse(stem) == reference_parse_stem(stem)
+
+    def test_matches_reference_on_random_names(self) -> None:
+        parser = FilenameParser(cache_size=0)
+        mismatches = [
+            stem
+            for stem in _random_names(5000, seed=7)
+            if parser.parse(stem) != reference_parse_stem(stem)
+        ]
+        assert mismatches == []
+
+    def test_parses_release_name(self) -> None:
+        parsed = FilenameParser().parse("Show.S01.E02.WEB-DL.x264-GROUP")
+
+        assert parsed == ParsedName("Show GROUP", MediaType.TV, None, 1, 2)
+
+    def test_cache_is_bounded_lru(self) -> None:
+        parser = FilenameParser(cache_size=2)
+
+        parser.parse("Heat.1995")
+        parser.parse("Heat.1995")
+        parser.parse("Alien.1979")
+        parser.parse("Fargo.1996")
+
+        info = parser.cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 3
+        assert info["size"] == 2
+
+        parser.cache_clear()
+        assert parser.cache_info()["size"] == 0
+
+    def test_cache_can_be_disabled(self) -> None:
+        parser = FilenameParser(cache_size=0)
+
+        parser.parse("Heat.1995")
+
+        assert parser.cache_info()["max_size"] == 0
@@ -0,0 +1,299 @@
+"""Tests for content fingerprints and move detection."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+from sqlmodel import select
+
+from media_manager.fingerprint import (
+    Fingerprinter,
+    FingerprintService,
+    ThroughputLimiter,
+    compute_fingerprint,
+)
+from media_manager.ingest_service import IngestService
+from media_manager.models import MediaType, VideoMetadata
+from media_manager.persistence.database import DatabaseService
+from media_manager.persistence.models import Library, MediaFile, MediaItem
+from media_manager.scan_engine import ScanEngine
+from media_manager.scan_index import ScanDelta, ScanIndex
+from media_manager.scanner import DiscoveredFile, ScanConfig
+
+
+def _write(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+@pytest.fixture
+def db_service(tmp_path: Path) -> DatabaseService:
+    service = DatabaseService(f"sqlite:///{tmp_path / 'library.db'}")
+    service.create_all()
+    return service
+
+
+def _add_media_file(
+    db_service: DatabaseService, path: Path, fingerprint: str | None
+) -> int:
+    with db_service.get_session() as session:
+        library = Library(name="Movies", path=str(path.parent), media_type="movie")
+        session.add(library)
+        session.commit()
+        item = MediaItem(library_id=library.id, title="Alien", media_type="movie", year=1979)
+        session.add(item)
+        session.commit()
+        session.add(
+            MediaFile(
+                media_item_id=item.id,
+                path=str(path),
+                filename=path.name,
+                file_size=path.stat().st_size,
+                fingerprint=fingerprint,
+            )
+        )
+        session.commit()
+        return item.id
+
+
+def _metadata(path: Path) -> VideoMetadata:
+    return VideoMetadata(path=path, title="Alien", media_type=MediaType.MOVIE, year=1979)
+
+
+class _CountingFingerprinter(Fingerprinter):
+    def __init__(self) -> None:
+        super().__init__(max_workers=1, max_bytes_per_second=None)
+        self.paths: list[Path] = []
+
+    def fingerprint(self, path: Path) -> str | None:
+        self.paths.append(path)
+        return super().fingerprint(path)
+
+
+class TestComputeFingerprint:
+    """Tests for compute_fingerprint."""
+
+    def test_samples_head_and_tail_only(self, tmp_path: Path) -> None:
+        data = bytes(range(256)) * 64  # 16 KiB
+        original = _write(tmp_path / "a.mkv", data)
+        middle_changed = _write(
+            tmp_path / "b.mkv", data[:8000] + b"\xff" * 100 + data[8100:]
+        )
+        tail_changed = _write(tmp_path / "c.mkv", data[:-1] + b"\x00")
+
+        fingerprint = compute_fingerprint(original, sample_size=4096)
+
+        assert fingerprint.startswith(f"{len(data):x}-")
+        assert compute_fingerprint(middle_changed, sample_size=4096) == fingerprint
+        assert compute_fingerprint(tail_changed, sample_size=4096) != fingerprint
+
+    def test_small_files_are_hashed_completely(self, tmp_path: Path) -> None:
+        first = _write(tmp_path / "a.mkv", b"a" * 5000)
+        second = _write(tmp_path / "b.mkv", b"a" * 2500 + b"b" + b"a" * 2499)
+
+        assert compute_fingerprint(first, sample_size=4096) != compute_fingerprint(
+            second, sample_size=4096
+        )
+
+    def test_reused_buffer_gives_same_result(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "a.mkv", b"xyz" * 10000)
+        buffer = bytearray(1024)
+
+        assert compute_fingerprint(path, 1024, buffer) == compute_fingerprint(path, 1024)
+
+
+class TestFingerprinter:
+    """Tests for the pooled fingerprinter."""
+
+    def test_fingerprint_many_keeps_order_and_skips_unreadable(
+        self, tmp_path: Path
+    ) -> None:
+        paths = [_write(tmp_path / f"{index}.mkv", bytes([index]) * 100) for index in range(9)]
+        paths.insert(4, tmp_path / "missing.mkv")
+
+        results = list(Fingerprinter(sample_size=64, max_workers=3).fingerprint_many(paths))
+
+        assert [path for path, _ in results] == paths
+        assert results[4][1] is None
+        assert len({fingerprint for _, fingerprint in results if fingerprint}) == 9
+
+    def test_throughput_limiter_paces_reads(self) -> None:
+        limiter = ThroughputLimiter(bytes_per_second=100_000)
+
+        started = time.monotonic()
+        for _ in range(5):
+            limiter.consume(10_000)
+
+        assert time.monotonic() - started >= 0.035
+
+
+class TestFingerprintService:
+    """Tests for relinking moved files."""
+
+    def test_moved_file_is_relinked_to_existing_item(
+        self, tmp_path: Path, db_service: DatabaseService
+    ) -> None:
+        old_path = _write(tmp_path / "old" / "Alien.1979.mkv", b"alien" * 1000)
+        fingerprint = compute_fingerprint(old_path)
+        item_id = _add_media_file(db_service, old_path, fingerprint)
+        new_path = tmp_path / "new" / "Alien (1979).mkv"
+        new_path.parent.mkdir()
+        old_path.rename(new_path)
+        delta = ScanDelta(added=[_metadata(new_path)], removed=[_metadata(old_path)])
+
+        relinked = FingerprintService(db_service).relink(delta)
+
+        assert [entry.media_item_id for entry in relinked] == [item_id]
+        assert delta.added == [] and delta.removed == []
+        assert delta.relinked[0].previous.path == old_path
+        with db_service.get_session() as session:
+            media_file = session.exec(select(MediaFile)).one()
+        assert media_file.path == str(new_path)
+        assert media_file.filename == "Alien (1979).mkv"
+
+    def test_copies_are_not_relinked(
+        self, tmp_path: Path, db_service: DatabaseService
+    ) -> None:
+        original = _write(tmp_path / "Alien.1979.mkv", b"alien" * 1000)
+        _add_media_file(db_service, original, compute_fingerprint(original))
+        copy = _write(tmp_path / "copy" / "Alien.1979.mkv", original.read_bytes())
+        delta = ScanDelta(added=[_metadata(copy)])
+
+        assert FingerprintService(db_service).relink(delta) == []
+        assert delta.added == [_metadata(copy)]
+
+    def test_backfill_stores_missing_fingerprints(
+        self, tmp_path: Path, db_service: DatabaseService
+    ) -> None:
+        path = _write(tmp_path / "Alien.1979.mkv", b"alien" * 1000)
+        _add_media_file(db_service, path, None)
+
+        assert FingerprintService(db_service).backfill() == 1
+        with db_service.get_session() as session:
+            media_file = session.exec(select(MediaFile)).one()
+        assert media_file.fingerprint == compute_fingerprint(path)
+
+    def test_only_files_with_a_tracked_size_are_hashed(
+        self, tmp_path: Path, db_service: DatabaseService
+    ) -> None:
+        old_path = _write(tmp_path / "old" / "Alien.1979.mkv", b"alien" * 1000)
+        _add_media_file(db_service, old_path, compute_fingerprint(old_path))
+        new_path = tmp_path / "new" / "Alien.1979.mkv"
+        new_path.parent.mkdir()
+        old_path.rename(new_path)
+        unrelated = _write(tmp_path / "new" / "Aliens.1986.mkv", b"aliens" * 1000)
+        fingerprinter = _CountingFingerprinter()
+        service = FingerprintService(db_service, fingerprinter)
+
+        relinked = service.relink(
+            ScanDelta(added=[_metadata(new_path), _metadata(unrelated)])
+        )
+
+        assert [entry.current.path for entry in relinked] == [new_path]
+        assert fingerprinter.paths == [new_path]
+
+    def test_new_files_are_not_hashed_without_a_size_match(
+        self, tmp_path: Path, db_service: DatabaseService
+    ) -> None:
+        tracked = _write(tmp_path / "Alien.1979.mkv", b"alien" * 1000)
+        _add_media_file(db_service, tracked, compute_fingerprint(tracked))
+        added = _write(tmp_path / "Aliens.1986.mkv", b"aliens" * 1000)
+        fingerprinter = _CountingFingerprinter()
+
+        delta = ScanDelta(added=[_metadata(added)])
+
+        assert FingerprintService(db_service, fingerprinter).relink(delta) == []
+        assert fingerprinter.paths == []
+
+    def test_sizes_recorded_by_the_scan_are_not_read_again(
+        self, tmp_path: Path, db_service: DatabaseService
+    ) -> None:
+        old_path = _write(tmp_path / "old" / "Alien.1979.mkv", b"alien" * 1000)
+        _add_media_file(db_service, old_path, compute_fingerprint(old_path))
+        new_path = tmp_path / "new" / "Alien.1979.mkv"
+        new_path.parent.mkdir()
+        old_path.rename(new_path)
+        fingerprinter = _CountingFingerprinter()
+        delta = ScanDelta(
+            added=[_metadata(new_path)],
+            discovered={str(new_path): DiscoveredFile(new_path, 1, 0, 0)},
+        )
+
+        # The recorded size wins over the file on disk, so nothing is hashed.
+        assert FingerprintService(db_service, fingerprinter).relink(delta) == []
+        assert fingerprinter.paths == []
+
+    def test_background_backfill_skips_unreadable_files(
+        self, tmp_path: Path, db_service: DatabaseService
+    ) -> None:
+        readable = _write(tmp_path / "a" / "Alien.1979.mkv", b"alien" * 1000)
+        missing = _write(tmp_path / "b" / "Aliens.1986.mkv", b"aliens" * 1000)
+        _add_media_file(db_service, readable, None)
+        _add_media_file(db_service, missing, None)
+        missing.unlink()
+        service = FingerprintService(db_service)
+
+        service.start_backfill(batch_size=1).join(timeout=10)
+
+        with db_service.get_session() as session:
+            stored = dict(session.exec(select(MediaFile.path, MediaFile.fingerprint)).all())
+        assert stored == {
+            str(readable): compute_fingerprint(readable),
+            str(missing): None,
+        }
+
+    def test_ingested_file_is_relinked_after_a_move(
+        self, tmp_path: Path, db_service: DatabaseService
+    ) -> None:
+        old_path = _write(tmp_path / "old" / "Alien.1979.mkv", b"alien" * 1000)
+        with db_service.get_session() as session:
+            library = Library(name="Movies", path=str(tmp_path), media_type="movie")
+            session.add(library)
+            session.commit()
+            library_id = library.id
+        fingerprinter = Fingerprinter(max_workers=1, max_bytes_per_second=None)
+        IngestService(db_service, fingerprinter=fingerprinter).ingest(
+            library_id, [_metadata(old_path)]
+        )
+        with db_service.get_session() as session:
+            media_file = session.exec(select(MediaFile)).one()
+        assert media_file.fingerprint == compute_fingerprint(old_path)
+        assert media_file.file_size == old_path.stat().st_size
+
+        new_path = tmp_path / "new" / "Alien.1979.mkv"
+        new_path.parent.mkdir()
+        old_path.rename(new_path)
+        delta = ScanDelta(added=[_metadata(new_path)], removed=[_metadata(old_path)])
+
+        relinked = FingerprintService(db_service, fingerprinter).relink(delta)
+
+        assert [entry.media_item_id for entry in relinked] == [media_file.media_item_id]
+
+
+def test_incremental_scan_reports_moves_as_relinked(
+    qapp, tmp_path: Path, db_service: DatabaseService
+) -> None:
+    library = tmp_path / "library"
+    old_path = _write(library / "Inbox" / "Alien.1979.mkv", b"alien" * 1000)
+    _add_media_file(db_service, old_path, compute_fingerprint(old_path))
+    engine = ScanEngine(fingerprint_service=FingerprintService(db_service))
+    index = ScanIndex(db_service)
+    config = ScanConfig(root_paths=[library])
+    engine.scan_incremental(config, index)
+    enriched = []
+    relinked = []
+    engine.register_enrichment_callback(enriched.append)
+    engine.files_relinked.connect(relinked.append)
+
+    new_path = library / "Movies" / "Alien (1979)" / "Alien.1979.mkv"
+    new_path.parent.mkdir(parents=True)
+    old_path.rename(new_path)
+    delta = engine.scan_incremental(config, index)
+
+    assert enriched == []
+    assert delta.added == [] and delta.removed == []
+    assert [entry.current.path for entry in relinked[0]] == [new_path]
+    assert [metadata.path for metadata in engine.get_results()] == [new_path]
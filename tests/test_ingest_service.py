@@ -0,0 +1,133 @@
+"""Tests for bulk ingest of scan results."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlmodel import select
+
+from media_manager.ingest_service import IngestService
+from media_manager.models import MatchStatus, MediaMatch, MediaType, VideoMetadata
+from media_manager.persistence.database import DatabaseService
+from media_manager.persistence.models import ExternalId, Library, MediaFile, MediaItem
+
+
+@pytest.fixture
+def db_service(tmp_path: Path) -> DatabaseService:
+    service = DatabaseService(f"sqlite:///{tmp_path / 'ingest.db'}")
+    service.create_all()
+    return service
+
+
+@pytest.fixture
+def library_id(db_service: DatabaseService) -> int:
+    with db_service.get_session() as session:
+        library = Library(name="Media", path="/media", media_type="mixed")
+        session.add(library)
+        session.commit()
+        return library.id
+
+
+def _episode(number: int, title: str = "Dark") -> VideoMetadata:
+    return VideoMetadata(
+        Path(f"/media/tv/{title}.S01E{number:02d}.mkv"), title, MediaType.TV, 2017, 1, number
+    )
+
+
+def test_ingest_inserts_items_and_files_in_chunks(db_service, library_id) -> None:
+    service = IngestService(db_service, chunk_size=4)
+    items = [_episode(number) for number in range(1, 11)]
+
+    result = service.ingest(library_id, items, file_sizes={str(items[0].path): 1234})
+
+    assert (result.inserted, result.updated, result.chunks) == (10, 0, 3)
+    with db_service.get_session() as session:
+        rows = session.exec(
+            select(MediaItem.episode, MediaFile.path, MediaFile.file_size)
+            .join(MediaFile, MediaFile.media_item_id == MediaItem.id)
+            .order_by(MediaItem.episode)
+        ).all()
+    assert [episode for episode, _, _ in rows] == list(range(1, 11))
+    assert rows[0][1:] == (str(items[0].path), 1234)
+    assert all(str(items[index].path) == path for index, (_, path, _) in enumerate(rows))
+
+
+def test_reingesting_a_path_updates_instead_of_duplicating(db_service, library_id) -> None:
+    service = IngestService(db_service)
+    service.ingest(library_id, [_episode(1), _episode(2)])
+    renamed = VideoMetadata(_episode(1).path, "Dark (2017)", MediaType.TV, 2017, 1, 1)
+
+    result = service.ingest(
+        library_id, [renamed, _episode(3), _episode(3)], file_sizes={str(renamed.path): 99}
+    )
+
+    assert (result.inserted, result.updated, result.duplicates) == (1, 1, 1)
+    with db_service.get_session() as session:
+        assert len(session.exec(select(MediaItem)).all()) == 3
+        assert len(session.exec(select(MediaFile)).all()) == 3
+        item_id, size = session.exec(
+            select(MediaFile.media_item_id, MediaFile.file_size).where(
+                MediaFile.path == str(renamed.path)
+            )
+        ).one()
+        assert size == 99
+        assert session.get(MediaItem, item_id).title == "Dark (2017)"
+
+
+def test_matches_bring_provider_details_and_external_ids(db_service, library_id) -> None:
+    metadata = VideoMetadata(Path("/media/movies/matrix.mkv"), "matrix", MediaType.MOVIE, None)
+    match = MediaMatch(
+        metadata=metadata,
+        status=MatchStatus.MATCHED,
+        matched_title="The Matrix",
+        matched_year=1999,
+        external_id="603",
+        source="tmdb",
+        overview="A hacker learns the truth.",
+        runtime=136,
+    )
+    unmatched = MediaMatch(metadata=_episode(1))
+
+    IngestService(db_service).ingest(library_id, [match, unmatched])
+
+    with db_service.get_session() as session:
+        movie = session.exec(select(MediaItem).where(MediaItem.media_type == "movie")).one()
+        assert (movie.title, movie.year, movie.runtime) == ("The Matrix", 1999, 136)
+        assert movie.description == "A hacker learns the truth."
+        external = session.exec(select(ExternalId)).all()
+        assert [(row.media_item_id, row.source, row.external_id) for row in external] == [
+            (movie.id, "tmdb", "603")
+        ]
+
+
+def test_matches_after_a_scan_update_existing_items(db_service, library_id) -> None:
+    metadata = VideoMetadata(Path("/media/movies/matrix.mkv"), "matrix", MediaType.MOVIE, None)
+    service = IngestService(db_service)
+    service.ingest(library_id, [metadata])
+    match = MediaMatch(
+        metadata=metadata,
+        status=MatchStatus.MATCHED,
+        matched_title="The Matrix",
+        matched_year=1999,
+        external_id="603",
+        source="tmdb",
+        overview="A hacker learns the truth.",
+        runtime=136,
+        aired_date="1999-03-31",
+    )
+
+    service.ingest(library_id, [match])
+    service.ingest(library_id, [metadata])
+    result = service.ingest(library_id, [match])
+
+    assert (result.inserted, result.updated) == (0, 1)
+    with db_service.get_session() as session:
+        movie = session.exec(select(MediaItem)).one()
+        assert (movie.title, movie.year, movie.runtime) == ("The Matrix", 1999, 136)
+        assert movie.description == "A hacker learns the truth."
+        assert movie.aired_date == "1999-03-31"
+        external = session.exec(select(ExternalId)).all()
+        assert [(row.media_item_id, row.source, row.external_id) for row in external] == [
+            (movie.id, "tmdb", "603")
+        ]
@@ -216,6 +216,24 @@ def test_record_timer_directly(instrumentation: Instrumentation) -> None:
     assert abs(metrics.avg_time - (0.123 + 0.456) / 2) < 0.0001
 
 
+def test_gauge_tracks_current_and_extremes(instrumentation: Instrumentation) -> None:
+    """Test setting gauge values."""
+    instrumentation.set_gauge("queue_depth", 3)
+    instrumentation.set_gauge("queue_depth", 7)
+    instrumentation.set_gauge("queue_depth", 2)
+
+    metrics = instrumentation.get_gauge_metrics("queue_depth")
+    assert metrics is not None
+    assert metrics.value == 2
+    assert metrics.min_value == 2
+    assert metrics.max_value == 7
+    assert "queue_depth" in instrumentation.get_all_metrics()["gauges"]
+    assert "queue_depth" in instrumentation.get_summary()
+
+    instrumentation.reset()
+    assert instrumentation.get_gauge_metrics("queue_depth") is None
+
+
 def test_global_instrumentation() -> None:
     """Test global instrumentation singleton."""
     inst1 = get_instrumentation()
@@ -0,0 +1,151 @@
+"""Tests for grouping pending metadata into shared provider lookups."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from media_manager.instrumentation import get_instrumentation, reset_instrumentation
+from media_manager.models import MatchStatus, MediaType, VideoMetadata
+from media_manager.providers.adapter import ProviderAdapter
+from media_manager.providers.base import BaseProvider, ProviderError, ProviderResult
+from media_manager.providers.match_planner import normalize_title, plan_match_groups
+from media_manager.workers import MatchWorker
+
+
+class CountingTVProvider(BaseProvider):
+    """Provider that counts search and details calls."""
+
+    def __init__(self, fail_details: bool = False) -> None:
+        super().__init__()
+        self.fail_details = fail_details
+        self.searches: list[str] = []
+        self.details: list[tuple] = []
+
+    def search_tv(self, title: str, year: int | None = None) -> list[ProviderResult]:
+        self.searches.append(title)
+        return [ProviderResult(self.name, normalize_title(title), title, year, confidence=0.9)]
+
+    def search_movie(self, title: str, year: int | None = None) -> list[ProviderResult]:
+        self.searches.append(title)
+        return [ProviderResult(self.name, normalize_title(title), title, year, confidence=0.9)]
+
+    def get_tv_details(self, external_id, season=None, episode=None) -> ProviderResult:
+        self.details.append((external_id, season, episode))
+        if self.fail_details:
+            raise ProviderError("details unavailable")
+        return ProviderResult(self.name, external_id, external_id.title(), cast=["Lead"])
+
+    def get_movie_details(self, external_id: str) -> ProviderResult:
+        return self.get_tv_details(external_id)
+
+    def get_cast(self, external_id: str, media_type: str) -> list[str]:
+        return []
+
+    def get_trailers(self, external_id: str, media_type: str) -> list[str]:
+        return []
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    reset_instrumentation()
+    yield
+    reset_instrumentation()
+
+
+def _episode(title: str, season: int, episode: int, year: int | None = 2020) -> VideoMetadata:
+    return VideoMetadata(
+        path=Path(f"/tv/{title}.S{season:02d}E{episode:02d}.mkv"),
+        title=title,
+        media_type=MediaType.TV,
+        year=year,
+        season=season,
+        episode=episode,
+    )
+
+
+def _series(title: str, seasons: int = 2, episodes: int = 10) -> list[VideoMetadata]:
+    return [
+        _episode(title, season, episode)
+        for season in range(1, seasons + 1)
+        for episode in range(1, episodes + 1)
+    ]
+
+
+def test_normalize_title_ignores_case_punctuation_and_accents() -> None:
+    assert normalize_title("Marvel's.Agents-of_SHIELD") == "marvels agents of shield"
+    assert normalize_title("  Pokémon_The   Series ") == "pokemon the series"
+
+
+def test_plan_groups_by_title_year_and_media_type() -> None:
+    items = [
+        _episode("The Office", 1, 1),
+        _episode("the.office", 1, 2),
+        _episode("The Office", 1, 1, year=2005),
+        VideoMetadata(Path("/movies/The Office.mkv"), "The Office", MediaType.MOVIE, 2020),
+        _episode("The-Office", 2, 1),
+    ]
+
+    groups = plan_match_groups(items)
+
+    assert [len(group.members) for group in groups] == [3, 1, 1]
+    assert groups[0].representative is items[0]
+    assert groups[0].members == [items[0], items[1], items[4]]
+
+
+def test_series_import_needs_one_search_and_details_call_per_show() -> None:
+    provider = CountingTVProvider()
+    adapter = ProviderAdapter([provider], use_cache=False, concurrent=False)
+    items = _series("Show A") + _series("show.a", seasons=1) + _series("Show B")
+
+    matches = [
+        match
+        for group in plan_match_groups(items)
+        for match in adapter.match_group(group)
+    ]
+
+    assert provider.searches == ["Show A", "Show B"]
+    assert provider.details == [("show a", None, None), ("show b", None, None)]
+    assert [match.metadata for match in matches] == (
+        _series("Show A") + _series("show.a", seasons=1) + _series("Show B")
+    )
+    assert all(match.cast == ["Lead"] for match in matches)
+    assert all(match.confidence == 0.9 for match in matches)
+    assert all(match.status is MatchStatus.MATCHED for match in matches)
+    saved = get_instrumentation().get_counter_metrics("provider_adapter.grouped_lookups_saved")
+    assert saved.count == len(items) - 2
+
+
+def test_failed_details_fall_back_to_the_search_result() -> None:
+    provider = CountingTVProvider(fail_details=True)
+    adapter = ProviderAdapter([provider], use_cache=False, concurrent=False)
+
+    matches = adapter.match_group(plan_match_groups(_series("Show A", seasons=1))[0])
+
+    assert len(provider.details) == 1
+    assert len(matches) == 10
+    assert all(match.matched_title == "Show A" and match.cast == [] for match in matches)
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_match_worker_fans_group_results_out_to_every_episode(concurrency: int) -> None:
+    provider = CountingTVProvider()
+    adapter = ProviderAdapter([provider], use_cache=False)
+    items = _series("Show A") + _series("Show B") + _series("Show C")
+    worker = MatchWorker(items, concurrency=concurrency)
+    matches = []
+    progress = []
+    worker.signals.match_found.connect(matches.append)
+    worker.signals.progress.connect(lambda current, total: progress.append((current, total)))
+
+    with patch.object(MatchWorker, "_get_adapter", return_value=adapter):
+        worker.run()
+
+    assert sorted(provider.searches) == ["Show A", "Show B", "Show C"]
+    assert len(provider.details) == 3
+    assert sorted(str(match.metadata.path) for match in matches) == sorted(
+        str(item.path) for item in items
+    )
+    assert progress[-1] == (len(items), len(items))
@@ -0,0 +1,116 @@
+"""Tests for multi-process batch parsing."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from media_manager.instrumentation import get_instrumentation, reset_instrumentation
+from media_manager.scan_engine import ScanEngine
+from media_manager.scanner import (
+    DEFAULT_MAX_PARSE_WORKERS,
+    ScanConfig,
+    Scanner,
+    default_parse_workers,
+)
+
+NAMES = [
+    "The.Matrix.1999.1080p.mkv",
+    "Avatar (2009).mp4",
+    "Breaking.Bad.S01E01.720p.mkv",
+    "The.Office.US.2x03.mkv",
+    "Strange.Show.Season.3.Episode.5.WEBRip.mp4",
+    "Heat.1995.PROPER.avi",
+    "Dark.S02E03.1080p.mkv",
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_instrumentation():
+    reset_instrumentation()
+    yield
+    reset_instrumentation()
+
+
+@pytest.fixture
+def paths(tmp_path: Path) -> list[Path]:
+    return [tmp_path / name for name in NAMES]
+
+
+class TestParseMany:
+    """Tests for Scanner.parse_many."""
+
+    def test_process_pool_matches_serial_parsing(self, paths: list[Path]) -> None:
+        scanner = Scanner()
+
+        parsed = scanner.parse_many(paths, workers=2, chunk_size=2)
+
+        assert parsed == [scanner.parse_video(path) for path in paths]
+        assert all(metadata.path is path for metadata, path in zip(parsed, paths))
+
+    def test_reports_throughput(self, paths: list[Path]) -> None:
+        Scanner().parse_many(paths, workers=1)
+
+        counter = get_instrumentation().get_counter_metrics("scanner.parse_many.items")
+        assert counter is not None
+        assert counter.count == len(paths)
+        assert counter.metadata["workers"] == 1
+        assert counter.metadata["items_per_second"] > 0
+        assert get_instrumentation().get_timer_metrics("scanner.parse_many") is not None
+
+    def test_falls_back_in_process_when_pool_fails(self, paths: list[Path]) -> None:
+        scanner = Scanner()
+
+        with patch(
+            "media_manager.scanner.ProcessPoolExecutor.submit",
+            side_effect=OSError("no processes"),
+        ):
+            parsed = scanner.parse_many(paths, workers=2, chunk_size=3)
+
+        assert parsed == [scanner.parse_video(path) for path in paths]
+
+    def test_empty_input(self) -> None:
+        assert Scanner().parse_many([], workers=2) == []
+
+    def test_default_worker_count_is_bounded(self) -> None:
+        with patch("media_manager.scanner.os.cpu_count", return_value=64):
+            assert default_parse_workers() == DEFAULT_MAX_PARSE_WORKERS
+        with patch("media_manager.scanner.os.cpu_count", return_value=None):
+            assert default_parse_workers() == 1
+
+    def test_worker_entry_point_does_not_import_qt(self) -> None:
+        code = (
+            "import sys, media_manager.filename_parser; "
+            "sys.exit('PySide6' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1] / "src",
+        )
+
+        assert result.returncode == 0
+
+
+class TestScanEngineProcessParsing:
+    """Tests for ScanEngine switching to multi-process parsing."""
+
+    def test_switches_above_threshold(self, qapp, tmp_path: Path) -> None:
+        for name in NAMES:
+            (tmp_path / name).write_text("", encoding="utf-8")
+        config = ScanConfig(root_paths=[tmp_path], parse_workers=2)
+        engine = ScanEngine()
+
+        expected = engine.scan(config)
+        assert get_instrumentation().get_counter_metrics("scanner.parse_many.items") is None
+
+        config.process_parse_threshold = 3
+        results = engine.scan(config)
+
+        assert results == expected
+        counter = get_instrumentation().get_counter_metrics("scanner.parse_many.items")
+        assert counter is not None
+        assert counter.count == len(NAMES) - 3
@@ -25,7 +25,14 @@ from media_manager.persistence.models import (
     HistoryEvent,
     JobRun,
 )
-from media_manager.persistence.repositories import Repository, UnitOfWork, transactional_context
+from media_manager.persistence.repositories import (
+    LibraryRepository,
+    MediaItemCursor,
+    MediaItemRepository,
+    Repository,
+    UnitOfWork,
+    transactional_context,
+)
 
 
 @pytest.fixture
@@ -494,6 +501,170 @@ class TestRepository:
         assert count == 2
 
 
+class TestLibraryItemCounts:
+    """Test the trigger-maintained library item counters."""
+
+    def test_counters_follow_inserts_moves_and_deletes(
+        self, in_memory_db: tuple[DatabaseService, Session]
+    ) -> None:
+        """Counters track inserts, library and type changes, and deletes."""
+        db_service, session = in_memory_db
+        movies = Library(name="Movies", path="/movies", media_type="movie")
+        shows = Library(name="Shows", path="/shows", media_type="tv")
+        session.add_all([movies, shows])
+        session.commit()
+
+        items = [
+            MediaItem(library_id=movies.id, title=f"Movie {i}", media_type="movie")
+            for i in range(3)
+        ]
+        items.append(MediaItem(library_id=shows.id, title="Show", media_type="tv"))
+        session.add_all(items)
+        session.commit()
+
+        items[0].library_id = shows.id
+        items[1].media_type = "tv"
+        session.delete(items[3])
+        session.commit()
+
+        library_repo = LibraryRepository()
+        media_repo = MediaItemRepository()
+        assert library_repo.count_items(movies.id) == 2
+        assert library_repo.count_items(shows.id) == 1
+        assert media_repo.count_by_library(movies.id) == 2
+        assert media_repo.count_all() == 3
+        assert library_repo.count_items(999) == 0
+
+        session.refresh(movies)
+        assert (movies.movie_count, movies.tv_count) == (1, 1)
+
+    def test_rebuild_item_counts(self, in_memory_db: tuple[DatabaseService, Session]) -> None:
+        """Rebuilding recomputes counters from the media items."""
+        db_service, session = in_memory_db
+        library = Library(name="Movies", path="/movies", media_type="movie")
+        session.add(library)
+        session.commit()
+        session.add(MediaItem(library_id=library.id, title="Movie", media_type="movie"))
+        session.commit()
+
+        library.item_count = 42
+        library.movie_count = 42
+        session.commit()
+
+        repo = LibraryRepository()
+        repo.rebuild_item_counts()
+
+        assert repo.count_items(library.id) == 1
+        session.refresh(library)
+        assert (library.movie_count, library.tv_count) == (1, 0)
+
+    def test_counts_without_triggers_scan_media_items(
+        self,
+        in_memory_db: tuple[DatabaseService, Session],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Databases other than SQLite have no triggers and count rows instead."""
+        from sqlalchemy import text
+
+        from media_manager import stats_service
+        from media_manager.persistence import repositories
+
+        db_service, session = in_memory_db
+        for name in ("insert", "delete", "update"):
+            session.exec(text(f"DROP TRIGGER mediaitem_count_{name}"))
+        movies = Library(name="Movies", path="/movies", media_type="movie")
+        empty = Library(name="Empty", path="/empty", media_type="tv")
+        session.add_all([movies, empty])
+        session.commit()
+        session.add_all(
+            [
+                MediaItem(library_id=movies.id, title="Movie", media_type="movie"),
+                MediaItem(library_id=movies.id, title="Show", media_type="tv"),
+            ]
+        )
+        session.commit()
+        for module in (repositories, stats_service):
+            monkeypatch.setattr(module, "library_counters_maintained", lambda bind: False)
+
+        assert LibraryRepository().count_items(movies.id) == 2
+        assert MediaItemRepository().count_by_library(movies.id) == 2
+        assert MediaItemRepository().count_all() == 2
+        stats = stats_service.StatsService()
+        assert stats.get_item_counts() == {"total": 2, "movies": 1, "tv": 1}
+        assert stats.get_counts_by_library() == {
+            movies.id: {"total": 2, "movies": 1, "tv": 1},
+            empty.id: {"total": 0, "movies": 0, "tv": 0},
+        }
+
+class TestMediaItemPaging:
+    """Test keyset pagination of media items."""
+
+    @pytest.mark.parametrize("sort_by", ["title", "year", "rating", "added", "runtime"])
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_cursor_pages_match_offset_order(
+        self, in_memory_db: tuple[DatabaseService, Session], sort_by: str, descending: bool
+    ) -> None:
+        """Walking cursors visits every item once, in the same order as offsets."""
+        db_service, session = in_memory_db
+        library = Library(name="Movies", path="/movies", media_type="movie")
+        other = Library(name="Other", path="/other", media_type="movie")
+        session.add_all([library, other])
+        session.commit()
+        # Repeated titles and NULL years, ratings and runtimes exercise ties.
+        session.add_all(
+            MediaItem(
+                library_id=library.id,
+                title=f"Title {i % 7}",
+                media_type="movie",
+                year=None if i % 5 == 0 else 1990 + i % 4,
+                rating=None if i % 3 == 0 else float(i % 6),
+                runtime=None if i % 4 == 0 else 90 + i % 3,
+                created_at=datetime(2024, 1, 1 + i % 9),
+            )
+            for i in range(40)
+        )
+        session.add(MediaItem(library_id=other.id, title="Elsewhere", media_type="movie"))
+        session.commit()
+
+        repo = MediaItemRepository()
+        expected = [
+            item.id
+            for item in repo.get_by_library(
+                library.id, sort_by=sort_by, descending=descending, lazy_load=True
+            )
+        ]
+
+        seen = []
+        cursor = None
+        while True:
+            page = repo.get_by_library(
+                library.id,
+                limit=6,
+                after=cursor,
+                sort_by=sort_by,
+                descending=descending,
+                lazy_load=True,
+            )
+            if not page:
+                break
+            seen.extend(item.id for item in page)
+            cursor = MediaItemCursor.after(page[-1], sort_by, descending)
+
+        assert len(expected) == 40
+        assert seen == expected
+
+    def test_cursor_must_match_sort(self, in_memory_db: tuple[DatabaseService, Session]) -> None:
+        """A cursor from one sort order is rejected by another."""
+        repo = MediaItemRepository()
+        cursor = MediaItemCursor("title", "A", 1)
+
+        with pytest.raises(ValueError):
+            repo.get_all(after=cursor, sort_by="year")
+        with pytest.raises(ValueError):
+            repo.get_all(sort_by="color")
+
+
+
 class TestUnitOfWork:
     """Test Unit of Work pattern."""
 
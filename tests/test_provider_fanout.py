@@ -0,0 +1,167 @@
+"""Tests for concurrent provider fan-out in ProviderAdapter."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from media_manager.instrumentation import get_instrumentation, reset_instrumentation
+from media_manager.models import MatchStatus, MediaType, VideoMetadata
+from media_manager.providers.adapter import ProviderAdapter
+from media_manager.providers.base import BaseProvider, ProviderError, ProviderResult
+
+
+class SleepyProvider(BaseProvider):
+    """Provider that answers after a fixed delay."""
+
+    def __init__(self, name: str, delay: float, confidence: float = 0.9) -> None:
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.confidence = confidence
+        self.calls = 0
+        self.finished = threading.Event()
+
+    def _search(self, title: str, year: int | None) -> list[ProviderResult]:
+        self.calls += 1
+        time.sleep(self.delay)
+        self.finished.set()
+        return [
+            ProviderResult(
+                provider_name=self.name,
+                external_id=f"{self.name}-1",
+                title=title,
+                year=year,
+                confidence=self.confidence,
+            )
+        ]
+
+    def search_movie(self, title: str, year: int | None = None) -> list[ProviderResult]:
+        return self._search(title, year)
+
+    def search_tv(self, title: str, year: int | None = None) -> list[ProviderResult]:
+        return self._search(title, year)
+
+    def get_movie_details(self, external_id: str) -> ProviderResult:
+        raise ProviderError("not supported")
+
+    def get_tv_details(self, external_id, season=None, episode=None) -> ProviderResult:
+        raise ProviderError("not supported")
+
+    def get_cast(self, external_id: str, media_type: str) -> list[str]:
+        return []
+
+    def get_trailers(self, external_id: str, media_type: str) -> list[str]:
+        return []
+
+
+class FailingProvider(SleepyProvider):
+    """Provider whose searches always fail."""
+
+    def _search(self, title: str, year: int | None) -> list[ProviderResult]:
+        raise ProviderError("service unavailable")
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    reset_instrumentation()
+    yield
+    reset_instrumentation()
+
+
+def _metadata() -> VideoMetadata:
+    return VideoMetadata(
+        path=Path("/movies/Alien.1979.mkv"),
+        title="Alien",
+        media_type=MediaType.MOVIE,
+        year=1979,
+    )
+
+
+def test_providers_are_queried_in_parallel() -> None:
+    providers = [SleepyProvider(f"P{index}", 0.2) for index in range(3)]
+    adapter = ProviderAdapter(providers, use_cache=False)
+
+    started = time.monotonic()
+    match = adapter.search_and_match(_metadata())
+    elapsed = time.monotonic() - started
+    adapter.close()
+
+    assert match.status == MatchStatus.MATCHED
+    assert all(provider.calls == 1 for provider in providers)
+    assert elapsed < 0.45
+
+
+def test_slow_provider_is_dropped_at_its_deadline() -> None:
+    fast = SleepyProvider("Fast", 0.01, confidence=0.6)
+    slow = SleepyProvider("Slow", 1.0, confidence=0.9)
+    adapter = ProviderAdapter([slow, fast], use_cache=False, provider_timeout=0.2)
+
+    started = time.monotonic()
+    match = adapter.search_and_match(_metadata())
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.6
+    assert match.source == "Fast"
+    metrics = get_instrumentation()
+    assert metrics.get_counter_metrics("provider.Slow.timeouts").count == 1
+    assert metrics.get_counter_metrics("provider.Fast.timeouts") is None
+
+    # The late answer still completes in the background.
+    assert slow.finished.wait(2.0)
+    adapter.close()
+
+
+def test_per_provider_timeouts_override_default() -> None:
+    slow = SleepyProvider("Slow", 0.3, confidence=0.9)
+    adapter = ProviderAdapter(
+        [slow], use_cache=False, provider_timeout=0.05, provider_timeouts={"Slow": 2.0}
+    )
+
+    match = adapter.search_and_match(_metadata())
+    adapter.close()
+
+    assert match.source == "Slow"
+
+
+def test_records_per_provider_latency_and_errors() -> None:
+    adapter = ProviderAdapter(
+        [SleepyProvider("Good", 0.01), FailingProvider("Bad", 0.0)], use_cache=False
+    )
+
+    match = adapter.search_and_match(_metadata())
+    adapter.close()
+
+    metrics = get_instrumentation()
+    assert match.source == "Good"
+    assert metrics.get_timer_metrics("provider.Good.latency").count == 1
+    assert metrics.get_timer_metrics("provider.Bad.latency").count == 1
+    assert metrics.get_timer_metrics("provider.Good.search").count == 1
+    assert metrics.get_counter_metrics("provider.Bad.errors").count == 1
+
+
+def test_sequential_mode_queries_providers_in_order() -> None:
+    providers = [SleepyProvider("A", 0.0, 0.5), SleepyProvider("B", 0.0, 0.7)]
+    adapter = ProviderAdapter(providers, use_cache=False, concurrent=False)
+
+    results = adapter.search_results("Alien", MediaType.MOVIE, 1979)
+
+    assert [result.provider_name for result in results] == ["B"]
+    assert all(provider.calls == 1 for provider in providers)
+
+
+def test_search_results_fans_out_and_merges() -> None:
+    providers = [SleepyProvider("A", 0.2, 0.5), SleepyProvider("B", 0.2, 0.7)]
+    adapter = ProviderAdapter(providers, use_cache=False)
+
+    started = time.monotonic()
+    results = adapter.search_results("Alien", MediaType.MOVIE, 1979)
+    elapsed = time.monotonic() - started
+    adapter.close()
+
+    assert [result.provider_name for result in results] == ["B"]
+    assert elapsed < 0.35
+    assert get_instrumentation().get_timer_metrics("provider.A.search").count == 1
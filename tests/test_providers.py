@@ -9,10 +9,12 @@ from unittest.mock import Mock, patch, MagicMock
 
 import pytest
 import requests
+from tenacity import wait_none
 
 from src.media_manager.models import MediaType, VideoMetadata
 from src.media_manager.providers.adapter import ProviderAdapter
 from src.media_manager.providers.base import ProviderError, ProviderResult
+from src.media_manager.providers.rate_limit import RateLimitedError
 from src.media_manager.providers.tmdb import TMDBProvider
 from src.media_manager.providers.tvdb import TVDBProvider
 
@@ -195,6 +197,14 @@ def tvdb_tv_details_response() -> dict[str, Any]:
     }
 
 
+def _rate_limited_response() -> Mock:
+    """A 429 response that allows an immediate retry."""
+    response = Mock()
+    response.status_code = 429
+    response.headers = {"Retry-After": "0"}
+    return response
+
+
 # ============================================================================
 # TMDB Provider Tests
 # ============================================================================
@@ -214,7 +224,7 @@ class TestTMDBProvider:
         provider = TMDBProvider()
         assert provider.api_key is None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_search_movie(self, mock_get: Mock, tmdb_movie_search_response: dict[str, Any]) -> None:
         """Test TMDB movie search."""
         mock_response = Mock()
@@ -231,7 +241,7 @@ class TestTMDBProvider:
         assert results[0].provider_name == "TMDB"
         assert 0.0 <= results[0].confidence <= 1.0
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_search_movie_without_api_key(self, mock_get: Mock) -> None:
         """Test TMDB movie search without API key raises error."""
         provider = TMDBProvider()
@@ -239,7 +249,7 @@ class TestTMDBProvider:
         with pytest.raises(ProviderError, match="API key is not configured"):
             provider.search_movie("Fight Club")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_search_tv(self, mock_get: Mock, tmdb_tv_search_response: dict[str, Any]) -> None:
         """Test TMDB TV series search."""
         mock_response = Mock()
@@ -254,7 +264,7 @@ class TestTMDBProvider:
         assert results[0].year == 2011
         assert results[0].external_id == "1399"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_movie_details(self, mock_get: Mock, tmdb_movie_details_response: dict[str, Any]) -> None:
         """Test TMDB get movie details."""
         mock_response = Mock()
@@ -274,7 +284,7 @@ class TestTMDBProvider:
         assert len(result.companies) == 1
         assert "Regency" in result.companies[0]
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_tv_details(self, mock_get: Mock, tmdb_tv_details_response: dict[str, Any]) -> None:
         """Test TMDB get TV details."""
         mock_response = Mock()
@@ -290,7 +300,7 @@ class TestTMDBProvider:
         assert len(result.cast) == 2
         assert "Emilia Clarke" in result.cast
 
-    @patch("src.media_manager.providers.tmdb.requests.get")
+    @patch("requests.Session.get")
     def test_api_call_handles_http_errors(self, mock_get: Mock) -> None:
         """Test TMDB provider handles HTTP errors gracefully."""
         mock_response = Mock()
@@ -302,7 +312,7 @@ class TestTMDBProvider:
         with pytest.raises(ProviderError, match="API call failed"):
             provider.search_movie("Test")
 
-    @patch("src.media_manager.providers.tmdb.requests.get")
+    @patch("requests.Session.get")
     def test_api_call_handles_network_errors(self, mock_get: Mock) -> None:
         """Test TMDB provider handles network errors gracefully."""
         mock_get.side_effect = requests.ConnectionError("Connection failed")
@@ -312,6 +322,20 @@ class TestTMDBProvider:
         with pytest.raises(ProviderError, match="API call failed"):
             provider.search_movie("Test")
 
+    @patch("requests.Session.get")
+    def test_sustained_rate_limit_raises_provider_error(
+        self, mock_get: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test TMDB provider surfaces exhausted 429 retries as a ProviderError."""
+        monkeypatch.setattr(TMDBProvider._api_call.retry, "wait", wait_none())
+        mock_get.return_value = _rate_limited_response()
+
+        provider = TMDBProvider("tmdb-rate-limit-key")
+
+        with pytest.raises(RateLimitedError):
+            provider.search_movie("Test")
+        assert mock_get.call_count == 3
+
 
 # ============================================================================
 # TVDB Provider Tests
@@ -327,13 +351,13 @@ class TestTVDBProvider:
         assert provider.api_key == "test-api-key"
         assert provider.name == "TVDBProvider"
 
-    @patch("src.media_manager.providers.tvdb.requests.post")
-    @patch("src.media_manager.providers.tvdb.Path.exists")
-    def test_authentication(self, mock_exists: Mock, mock_post: Mock) -> None:
+    @patch("requests.Session.post")
+    @patch.object(TVDBProvider, "_store_token")
+    @patch.object(TVDBProvider, "_load_cached_token", return_value=None)
+    def test_authentication(
+        self, mock_load: Mock, mock_store: Mock, mock_post: Mock
+    ) -> None:
         """Test TVDB authentication."""
-        # Indicate cache doesn't exist
-        mock_exists.return_value = False
-        
         auth_response = Mock()
         auth_response.json.return_value = {"data": {"token": "test-token-123"}}
         mock_post.return_value = auth_response
@@ -342,9 +366,10 @@ class TestTVDBProvider:
         provider._authenticate()
 
         assert provider._token == "test-token-123"
+        mock_store.assert_called_once_with("test-token-123")
 
-    @patch("requests.post")
-    @patch("requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     def test_search_tv(
         self, mock_get: Mock, mock_post: Mock, tvdb_tv_search_response: dict[str, Any]
     ) -> None:
@@ -367,8 +392,8 @@ class TestTVDBProvider:
         assert results[0].external_id == "121361"
         assert results[0].provider_name == "TVDB"
 
-    @patch("requests.post")
-    @patch("requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     def test_get_tv_details(
         self, mock_get: Mock, mock_post: Mock, tvdb_tv_details_response: dict[str, Any]
     ) -> None:
@@ -391,7 +416,7 @@ class TestTVDBProvider:
         assert len(result.cast) == 2
         assert "Emilia Clarke" in result.cast
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_authentication_without_api_key(self, mock_post: Mock) -> None:
         """Test TVDB authentication without API key raises error."""
         provider = TVDBProvider()
@@ -399,6 +424,21 @@ class TestTVDBProvider:
         with pytest.raises(ProviderError, match="API key is not configured"):
             provider._authenticate()
 
+    @patch("requests.Session.get")
+    def test_sustained_rate_limit_raises_provider_error(
+        self, mock_get: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test TVDB provider surfaces exhausted 429 retries as a ProviderError."""
+        monkeypatch.setattr(TVDBProvider._api_call.retry, "wait", wait_none())
+        mock_get.return_value = _rate_limited_response()
+
+        provider = TVDBProvider("tvdb-rate-limit-key")
+        provider._token = "test-token"
+
+        with pytest.raises(RateLimitedError):
+            provider.search_tv("Test")
+        assert mock_get.call_count == 3
+
 
 # ============================================================================
 # Provider Adapter Tests
@@ -555,7 +595,7 @@ class TestProviderAdapter:
 class TestProviderIntegration:
     """Integration tests for providers."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_complete_movie_workflow(
         self, mock_get: Mock, tmdb_movie_search_response: dict[str, Any],
         tmdb_movie_details_response: dict[str, Any]
@@ -585,8 +625,8 @@ class TestProviderIntegration:
         match = adapter.search_and_match(metadata)
         assert match.matched_title == "Fight Club"
 
-    @patch("requests.get")
-    @patch("requests.post")
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
     def test_multiple_providers_priority(
         self, mock_post: Mock, mock_get: Mock,
         tmdb_movie_search_response: dict[str, Any],
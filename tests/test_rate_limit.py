@@ -0,0 +1,226 @@
+"""Tests for the shared provider rate limiter and AIMD controller."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
+
+import pytest
+from tenacity import wait_none
+
+from media_manager.instrumentation import get_instrumentation, reset_instrumentation
+from media_manager.providers.base import ProviderError
+from media_manager.providers.rate_limit import (
+    AIMDController,
+    ProviderRateLimiter,
+    RateLimitedError,
+    TokenBucket,
+    get_rate_limiter,
+    parse_retry_after,
+    reset_rate_limiters,
+)
+from media_manager.providers.tmdb import TMDBProvider
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters():
+    reset_rate_limiters()
+    reset_instrumentation()
+    yield
+    reset_rate_limiters()
+    reset_instrumentation()
+
+
+class TestTokenBucket:
+    def test_allows_a_burst_then_spaces_requests(self) -> None:
+        bucket = TokenBucket(rate=10.0, capacity=3)
+
+        delays = [bucket.reserve() for _ in range(5)]
+
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert delays[3] == pytest.approx(0.1, abs=0.01)
+        assert delays[4] == pytest.approx(0.2, abs=0.01)
+
+    def test_pause_holds_every_slot_and_suppresses_the_burst(self) -> None:
+        bucket = TokenBucket(rate=100.0, capacity=5)
+
+        bucket.pause(0.5)
+        delays = [bucket.reserve() for _ in range(3)]
+
+        assert delays[0] == pytest.approx(0.5, abs=0.02)
+        assert delays[1] == pytest.approx(0.51, abs=0.02)
+        assert delays[2] == pytest.approx(0.52, abs=0.02)
+
+
+class TestRetryAfter:
+    def test_parses_seconds_and_dates(self) -> None:
+        future = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(format_datetime(future, usegmt=True)) == pytest.approx(30, abs=2)
+        assert parse_retry_after(None) == 1.0
+        assert parse_retry_after("soon") == 1.0
+
+
+class TestAIMDController:
+    def test_increases_after_a_window_of_successes(self) -> None:
+        controller = AIMDController(initial=2, maximum=4)
+
+        for _ in range(2):
+            controller.record_success(0.1)
+        assert controller.limit == 3
+
+        for _ in range(3):
+            controller.record_success(0.1)
+        assert controller.limit == 4
+
+        for _ in range(10):
+            controller.record_success(0.1)
+        assert controller.limit == 4
+
+    def test_halves_on_congestion_once_per_cooldown(self) -> None:
+        controller = AIMDController(initial=16, cooldown=60.0)
+
+        controller.record_congestion()
+        controller.record_congestion()
+
+        assert controller.limit == 8
+
+    def test_backs_off_when_latency_rises(self) -> None:
+        controller = AIMDController(initial=8, cooldown=0.0)
+
+        for _ in range(3):
+            controller.record_success(0.05)
+        for _ in range(10):
+            controller.record_success(1.0)
+
+        assert controller.limit < 8
+
+    def test_blocks_threads_beyond_the_limit(self) -> None:
+        controller = AIMDController(initial=2)
+        controller.acquire()
+        controller.acquire()
+        acquired = threading.Event()
+
+        def third() -> None:
+            controller.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=third)
+        thread.start()
+        assert not acquired.wait(0.1)
+        assert controller.waiting == 1
+
+        controller.release()
+        assert acquired.wait(1.0)
+        thread.join()
+        assert controller.in_flight == 2
+
+    def test_wakes_coroutines_from_other_threads(self) -> None:
+        controller = AIMDController(initial=1)
+        controller.acquire()
+
+        async def waiter() -> float:
+            started = time.monotonic()
+            await controller.acquire_async()
+            return time.monotonic() - started
+
+        threading.Timer(0.1, controller.release).start()
+        waited = asyncio.run(waiter())
+
+        assert waited >= 0.09
+        assert controller.in_flight == 1
+
+
+class TestProviderRateLimiter:
+    def test_limiters_are_shared_per_provider_and_key(self) -> None:
+        assert get_rate_limiter("TMDB", "a") is get_rate_limiter("TMDB", "a")
+        assert get_rate_limiter("TMDB", "a") is not get_rate_limiter("TMDB", "b")
+        assert get_rate_limiter("TMDB", "a") is not get_rate_limiter("TVDB", "a")
+
+    def test_throttled_response_pauses_and_backs_off(self) -> None:
+        limiter = ProviderRateLimiter("rate_limiter.Test", rate=100.0, burst=10)
+        limiter.controller = AIMDController(initial=8)
+
+        with limiter.request() as ticket:
+            ticket.observe(429, "0.3")
+
+        started = time.monotonic()
+        with limiter.request() as ticket:
+            ticket.observe(200)
+
+        assert time.monotonic() - started >= 0.28
+        assert limiter.controller.limit == 4
+        metrics = get_instrumentation()
+        assert metrics.get_counter_metrics("rate_limiter.Test.throttled").count == 1
+
+    def test_transport_errors_count_as_congestion(self) -> None:
+        limiter = ProviderRateLimiter("rate_limiter.Test", rate=100.0, burst=10)
+        limiter.controller = AIMDController(initial=8)
+
+        with pytest.raises(ConnectionError):
+            with limiter.request():
+                raise ConnectionError("reset")
+
+        assert limiter.controller.limit == 4
+
+    def test_publishes_rate_queue_and_concurrency_gauges(self) -> None:
+        limiter = ProviderRateLimiter("rate_limiter.Test", rate=20.0, burst=1)
+
+        async def run() -> None:
+            async def one() -> None:
+                async with limiter.request_async() as ticket:
+                    ticket.observe(200)
+
+            await asyncio.gather(*(one() for _ in range(6)))
+
+        asyncio.run(run())
+
+        metrics = get_instrumentation()
+        assert metrics.get_gauge_metrics("rate_limiter.Test.rate").max_value >= 5
+        assert metrics.get_gauge_metrics("rate_limiter.Test.queue_depth").max_value >= 1
+        assert metrics.get_gauge_metrics("rate_limiter.Test.queue_depth").value == 0
+        assert metrics.get_gauge_metrics("rate_limiter.Test.concurrency").value >= 4
+
+
+def _response(status: int, payload: dict | None = None, headers: dict | None = None) -> Mock:
+    response = Mock()
+    response.status_code = status
+    response.headers = headers or {}
+    response.json.return_value = payload or {}
+    return response
+
+
+class TestProviderIntegration:
+    def test_tmdb_retries_after_429_honouring_retry_after(self, provider_cache) -> None:
+        provider = TMDBProvider("rate-test-key")
+        responses = [
+            _response(429, headers={"Retry-After": "0.2"}),
+            _response(200, {"results": []}),
+        ]
+        call = TMDBProvider._api_call.retry_with(wait=wait_none())
+
+        with patch("requests.Session.get", side_effect=responses) as get:
+            started = time.monotonic()
+            result = call(provider, "/search/movie", {"query": "Alien"})
+
+        assert result == {"results": []}
+        assert get.call_count == 2
+        assert time.monotonic() - started >= 0.18
+
+    def test_tmdb_gives_up_after_repeated_429s(self, provider_cache) -> None:
+        provider = TMDBProvider("rate-test-key")
+        call = TMDBProvider._api_call.retry_with(wait=wait_none(), reraise=True)
+
+        with patch(
+            "requests.Session.get",
+            return_value=_response(429, headers={"Retry-After": "0"}),
+        ):
+            with pytest.raises(RateLimitedError) as excinfo:
+                call(provider, "/search/movie", {"query": "Alien"})
+
+        assert isinstance(excinfo.value, ProviderError)
@@ -0,0 +1,156 @@
+"""Tests for checkpointed, resumable scans."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlmodel import select
+
+from media_manager.persistence.database import DatabaseService
+from media_manager.persistence.models import JobRun, ScanCheckpoint, ScanCheckpointEntry
+from media_manager.scan_checkpoint import ScanCheckpointStore
+from media_manager.scan_engine import ScanEngine
+from media_manager.scanner import ScanConfig, Scanner
+
+
+class ScanCrashed(Exception):
+    """Raised by CrashingScanner to simulate an interrupted scan."""
+
+
+class CrashingScanner(Scanner):
+    """Scanner that fails after parsing a number of files."""
+
+    def __init__(self, fail_after: int) -> None:
+        super().__init__()
+        self.fail_after = fail_after
+        self.parsed: list[Path] = []
+
+    def parse_video(self, path: Path):
+        if len(self.parsed) >= self.fail_after:
+            raise ScanCrashed("simulated crash")
+        self.parsed.append(path)
+        return super().parse_video(path)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ScanCheckpointStore:
+    db_service = DatabaseService(f"sqlite:///{tmp_path / 'checkpoints.db'}")
+    db_service.create_all()
+    return ScanCheckpointStore(db_service)
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    root = tmp_path / "library"
+    for show in range(4):
+        for episode in range(1, 4):
+            path = root / f"Show{show}" / f"Show{show}.S01E{episode:02d}.mkv"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("", encoding="utf-8")
+    (root / "Show0" / "notes.txt").write_text("", encoding="utf-8")
+    return root
+
+
+def _job_runs(store: ScanCheckpointStore) -> list[JobRun]:
+    with store._db_service.get_session() as session:
+        return list(session.exec(select(JobRun).order_by(JobRun.id)).all())
+
+
+class TestScannerFrontier:
+    """Tests for Scanner.iter_frontier."""
+
+    def test_matches_regular_discovery_order(self, library: Path) -> None:
+        config = ScanConfig(root_paths=[library])
+        frontier = [str(library)]
+
+        paths = [path for batch in Scanner().iter_frontier(config, frontier) for path in batch]
+
+        assert paths == list(Scanner().iter_video_files(config))
+        assert frontier == []
+
+    def test_frontier_can_be_resumed(self, library: Path) -> None:
+        config = ScanConfig(root_paths=[library])
+        frontier = [str(library)]
+        walk = Scanner().iter_frontier(config, frontier)
+        first = next(walk) + next(walk)
+        saved = list(frontier)
+
+        rest = [path for batch in Scanner().iter_frontier(config, saved) for path in batch]
+
+        assert first + rest == list(Scanner().iter_video_files(config))
+
+
+class TestCheckpointedScan:
+    """Tests for ScanEngine.scan_checkpointed."""
+
+    def test_completed_scan_records_job_and_drops_checkpoint(
+        self, qapp, library: Path, store: ScanCheckpointStore
+    ) -> None:
+        engine = ScanEngine()
+        results = engine.scan_checkpointed(
+            ScanConfig(root_paths=[library]), store, checkpoint_every=2
+        )
+
+        assert len(results) == 12
+        [job_run] = _job_runs(store)
+        assert job_run.job_type == "scan"
+        assert job_run.status == "completed"
+        assert job_run.items_processed == 12
+        with store._db_service.get_session() as session:
+            assert session.exec(select(ScanCheckpoint)).all() == []
+            assert session.exec(select(ScanCheckpointEntry)).all() == []
+
+    def test_interrupted_scan_resumes_from_last_checkpoint(
+        self, qapp, library: Path, store: ScanCheckpointStore
+    ) -> None:
+        config = ScanConfig(root_paths=[library])
+        expected = ScanEngine().scan(config)
+
+        crashing = CrashingScanner(fail_after=8)
+        with pytest.raises(ScanCrashed):
+            ScanEngine(crashing).scan_checkpointed(config, store, checkpoint_every=3)
+
+        [job_run] = _job_runs(store)
+        assert job_run.status == "interrupted"
+        assert job_run.items_processed == 6  # Two directories were checkpointed
+
+        resumed_scanner = CrashingScanner(fail_after=100)
+        engine = ScanEngine(resumed_scanner)
+        resumed = []
+        engine.scan_resumed.connect(lambda job_id, count: resumed.append(count))
+        results = engine.scan_checkpointed(config, store, checkpoint_every=3)
+
+        assert results == expected
+        assert resumed == [6]
+        assert len(resumed_scanner.parsed) == 6
+        [job_run] = _job_runs(store)
+        assert job_run.status == "completed"
+        assert job_run.items_processed == 12
+
+    def test_resume_disabled_discards_unfinished_job(
+        self, qapp, library: Path, store: ScanCheckpointStore
+    ) -> None:
+        config = ScanConfig(root_paths=[library])
+        with pytest.raises(ScanCrashed):
+            ScanEngine(CrashingScanner(fail_after=4)).scan_checkpointed(
+                config, store, checkpoint_every=1
+            )
+
+        results = ScanEngine().scan_checkpointed(config, store, resume=False)
+
+        assert len(results) == 12
+        assert [job_run.status for job_run in _job_runs(store)] == ["failed", "completed"]
+
+    def test_checkpoints_are_scoped_to_roots_and_filters(
+        self, qapp, library: Path, store: ScanCheckpointStore
+    ) -> None:
+        with pytest.raises(ScanCrashed):
+            ScanEngine(CrashingScanner(fail_after=4)).scan_checkpointed(
+                ScanConfig(root_paths=[library]), store, checkpoint_every=1
+            )
+
+        other = ScanConfig(root_paths=[library], ignored_extensions=[".avi"])
+
+        assert store.find_resumable(other) is None
+        assert store.find_resumable(ScanConfig(root_paths=[library])) is not None
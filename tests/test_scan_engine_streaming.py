@@ -0,0 +1,99 @@
+"""Tests for the streaming scan mode of the scan engine."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from media_manager.scan_engine import ScanEngine, StreamingScanOptions
+from media_manager.scanner import ScanConfig
+
+
+def _touch_file(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    root = tmp_path / "library"
+    for index in range(25):
+        _touch_file(root / f"Show.S01E{index + 1:02d}.mkv")
+    return root
+
+
+class TestStreamingScan:
+    """Tests for ScanEngine.iter_scan."""
+
+    def test_yields_batches_and_batched_signals(self, qapp, library: Path) -> None:
+        engine = ScanEngine()
+        batches = []
+        enrichment_batches = []
+        per_item_tasks = []
+        callbacks = []
+        engine.scan_batch_ready.connect(batches.append)
+        engine.enrichment_batch_created.connect(enrichment_batches.append)
+        engine.enrichment_task_created.connect(per_item_tasks.append)
+        engine.register_enrichment_callback(callbacks.append)
+
+        options = StreamingScanOptions(batch_size=10, max_retained_results=None)
+        yielded = list(engine.iter_scan(ScanConfig(root_paths=[library]), options))
+
+        assert [len(batch) for batch in yielded] == [10, 10, 5]
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert [len(batch) for batch in enrichment_batches] == [10, 10, 5]
+        assert per_item_tasks == []
+        assert len(callbacks) == 25
+        assert len(engine.get_results()) == 25
+
+    def test_progress_is_throttled_by_count(self, qapp, library: Path) -> None:
+        engine = ScanEngine()
+        progress = []
+        engine.scan_progress.connect(lambda *args: progress.append(args))
+
+        options = StreamingScanOptions(progress_every=10, progress_interval=3600)
+        list(engine.iter_scan(ScanConfig(root_paths=[library]), options))
+
+        assert [(current, total) for current, total, _ in progress] == [
+            (10, 0),
+            (20, 0),
+            (25, 25),
+        ]
+
+    def test_progress_is_throttled_by_time(self, qapp, library: Path) -> None:
+        engine = ScanEngine()
+        progress = []
+        engine.scan_progress.connect(lambda *args: progress.append(args))
+
+        options = StreamingScanOptions(progress_every=1000, progress_interval=0.0)
+        list(engine.iter_scan(ScanConfig(root_paths=[library]), options))
+
+        assert len(progress) == 26
+        assert progress[-1][:2] == (25, 25)
+
+    def test_retained_results_are_capped(self, qapp, library: Path) -> None:
+        engine = ScanEngine()
+        completed = []
+        engine.scan_completed.connect(completed.append)
+
+        options = StreamingScanOptions(batch_size=4, max_retained_results=6)
+        list(engine.iter_scan(ScanConfig(root_paths=[library]), options))
+
+        names = [metadata.path.name for metadata in engine.get_results()]
+        assert names == [f"Show.S01E{index:02d}.mkv" for index in range(20, 26)]
+        assert len(completed) == 1
+        assert len(completed[0]) == 6
+
+    def test_missing_root_completes_empty(self, qapp, tmp_path: Path) -> None:
+        engine = ScanEngine()
+        completed = []
+        errors = []
+        engine.scan_completed.connect(completed.append)
+        engine.scan_error.connect(errors.append)
+
+        batches = list(engine.iter_scan(ScanConfig(root_paths=[tmp_path / "missing"])))
+
+        assert batches == []
+        assert completed == [[]]
+        assert len(errors) == 1
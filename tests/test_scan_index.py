@@ -0,0 +1,212 @@
+"""Tests for incremental scanning with the persisted scan index."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from media_manager.persistence.database import DatabaseService
+from media_manager.scan_engine import ScanEngine
+from media_manager.scan_index import ScanIndex
+from media_manager.scanner import ScanConfig, Scanner
+
+
+def _touch_file(path: Path, content: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _bump_mtime(path: Path) -> None:
+    stat_result = path.stat()
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def scan_index(tmp_path: Path) -> ScanIndex:
+    db_service = DatabaseService(f"sqlite:///{tmp_path / 'index.db'}")
+    db_service.create_all()
+    return ScanIndex(db_service)
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    root = tmp_path / "library"
+    _touch_file(root / "Movies" / "The.Matrix.1999.1080p.mkv")
+    _touch_file(root / "Movies" / "poster.jpg")
+    _touch_file(root / "TV" / "Dark" / "Dark.S01E01.mkv")
+    _touch_file(root / "TV" / "Dark" / "Dark.S01E02.mkv")
+    return root
+
+
+class TestIncrementalScan:
+    """Tests for Scanner.scan_incremental."""
+
+    def test_first_scan_reports_everything_as_added(
+        self, library: Path, scan_index: ScanIndex
+    ) -> None:
+        delta = Scanner().scan_incremental(ScanConfig(root_paths=[library]), scan_index)
+
+        assert sorted(metadata.path.name for metadata in delta.added) == [
+            "Dark.S01E01.mkv",
+            "Dark.S01E02.mkv",
+            "The.Matrix.1999.1080p.mkv",
+        ]
+        assert delta.changed == []
+        assert delta.removed == []
+
+    def test_unchanged_tree_is_skipped(
+        self, library: Path, scan_index: ScanIndex
+    ) -> None:
+        scanner = Scanner()
+        config = ScanConfig(root_paths=[library])
+        scanner.scan_incremental(config, scan_index)
+
+        delta = scanner.scan_incremental(config, scan_index)
+
+        assert not delta.has_changes()
+        assert delta.unchanged_count == 3
+        assert delta.skipped_directories == 4
+
+    def test_added_changed_and_removed_files(
+        self, library: Path, scan_index: ScanIndex
+    ) -> None:
+        scanner = Scanner()
+        config = ScanConfig(root_paths=[library])
+        scanner.scan_incremental(config, scan_index)
+
+        _touch_file(library / "TV" / "Dark" / "Dark.S01E03.mkv")
+        matrix = library / "Movies" / "The.Matrix.1999.1080p.mkv"
+        matrix.write_text("re-encoded", encoding="utf-8")
+        (library / "TV" / "Dark" / "Dark.S01E01.mkv").unlink()
+
+        delta = scanner.scan_incremental(config, scan_index)
+
+        assert [metadata.path.name for metadata in delta.added] == ["Dark.S01E03.mkv"]
+        assert [metadata.path.name for metadata in delta.changed] == [
+            "The.Matrix.1999.1080p.mkv"
+        ]
+        assert [metadata.path.name for metadata in delta.removed] == ["Dark.S01E01.mkv"]
+        assert delta.removed[0].season == 1
+        assert delta.unchanged_count == 1
+
+        # The index now reflects the new state.
+        assert not scanner.scan_incremental(config, scan_index).has_changes()
+
+    def test_in_place_change_needs_file_verification(
+        self, library: Path, scan_index: ScanIndex
+    ) -> None:
+        scanner = Scanner()
+        config = ScanConfig(root_paths=[library])
+        scanner.scan_incremental(config, scan_index)
+
+        matrix = library / "Movies" / "The.Matrix.1999.1080p.mkv"
+        _bump_mtime(matrix)
+
+        trusting = scanner.scan_incremental(config, scan_index, verify_files=False)
+        assert not trusting.has_changes()
+
+        verified = scanner.scan_incremental(config, scan_index, verify_files=True)
+        assert [metadata.path.name for metadata in verified.changed] == [
+            "The.Matrix.1999.1080p.mkv"
+        ]
+
+    def test_filter_change_relists_directories(
+        self, library: Path, scan_index: ScanIndex
+    ) -> None:
+        scanner = Scanner()
+        scanner.scan_incremental(ScanConfig(root_paths=[library]), scan_index)
+
+        delta = scanner.scan_incremental(
+            ScanConfig(root_paths=[library], ignored_directories=["tv"]), scan_index
+        )
+
+        assert sorted(metadata.path.name for metadata in delta.removed) == [
+            "Dark.S01E01.mkv",
+            "Dark.S01E02.mkv",
+        ]
+        assert delta.skipped_directories == 0
+
+    def test_listed_files_are_signed_from_their_dir_entries(
+        self, library: Path, scan_index: ScanIndex, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        scanner = Scanner()
+
+        def _fail(path: str) -> None:
+            raise AssertionError(f"unexpected stat of {path}")
+
+        monkeypatch.setattr(scanner, "_file_signature", _fail)
+
+        delta = scanner.scan_incremental(ScanConfig(root_paths=[library]), scan_index)
+
+        assert len(delta.added) == 3
+        matrix = library / "Movies" / "The.Matrix.1999.1080p.mkv"
+        assert scan_index.load(library).files[str(matrix)].inode == matrix.stat().st_ino
+        discovered = delta.discovered[str(matrix)]
+        assert (discovered.size, discovered.inode) == (
+            matrix.stat().st_size,
+            matrix.stat().st_ino,
+        )
+
+
+class TestScanEngineIncremental:
+    """Tests for ScanEngine.scan_incremental."""
+
+    def test_engine_emits_delta_and_patches_results(
+        self, qapp, library: Path, scan_index: ScanIndex
+    ) -> None:
+        engine = ScanEngine()
+        deltas = []
+        tasks = []
+        engine.scan_delta_completed.connect(deltas.append)
+        engine.enrichment_task_created.connect(tasks.append)
+        config = ScanConfig(root_paths=[library])
+
+        engine.scan_incremental(config, scan_index)
+        assert len(engine.get_results()) == 3
+        # Overlapping roots keep independent index entries.
+        Scanner().scan_incremental(config.with_roots([library / "TV"]), scan_index)
+
+        _touch_file(library / "Movies" / "Inception.2010.mkv")
+        (library / "TV" / "Dark" / "Dark.S01E02.mkv").unlink()
+        tasks.clear()
+        deltas.clear()
+
+        delta = engine.scan_incremental(config, scan_index)
+
+        assert len(deltas) == 1
+        assert deltas[0] is delta
+        assert engine.get_last_delta() is delta
+        assert {metadata.path.name for metadata in tasks} == {
+            metadata.path.name for metadata in delta.added
+        }
+        assert [metadata.path.name for metadata in delta.removed] == ["Dark.S01E02.mkv"]
+        names = sorted(metadata.path.name for metadata in engine.get_results())
+        assert names == [
+            "Dark.S01E01.mkv",
+            "Inception.2010.mkv",
+            "The.Matrix.1999.1080p.mkv",
+        ]
+
+    def test_results_cover_library_after_restart(
+        self, qapp, library: Path, scan_index: ScanIndex
+    ) -> None:
+        config = ScanConfig(root_paths=[library])
+        ScanEngine().scan_incremental(config, scan_index)
+        _touch_file(library / "Movies" / "Inception.2010.mkv")
+
+        # A new engine stands in for a fresh process with a populated index.
+        engine = ScanEngine()
+        delta = engine.scan_incremental(config, scan_index)
+
+        assert [metadata.path.name for metadata in delta.added] == ["Inception.2010.mkv"]
+        names = sorted(metadata.path.name for metadata in engine.get_results())
+        assert names == [
+            "Dark.S01E01.mkv",
+            "Dark.S01E02.mkv",
+            "Inception.2010.mkv",
+            "The.Matrix.1999.1080p.mkv",
+        ]
+        matrix = engine.get_results_by_paths([str(library / "Movies" / "The.Matrix.1999.1080p.mkv")])
+        assert matrix[0].year == 1999
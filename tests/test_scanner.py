@@ -101,3 +101,22 @@ class TestScanner:
 
         assert len(results) == 1
         assert results[0].name == "Movie.Title.2020.mkv"
+
+    def test_iter_discovered_files_returns_stat_data(self, tmp_path: Path) -> None:
+        movie = tmp_path / "Movie.Title.2020.mkv"
+        movie.parent.mkdir(parents=True, exist_ok=True)
+        movie.write_bytes(b"x" * 42)
+        _touch_file(tmp_path / "movie.nfo")
+
+        scanner = Scanner()
+        config = ScanConfig(root_paths=[tmp_path])
+        discovered = list(scanner.iter_discovered_files(config))
+
+        assert [item.path for item in discovered] == [movie]
+        assert discovered[0].size == 42
+        assert discovered[0].mtime_ns == movie.stat().st_mtime_ns
+        assert discovered[0].inode == movie.stat().st_ino
+
+        unstatted = list(scanner.iter_discovered_files(config, stat_files=False))
+        assert unstatted[0].size is None
+        assert unstatted[0].mtime_ns is None
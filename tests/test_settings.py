@@ -180,6 +180,16 @@ class TestSettingsManager:
             assert stored["delete"] is True
             assert stored["move_library_id"] == 7
 
+    def test_provider_concurrency_defaults_to_blocking_sessions(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings = SettingsManager(Path(temp_dir) / "test_settings.json")
+
+            assert settings.get_provider_concurrency() == 1
+            settings.set_provider_concurrency(0)
+            assert settings.get_provider_concurrency() == 1
+            settings.set_provider_concurrency(16)
+            assert settings.get_provider_concurrency() == 16
+
     def test_setting_changed_signal_emitted(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             settings = SettingsManager(Path(temp_dir) / "test_settings.json")
@@ -0,0 +1,160 @@
+"""Tests for in-flight deduplication of provider lookups."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from media_manager.instrumentation import get_instrumentation, reset_instrumentation
+from media_manager.models import MediaType, VideoMetadata
+from media_manager.providers.adapter import ProviderAdapter
+from media_manager.providers.base import BaseProvider, ProviderError, ProviderResult
+from media_manager.providers.single_flight import SingleFlight
+
+
+class CountingProvider(BaseProvider):
+    """TV provider that counts searches and answers after a short delay."""
+
+    def __init__(self, delay: float = 0.1, fail: bool = False) -> None:
+        super().__init__()
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _answer(self, title: str, year: int | None) -> list[ProviderResult]:
+        if self.fail:
+            raise ProviderError("service unavailable")
+        return [ProviderResult(self.name, "1", title, year, confidence=0.9)]
+
+    def search_tv(self, title: str, year: int | None = None) -> list[ProviderResult]:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self._answer(title, year)
+
+    async def search_tv_async(
+        self, title: str, year: int | None = None
+    ) -> list[ProviderResult]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self._answer(title, year)
+
+    def search_movie(self, title: str, year: int | None = None) -> list[ProviderResult]:
+        return []
+
+    def get_movie_details(self, external_id: str) -> ProviderResult:
+        raise ProviderError("not supported")
+
+    def get_tv_details(self, external_id, season=None, episode=None) -> ProviderResult:
+        raise ProviderError("not supported")
+
+    def get_cast(self, external_id: str, media_type: str) -> list[str]:
+        return []
+
+    def get_trailers(self, external_id: str, media_type: str) -> list[str]:
+        return []
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    reset_instrumentation()
+    yield
+    reset_instrumentation()
+
+
+def _episodes(count: int) -> list[VideoMetadata]:
+    return [
+        VideoMetadata(
+            path=Path(f"/tv/Show.S01E{episode:02d}.mkv"),
+            title="Show",
+            media_type=MediaType.TV,
+            year=2020,
+            season=1,
+            episode=episode,
+        )
+        for episode in range(1, count + 1)
+    ]
+
+
+def test_single_flight_shares_one_call() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    calls = []
+
+    def slow() -> int:
+        calls.append(1)
+        time.sleep(0.1)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outcomes = list(executor.map(lambda _: flights.do("key", slow), range(8)))
+
+    assert len(calls) == 1
+    assert [result for result, _ in outcomes] == [42] * 8
+    assert sum(shared for _, shared in outcomes) == 7
+    assert flights.in_flight() == 0
+
+
+def test_single_flight_shares_exceptions_and_forgets_the_key() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+
+    def broken() -> int:
+        raise ProviderError("boom")
+
+    with pytest.raises(ProviderError):
+        flights.do("key", broken)
+
+    assert flights.do("key", lambda: 1) == (1, False)
+
+
+def test_concurrent_episode_searches_are_coalesced() -> None:
+    provider = CountingProvider()
+    # Sequential mode, so each caller thread queries the provider itself.
+    adapter = ProviderAdapter([provider], use_cache=False, concurrent=False)
+
+    with ThreadPoolExecutor(max_workers=12) as executor:
+        matches = list(executor.map(adapter.search_and_match, _episodes(12)))
+
+    assert provider.calls == 1
+    assert all(match.matched_title == "Show" for match in matches)
+    coalesced = get_instrumentation().get_counter_metrics("provider_adapter.coalesced_requests")
+    assert coalesced.count == 11
+
+
+def test_async_searches_are_coalesced() -> None:
+    provider = CountingProvider()
+    adapter = ProviderAdapter([provider], use_cache=False)
+
+    async def run() -> list:
+        return await asyncio.gather(
+            *(adapter.search_and_match_async(metadata) for metadata in _episodes(24))
+        )
+
+    matches = asyncio.run(run())
+
+    assert provider.calls == 1
+    assert len(matches) == 24
+    coalesced = get_instrumentation().get_counter_metrics("provider_adapter.coalesced_requests")
+    assert coalesced.count == 23
+
+
+def test_shared_failures_reach_every_caller() -> None:
+    provider = CountingProvider(fail=True)
+    adapter = ProviderAdapter([provider], use_cache=False)
+
+    async def run() -> list:
+        return await asyncio.gather(
+            *(adapter.search_and_match_async(metadata) for metadata in _episodes(5))
+        )
+
+    matches = asyncio.run(run())
+
+    assert provider.calls == 1
+    assert all(match.confidence == 0.0 for match in matches)
+    errors = get_instrumentation().get_counter_metrics(f"provider.{provider.name}.errors")
+    assert errors.count == 5
@@ -0,0 +1,160 @@
+"""Tests for the parallel directory walker."""
+
+from __future__ import annotations
+
+import itertools
+import os
+from pathlib import Path
+
+import pytest
+
+from media_manager.scan_engine import ScanEngine
+from media_manager.scanner import ScanConfig, Scanner
+from media_manager.walker import SUBTREE_BUFFER_LISTINGS, ParallelWalker
+
+
+def _touch_file(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    root = tmp_path / "library"
+    _touch_file(root / "Zulu.2013.mkv")
+    _touch_file(root / "Avatar.2009.mp4")
+    _touch_file(root / "Movies" / "B" / "Blade.Runner.1982.mkv")
+    _touch_file(root / "Movies" / "A" / "Alien.1979.mkv")
+    _touch_file(root / "Movies" / "Heat.1995.avi")
+    _touch_file(root / "TV" / "Dark" / "Dark.S01E02.mkv")
+    _touch_file(root / "TV" / "Dark" / "Dark.S01E01.mkv")
+    _touch_file(root / "TV" / "notes.txt")
+    _touch_file(root / "node_modules" / "ignored.mkv")
+    return root
+
+
+def _relative(paths: list[Path], base: Path) -> list[str]:
+    return [path.relative_to(base).as_posix() for path in paths]
+
+
+class TestParallelWalker:
+    """Tests for the ParallelWalker class."""
+
+    def test_walk_yields_sorted_depth_first_order(self, library: Path) -> None:
+        walker = ParallelWalker(ignored_directories=["node_modules"], max_workers=4)
+
+        paths = [Path(entry.path) for entry in walker.walk([library])]
+
+        assert _relative(paths, library) == [
+            "Avatar.2009.mp4",
+            "Zulu.2013.mkv",
+            "Movies/Heat.1995.avi",
+            "Movies/A/Alien.1979.mkv",
+            "Movies/B/Blade.Runner.1982.mkv",
+            "TV/notes.txt",
+            "TV/Dark/Dark.S01E01.mkv",
+            "TV/Dark/Dark.S01E02.mkv",
+        ]
+
+    @pytest.mark.parametrize("workers", [1, 2, 8])
+    def test_output_is_independent_of_worker_count(
+        self, tmp_path: Path, library: Path, workers: int
+    ) -> None:
+        second_root = tmp_path / "second"
+        _touch_file(second_root / "Show" / "Show.S01E01.mkv")
+        roots = [second_root, library]
+
+        reference = [entry.path for entry in ParallelWalker(max_workers=1).walk(roots)]
+        paths = [entry.path for entry in ParallelWalker(max_workers=workers).walk(roots)]
+
+        assert paths == reference
+        assert paths[0] == str(second_root / "Show" / "Show.S01E01.mkv")
+
+    def test_file_filter_and_missing_root(self, tmp_path: Path, library: Path) -> None:
+        walker = ParallelWalker(
+            file_filter=lambda entry: entry.name.endswith(".mkv"), max_workers=2
+        )
+
+        paths = [Path(entry.path) for entry in walker.walk([tmp_path / "missing", library])]
+
+        assert "TV/notes.txt" not in _relative(paths, library)
+        assert "node_modules/ignored.mkv" in _relative(paths, library)
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unsupported")
+    def test_does_not_follow_directory_symlinks(self, tmp_path: Path, library: Path) -> None:
+        outside = tmp_path / "outside"
+        _touch_file(outside / "Elsewhere.2001.mkv")
+        try:
+            (library / "link").symlink_to(outside, target_is_directory=True)
+        except OSError:
+            pytest.skip("cannot create symlinks")
+
+        paths = [entry.path for entry in ParallelWalker(max_workers=2).walk([library])]
+
+        assert not any("Elsewhere" in path for path in paths)
+
+
+    def test_early_close_stops_walking_large_subtrees(self, tmp_path: Path) -> None:
+        root = tmp_path / "library"
+        for index in range(300):
+            _touch_file(root / "Big" / f"{index:03d}" / "Movie.mkv")
+        listed = itertools.count()
+
+        class CountingWalker(ParallelWalker):
+            def _list_directory(self, directory: str):
+                next(listed)
+                return super()._list_directory(directory)
+
+        entries = CountingWalker(max_workers=2).walk([root])
+        next(entries)
+        entries.close()
+
+        # Subtree buffers are bounded, so closing early abandons the rest.
+        assert next(listed) < 2 * SUBTREE_BUFFER_LISTINGS + 10
+
+    def test_subtree_errors_reach_the_consumer(self, library: Path) -> None:
+        def _fail(entry: os.DirEntry) -> bool:
+            raise ValueError(entry.name)
+
+        with pytest.raises(ValueError):
+            list(ParallelWalker(file_filter=_fail, max_workers=2).walk([library]))
+
+class TestScannerParallelDiscovery:
+    """Tests for Scanner discovery through the parallel walker."""
+
+    def test_iter_video_files_keeps_config_semantics(self, library: Path) -> None:
+        config = ScanConfig(
+            root_paths=[library], ignored_extensions=[".avi"], walker_workers=3
+        )
+
+        paths = list(Scanner().iter_video_files(config))
+
+        assert _relative(paths, library) == [
+            "Avatar.2009.mp4",
+            "Zulu.2013.mkv",
+            "Movies/A/Alien.1979.mkv",
+            "Movies/B/Blade.Runner.1982.mkv",
+            "TV/Dark/Dark.S01E01.mkv",
+            "TV/Dark/Dark.S01E02.mkv",
+        ]
+
+    def test_with_roots_keeps_worker_count(self, library: Path) -> None:
+        config = ScanConfig(root_paths=[library], walker_workers=2)
+
+        assert config.with_roots([library]).walker_workers == 2
+
+    def test_scan_engine_streams_discovered_paths(self, qapp, library: Path) -> None:
+        engine = ScanEngine()
+        progress = []
+        engine.scan_progress.connect(lambda *args: progress.append(args))
+
+        results = engine.scan(ScanConfig(root_paths=[library], walker_workers=4))
+
+        assert [metadata.path.name for metadata in results][:2] == [
+            "Avatar.2009.mp4",
+            "Zulu.2013.mkv",
+        ]
+        streamed, final = progress[:-1], progress[-1]
+        assert [entry[0] for entry in streamed] == list(range(1, len(results) + 1))
+        assert all(entry[1] == 0 for entry in streamed)
+        assert final[:2] == (len(results), len(results))
@@ -0,0 +1,310 @@
+"""Tests for the filesystem watch mode."""
+
+from __future__ import annotations
+
+import errno
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from media_manager.scan_engine import ScanEngine, StreamingScanOptions
+from media_manager.scanner import ScanConfig
+from media_manager.watcher import (
+    ChangeCoalescer,
+    ChangeKind,
+    FileChange,
+    InotifyBackend,
+    LibraryWatcher,
+    PollingBackend,
+)
+
+
+def _touch_file(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    root = tmp_path / "library"
+    _touch_file(root / "Movies" / "Alien.1979.mkv")
+    _touch_file(root / "TV" / "Dark" / "Dark.S01E01.mkv")
+    (root / "node_modules").mkdir()
+    return root
+
+
+def _inotify_available(config: ScanConfig) -> bool:
+    if not InotifyBackend.is_supported():
+        return False
+    try:
+        InotifyBackend(config).close()
+    except (OSError, AttributeError):
+        return False
+    return True
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class TestChangeCoalescer:
+    """Tests for debouncing and coalescing of raw events."""
+
+    def test_waits_for_quiet_period(self) -> None:
+        clock = FakeClock()
+        coalescer = ChangeCoalescer(debounce=1.0, max_delay=10.0, clock=clock)
+
+        coalescer.add("/a.mkv", ChangeKind.CREATED)
+        clock.now = 0.5
+        assert coalescer.drain() == []
+
+        clock.now = 1.5
+        assert coalescer.drain() == [FileChange(Path("/a.mkv"), ChangeKind.CREATED)]
+        assert coalescer.pending_count() == 0
+
+    def test_max_delay_bounds_a_steady_stream(self) -> None:
+        clock = FakeClock()
+        coalescer = ChangeCoalescer(debounce=1.0, max_delay=3.0, clock=clock)
+
+        for step in range(4):
+            clock.now = step * 0.9
+            coalescer.add(f"/{step}.mkv", ChangeKind.CREATED)
+            if step < 3:
+                assert not coalescer.is_ready()
+
+        clock.now = 3.0
+        assert len(coalescer.drain()) == 4
+
+    @pytest.mark.parametrize(
+        ("kinds", "expected"),
+        [
+            ([ChangeKind.CREATED, ChangeKind.MODIFIED], ChangeKind.CREATED),
+            ([ChangeKind.CREATED, ChangeKind.DELETED], None),
+            ([ChangeKind.DELETED, ChangeKind.CREATED], ChangeKind.MODIFIED),
+            ([ChangeKind.MODIFIED, ChangeKind.DELETED], ChangeKind.DELETED),
+            ([ChangeKind.MODIFIED, ChangeKind.MODIFIED], ChangeKind.MODIFIED),
+        ],
+    )
+    def test_coalesces_event_sequences(self, kinds, expected) -> None:
+        coalescer = ChangeCoalescer(debounce=0.0)
+        for kind in kinds:
+            coalescer.add("/a.mkv", kind)
+
+        changes = coalescer.drain(force=True)
+
+        assert [change.kind for change in changes] == ([expected] if expected else [])
+
+
+class TestPollingBackend:
+    """Tests for the mtime-based polling backend."""
+
+    def test_reports_created_moved_and_deleted_files(self, library: Path) -> None:
+        backend = PollingBackend(ScanConfig(root_paths=[library]), interval=0)
+        backend.start()
+
+        _touch_file(library / "Movies" / "Heat.1995.mkv")
+        _touch_file(library / "Movies" / "notes.txt")
+        (library / "TV" / "Dark").rename(library / "TV" / "Dark (2017)")
+        (library / "Movies" / "Alien.1979.mkv").unlink()
+
+        events = sorted(backend.poll())
+
+        assert events == sorted(
+            [
+                (str(library / "Movies" / "Heat.1995.mkv"), ChangeKind.CREATED),
+                (str(library / "Movies" / "Alien.1979.mkv"), ChangeKind.DELETED),
+                (str(library / "TV" / "Dark" / "Dark.S01E01.mkv"), ChangeKind.DELETED),
+                (
+                    str(library / "TV" / "Dark (2017)" / "Dark.S01E01.mkv"),
+                    ChangeKind.CREATED,
+                ),
+            ]
+        )
+        assert backend.poll() == []
+
+    def test_respects_ignored_directories(self, library: Path) -> None:
+        backend = PollingBackend(ScanConfig(root_paths=[library]), interval=0)
+        backend.start()
+
+        _touch_file(library / "node_modules" / "ignored.mkv")
+        _touch_file(library / "node_modules" / "deep" / "ignored.mkv")
+
+        assert backend.poll() == []
+
+
+class TestInotifyBackend:
+    """Tests for the inotify backend."""
+
+    def test_reports_changes_in_new_directories(self, library: Path) -> None:
+        config = ScanConfig(root_paths=[library])
+        if not _inotify_available(config):
+            pytest.skip("inotify unavailable")
+        backend = InotifyBackend(config)
+        backend.start()
+        try:
+            _touch_file(library / "New Show" / "Show.S01E01.mkv")
+            _touch_file(library / "node_modules" / "ignored.mkv")
+            events = backend.read_events(1.0)
+            _touch_file(library / "New Show" / "Show.S01E02.mkv")
+            (library / "Movies" / "Alien.1979.mkv").unlink()
+            deadline = time.monotonic() + 2.0
+            while len(set(events)) < 3 and time.monotonic() < deadline:
+                events.extend(backend.read_events(0.2))
+        finally:
+            backend.close()
+
+        first = str(library / "New Show" / "Show.S01E01.mkv")
+        second = str(library / "New Show" / "Show.S01E02.mkv")
+        alien = str(library / "Movies" / "Alien.1979.mkv")
+        assert {
+            (first, ChangeKind.CREATED),
+            (second, ChangeKind.CREATED),
+            (alien, ChangeKind.DELETED),
+        } <= set(events)
+        # Writes may add MODIFIED events, but ignored directories add nothing.
+        assert {path for path, _kind in events} == {first, second, alien}
+
+
+class TestScanEngineApplyChanges:
+    """Tests for ScanEngine.apply_changes."""
+
+    def test_only_changed_paths_are_parsed_and_enriched(
+        self, qapp, library: Path
+    ) -> None:
+        engine = ScanEngine()
+        engine.scan(ScanConfig(root_paths=[library]))
+        enriched = []
+        engine.register_enrichment_callback(enriched.append)
+        alien = library / "Movies" / "Alien.1979.mkv"
+        heat = library / "Movies" / "Heat.1995.mkv"
+        dark = library / "TV" / "Dark" / "Dark.S01E01.mkv"
+
+        delta = engine.apply_changes(
+            [
+                FileChange(heat, ChangeKind.CREATED),
+                FileChange(dark, ChangeKind.MODIFIED),
+                FileChange(alien, ChangeKind.DELETED),
+            ]
+        )
+
+        assert [metadata.title for metadata in delta.added] == ["Heat"]
+        assert [metadata.path for metadata in delta.changed] == [dark]
+        assert [metadata.path for metadata in delta.removed] == [alien]
+        assert [metadata.path for metadata in enriched] == [heat, dark]
+        assert [metadata.path for metadata in engine.get_results()] == [heat, dark]
+        assert engine.get_last_delta() is delta
+
+    def test_changes_apply_while_a_streaming_scan_trims_results(
+        self, qapp, tmp_path: Path
+    ) -> None:
+        root = tmp_path / "library"
+        for index in range(600):
+            _touch_file(root / f"Movie.{index:04d}.2001.mkv")
+        engine = ScanEngine()
+        options = StreamingScanOptions(batch_size=5, max_retained_results=20)
+        errors = []
+        done = threading.Event()
+
+        def scan() -> None:
+            try:
+                for _ in engine.iter_scan(ScanConfig(root_paths=[root]), options):
+                    pass
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                done.set()
+
+        thread = threading.Thread(target=scan)
+        thread.start()
+        watched = [root / f"Watched.{index}.mkv" for index in range(50)]
+        while not done.is_set():
+            engine.apply_changes([FileChange(path, ChangeKind.CREATED) for path in watched])
+            engine.apply_changes([FileChange(path, ChangeKind.DELETED) for path in watched])
+        thread.join()
+
+        assert errors == []
+        assert len(engine.get_results()) <= 20
+
+
+class TestLibraryWatcher:
+    """End-to-end tests for LibraryWatcher."""
+
+    @pytest.mark.parametrize("backend", ["polling", "inotify"])
+    def test_pushes_new_files_through_the_engine(
+        self, qapp, library: Path, backend: str
+    ) -> None:
+        config = ScanConfig(root_paths=[library])
+        if backend == "inotify" and not _inotify_available(config):
+            pytest.skip("inotify unavailable")
+        engine = ScanEngine()
+        engine.scan(config)
+        enriched = []
+        engine.register_enrichment_callback(enriched.append)
+        watcher = LibraryWatcher(
+            engine, config, debounce=0.05, poll_interval=0.05, backend=backend
+        )
+        watcher.start()
+        try:
+            assert watcher.backend_names() == [backend]
+            _touch_file(library / "Movies" / "Heat.1995.mkv")
+            _touch_file(library / "node_modules" / "ignored.mkv")
+            assert _wait_for(lambda: len(enriched) >= 1)
+        finally:
+            watcher.stop()
+
+        assert [metadata.title for metadata in enriched] == ["Heat"]
+        assert len(engine.get_results()) == 3
+
+    def test_missing_root_reports_error(self, qapp, tmp_path: Path) -> None:
+        errors = []
+        watcher = LibraryWatcher(
+            ScanEngine(), ScanConfig(root_paths=[tmp_path / "missing"]), backend="polling"
+        )
+        watcher.watch_error.connect(errors.append)
+
+        watcher.start()
+
+        assert not watcher.is_running()
+        assert errors[-1] == "No scan roots to watch"
+
+    def test_failed_inotify_start_closes_backend(
+        self, qapp, library: Path, monkeypatch
+    ) -> None:
+        config = ScanConfig(root_paths=[library])
+        if not _inotify_available(config):
+            pytest.skip("inotify unavailable")
+        closed = []
+        real_close = InotifyBackend.close
+
+        def failing_start(self) -> None:
+            raise OSError(errno.ENOSPC, "inotify watch limit reached")
+
+        def tracking_close(self) -> None:
+            closed.append(self)
+            real_close(self)
+
+        monkeypatch.setattr(InotifyBackend, "start", failing_start)
+        monkeypatch.setattr(InotifyBackend, "close", tracking_close)
+        watcher = LibraryWatcher(ScanEngine(), config, backend="inotify")
+
+        watcher.start()
+        try:
+            assert watcher.backend_names() == ["polling"]
+            assert len(closed) == 1
+        finally:
+            watcher.stop()